@@ -18,21 +18,26 @@ import jwt  # Token generation and validation (PyJWT version 2.3.0)
 
 # Internal dependencies
 from src.backend.authentication_service.config import DATABASE_URL, SECRET_KEY, DEBUG  # Configuration settings
-from src.backend.authentication_service.src.models import User, Role  # User and Role models
+from src.backend.authentication_service.src.models import (
+    User,
+    Role,
+    create_schema,
+)  # User and Role models and schema creation
 from src.backend.authentication_service.src.utils import (
     hash_password,
     verify_password,
     generate_token,
     validate_token,
 )  # Utility functions for authentication
-from src.backend.authentication_service.src.routes import (
-    register_user,
-    login_user,
-    protected_route,
-)  # API endpoints for authentication
+from src.backend.common.hashing import get_hash_cost  # Password hashing cost calibration
+from src.backend.common.json_provider import init_json  # Fast JSON responses
+from src.backend.common.profiling import init_profiling  # Opt-in request profiling
+from src.backend.authentication_service.src.routes import auth_routes  # API endpoints for authentication
 
 # Global instances
 app = Flask(__name__)  # Instantiate the Flask application
+init_json(app)  # Serialize JSON responses with the shared fast provider
+init_profiling(app)  # Profile sampled and debug requests when PROFILE_SAMPLE_RATE or PROFILE_TOKEN is set
 
 # Configure the application settings
 app.config['DEBUG'] = DEBUG  # Debug mode configuration
@@ -45,10 +50,19 @@ db = SQLAlchemy(app)  # Initialize SQLAlchemy with the Flask app
 # Initialize JWT Manager for handling JWT tokens
 jwt = JWTManager(app)
 
-# Register API routes for authentication
-app.register_blueprint(register_user)  # Register user registration routes
-app.register_blueprint(login_user)     # Register user login routes
-app.register_blueprint(protected_route)  # Register protected routes requiring authentication
+# Register API routes for authentication: registration, login, protected resources, the JWKS
+# and metrics. The blueprint returns each request's database session to the pool at teardown.
+app.register_blueprint(auth_routes)
+
+@app.cli.command('create-schema')
+def create_schema_command():
+    """
+    Creates the authentication tables. Run once per deployment: `flask create-schema`.
+
+    The models no longer create tables on import, so starting a worker never touches the schema.
+    """
+    create_schema()
+    print('Authentication schema is up to date.')
 
 def create_app():
     """
@@ -59,7 +73,8 @@ def create_app():
     2. Set up the database connection using SQLAlchemy.
     3. Initialize JWT manager.
     4. Register API routes for user registration, login, and protected resources.
-    5. Return the configured Flask app instance.
+    5. Calibrate the password hashing cost on this host.
+    6. Return the configured Flask app instance.
 
     Returns:
         app (Flask): Configured Flask application instance.
@@ -68,7 +83,11 @@ def create_app():
     - Secure User Authentication and Role-Based Authorization
       (Technical Specification/5.1 Feature ID: F-001)
     """
-    # Using the global 'app', 'db', and 'jwt' instances initialized above
+    # Using the global 'app', 'db', and 'jwt' instances initialized above.
+    # Calibrate the password hashing cost to PASSWORD_HASH_TARGET_MS on this host as the server
+    # starts, so that the first registration or login does not pay for the measurement. Importing
+    # the app (tests, the CLI) does not calibrate.
+    get_hash_cost()
     return app
 
 # Entry point for running the application
@@ -0,0 +1,99 @@
+"""
+Benchmark: password verifications (logins) per second against hashing pool size.
+
+Simulates a login storm by having many client threads verify a bcrypt password through the
+shared HashingExecutor, and reports sustained throughput and rejections (the requests that
+would have been answered with 503) for each worker count.
+
+Usage (from the repository root):
+    python -m src.backend.authentication_service.benchmarks.bench_login_throughput \\
+        --workers 1,2,4,8 --clients 32 --duration 5 --rounds 10
+
+Requirements Addressed:
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import argparse
+import os
+import threading
+import time
+
+# Internal dependencies
+from src.backend.common.hashing import (
+    HashingExecutor,
+    HashingPoolFull,
+    bcrypt_hash,
+)
+
+
+def run_storm(workers, clients, duration, hashed_password, max_pending):
+    """
+    Runs a fixed-duration login storm against a fresh executor.
+
+    Parameters:
+    - workers (int): Pool size under test.
+    - clients (int): Number of concurrent client threads.
+    - duration (float): Seconds to keep submitting.
+    - hashed_password (str): The stored hash every client verifies against.
+    - max_pending (int): Queue bound for the executor.
+
+    Returns:
+    - dict: Completed logins, rejections and logins per second.
+    """
+    executor = HashingExecutor(workers=workers, max_pending=max_pending, timeout=60)
+    # Warm the pool so process start-up is not counted.
+    executor.check_password('correct horse', hashed_password)
+
+    completed = [0] * clients
+    rejected = [0] * clients
+    deadline = time.perf_counter() + duration
+
+    def client(index):
+        while time.perf_counter() < deadline:
+            try:
+                executor.check_password('correct horse', hashed_password)
+                completed[index] += 1
+            except HashingPoolFull:
+                rejected[index] += 1
+                time.sleep(0.001)
+
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    executor.shutdown()
+
+    return {
+        'workers': workers,
+        'completed': sum(completed),
+        'rejected': sum(rejected),
+        'logins_per_second': sum(completed) / elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--workers', default=','.join(str(2 ** i) for i in range(0, 4)),
+                        help='Comma-separated pool sizes to test.')
+    parser.add_argument('--clients', type=int, default=32, help='Concurrent client threads.')
+    parser.add_argument('--duration', type=float, default=5.0, help='Seconds per pool size.')
+    parser.add_argument('--rounds', type=int, default=10, help='bcrypt cost factor.')
+    parser.add_argument('--max-pending', type=int, default=64, help='Executor queue bound.')
+    args = parser.parse_args()
+
+    hashed_password = bcrypt_hash('correct horse', args.rounds)
+    print(f'cpu_count={os.cpu_count()} clients={args.clients} rounds={args.rounds}')
+    print(f'{"workers":>8} {"logins/s":>10} {"completed":>10} {"rejected":>10}')
+    for workers in (int(w) for w in args.workers.split(',')):
+        result = run_storm(workers, args.clients, args.duration, hashed_password, args.max_pending)
+        print(f'{result["workers"]:>8} {result["logins_per_second"]:>10.1f} '
+              f'{result["completed"]:>10} {result["rejected"]:>10}')
+
+
+if __name__ == '__main__':
+    main()
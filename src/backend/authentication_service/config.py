@@ -24,4 +24,54 @@ SECRET_KEY = os.getenv('SECRET_KEY', 'default_secret')
 # Debug mode configuration for the application.
 # Internal Dependency: DEBUG from src/backend/authentication_service/config.py
 # Purpose: Determines if the application runs in debug mode; should be set to 'False' in production.
-DEBUG = os.getenv('DEBUG', 'False')
\ No newline at end of file
+DEBUG = os.getenv('DEBUG', 'False')
+
+# Number of users inserted per transaction by the bulk registration endpoint.
+# Internal Dependency: BULK_REGISTER_CHUNK_SIZE from src/backend/authentication_service/config.py
+# Purpose: Keeps bulk provisioning transactions and IN-lists to a bounded size.
+BULK_REGISTER_CHUNK_SIZE = int(os.getenv('BULK_REGISTER_CHUNK_SIZE', '500'))
+
+# Maximum number of rows accepted in one bulk registration request.
+# Internal Dependency: BULK_REGISTER_MAX_ROWS from src/backend/authentication_service/config.py
+# Purpose: Rejects oversized uploads before any hashing or database work starts.
+BULK_REGISTER_MAX_ROWS = int(os.getenv('BULK_REGISTER_MAX_ROWS', '50000'))
+
+# Number of connections kept open in the database connection pool.
+# Internal Dependency: DB_POOL_SIZE from src/backend/authentication_service/config.py
+# Purpose: Sizes the engine's connection pool, created on first database use.
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '5'))
+
+# Number of extra connections the pool may open beyond DB_POOL_SIZE under load.
+# Internal Dependency: DB_MAX_OVERFLOW from src/backend/authentication_service/config.py
+# Purpose: Bounds burst connection usage per worker.
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '10'))
+
+# Whether to test pooled connections with a lightweight ping before handing them out.
+# Internal Dependency: DB_POOL_PRE_PING from src/backend/authentication_service/config.py
+# Purpose: Transparently replaces connections dropped by the database or a proxy.
+DB_POOL_PRE_PING = os.getenv('DB_POOL_PRE_PING', 'True').lower() in ('1', 'true', 'yes')
+
+# Seconds after which pooled connections are recycled; -1 disables recycling.
+# Internal Dependency: DB_POOL_RECYCLE from src/backend/authentication_service/config.py
+# Purpose: Avoids reusing connections older than the database's idle timeout.
+DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', '1800'))
+
+# Signature algorithm for issued tokens: 'EdDSA' (Ed25519) or 'RS256'.
+# Internal Dependency: JWT_ALGORITHM from src/backend/authentication_service/config.py
+# Purpose: Tokens are signed with a private key so other services verify them without a shared secret.
+JWT_ALGORITHM = os.getenv('JWT_ALGORITHM', 'EdDSA')
+
+# Path to the PEM private key used to sign tokens.
+# Internal Dependency: JWT_PRIVATE_KEY_PATH from src/backend/authentication_service/config.py
+# Purpose: Shared by all workers; when unset, each process generates a throwaway key (development only).
+JWT_PRIVATE_KEY_PATH = os.getenv('JWT_PRIVATE_KEY_PATH', '')
+
+# Comma-separated paths to PEM public keys of retired signing keys.
+# Internal Dependency: JWT_PUBLISHED_KEY_PATHS from src/backend/authentication_service/config.py
+# Purpose: Keeps retired keys in the JWKS during a rotation until the tokens they signed expire.
+JWT_PUBLISHED_KEY_PATHS = [path for path in os.getenv('JWT_PUBLISHED_KEY_PATHS', '').split(',') if path]
+
+# Role given to users who register themselves through /register.
+# Internal Dependency: NEW_USER_ROLE from src/backend/authentication_service/config.py
+# Purpose: Registration ignores any role the client sends; other roles are granted by a user with MANAGE_USERS.
+NEW_USER_ROLE = 'Employee'
@@ -1,11 +1,19 @@
 # SQLAlchemy version 1.4.25
-from sqlalchemy import Column, Integer, String, ForeignKey, create_engine
-from sqlalchemy.orm import relationship, declarative_base
-# Import the database URL from the configuration file
-from config import DATABASE_URL
-# Import standard library modules for password hashing
-import hashlib
-import os
+from sqlalchemy import Column, Integer, String, ForeignKey, create_engine, event, inspect
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import relationship, declarative_base, scoped_session, sessionmaker
+from sqlalchemy.orm import Session as SessionClass
+# Import the database URL and connection pool settings from the configuration file
+from src.backend.authentication_service.config import DATABASE_URL, DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_PRE_PING, DB_POOL_RECYCLE
+from src.backend.common.config import ROLE_PERMISSIONS_TTL
+# Import standard library modules
+import threading
+import time
+# Internal dependency
+from src.backend.common.metrics import metrics  # Records connection pool checkout metrics.
+from src.backend.common.hashing import get_hashing_executor  # Hashes passwords with the calibrated scheme and cost.
+from src.backend.common.permissions import PermissionRegistry  # Compiles role permissions into bitsets.
+from src.backend.common.token_cache import get_token_cache  # Cached principals dropped on role changes.
 
 # Create a declarative base class for the ORM models
 Base = declarative_base()
@@ -24,6 +32,8 @@ class Role(Base):
 
     id = Column(Integer, primary_key=True)
     name = Column(String, unique=True, nullable=False)
+    # Permission bitset (see permissions.Permission); NULL uses the role's default permissions.
+    permissions = Column(Integer, nullable=True)
 
     def __init__(self, name):
         """
@@ -37,6 +47,19 @@ class Role(Base):
         """
         self.name = name
 
+    @classmethod
+    def find_by_name(cls, name):
+        """
+        Retrieves a role by its name.
+
+        Parameters:
+        - name (string): The name of the role.
+
+        Returns:
+        - (Role or None): The matching role, if any.
+        """
+        return get_session().query(cls).filter_by(name=name).first()
+
 class User(Base):
     """
     Represents a user in the system with attributes for authentication and authorization.
@@ -81,6 +104,50 @@ class User(Base):
         self.password_hash = password_hash
         self.role = role
 
+    @classmethod
+    def find_by_username(cls, username):
+        """
+        Retrieves a user by username.
+
+        Parameters:
+        - username (string): The username to look up.
+
+        Returns:
+        - (User or None): The matching user, if any.
+        """
+        return get_session().query(cls).filter_by(username=username).first()
+
+    @classmethod
+    def find_by_id(cls, user_id):
+        """
+        Retrieves a user by primary key.
+
+        Parameters:
+        - user_id (int): The user's id.
+
+        Returns:
+        - (User or None): The matching user, if any.
+        """
+        if user_id is None:
+            return None
+        return get_session().get(cls, user_id)
+
+    def save_to_db(self):
+        """
+        Adds the user to the current session and commits it.
+
+        Steps:
+        - Add the instance to the request-scoped session.
+        - Commit, rolling back if the commit fails.
+        """
+        session = get_session()
+        session.add(self)
+        try:
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
     def set_password(self, password):
         """
         Sets the user's password by hashing it.
@@ -94,18 +161,11 @@ class User(Base):
         - password (string): The plain text password to be hashed.
 
         Steps:
-        - Generate a random salt.
-        - Hash the provided password using PBKDF2_HMAC with SHA256 and the salt.
-        - Store the hashed password and the salt in the password_hash attribute.
-        """
-        salt = os.urandom(16)
-        key = hashlib.pbkdf2_hmac(
-            'sha256',
-            password.encode('utf-8'),
-            salt,
-            100000
-        )
-        self.password_hash = key.hex() + ':' + salt.hex()
+        - Hash the password on the shared hashing pool with the preferred scheme (bcrypt or
+          PBKDF2-SHA256) at the cost calibrated for this host.
+        - Store the result, which records its scheme, cost and salt, in the password_hash attribute.
+        """
+        self.password_hash = get_hashing_executor().hash_password(password)
 
     def check_password(self, password):
         """
@@ -123,21 +183,188 @@ class User(Base):
         - (boolean): True if the password matches, False otherwise.
 
         Steps:
-        - Split the stored password hash to retrieve the key and the salt.
-        - Hash the provided password using the same method and salt.
-        - Compare the new hash with the stored hash.
-        - Return the result of the comparison.
-        """
-        stored_key, salt = self.password_hash.split(':')
-        key = hashlib.pbkdf2_hmac(
-            'sha256',
-            password.encode('utf-8'),
-            bytes.fromhex(salt),
-            100000
-        )
-        return stored_key == key.hex()
-
-# Create the database engine
-engine = create_engine(DATABASE_URL)
-# Create all tables in the database
-Base.metadata.create_all(engine)
\ No newline at end of file
+        - Read the scheme, cost and salt from the stored hash; legacy 'key:salt' PBKDF2 hashes
+          use 100000 iterations.
+        - Hash the provided password the same way on the shared hashing pool.
+        - Compare the result with the stored hash in constant time.
+        """
+        return get_hashing_executor().check_password(password, self.password_hash)
+
+# The engine is created on first database use rather than at import, so importing the models
+# (from the app, the tests or another service) never opens a connection or touches the schema.
+_engine = None
+_engine_lock = threading.Lock()
+
+# Request-scoped sessions. Each thread gets its own session; the app removes it at teardown,
+# which returns the connection to the pool.
+Session = scoped_session(sessionmaker())
+
+
+def _instrument_pool(engine):
+    """
+    Attaches connection pool event listeners that record checkout metrics.
+
+    Steps:
+    - Count new connections, checkouts, checkins and invalidations.
+    - Record how long each connection is held between checkout and checkin.
+    - Expose the pool's current size, checked out and overflow counts as gauges.
+    """
+    pool = engine.pool
+
+    @event.listens_for(pool, 'connect')
+    def on_connect(dbapi_connection, connection_record):
+        metrics.inc('db_pool_connections_created')
+
+    @event.listens_for(pool, 'checkout')
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info['checked_out_at'] = time.perf_counter()
+        metrics.inc('db_pool_checkouts')
+
+    @event.listens_for(pool, 'checkin')
+    def on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop('checked_out_at', None)
+        if checked_out_at is not None:
+            metrics.observe('db_pool_checkout_seconds', time.perf_counter() - checked_out_at)
+        metrics.inc('db_pool_checkins')
+
+    @event.listens_for(pool, 'invalidate')
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.inc('db_pool_invalidations')
+
+    # Not every pool class (e.g. SQLite's) reports size and overflow.
+    for name in ('size', 'checkedout', 'overflow'):
+        if hasattr(pool, name):
+            metrics.gauge(f'db_pool_{name}', getattr(pool, name))
+
+
+def get_engine():
+    """
+    Returns the process-wide engine, creating it and its connection pool on first use.
+
+    Addresses requirement:
+    - Scalability and Reliability
+      Location: Technical Specification/5.19 Feature ID: F-019
+
+    Returns:
+    - (Engine): The SQLAlchemy engine.
+
+    Steps:
+    - Build pool options from DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_PRE_PING and DB_POOL_RECYCLE.
+    - Skip the queue pool sizing options for SQLite, which uses its own pool classes.
+    - Attach the pool metrics listeners and bind the session factory to the engine.
+    """
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                options = {'pool_pre_ping': DB_POOL_PRE_PING, 'pool_recycle': DB_POOL_RECYCLE}
+                if make_url(DATABASE_URL).get_backend_name() != 'sqlite':
+                    options.update(pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW)
+                bind_engine(create_engine(DATABASE_URL, **options))
+    return _engine
+
+
+def bind_engine(engine):
+    """
+    Makes an engine the process-wide one, e.g. an in-memory database in the tests.
+
+    Parameters:
+    - engine (Engine): The engine the models and request sessions use from now on.
+    """
+    global _engine
+    Session.remove()
+    _instrument_pool(engine)
+    Session.configure(bind=engine)
+    _engine = engine
+
+
+def get_session():
+    """
+    Returns the current thread's session, bound to the pooled engine.
+
+    Returns:
+    - (Session): The request-scoped SQLAlchemy session.
+    """
+    get_engine()
+    return Session()
+
+
+def remove_session(exception=None):
+    """
+    Closes the current thread's session and returns its connection to the pool.
+
+    Registered as an app teardown handler.
+    """
+    Session.remove()
+
+
+def create_schema():
+    """
+    Creates all tables that do not exist yet.
+
+    Run once per deployment as a separate step (`flask create-schema`), not on import.
+    """
+    Base.metadata.create_all(get_engine())
+
+
+def _load_role_permissions():
+    """
+    Reads every stored role's permission bitset, for the permission registry.
+
+    Returns:
+    - (dict): Role name -> bitset, or None where the role uses its defaults.
+    """
+    session = SessionClass(bind=get_engine())
+    try:
+        return dict(session.query(Role.name, Role.permissions).all())
+    finally:
+        session.close()
+
+
+# Role name -> permission bitset for this process. Reloaded every ROLE_PERMISSIONS_TTL seconds and
+# as soon as this process commits a change to a role.
+role_permissions = PermissionRegistry(loader=_load_role_permissions, ttl=ROLE_PERMISSIONS_TTL)
+
+
+@event.listens_for(Role, 'after_insert')
+@event.listens_for(Role, 'after_update')
+@event.listens_for(Role, 'after_delete')
+def _mark_roles_changed(mapper, connection, target):
+    # Flush-time: remember the change and apply it once the transaction commits.
+    SessionClass.object_session(target).info['roles_changed'] = True
+
+
+def _users_changed(target):
+    # The ids of users whose cached principals are dropped when the target's session commits.
+    return SessionClass.object_session(target).info.setdefault('users_changed', set())
+
+
+@event.listens_for(User, 'after_update')
+def _mark_user_role_changed(mapper, connection, target):
+    # Flush-time: a changed role (by id or by relationship) outdates the user's cached principals.
+    state = inspect(target)
+    if state.attrs.role_id.history.has_changes() or state.attrs.role.history.has_changes():
+        _users_changed(target).add(target.id)
+
+
+@event.listens_for(User, 'after_delete')
+def _mark_user_deleted(mapper, connection, target):
+    _users_changed(target).add(target.id)
+
+
+@event.listens_for(SessionClass, 'after_commit')
+def _refresh_role_permissions(session):
+    roles_changed = session.info.pop('roles_changed', False)
+    users_changed = session.info.pop('users_changed', ())
+    if roles_changed:
+        role_permissions.invalidate()
+        # Cached principals carry their role's permissions as of their resolution.
+        get_token_cache().invalidate_principal()
+    else:
+        for user_id in users_changed:
+            get_token_cache().invalidate_principal(user_id)
+
+
+@event.listens_for(SessionClass, 'after_rollback')
+def _forget_role_changes(session):
+    session.info.pop('roles_changed', None)
+    session.info.pop('users_changed', None)
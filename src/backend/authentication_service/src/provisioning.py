@@ -0,0 +1,204 @@
+"""
+Bulk user provisioning for onboarding whole organisations at once.
+
+Registering users one `/register` call at a time costs a username query, a role query, a bcrypt
+hash and a commit per user. This module does the same work for a whole upload:
+- one set-based query per chunk for usernames and emails that already exist,
+- one query for all referenced roles,
+- parallel hashing on the shared hashing pool,
+- chunked multi-row inserts, one transaction per chunk.
+It returns a result for every input row.
+
+Requirements Addressed:
+- Secure User Authentication and Role-Based Authorization
+  - Location: Technical Specification/5.1 Feature ID: F-001
+    - TR-F001.1: Implement secure login using unique username and password.
+    - TR-F001.4: Define role-based access levels.
+- Administration and Configuration
+  - Location: Technical Specification/5.12 Feature ID: F-012
+"""
+
+# Standard library
+import csv
+import io
+import json
+
+# SQLAlchemy version 1.4.25
+from sqlalchemy import insert, or_, select
+from sqlalchemy.exc import IntegrityError
+
+# Internal dependencies
+from ..config import BULK_REGISTER_CHUNK_SIZE, BULK_REGISTER_MAX_ROWS
+from src.backend.common.hashing import get_hashing_executor
+from .models import User, Role, Session, get_engine
+
+# Fields every row must provide.
+REQUIRED_FIELDS = ('username', 'email', 'password', 'role')
+
+
+class BulkPayloadError(ValueError):
+    """
+    Raised when an upload cannot be parsed at all, as opposed to individual bad rows.
+    """
+
+
+def parse_user_rows(body, content_type):
+    """
+    Parses an NDJSON or CSV upload into a list of row dictionaries.
+
+    Parameters:
+    - body (str): The request body.
+    - content_type (str): The request mimetype; 'text/csv' selects CSV, anything else NDJSON.
+
+    Returns:
+    - list of dict: One dictionary per input row, in input order. A row that is not valid JSON
+      is kept as {'_error': message} so it still gets a per-row result.
+
+    Raises:
+    - BulkPayloadError: If the upload is empty or exceeds BULK_REGISTER_MAX_ROWS.
+    """
+    if content_type == 'text/csv':
+        rows = [dict(row) for row in csv.DictReader(io.StringIO(body))]
+    else:
+        rows = []
+        for line in body.splitlines():
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+                rows.append(row if isinstance(row, dict) else {'_error': 'Row must be a JSON object.'})
+            except ValueError as e:
+                rows.append({'_error': f'Invalid JSON: {e}'})
+    if not rows:
+        raise BulkPayloadError('No rows found in the upload.')
+    if len(rows) > BULK_REGISTER_MAX_ROWS:
+        raise BulkPayloadError(f'Upload exceeds the limit of {BULK_REGISTER_MAX_ROWS} rows.')
+    return rows
+
+
+def _is_unique_violation(error):
+    # True for a duplicate key, as opposed to e.g. a NOT NULL or foreign key violation.
+    code = getattr(error.orig, 'pgcode', None) or getattr(error.orig, 'sqlstate', None)
+    if code:
+        return code == '23505'
+    message = str(error.orig).lower()
+    return 'unique' in message or 'duplicate' in message
+
+
+def _chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def provision_users(rows, chunk_size=None, engine=None, executor=None):
+    """
+    Creates users in bulk and reports the outcome of every row.
+
+    Parameters:
+    - rows (list of dict): Rows with 'username', 'email', 'password' and 'role', all strings.
+    - chunk_size (int, optional): Rows per query and per insert transaction.
+    - engine (Engine, optional): Defaults to the service's engine.
+    - executor (HashingExecutor, optional): Defaults to the shared hashing executor.
+
+    Returns:
+    - list of dict: For each input row, {'row', 'username', 'status'} plus 'error' on failure.
+      'status' is 'created' or 'error'.
+    """
+    chunk_size = chunk_size or BULK_REGISTER_CHUNK_SIZE
+    results = [{'row': index + 1, 'username': row.get('username'), 'status': 'pending'}
+               for index, row in enumerate(rows)]
+
+    def fail(index, message):
+        results[index]['status'] = 'error'
+        results[index]['error'] = message
+
+    # Step 1: Validate rows and reject duplicates within the upload itself.
+    candidates = []
+    seen_usernames, seen_emails = set(), set()
+    for index, row in enumerate(rows):
+        if '_error' in row:
+            fail(index, row['_error'])
+            continue
+        missing = [field for field in REQUIRED_FIELDS if not row.get(field)]
+        if missing:
+            fail(index, f'Missing required fields: {", ".join(missing)}.')
+            continue
+        # NDJSON rows may carry numbers, lists or objects, which cannot be hashed or stored.
+        not_strings = [field for field in REQUIRED_FIELDS if not isinstance(row[field], str)]
+        if not_strings:
+            fail(index, f'Fields must be strings: {", ".join(not_strings)}.')
+            continue
+        if row['username'] in seen_usernames:
+            fail(index, 'Duplicate username in upload.')
+            continue
+        if row['email'] in seen_emails:
+            fail(index, 'Duplicate email in upload.')
+            continue
+        seen_usernames.add(row['username'])
+        seen_emails.add(row['email'])
+        candidates.append(index)
+
+    # A dedicated session (not the request's) so the chunked transactions below are independent.
+    with Session.session_factory(bind=engine or get_engine()) as session:
+        # Step 2: Find existing usernames and emails with set-based queries.
+        existing_usernames, existing_emails = set(), set()
+        for chunk in _chunks(candidates, chunk_size):
+            usernames = [rows[i]['username'] for i in chunk]
+            emails = [rows[i]['email'] for i in chunk]
+            for username, email in session.execute(
+                select(User.username, User.email).where(
+                    or_(User.username.in_(usernames), User.email.in_(emails))
+                )
+            ):
+                existing_usernames.add(username)
+                existing_emails.add(email)
+
+        # Step 3: Resolve every referenced role once.
+        role_names = {rows[i]['role'] for i in candidates}
+        role_ids = dict(session.execute(select(Role.name, Role.id).where(Role.name.in_(role_names))).all())
+
+        accepted = []
+        for index in candidates:
+            row = rows[index]
+            if row['username'] in existing_usernames:
+                fail(index, 'User already exists.')
+            elif row['email'] in existing_emails:
+                fail(index, 'Email already registered.')
+            elif row['role'] not in role_ids:
+                fail(index, 'Invalid role specified.')
+            else:
+                accepted.append(index)
+
+        # End the read transaction so each insert chunk below gets its own.
+        session.rollback()
+
+        # Step 4: Hash the accepted passwords in parallel on the hashing pool.
+        hashes = (executor or get_hashing_executor()).hash_many([rows[i]['password'] for i in accepted])
+        records = [
+            (index, {
+                'username': rows[index]['username'],
+                'email': rows[index]['email'],
+                'password_hash': password_hash,
+                'role_id': role_ids[rows[index]['role']],
+            })
+            for index, password_hash in zip(accepted, hashes)
+        ]
+
+        # Step 5: Insert in chunked transactions; on a conflict, retry the chunk row by row.
+        for chunk in _chunks(records, chunk_size):
+            try:
+                with session.begin():
+                    session.execute(insert(User.__table__), [values for _, values in chunk])
+                for index, _ in chunk:
+                    results[index]['status'] = 'created'
+            except IntegrityError:
+                for index, values in chunk:
+                    try:
+                        with session.begin():
+                            session.execute(insert(User.__table__), [values])
+                        results[index]['status'] = 'created'
+                    except IntegrityError as e:
+                        fail(index, 'User already exists.' if _is_unique_violation(e)
+                             else 'The row violates a database constraint.')
+
+    return results
@@ -8,29 +8,34 @@ Requirements Addressed:
 """
 
 # External dependencies
-from flask import Flask, request, jsonify  # Flask web framework (version 2.0.1)
-from flask_jwt_extended import (
-    JWTManager,
-    create_access_token,
-    jwt_required,
-    get_jwt_identity
-)  # Flask-JWT-Extended (version 4.3.1)
+from flask import Blueprint, request, jsonify, g  # Flask web framework (version 2.0.1)
 
 # Internal dependencies
-from models import User, Role  # User and Role models for handling user-related operations
-from utils import (
+from src.backend.authentication_service.src.models import User, Role, remove_session  # User and Role models for handling user-related operations
+from src.backend.authentication_service.src.utils import (
     hash_password,
     verify_password,
     generate_token,
-    validate_token
+    validate_token,
+    token_required,
+    upgrade_password_hash,
+    user_token_claims
 )  # Utility functions for password hashing, verification, and token management
+from src.backend.common.hashing import HashingPoolFull  # Raised when the password hashing pool is saturated or times out
+from src.backend.authentication_service.src.provisioning import parse_user_rows, provision_users, BulkPayloadError  # Bulk user provisioning
+from src.backend.common.metrics import metrics  # In-process service metrics
+from src.backend.authentication_service.src.signing import get_token_signer  # Publishes the token signing keys
+from src.backend.common.rate_limit import get_login_rate_limiter  # Per-IP and per-username login admission control
+from src.backend.common.permissions import Permission, require_permissions  # Bitwise role permission guards
+from src.backend.authentication_service.config import NEW_USER_ROLE  # Role of self-registered users
 
-# Initialize the Flask application
-app = Flask(__name__)
-app.config['JWT_SECRET_KEY'] = 'your_jwt_secret_key'  # Replace with a secure key in production
-jwt = JWTManager(app)
+# The authentication routes, registered on the service's app (app.py) or mounted by the main server.
+auth_routes = Blueprint('auth_routes', __name__)
 
-@app.route('/register', methods=['POST'])
+# Return each request's database session (and its pooled connection) when the request ends.
+auth_routes.teardown_app_request(remove_session)
+
+@auth_routes.route('/register', methods=['POST'])
 def register_user():
     """
     API endpoint for user registration, creating a new user in the system.
@@ -48,15 +53,16 @@ def register_user():
     - JSONResponse: A JSON response indicating success or failure of the registration process.
     """
     try:
-        # Step 1: Extract user data from the request payload.
+        # Step 1: Extract user data from the request payload. Any 'role' the client sends is
+        # ignored: self-registered users get NEW_USER_ROLE, whose permission bitset goes into the token.
         data = request.get_json()
         username = data.get('username')
+        email = data.get('email')
         password = data.get('password')
-        role_name = data.get('role')
 
         # Input validation
-        if not username or not password or not role_name:
-            return jsonify({'message': 'Username, password, and role are required.'}), 400
+        if not username or not email or not password:
+            return jsonify({'message': 'Username, email, and password are required.'}), 400
 
         # Check if the username already exists in the system.
         if User.find_by_username(username):
@@ -65,31 +71,81 @@ def register_user():
         # Step 2: Hash the user's password using hash_password utility.
         hashed_password = hash_password(password)
 
-        # Step 3: Create a new User instance with the provided data.
-        # Retrieve the Role instance based on role_name.
-        role = Role.find_by_name(role_name)
-        if not role:
-            return jsonify({'message': 'Invalid role specified.'}), 400
-
-        new_user = User(username=username, password=hashed_password, role_id=role.id)
+        # Step 3: Create a new User instance with the default role; a fresh database gets the
+        # role with the user.
+        role = Role.find_by_name(NEW_USER_ROLE) or Role(NEW_USER_ROLE)
+        new_user = User(username, email, hashed_password, role)
 
         # Step 4: Save the User instance to the database.
         new_user.save_to_db()
 
-        # Step 5: Generate a JWT token using generate_token utility.
-        access_token = generate_token(identity=new_user.id)
+        # Step 5: Generate a JWT token, carrying the role's permission bitset, using generate_token utility.
+        access_token = generate_token(user_token_claims(new_user))
 
         # Step 6: Return a success response with a generated JWT token.
         return jsonify({
             'message': 'User registered successfully.',
-            'access_token': access_token
+            'token': access_token,
+            'access_token': access_token  # Earlier name of 'token', kept for existing clients
         }), 201
 
+    except HashingPoolFull:
+        # The hashing pool is saturated or too slow; ask the client to retry shortly.
+        return jsonify({'message': 'Service busy, please retry.'}), 503, {'Retry-After': '1'}
+
     except Exception as e:
         # Handle exceptions and return an error response.
         return jsonify({'message': 'An error occurred during registration.', 'error': str(e)}), 500
 
-@app.route('/login', methods=['POST'])
+@auth_routes.route('/register/bulk', methods=['POST'])
+@token_required
+# The principal's permissions are re-read after a role change (see token_cache.py), not at token issue.
+@require_permissions(Permission.MANAGE_USERS, granted=lambda: g.current_user['permissions'])
+def register_users_bulk():
+    """
+    API endpoint for provisioning many users at once from an NDJSON or CSV upload.
+
+    Requirements Addressed:
+    - TR-F001.1: Implement secure login using unique username and password (High Priority)
+      - Technical Specification/5.1 Feature ID: F-001
+    - TR-F001.4: Define role-based access levels for Employees, Managers, Finance Team, and Administrators (High Priority)
+      - Technical Specification/5.1 Feature ID: F-001
+
+    Parameters:
+    - request (FlaskRequest): NDJSON (application/x-ndjson) or CSV (text/csv) with
+      username, email, password and role for each user.
+
+    Returns:
+    - JSONResponse: Counts of created and failed rows, and a result for every input row.
+    """
+    try:
+        # Step 1: Parse the upload into rows. Only roles with MANAGE_USERS get this far.
+        rows = parse_user_rows(request.get_data(as_text=True), request.mimetype)
+
+        # Step 2: Create the users with set-based lookups, parallel hashing and chunked inserts.
+        results = provision_users(rows)
+
+        # Step 3: Return a summary and the per-row results.
+        created = sum(1 for result in results if result['status'] == 'created')
+        return jsonify({
+            'message': 'Bulk registration processed.',
+            'created': created,
+            'failed': len(results) - created,
+            'results': results
+        }), 200
+
+    except BulkPayloadError as e:
+        return jsonify({'message': str(e)}), 400
+
+    except HashingPoolFull:
+        # Hashing runs before any insert, so nothing was created and the upload can be retried.
+        return jsonify({'message': 'Service busy, please retry.'}), 503, {'Retry-After': '1'}
+
+    except Exception as e:
+        # Handle exceptions and return an error response.
+        return jsonify({'message': 'An error occurred during bulk registration.', 'error': str(e)}), 500
+
+@auth_routes.route('/login', methods=['POST'])
 def login_user():
     """
     API endpoint for user login, authenticating users and issuing JWT tokens.
@@ -116,30 +172,44 @@ def login_user():
         if not username or not password:
             return jsonify({'message': 'Username and password are required.'}), 400
 
+        # Refuse attempts over the per-IP or per-username rate before any lookup or hashing.
+        decision = get_login_rate_limiter().check(username, request.remote_addr)
+        if not decision.allowed:
+            return (jsonify({'message': 'Too many login attempts, please retry later.'}), 429,
+                    {'Retry-After': str(decision.retry_after)})
+
         # Step 2: Retrieve the User instance from the database using the provided username.
         user = User.find_by_username(username)
         if not user:
             return jsonify({'message': 'Invalid username or password.'}), 401
 
         # Step 3: Verify the provided password using verify_password utility.
-        if not verify_password(password, user.password):
+        if not verify_password(password, user.password_hash):
             return jsonify({'message': 'Invalid username or password.'}), 401
 
-        # Step 4: Generate a JWT token using generate_token utility.
-        access_token = generate_token(identity=user.id)
+        # Upgrade the stored hash if it predates the current scheme or calibrated cost.
+        upgrade_password_hash(user, password)
+
+        # Step 4: Generate a JWT token, carrying the role's permission bitset, using generate_token utility.
+        access_token = generate_token(user_token_claims(user))
 
         # Step 5: Return a success response with the JWT token.
         return jsonify({
             'message': 'Login successful.',
-            'access_token': access_token
+            'token': access_token,
+            'access_token': access_token  # Earlier name of 'token', kept for existing clients
         }), 200
 
+    except HashingPoolFull:
+        # The hashing pool is saturated or too slow; ask the client to retry shortly.
+        return jsonify({'message': 'Service busy, please retry.'}), 503, {'Retry-After': '1'}
+
     except Exception as e:
         # Handle exceptions and return an error response.
         return jsonify({'message': 'An error occurred during login.', 'error': str(e)}), 500
 
-@app.route('/protected', methods=['GET'])
-@jwt_required()
+@auth_routes.route('/protected', methods=['GET'])
+@token_required
 def protected_route():
     """
     Example of a protected API route that requires JWT authentication.
@@ -156,18 +226,46 @@ def protected_route():
     """
     try:
         # Step 1: Validate the JWT token using validate_token utility.
-        # Note: The @jwt_required() decorator automatically checks for a valid token.
-
-        # Optionally, get the identity of the current user.
-        current_user_id = get_jwt_identity()
-        user = User.find_by_id(current_user_id)
+        # Note: The @token_required decorator validates the token and resolves the user through
+        # the verified-token cache, so repeat requests skip both the decode and the user query.
+        user = g.current_user
 
         # Step 2: Return a response indicating successful access to the protected resource.
         return jsonify({
             'message': 'Access granted to protected resource.',
-            'user': user.username
+            'user': user['username']
         }), 200
 
     except Exception as e:
         # Handle exceptions and return an error response.
-        return jsonify({'message': 'An error occurred while accessing the protected resource.', 'error': str(e)}), 500
\ No newline at end of file
+        return jsonify({'message': 'An error occurred while accessing the protected resource.', 'error': str(e)}), 500
+
+@auth_routes.route('/.well-known/jwks.json', methods=['GET'])
+def jwks_route():
+    """
+    Publishes the public keys that verify this service's tokens as a JSON Web Key Set.
+
+    Other services fetch this once and verify tokens locally by `kid`, without a shared secret.
+
+    Requirements Addressed:
+    - TR-F001.4: Define role-based access levels (High Priority)
+      - Technical Specification/5.1 Feature ID: F-001
+
+    Returns:
+    - JSONResponse: {'keys': [...]}, cacheable for five minutes.
+    """
+    return jsonify(get_token_signer().jwks()), 200, {'Cache-Control': 'public, max-age=300'}
+
+@auth_routes.route('/metrics', methods=['GET'])
+def metrics_route():
+    """
+    Reports the service's in-process metrics, including database connection pool checkouts.
+
+    Requirements Addressed:
+    - Scalability and Reliability
+      - Technical Specification/5.19 Feature ID: F-019
+
+    Returns:
+    - JSONResponse: Counters, histograms and gauges for this worker process.
+    """
+    return jsonify(metrics.snapshot()), 200
@@ -0,0 +1,193 @@
+"""
+Asymmetric signing of authentication tokens and publication of the public keys as a JWKS.
+
+Tokens are signed with an Ed25519 (EdDSA) or RSA (RS256) private key that only the authentication
+service holds. Every token header carries the `kid` of its signing key. `/.well-known/jwks.json`
+publishes the current public key and any retired ones that are still needed, so other services
+verify tokens locally with `jwks.JWKSVerifier`.
+
+Key rotation: deploy the new private key as JWT_PRIVATE_KEY_PATH and add the previous public key to
+JWT_PUBLISHED_KEY_PATHS. Verifiers pick up the new `kid` on first sight. Remove the old public key
+once the tokens it signed have expired.
+
+Requirements Addressed:
+- Secure User Authentication and Role-Based Authorization
+  - Location: Technical Specification/5.1 Feature ID: F-001
+    - TR-F001.1: Implement secure login using unique username and password.
+    - TR-F001.4: Define role-based access levels.
+"""
+
+# Standard library
+import base64
+import hashlib
+import json
+import logging
+import threading
+
+# PyJWT==2.3.0
+import jwt  # Token encoding and decoding.
+
+# cryptography==3.4.8
+from cryptography.hazmat.primitives import serialization  # PEM loading and raw key export.
+from cryptography.hazmat.primitives.asymmetric import rsa  # RSA key generation.
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey, Ed25519PublicKey
+
+# Internal dependencies
+from ..config import JWT_ALGORITHM, JWT_PRIVATE_KEY_PATH, JWT_PUBLISHED_KEY_PATHS
+from src.backend.common.jwks import SUPPORTED_ALGORITHMS, key_from_jwk
+
+logger = logging.getLogger(__name__)
+
+
+def b64url_encode(data):
+    """Encodes bytes as unpadded base64url, as used by JWK members."""
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def _uint_bytes(value):
+    return value.to_bytes((value.bit_length() + 7) // 8, 'big')
+
+
+def public_jwk(public_key):
+    """
+    Serializes a public key as a JWK with an RFC 7638 thumbprint as its `kid`.
+
+    Parameters:
+    - public_key: An Ed25519 or RSA public key.
+
+    Returns:
+    - dict: The JWK, including 'kid', 'alg' and 'use'.
+
+    Raises:
+    - ValueError: If the key type is not supported.
+    """
+    if isinstance(public_key, Ed25519PublicKey):
+        raw = public_key.public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+        members = {'crv': 'Ed25519', 'kty': 'OKP', 'x': b64url_encode(raw)}
+        algorithm = 'EdDSA'
+    elif isinstance(public_key, rsa.RSAPublicKey):
+        numbers = public_key.public_numbers()
+        members = {'e': b64url_encode(_uint_bytes(numbers.e)), 'kty': 'RSA',
+                   'n': b64url_encode(_uint_bytes(numbers.n))}
+        algorithm = 'RS256'
+    else:
+        raise ValueError(f'Unsupported key type: {type(public_key).__name__}')
+    # The thumbprint hashes the required members, sorted, without whitespace.
+    canonical = json.dumps(members, sort_keys=True, separators=(',', ':')).encode('utf-8')
+    kid = b64url_encode(hashlib.sha256(canonical).digest())
+    return dict(members, kid=kid, alg=algorithm, use='sig')
+
+
+def generate_private_key(algorithm):
+    """
+    Generates a new private key for an algorithm.
+
+    Parameters:
+    - algorithm (str): 'EdDSA' or 'RS256'.
+
+    Returns:
+    - The private key.
+    """
+    if algorithm == 'EdDSA':
+        return Ed25519PrivateKey.generate()
+    if algorithm == 'RS256':
+        return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    raise ValueError(f'Unsupported signing algorithm: {algorithm}')
+
+
+class TokenSigner:
+    """
+    Signs tokens with the current private key and verifies them against all published keys.
+
+    Attributes:
+        algorithm (str): 'EdDSA' or 'RS256'.
+        kid (str): Key id of the current signing key.
+    """
+
+    def __init__(self, private_key, algorithm, retired_public_keys=()):
+        """
+        Initializes the signer.
+
+        Parameters:
+        - private_key: The current Ed25519 or RSA private key.
+        - algorithm (str): The signature algorithm; must match the key type.
+        - retired_public_keys (iterable): Public keys of previous signing keys to keep publishing.
+        """
+        if algorithm not in SUPPORTED_ALGORITHMS:
+            raise ValueError(f'Unsupported signing algorithm: {algorithm}')
+        self.algorithm = algorithm
+        self._private_key = private_key
+        current = public_jwk(private_key.public_key())
+        if current['alg'] != algorithm:
+            raise ValueError(f'JWT_ALGORITHM {algorithm} does not match the signing key type.')
+        self.kid = current['kid']
+        self._jwks = [current] + [public_jwk(key) for key in retired_public_keys]
+        self._verification_keys = {jwk['kid']: key_from_jwk(jwk) for jwk in self._jwks}
+
+    def sign(self, payload):
+        """
+        Encodes and signs a token, with the signing key's `kid` in its header.
+
+        Parameters:
+        - payload (dict): The claims.
+
+        Returns:
+        - str: The encoded JWT.
+        """
+        return jwt.encode(payload, self._private_key, algorithm=self.algorithm, headers={'kid': self.kid})
+
+    def verify(self, token):
+        """
+        Verifies a token issued by this service, including tokens signed with retired keys.
+
+        Returns:
+        - dict: The decoded claims.
+
+        Raises:
+        - jwt.InvalidTokenError: If the token is invalid or signed with an unknown key.
+        """
+        key = self._verification_keys.get(jwt.get_unverified_header(token).get('kid'))
+        if key is None:
+            raise jwt.InvalidTokenError('Unknown signing key.')
+        public_key, algorithm = key
+        return jwt.decode(token, public_key, algorithms=[algorithm])
+
+    def jwks(self):
+        """
+        Returns the JSON Web Key Set published at `/.well-known/jwks.json`.
+        """
+        return {'keys': list(self._jwks)}
+
+
+def _load_pem(path, private):
+    with open(path, 'rb') as pem_file:
+        data = pem_file.read()
+    if private:
+        return serialization.load_pem_private_key(data, password=None)
+    return serialization.load_pem_public_key(data)
+
+
+# Process-wide signer built from the configuration.
+_signer = None
+_signer_lock = threading.Lock()
+
+
+def get_token_signer():
+    """
+    Returns the process-wide TokenSigner, loading the keys on first use.
+
+    Without JWT_PRIVATE_KEY_PATH a throwaway key is generated. Tokens signed with it are only
+    valid in this process, so this is for development only.
+    """
+    global _signer
+    if _signer is None:
+        with _signer_lock:
+            if _signer is None:
+                if JWT_PRIVATE_KEY_PATH:
+                    private_key = _load_pem(JWT_PRIVATE_KEY_PATH, private=True)
+                else:
+                    logger.warning('JWT_PRIVATE_KEY_PATH is not set; generating a throwaway signing key.')
+                    private_key = generate_private_key(JWT_ALGORITHM)
+                retired = [_load_pem(path, private=False) for path in JWT_PUBLISHED_KEY_PATHS]
+                _signer = TokenSigner(private_key, JWT_ALGORITHM, retired)
+    return _signer
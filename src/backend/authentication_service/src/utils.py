@@ -1,16 +1,23 @@
+# Standard library
+from functools import wraps
+
 # External dependencies
-# bcrypt==3.2.0
-import bcrypt  # Password hashing and verification.
+# Flask==2.0.1
+from flask import request, jsonify, g  # Request access for the token_required decorator.
 
 # PyJWT==2.3.0
 import jwt  # JWT token generation and validation.
 
-# Internal dependency
-from ..config import SECRET_KEY  # Used for encoding and decoding JWT tokens.
+# Internal dependencies
+from src.backend.common.hashing import get_hashing_executor, needs_rehash, HashingPoolFull  # Bounded hashing pool.
+from src.backend.common.token_cache import get_token_cache  # Caches verified tokens and their resolved users.
+from .signing import get_token_signer  # Signs tokens with the service's private key.
+from src.backend.common.permissions import PERMISSIONS_CLAIM  # Token claim carrying the permission bitset.
 
 def hash_password(password):
     """
-    Hashes a plain text password using bcrypt.
+    Hashes a plain text password with the preferred scheme (PASSWORD_HASH_SCHEME) at the cost
+    calibrated for this host, on the shared hashing pool.
 
     Addresses:
     - Secure User Authentication and Role-Based Authorization
@@ -22,13 +29,13 @@ def hash_password(password):
 
     Returns:
     - str: The hashed password.
+
+    Raises:
+    - HashingPoolFull: If the hashing pool has no free capacity, or (HashingTimeout) does not
+      finish the job within its timeout.
     """
-    # Use bcrypt to generate a salt.
-    salt = bcrypt.gensalt()
-    # Hash the password with the generated salt.
-    hashed_password = bcrypt.hashpw(password.encode('utf-8'), salt)
-    # Return the hashed password.
-    return hashed_password.decode('utf-8')
+    # Generate the salt and hash on the shared hashing pool, off the request thread.
+    return get_hashing_executor().hash_password(password)
 
 def verify_password(password, hashed_password):
     """
@@ -45,9 +52,38 @@ def verify_password(password, hashed_password):
 
     Returns:
     - bool: True if the password matches, False otherwise.
+
+    Raises:
+    - HashingPoolFull: If the hashing pool has no free capacity, or (HashingTimeout) does not
+      finish the job within its timeout.
+    """
+    # Compare the plain text password with the hashed password on the shared hashing pool.
+    return get_hashing_executor().check_password(password, hashed_password)
+
+def upgrade_password_hash(user, password):
+    """
+    Re-hashes a user's password after a successful login if the stored hash is outdated.
+
+    Stored hashes that use another scheme, the legacy PBKDF2 format or a lower cost than the one
+    calibrated for this host are replaced transparently, so hash strength follows the hardware
+    without a password reset.
+
+    Parameters:
+    - user (User): The authenticated user.
+    - password (str): The password the user just proved.
+
+    Returns:
+    - bool: True if the hash was upgraded. When the hashing pool is busy the upgrade is left for
+      a later login.
     """
-    # Use bcrypt to compare the plain text password with the hashed password.
-    return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+    if not needs_rehash(user.password_hash):
+        return False
+    try:
+        user.password_hash = hash_password(password)
+    except HashingPoolFull:
+        return False
+    user.save_to_db()
+    return True
 
 def generate_token(user_payload):
     """
@@ -65,11 +101,35 @@ def generate_token(user_payload):
     Returns:
     - str: The generated JWT token.
     """
-    # Encode the user payload using PyJWT with the SECRET_KEY.
-    token = jwt.encode(user_payload, SECRET_KEY, algorithm='HS256')
+    # Sign the user payload with the service's private key; the header carries the key id.
+    token = get_token_signer().sign(user_payload)
     # Return the generated JWT token.
     return token
 
+def user_token_claims(user):
+    """
+    Builds the claims of a user's token, including the compact permission bitset.
+
+    Addresses:
+    - Secure User Authentication and Role-Based Authorization
+      - Location: Technical Specification/5.1 Feature ID: F-001
+        - TR-F001.4: Define role-based access levels.
+
+    Parameters:
+    - user (User): The authenticated user.
+
+    Returns:
+    - dict: 'sub', 'username', 'role' and the 'perm' bitset from the role permission registry.
+    """
+    from .models import role_permissions
+    role_name = user.role.name if user.role else None
+    return {
+        'sub': str(user.id),
+        'username': user.username,
+        'role': role_name,
+        PERMISSIONS_CLAIM: role_permissions.mask(role_name),
+    }
+
 def validate_token(token):
     """
     Validates a JWT token and returns the decoded payload.
@@ -86,9 +146,81 @@ def validate_token(token):
     - dict: Decoded payload if the token is valid.
 
     Raises:
-    - jwt.InvalidTokenError: If the token is invalid or expired.
+    - jwt.InvalidTokenError: If the token is invalid, expired or revoked.
+    """
+    # Verify the JWT token against the published signing keys, unless it was verified recently.
+    return get_token_cache().get_or_verify(token, _decode_token).claims
+
+def authenticate_token(token):
+    """
+    Validates a JWT token and resolves the user it was issued to.
+
+    The decoded claims and a snapshot of the user are cached together until the token's `exp`,
+    so repeated requests with the same token skip both the signature check and the user query.
+
+    Addresses:
+    - Secure User Authentication and Role-Based Authorization
+      - Location: Technical Specification/5.1 Feature ID: F-001
+        - TR-F001.4: Define role-based access levels.
+
+    Parameters:
+    - token (str): The JWT token to authenticate.
+
+    Returns:
+    - dict: The user snapshot with 'id', 'username', 'role' and the role's 'permissions' bitset.
+
+    Raises:
+    - jwt.InvalidTokenError: If the token is invalid, expired, revoked or its user no longer exists.
+    """
+    return get_token_cache().get_or_verify(token, _decode_token, _resolve_principal).principal
+
+def revoke_token(token):
+    """
+    Revokes a JWT token so that it is refused until it expires, e.g. on logout.
+
+    Parameters:
+    - token (str): The JWT token to revoke.
+    """
+    expires_at = None
+    try:
+        expires_at = _decode_token(token).get('exp')
+    except jwt.InvalidTokenError:
+        pass
+    get_token_cache().revoke(token, expires_at)
+
+def token_required(view):
+    """
+    Route decorator that authenticates the Bearer token through the verified-token cache.
+
+    The resolved user snapshot is available to the view as `flask.g.current_user`.
+    Responds with 401 when the token is missing, invalid, expired or revoked.
     """
-    # Decode the JWT token using PyJWT with the SECRET_KEY.
-    decoded_payload = jwt.decode(token, SECRET_KEY, algorithms=['HS256'])
-    # Return the decoded payload if the token is valid.
-    return decoded_payload
\ No newline at end of file
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        auth_header = request.headers.get('Authorization', '')
+        if not auth_header.startswith('Bearer '):
+            return jsonify({'message': 'Missing authorization token.'}), 401
+        try:
+            g.current_user = authenticate_token(auth_header[len('Bearer '):])
+        except jwt.InvalidTokenError as e:
+            return jsonify({'message': 'Invalid or expired token.', 'error': str(e)}), 401
+        return view(*args, **kwargs)
+    return wrapper
+
+def _decode_token(token):
+    # Signature and expiry check; only runs on a token cache miss.
+    return get_token_signer().verify(token)
+
+def _resolve_principal(claims):
+    # Loads the token's user once per token; imported lazily to keep model setup out of import time.
+    from .models import User, role_permissions
+    user = User.find_by_id(claims.get('sub', claims.get('user_id')))
+    if user is None:
+        return None
+    role_name = user.role.name if user.role else None
+    return {
+        'id': user.id,
+        'username': user.username,
+        'role': role_name,
+        'permissions': role_permissions.mask(role_name),
+    }
@@ -8,14 +8,24 @@ Requirements Addressed:
 """
 
 # External Dependencies
-import pytest  # Testing framework for writing and executing test cases. Version: 6.2.4
+import time  # Token expiry times.
+import unittest  # Plain test cases for components that do not need the Flask app.
 from flask_testing import TestCase  # Extension for testing Flask applications. Version: 0.8.1
+from sqlalchemy import create_engine, select  # Databases for the provisioning and role change tests. SQLAlchemy version 1.4.25
+from sqlalchemy.pool import StaticPool  # One shared in-memory database for the provisioning tests.
+import jwt  # Token encoding for the JWKS and token cache tests. PyJWT version 2.3.0
 
 # Internal Dependencies
-from app import create_app  # Initialize the Flask application for testing.
-from src.models import db, User  # User model for creating test users.
-from src.utils import hash_password  # Utility function for hashing passwords in tests.
-from src.routes import register_user, login_user, protected_route  # API routes for testing registration, login, and protected resources.
+from src.backend.authentication_service.app import create_app  # Initialize the Flask application for testing.
+from src.backend.authentication_service.src.models import Base, Role, User, SessionClass  # Models for creating test users and roles.
+from src.backend.authentication_service.src.models import bind_engine, create_schema, remove_session  # In-memory database per test.
+from src.backend.authentication_service.src.utils import hash_password, validate_token  # Password hashing and token checks in tests.
+from src.backend.authentication_service.src.provisioning import parse_user_rows, provision_users, BulkPayloadError  # Bulk registration.
+from src.backend.authentication_service.src.signing import TokenSigner, generate_private_key  # Asymmetric token signing.
+from src.backend.authentication_service.config import NEW_USER_ROLE  # Role of self-registered users.
+from src.backend.common.permissions import Permission, claims_permissions, has_permissions  # Token permission checks.
+from src.backend.common.jwks import JWKSVerifier  # Local token verification against the published JWKS.
+from src.backend.common.token_cache import get_token_cache  # Cached principals dropped on role changes.
 
 class TestAuthentication(TestCase):
     """
@@ -27,7 +37,6 @@ class TestAuthentication(TestCase):
         Set up the test client using the Flask application.
 
         - Disables CSRF protection for testing purposes.
-        - Uses an in-memory SQLite database for isolation.
 
         Related Requirements:
         - Ensures a secure testing environment.
@@ -35,26 +44,24 @@ class TestAuthentication(TestCase):
         app = create_app()
         app.config['TESTING'] = True
         app.config['WTF_CSRF_ENABLED'] = False  # Disable CSRF for testing
-        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///:memory:'  # In-memory database
         return app
 
     def setUp(self):
         """
-        Prepare the database before each test.
+        Prepare a fresh in-memory database before each test.
         """
-        db.create_all()
+        self.engine = create_engine('sqlite://', poolclass=StaticPool)
+        bind_engine(self.engine)
+        create_schema()
 
     def tearDown(self):
         """
         Clean up the database after each test.
         """
-        db.session.remove()
-        db.drop_all()
+        remove_session()
+        self.engine.dispose()
 
-    @pytest.mark.parametrize('username, email, password', [
-        ('testuser', 'testuser@example.com', 'TestPassword123!')
-    ])
-    def test_user_registration(self, username, email, password):
+    def test_user_registration(self, username='testuser', email='testuser@example.com', password='TestPassword123!'):
         """
         Tests the user registration endpoint to ensure users can be registered successfully.
 
@@ -88,10 +95,30 @@ class TestAuthentication(TestCase):
         assert 'token' in data
         assert data['token'] is not None
 
-    @pytest.mark.parametrize('username, password', [
-        ('testuser', 'TestPassword123!')
-    ])
-    def test_user_login(self, username, password):
+    def test_self_registration_ignores_requested_role(self):
+        """
+        Tests that a client asking /register for the Administrator role gets a token without
+        MANAGE_USERS, which /register/bulk then refuses.
+        """
+        payload = {
+            'username': 'mallory',
+            'email': 'mallory@example.com',
+            'password': 'TestPassword123!',
+            'role': 'Administrator'
+        }
+        response = self.client.post('/register', json=payload)
+        assert response.status_code == 201
+
+        claims = validate_token(response.get_json()['access_token'])
+        assert claims['role'] == NEW_USER_ROLE
+        assert not has_permissions(claims_permissions(claims), Permission.MANAGE_USERS)
+
+        headers = {'Authorization': f"Bearer {response.get_json()['access_token']}"}
+        bulk = self.client.post('/register/bulk', data='username,email,password,role\n',
+                                content_type='text/csv', headers=headers)
+        assert bulk.status_code == 403
+
+    def test_user_login(self, username='testuser', password='TestPassword123!'):
         """
         Tests the user login endpoint to ensure users can log in and receive a JWT token.
 
@@ -110,9 +137,8 @@ class TestAuthentication(TestCase):
         """
         # 2. Create a test user in the database with a known password.
         hashed_password = hash_password(password)
-        user = User(username=username, email='testuser@example.com', password=hashed_password)
-        db.session.add(user)
-        db.session.commit()
+        user = User(username, 'testuser@example.com', hashed_password, None)
+        user.save_to_db()
 
         # 3. Prepare a valid login payload with the user's credentials.
         payload = {
@@ -152,9 +178,8 @@ class TestAuthentication(TestCase):
         username = 'testuser'
         password = 'TestPassword123!'
         hashed_password = hash_password(password)
-        user = User(username=username, email='testuser@example.com', password=hashed_password)
-        db.session.add(user)
-        db.session.commit()
+        user = User(username, 'testuser@example.com', hashed_password, None)
+        user.save_to_db()
 
         login_payload = {
             'username': username,
@@ -179,4 +204,166 @@ class TestAuthentication(TestCase):
         unauthorized_response = self.client.get('/protected')
 
         # 6. Assert that the response status code is 401 (Unauthorized) indicating access is denied.
-        assert unauthorized_response.status_code == 401
\ No newline at end of file
+        assert unauthorized_response.status_code == 401
+
+
+class TestBulkRegistrationParsing(unittest.TestCase):
+    """
+    Test suite for parsing bulk registration uploads.
+    """
+
+    def test_parses_csv_and_ndjson(self):
+        """
+        Tests that CSV and NDJSON uploads produce the same rows, and a bad NDJSON line
+        is kept as an error row so it still gets a per-row result.
+        """
+        csv_body = 'username,email,password,role\njdoe,jdoe@example.com,Secret123!,Employee\n'
+        ndjson_body = (
+            '{"username": "jdoe", "email": "jdoe@example.com", "password": "Secret123!", "role": "Employee"}\n'
+            'not json\n'
+        )
+        csv_rows = parse_user_rows(csv_body, 'text/csv')
+        ndjson_rows = parse_user_rows(ndjson_body, 'application/x-ndjson')
+        assert csv_rows[0] == ndjson_rows[0]
+        assert '_error' in ndjson_rows[1]
+
+    def test_rejects_empty_upload(self):
+        """
+        Tests that an upload without rows is rejected as a whole.
+        """
+        with self.assertRaises(BulkPayloadError):
+            parse_user_rows('\n\n', 'application/x-ndjson')
+
+
+class _FakeHasher:
+    """
+    Stands in for the hashing executor: 'hash:<password>', None for 'no-hash', and a
+    concurrent registration of 'late' while the batch is being hashed.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def hash_many(self, passwords):
+        with self.engine.begin() as connection:
+            connection.execute(User.__table__.insert(), [{'username': 'late', 'email': 'late@example.com',
+                                                          'password_hash': 'x', 'role_id': 1}])
+        return [None if password == 'no-hash' else f'hash:{password}' for password in passwords]
+
+
+class TestBulkProvisioning(unittest.TestCase):
+    """
+    Test suite for creating users in bulk.
+    """
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://', poolclass=StaticPool)
+        Base.metadata.create_all(self.engine)
+        with self.engine.begin() as connection:
+            connection.execute(Role.__table__.insert(), [{'id': 1, 'name': 'Employee'}])
+            connection.execute(User.__table__.insert(), [{'username': 'taken', 'email': 'taken@example.com',
+                                                          'password_hash': 'x', 'role_id': 1}])
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_every_row_gets_its_own_result(self):
+        """
+        Tests that bad rows, existing users, concurrent registrations and constraint violations
+        fail their own row only, and that only duplicates are reported as existing users.
+        """
+        def row(username, password='Secret123!', role='Employee'):
+            return {'username': username, 'email': f'{username}@example.com', 'password': password, 'role': role}
+
+        rows = [row('ada'), row('numeric', password=12345678), row('listed', password=['a']),
+                row('taken'), row('nobody', role='Astronaut'), row('late'), row('nohash', password='no-hash')]
+        results = provision_users(rows, chunk_size=10, engine=self.engine, executor=_FakeHasher(self.engine))
+        outcomes = {result['username']: result.get('error', result['status']) for result in results}
+        assert outcomes == {
+            'ada': 'created',
+            'numeric': 'Fields must be strings: password.',
+            'listed': 'Fields must be strings: password.',
+            'taken': 'User already exists.',
+            'nobody': 'Invalid role specified.',
+            'late': 'User already exists.',
+            'nohash': 'The row violates a database constraint.',
+        }
+        with self.engine.connect() as connection:
+            stored = dict(connection.execute(select(User.username, User.password_hash)).all())
+        assert stored['ada'] == 'hash:Secret123!' and 'nohash' not in stored
+
+
+class TestJWKSVerification(unittest.TestCase):
+    """
+    Test suite for asymmetric token signing and local verification against the published JWKS.
+    """
+
+    def setUp(self):
+        self.old_key = generate_private_key('EdDSA')
+        self.signer = TokenSigner(self.old_key, 'EdDSA')
+        self.jwks = self.signer.jwks()
+        self.fetches = []
+        self.verifier = JWKSVerifier('http://auth/.well-known/jwks.json', min_refresh_interval=0,
+                                     fetch=self._fetch)
+
+    def _fetch(self, url, timeout):
+        self.fetches.append(url)
+        return self.jwks
+
+    def test_verifies_locally_with_cached_keys(self):
+        """
+        Tests that tokens verify against the published key and the key set is fetched only once.
+        """
+        token = self.signer.sign({'sub': '1', 'exp': time.time() + 60})
+        assert self.verifier.verify(token)['sub'] == '1'
+        assert self.verifier.verify(token)['sub'] == '1'
+        assert len(self.fetches) == 1
+
+    def test_unknown_kid_triggers_refetch_after_rotation(self):
+        """
+        Tests that after a rotation the verifier picks up the new key, and tokens signed with the
+        retired key stay valid while it is still published.
+        """
+        old_token = self.signer.sign({'sub': '1'})
+        self.verifier.verify(old_token)
+        rotated = TokenSigner(generate_private_key('EdDSA'), 'EdDSA', [self.old_key.public_key()])
+        self.jwks = rotated.jwks()
+        assert self.verifier.verify(rotated.sign({'sub': '2'}))['sub'] == '2'
+        assert self.verifier.verify(old_token)['sub'] == '1'
+        assert len(self.fetches) == 2
+
+    def test_rejects_shared_secret_tokens(self):
+        """
+        Tests that an HS256 token carrying a published kid is refused.
+        """
+        token = jwt.encode({'sub': '1'}, 'shared-secret', algorithm='HS256',
+                           headers={'kid': self.signer.kid})
+        with self.assertRaises(jwt.InvalidTokenError):
+            self.verifier.verify(token)
+
+
+class TestRoleChangeInvalidation(unittest.TestCase):
+    """
+    Test suite for dropping cached principals when a user's role changes.
+    """
+
+    def test_role_change_drops_cached_principals(self):
+        """
+        Tests that a role change committed in this process drops the user's cached principals.
+        """
+        engine = create_engine('sqlite://')
+        Base.metadata.create_all(engine)
+        session = SessionClass(bind=engine)
+        employee, administrator = Role('Employee'), Role('Administrator')
+        session.add_all([employee, administrator])
+        user = User('testuser', 'testuser@example.com', 'x', administrator)
+        session.add(user)
+        session.commit()
+        token = jwt.encode({'sub': str(user.id), 'exp': int(time.time()) + 300}, 'test_secret', algorithm='HS256')
+        shared = get_token_cache()
+        shared.put(token, {'sub': str(user.id)}, {'id': user.id, 'role': 'Administrator'})
+        user.role = employee
+        session.commit()
+        assert shared.get(token) is None
+        session.close()
+        engine.dispose()
@@ -0,0 +1,160 @@
+"""
+Shared batch validation for the `/validate_expense/batch` routes of the main server and the
+policy engine.
+
+A client syncing many expenses at once (e.g. an offline trip of 80 receipts) sends them in one
+request, either as a JSON array or as NDJSON (application/x-ndjson, one expense per line).
+`validate_batch` then:
+- groups the expenses by policy key, (category, region, employee level), and resolves the
+  applicable policies once per distinct key rather than once per expense,
+- checks each expense against its resolved policies,
+- returns one result per expense, in input order. An expense that is not an object, whose key
+  cannot be computed (e.g. a list as its category), or whose resolution or check raises, gets an
+  {'error': ...} result; the rest of the batch is still checked.
+
+Resolution and checks both run in the request's thread. A check is a few comparisons in pure
+Python, which holds the GIL, so spreading checks over threads would only add hand-off overhead;
+the saving comes from resolving each key once.
+
+Batches are counted as `expense_batches`, `expense_batch_items` and `expense_batch_keys`, and
+timed in `expense_batch_seconds`.
+
+This module only depends on Flask and the standard library.
+
+Requirements Addressed:
+- Policy and Compliance Engine
+  - Location: Technical Specification/5.3 Feature ID: F-003
+    - TR-F003.2: Perform real-time policy checks during expense submission.
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import os
+import time
+
+# Flask==2.0.1
+from flask import request
+
+# Internal dependencies
+from .json_provider import NDJSON_MIMETYPE, loads
+from .metrics import metrics
+
+# BATCH_MAX_ITEMS: Expenses accepted in one batch request; larger batches are refused with 413.
+BATCH_MAX_ITEMS = int(os.getenv('BATCH_MAX_ITEMS', '1000'))
+
+
+class BatchPayloadError(ValueError):
+    """
+    Raised when a batch body is not a JSON array or NDJSON, or holds too many expenses.
+
+    Attributes:
+        status (int): The HTTP status to answer with, 400 or 413.
+    """
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def read_batch(max_items=None):
+    """
+    Reads the current request's body as a list of expenses.
+
+    NDJSON bodies (application/x-ndjson) are parsed line by line, skipping blank lines; any
+    other body must be a JSON array.
+
+    Parameters:
+    - max_items (int, optional): Defaults to BATCH_MAX_ITEMS.
+
+    Returns:
+    - list: The decoded items, in input order; they are not checked to be objects here.
+
+    Raises:
+    - BatchPayloadError: If the body cannot be parsed or holds more than max_items items.
+    """
+    max_items = BATCH_MAX_ITEMS if max_items is None else max_items
+    if request.mimetype == NDJSON_MIMETYPE:
+        items = []
+        for number, line in enumerate(request.stream, start=1):
+            if not line.strip():
+                continue
+            if len(items) == max_items:
+                raise BatchPayloadError(f'A batch holds at most {max_items} expenses.', status=413)
+            try:
+                items.append(loads(line))
+            except ValueError:
+                raise BatchPayloadError(f'Line {number} is not valid JSON.') from None
+        return items
+    try:
+        items = loads(request.get_data())
+    except ValueError:
+        raise BatchPayloadError('The body is not valid JSON.') from None
+    if not isinstance(items, list):
+        raise BatchPayloadError('The body must be a JSON array or NDJSON.')
+    if len(items) > max_items:
+        raise BatchPayloadError(f'A batch holds at most {max_items} expenses.', status=413)
+    return items
+
+
+def policy_key(expense):
+    """
+    Returns the key policies are resolved by: (category, region, employee level).
+
+    The region is read from 'region', or from 'location' as the policy engine's expenses name it.
+    """
+    return (expense.get('category'), expense.get('region', expense.get('location')), expense.get('employee_level'))
+
+
+def _check_one(check, expense, resolved, error):
+    # The result of one expense: the check's, or an error result.
+    if error is not None:
+        return {'error': error}
+    try:
+        return check(expense, resolved)
+    except Exception as e:
+        return {'error': str(e)}
+
+
+def _resolve_one(expense, key, resolve, resolved_by_key):
+    # (resolved, error) for one expense; each key is resolved once, failed or not.
+    if not isinstance(expense, dict):
+        return None, 'Each expense must be a JSON object.'
+    try:
+        expense_key = key(expense)
+        if expense_key not in resolved_by_key:
+            try:
+                resolved_by_key[expense_key] = (resolve(expense), None)
+            except Exception as e:
+                resolved_by_key[expense_key] = (None, str(e))
+        return resolved_by_key[expense_key]
+    except TypeError:  # A list or object where the key expects a string
+        return None, 'category, region and employee_level must be strings or numbers.'
+
+
+def validate_batch(expenses, resolve, check, key=policy_key):
+    """
+    Checks a batch of expenses, resolving policies once per distinct key.
+
+    Parameters:
+    - expenses (list): The decoded expenses, e.g. from read_batch.
+    - resolve (callable): resolve(expense) -> the policies applying to every expense with the
+      same key; called with the first expense of each key. If it raises, every expense of that
+      key gets the error as its result.
+    - check (callable): check(expense, resolved) -> the expense's result dict.
+    - key (callable): key(expense) -> a hashable policy key; defaults to policy_key.
+
+    Returns:
+    - dict: 'results', one per expense in input order, and 'policy_keys', the number of
+      distinct keys resolved.
+    """
+    started = time.monotonic()
+    resolved_by_key = {}
+    results = [_check_one(check, expense, *_resolve_one(expense, key, resolve, resolved_by_key))
+               for expense in expenses]
+
+    metrics.inc('expense_batches')
+    metrics.inc('expense_batch_items', len(expenses))
+    metrics.inc('expense_batch_keys', len(resolved_by_key))
+    metrics.observe('expense_batch_seconds', time.monotonic() - started)
+    return {'results': results, 'policy_keys': len(resolved_by_key)}
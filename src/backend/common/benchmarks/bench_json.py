@@ -0,0 +1,119 @@
+"""
+Benchmark: serializing a 10,000-line expense report with Flask's default JSON path and with the shared provider.
+
+Builds one report payload with Decimal amounts, dates and datetimes, as the services' to_dict
+methods return them. It times the whole `jsonify` call that builds the response:
+- flask_default: a plain Flask app (the standard library encoder, with sorted keys),
+- provider_stdlib: an app set up by init_json with the standard library backend,
+- provider_orjson: the same with orjson, when it is installed,
+- ndjson_<backend>: the report lines streamed by ndjson_response, fully consumed.
+
+Prints the median and best time per repetition, and the response size, for each path.
+
+Usage (from the repository root):
+    python -m src.backend.common.benchmarks.bench_json --lines 10000 --repeat 20
+
+Requirements Addressed:
+- Reporting and Analytics
+  - Location: Technical Specification/5.6 Feature ID: F-006
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import argparse
+import datetime
+import statistics
+import time
+from decimal import Decimal
+
+# Flask==2.0.1
+from flask import Flask, jsonify
+
+# Internal dependencies
+from src.backend.common.json_provider import BACKENDS, init_json, ndjson_response
+
+CATEGORIES = ('Airfare', 'Lodging', 'Meals', 'Ground Transport', 'Conference Fees')
+
+
+def build_report(lines):
+    """
+    Builds an expense report payload with the given number of lines.
+
+    Parameters:
+    - lines (int): Number of expense lines.
+
+    Returns:
+    - dict: The payload, shaped like ExpenseReport.to_dict() with its items.
+    """
+    submitted = datetime.datetime(2024, 3, 1, 9, 30, 15, 123456)
+    return {
+        'report_id': 4242,
+        'employee_id': 17,
+        'submission_date': submitted,
+        'status': 'Pending',
+        'total_amount': sum((Decimal(index % 500) + Decimal('0.25') for index in range(lines)), Decimal('0')),
+        'expenses': [
+            {
+                'expense_id': index,
+                'report_id': 4242,
+                'amount': Decimal(index % 500) + Decimal('0.25'),
+                'currency': 'EUR' if index % 3 else 'USD',
+                'category': CATEGORIES[index % len(CATEGORIES)],
+                'description': f'Line {index}: client visit, receipt attached',
+                'expense_date': datetime.date(2024, 1, 1) + datetime.timedelta(days=index % 60),
+                'created_at': submitted - datetime.timedelta(minutes=index),
+            }
+            for index in range(lines)
+        ],
+    }
+
+
+def time_path(app, serialize, repeat):
+    """
+    Times a serialization within an app's request context.
+
+    Parameters:
+    - app (Flask): The app to serialize with.
+    - serialize (callable): serialize() -> bytes.
+    - repeat (int): Number of timed runs, after one warm-up run.
+
+    Returns:
+    - dict: Median and best milliseconds per run, and the size of the output in bytes.
+    """
+    with app.test_request_context():
+        size = len(serialize())
+        timings = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            serialize()
+            timings.append((time.perf_counter() - started) * 1000)
+    return {'median_ms': statistics.median(timings), 'best_ms': min(timings), 'bytes': size}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--lines', type=int, default=10000, help='Expense lines in the report.')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed runs per path.')
+    args = parser.parse_args()
+
+    report = build_report(args.lines)
+    paths = {'flask_default': (Flask('bench_default'), lambda: jsonify(report).get_data())}
+    for backend in sorted(BACKENDS):
+        app = init_json(Flask(f'bench_{backend}'), backend=backend)
+        paths[f'provider_{backend}'] = (app, lambda: jsonify(report).get_data())
+        paths[f'ndjson_{backend}'] = (app, lambda backend=backend: b''.join(
+            ndjson_response(report['expenses'], backend=backend).response))
+
+    print(f'lines={args.lines} repeat={args.repeat} backends={",".join(sorted(BACKENDS))}')
+    print(f'{"path":>16} {"median ms":>10} {"best ms":>10} {"bytes":>10} {"speedup":>8}')
+    baseline = None
+    for name, (app, serialize) in paths.items():
+        result = time_path(app, serialize, args.repeat)
+        baseline = baseline or result['median_ms']
+        print(f'{name:>16} {result["median_ms"]:>10.2f} {result["best_ms"]:>10.2f} '
+              f'{result["bytes"]:>10} {baseline / result["median_ms"]:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
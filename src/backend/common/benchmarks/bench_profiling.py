@@ -0,0 +1,92 @@
+"""
+Benchmark: request overhead of the sampling profiler middleware.
+
+Serves one route that checks a batch of expenses in Python (about a millisecond of work, like a
+small /validate_expense) through Flask's test client, and times it with:
+- plain: an app without init_profiling,
+- unconfigured: init_profiling with no sample rate and no token; no hook is installed,
+- token_only: a PROFILE_TOKEN is set but requests do not send it; one environ lookup each,
+- sampled_<rate>: that fraction of requests profiled, e.g. 0.01 and 1.0.
+
+Prints the best and median time per request over --repeat runs of --requests requests, the
+configurations taking turns, and the overhead of the best run against plain. Below 2% is within noise for the off paths.
+
+Usage (from the repository root):
+    python -m src.backend.common.benchmarks.bench_profiling --requests 500 --repeat 30
+
+Requirements Addressed:
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import argparse
+import statistics
+import time
+
+# Flask==2.0.1
+from flask import Flask, jsonify
+
+# Internal dependencies
+from src.backend.common.profiling import SamplingProfiler, init_profiling
+
+EXPENSES = [{'amount': (n * 37) % 900, 'region': ('EU', 'US', 'APAC')[n % 3]} for n in range(400)]
+LIMITS = {'EU': 500, 'US': 750, 'APAC': 600}
+
+
+def build_app(**profiling):
+    """
+    Builds the benchmark app, set up by init_profiling when options are given.
+    """
+    app = Flask('bench_profiling')
+
+    @app.route('/validate_expense', methods=['POST'])
+    def validate_expense():
+        violations = [n for n, expense in enumerate(EXPENSES) if expense['amount'] > LIMITS[expense['region']]]
+        return jsonify({'violations': len(violations)})
+
+    if profiling:
+        init_profiling(app, **profiling)
+    return app
+
+
+def time_us(client, requests):
+    started = time.perf_counter()
+    for _ in range(requests):
+        client.post('/validate_expense')
+    return (time.perf_counter() - started) / requests * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=500, help='Requests per timed run.')
+    parser.add_argument('--repeat', type=int, default=30, help='Timed runs per configuration.')
+    parser.add_argument('--rates', default='0.01,1.0', help='Comma-separated sample rates.')
+    args = parser.parse_args()
+
+    configurations = [
+        ('plain', {}),
+        ('unconfigured', {'sample_rate': 0, 'token': ''}),
+        ('token_only', {'sample_rate': 0, 'token': 'bench-token'}),
+    ] + [(f'sampled_{rate}', {'sample_rate': float(rate), 'token': '', 'profiler': SamplingProfiler()})
+         for rate in args.rates.split(',')]
+
+    clients = {name: build_app(**options).test_client() for name, options in configurations}
+    timings = {name: [] for name in clients}
+    for client in clients.values():
+        time_us(client, 100)  # Warm-up
+    # Configurations take turns in each run, so that drift in the machine's speed hits them all.
+    for _ in range(args.repeat):
+        for name, client in clients.items():
+            timings[name].append(time_us(client, args.requests))
+
+    # The best run is the least disturbed by the rest of the machine; the median shows the spread.
+    baseline = min(timings['plain'])
+    print(f'{"configuration":>16} {"best us":>8} {"median us":>10} {"overhead":>9}')
+    for name, results in timings.items():
+        best = min(results)
+        print(f'{name:>16} {best:>8.1f} {statistics.median(results):>10.1f} {(best / baseline - 1) * 100:>8.1f}%')
+
+
+if __name__ == '__main__':
+    main()
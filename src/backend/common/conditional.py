@@ -0,0 +1,136 @@
+"""
+Conditional GET for versioned resources: strong ETags and a version-keyed LRU of payloads.
+
+A resource that carries a version counter, bumped on every write, names each of its
+representations by (resource key, version). That pair is the ETag. A client repeating a request
+with `If-None-Match` gets `304 Not Modified` once the server knows the current version, without
+the resource being loaded or serialized. Other clients get the serialized payload from a bounded
+LRU. An entry is only served for the version it was built at, so a version bump invalidates it,
+whichever worker made the write.
+
+This module only depends on Flask and the standard library, so that any service can import it.
+
+Requirements Addressed:
+- Reporting and Analytics
+  - Location: Technical Specification/5.6 Feature ID: F-006
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import threading
+from collections import OrderedDict
+
+# Flask==2.0.1
+from flask import Response, request  # Conditional request headers and raw JSON responses.
+
+# Internal dependency
+from .json_provider import dumps_bytes  # Shared JSON serialization
+from .metrics import metrics  # Shared in-process metrics
+
+# Responses may be stored by the client only, and must be revalidated before each reuse.
+CACHE_CONTROL = 'private, no-cache'
+
+
+class VersionedResponseCache:
+    """
+    Thread-safe LRU of serialized payloads keyed by resource, valid for one version each.
+
+    Attributes:
+        namespace (str): Prefix of the ETags, e.g. 'report'; distinguishes resource types.
+        maxsize (int): Maximum number of cached payloads.
+    """
+
+    def __init__(self, namespace, maxsize=1024):
+        """
+        Initializes an empty cache.
+
+        Parameters:
+        - namespace (str): ETag prefix for this resource type.
+        - maxsize (int): Maximum number of cached payloads.
+        """
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self._entries = OrderedDict()  # key -> (version, body)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def etag(self, key, version):
+        """
+        Returns the strong ETag (without quotes) of a resource version.
+        """
+        return f'{self.namespace}-{key}-v{version}'
+
+    def get(self, key, version):
+        """
+        Returns the cached payload of a resource version, or None. An entry cached for another
+        version is dropped.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != version:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key, version, body):
+        """
+        Stores the payload of a resource version, evicting the least recently used entries.
+        """
+        with self._lock:
+            self._entries[key] = (version, body)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        """Drops a resource's cached payload."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Drops all cached payloads."""
+        with self._lock:
+            self._entries.clear()
+
+    def respond(self, key, version, build):
+        """
+        Answers a GET for a versioned resource within a request.
+
+        Parameters:
+        - key: The resource's identifier, e.g. a report id.
+        - version (int): The resource's current version.
+        - build (callable): build() -> (version, payload); loads the resource and returns the
+          version it was loaded at and its JSON-serializable representation. Called only when
+          neither the client nor the cache holds the current version.
+
+        Returns:
+        - Response: 304 if If-None-Match names the current version, else 200 with the payload.
+          Both carry the ETag.
+        """
+        etag = self.etag(key, version)
+        if request.if_none_match.contains_weak(etag):
+            metrics.inc(f'{self.namespace}_not_modified')
+            return self._response(status=304, etag=etag)
+        body = self.get(key, version)
+        if body is None:
+            metrics.inc(f'{self.namespace}_cache_misses')
+            version, payload = build()
+            etag = self.etag(key, version)
+            body = dumps_bytes(payload)
+            self.put(key, version, body)
+        else:
+            metrics.inc(f'{self.namespace}_cache_hits')
+        return self._response(body, etag=etag)
+
+    @staticmethod
+    def _response(body=None, status=200, etag=None):
+        response = Response(body, status=status, mimetype='application/json')
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = CACHE_CONTROL
+        return response
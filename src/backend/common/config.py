@@ -0,0 +1,86 @@
+# Import necessary modules
+import os  # Standard library for operating system interactions
+
+"""
+Configuration settings for the helpers shared by the backend services: password hashing, the
+verified token cache and login rate limiting.
+Every service image copies src/backend/common, so these settings are read the same way by the
+authentication service, the main server and any other service using the helpers.
+
+Addressing Requirement:
+- Name: Secure User Authentication and Role-Based Authorization
+- Location: Technical Specification/5.1 Feature ID: F-001
+- Description: Implement secure login, multi-factor authentication, and role-based access levels.
+"""
+
+# Number of worker processes in the password hashing pool.
+# Internal Dependency: HASH_POOL_WORKERS from src/backend/common/config.py
+# Purpose: Sizes the process pool that runs bcrypt off the request thread; 0 means one worker per CPU core.
+HASH_POOL_WORKERS = int(os.getenv('HASH_POOL_WORKERS', '0'))
+
+# Number of hashing jobs allowed to wait behind busy pool workers.
+# Internal Dependency: HASH_POOL_MAX_PENDING from src/backend/common/config.py
+# Purpose: Bounds the hashing queue; requests beyond it are answered with 503 instead of piling up.
+HASH_POOL_MAX_PENDING = int(os.getenv('HASH_POOL_MAX_PENDING', '64'))
+
+# Seconds a request waits for a hashing result.
+# Internal Dependency: HASH_POOL_TIMEOUT from src/backend/common/config.py
+# Purpose: Prevents a request thread from waiting indefinitely on a stuck pool worker.
+HASH_POOL_TIMEOUT = float(os.getenv('HASH_POOL_TIMEOUT', '10'))
+
+# Maximum number of verified JWTs kept in the in-process token cache.
+# Internal Dependency: TOKEN_CACHE_SIZE from src/backend/common/config.py
+# Purpose: Bounds the memory used to skip repeated signature checks and user lookups.
+TOKEN_CACHE_SIZE = int(os.getenv('TOKEN_CACHE_SIZE', '10000'))
+
+# Longest time, in seconds, a verified JWT stays cached.
+# Internal Dependency: TOKEN_CACHE_MAX_TTL from src/backend/common/config.py
+# Purpose: Entries normally expire at the token's `exp`; this caps tokens issued without one.
+TOKEN_CACHE_MAX_TTL = float(os.getenv('TOKEN_CACHE_MAX_TTL', '3600'))
+
+# Preferred password hash scheme for new and upgraded hashes: 'bcrypt' or 'pbkdf2_sha256'.
+# Internal Dependency: PASSWORD_HASH_SCHEME from src/backend/common/config.py
+# Purpose: Hashes stored with another scheme are upgraded on the user's next successful login.
+PASSWORD_HASH_SCHEME = os.getenv('PASSWORD_HASH_SCHEME', 'bcrypt')
+
+# Target time, in milliseconds, for a single password hash on this host.
+# Internal Dependency: PASSWORD_HASH_TARGET_MS from src/backend/common/config.py
+# Purpose: Startup calibration picks the bcrypt cost and PBKDF2 iterations that meet it; 0 disables calibration.
+PASSWORD_HASH_TARGET_MS = float(os.getenv('PASSWORD_HASH_TARGET_MS', '250'))
+
+# Lowest bcrypt cost factor calibration may choose.
+# Internal Dependency: BCRYPT_MIN_ROUNDS from src/backend/common/config.py
+# Purpose: Keeps hashes at least as strong as bcrypt's default on fast hardware.
+BCRYPT_MIN_ROUNDS = int(os.getenv('BCRYPT_MIN_ROUNDS', '12'))
+
+# Lowest PBKDF2-SHA256 iteration count calibration may choose.
+# Internal Dependency: PBKDF2_MIN_ITERATIONS from src/backend/common/config.py
+# Purpose: Keeps PBKDF2 hashes at least as strong as the previous fixed iteration count.
+PBKDF2_MIN_ITERATIONS = int(os.getenv('PBKDF2_MIN_ITERATIONS', '100000'))
+
+# Backing store for login rate limiting: 'memory' (per process) or 'sqlite' (shared by workers on a host).
+# Internal Dependency: LOGIN_RATE_LIMIT_STORE from src/backend/common/config.py
+# Purpose: Token buckets must be shared for limits to hold across multiple worker processes.
+LOGIN_RATE_LIMIT_STORE = os.getenv('LOGIN_RATE_LIMIT_STORE', 'memory')
+
+# Path of the SQLite database holding shared login rate limit buckets.
+# Internal Dependency: LOGIN_RATE_LIMIT_SQLITE_PATH from src/backend/common/config.py
+# Purpose: Used when LOGIN_RATE_LIMIT_STORE is 'sqlite'; should be on local disk.
+LOGIN_RATE_LIMIT_SQLITE_PATH = os.getenv('LOGIN_RATE_LIMIT_SQLITE_PATH', '/tmp/login_rate_limit.db')
+
+# Login attempts a single client IP may burst, and its sustained rate per minute.
+# Internal Dependency: LOGIN_IP_BURST, LOGIN_IP_PER_MINUTE from src/backend/common/config.py
+# Purpose: Caps credential-stuffing from one address before any password hashing or database lookup.
+LOGIN_IP_BURST = int(os.getenv('LOGIN_IP_BURST', '20'))
+LOGIN_IP_PER_MINUTE = float(os.getenv('LOGIN_IP_PER_MINUTE', '30'))
+
+# Login attempts a single username may burst, and its sustained rate per minute.
+# Internal Dependency: LOGIN_USERNAME_BURST, LOGIN_USERNAME_PER_MINUTE from src/backend/common/config.py
+# Purpose: Caps password guessing against one account spread across many addresses.
+LOGIN_USERNAME_BURST = int(os.getenv('LOGIN_USERNAME_BURST', '5'))
+LOGIN_USERNAME_PER_MINUTE = float(os.getenv('LOGIN_USERNAME_PER_MINUTE', '5'))
+
+# Seconds between reloads of the role permission bitsets from the roles table.
+# Internal Dependency: ROLE_PERMISSIONS_TTL from src/backend/common/config.py
+# Purpose: Role changes committed by other worker processes take effect within this interval.
+ROLE_PERMISSIONS_TTL = float(os.getenv('ROLE_PERMISSIONS_TTL', '60'))
@@ -0,0 +1,446 @@
+"""
+Dedicated executor for password hashing and verification.
+
+bcrypt is deliberately CPU-expensive, so hashing on the request thread lets a burst of logins
+starve every other route. This module moves the work onto a process pool sized to the host's
+cores and puts a bounded number of pending jobs in front of it. When the pool is saturated,
+callers get HashingPoolFull immediately and the routes answer 503 instead of queueing; a job
+that does not finish within HASH_POOL_TIMEOUT raises HashingTimeout, which routes answer alike.
+
+The cost of a hash is calibrated once per process to PASSWORD_HASH_TARGET_MS on the current
+hardware. New hashes use the preferred scheme and calibrated cost. `needs_rehash` tells the login
+routes when a stored hash (an older scheme, or a lower cost) should be replaced with the password
+the user just proved. Worker-side hash times are recorded in the `password_hash_seconds` and
+`password_verify_seconds` histograms.
+
+Requirements Addressed:
+- Secure User Authentication and Role-Based Authorization
+  - Location: Technical Specification/5.1 Feature ID: F-001
+    - TR-F001.1: Implement secure login using unique username and password.
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+
+# bcrypt==3.2.0
+import bcrypt  # Password hashing and verification.
+
+# Internal dependencies
+from .config import HASH_POOL_WORKERS, HASH_POOL_MAX_PENDING, HASH_POOL_TIMEOUT
+from .config import PASSWORD_HASH_SCHEME, PASSWORD_HASH_TARGET_MS, BCRYPT_MIN_ROUNDS, PBKDF2_MIN_ITERATIONS
+from .metrics import metrics
+
+# Identifier of PBKDF2 hashes: 'pbkdf2_sha256$<iterations>$<salt hex>$<key hex>'.
+PBKDF2_SCHEME = 'pbkdf2_sha256'
+# Iteration count of the older 'key hex:salt hex' PBKDF2 format, which does not record it.
+LEGACY_PBKDF2_ITERATIONS = 100000
+
+# Hash parameters for new passwords.
+# - scheme (str): 'bcrypt' or 'pbkdf2_sha256'.
+# - bcrypt_rounds (int): bcrypt cost factor.
+# - pbkdf2_iterations (int): PBKDF2-SHA256 iteration count.
+HashCost = namedtuple('HashCost', ['scheme', 'bcrypt_rounds', 'pbkdf2_iterations'])
+
+
+class HashingPoolFull(Exception):
+    """
+    Raised when the hashing executor already holds its maximum number of pending jobs.
+
+    Routes translate this into a 503 response so that clients back off and retry.
+    """
+
+
+class HashingTimeout(HashingPoolFull):
+    """
+    Raised when a hashing job does not finish within the executor's timeout.
+
+    A HashingPoolFull, so that routes answer a pool too slow to keep up with the same 503 as a
+    full one. The job itself keeps its worker until it finishes.
+    """
+
+
+def bcrypt_hash(password, rounds=None):
+    """
+    Hashes a plain text password with bcrypt. Runs inside a pool worker process.
+
+    Parameters:
+    - password (str): The plain text password to hash.
+    - rounds (int, optional): The bcrypt cost factor; bcrypt's default when omitted.
+
+    Returns:
+    - str: The bcrypt hash.
+    """
+    salt = bcrypt.gensalt(rounds) if rounds else bcrypt.gensalt()
+    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+
+
+def bcrypt_check(password, hashed_password):
+    """
+    Checks a plain text password against a bcrypt hash. Runs inside a pool worker process.
+
+    Parameters:
+    - password (str): The plain text password to verify.
+    - hashed_password (str): The stored bcrypt hash.
+
+    Returns:
+    - bool: True if the password matches, False otherwise.
+    """
+    return bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
+
+
+def pbkdf2_hash(password, iterations):
+    """
+    Hashes a plain text password with PBKDF2-SHA256 and a random salt. Runs inside a pool worker.
+
+    Parameters:
+    - password (str): The plain text password to hash.
+    - iterations (int): The iteration count, recorded in the hash.
+
+    Returns:
+    - str: 'pbkdf2_sha256$<iterations>$<salt hex>$<key hex>'.
+    """
+    salt = os.urandom(16)
+    key = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations)
+    return f'{PBKDF2_SCHEME}${iterations}${salt.hex()}${key.hex()}'
+
+
+def pbkdf2_check(password, hashed_password):
+    """
+    Checks a plain text password against a PBKDF2 hash, in the current or the legacy format.
+    """
+    if hashed_password.startswith(PBKDF2_SCHEME + '$'):
+        _, iterations, salt, stored_key = hashed_password.split('$')
+        iterations = int(iterations)
+    else:
+        stored_key, salt = hashed_password.split(':')
+        iterations = LEGACY_PBKDF2_ITERATIONS
+    key = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), bytes.fromhex(salt), iterations)
+    return hmac.compare_digest(key.hex(), stored_key)
+
+
+def check_hash(password, hashed_password):
+    """
+    Checks a password against a bcrypt or PBKDF2 hash. Runs inside a pool worker process.
+    """
+    if identify_hash(hashed_password)[0] == 'bcrypt':
+        return bcrypt_check(password, hashed_password)
+    return pbkdf2_check(password, hashed_password)
+
+
+def identify_hash(hashed_password):
+    """
+    Returns the scheme and work factor of a stored hash.
+
+    Parameters:
+    - hashed_password (str): A bcrypt hash, a 'pbkdf2_sha256$...' hash or a legacy 'key:salt' hash.
+
+    Returns:
+    - tuple: (scheme, cost), e.g. ('bcrypt', 12) or ('pbkdf2_sha256', 100000).
+
+    Raises:
+    - ValueError: If the format is not recognised.
+    """
+    if hashed_password.startswith('$2'):
+        return 'bcrypt', int(hashed_password.split('$')[2])
+    if hashed_password.startswith(PBKDF2_SCHEME + '$'):
+        return PBKDF2_SCHEME, int(hashed_password.split('$')[1])
+    if ':' in hashed_password:
+        return PBKDF2_SCHEME, LEGACY_PBKDF2_ITERATIONS
+    raise ValueError('Unrecognised password hash format.')
+
+
+def _timed(fn, *args):
+    # Runs inside a pool worker; the caller records the duration in the parent process.
+    start = time.perf_counter()
+    value = fn(*args)
+    return value, time.perf_counter() - start
+
+
+def calibrate_hash_cost(target_ms=None, scheme=None):
+    """
+    Picks the bcrypt cost and PBKDF2 iteration count that meet a per-hash latency target here.
+
+    Parameters:
+    - target_ms (float, optional): Target milliseconds per hash; defaults to PASSWORD_HASH_TARGET_MS.
+    - scheme (str, optional): Preferred scheme; defaults to PASSWORD_HASH_SCHEME.
+
+    Returns:
+    - HashCost: The calibrated parameters, never below BCRYPT_MIN_ROUNDS and PBKDF2_MIN_ITERATIONS.
+
+    Steps:
+    - Time one bcrypt hash at BCRYPT_MIN_ROUNDS; each extra round doubles the cost, so add rounds
+      while the doubled time stays within the target.
+    - Time a short PBKDF2 run and scale the iteration count linearly to the target.
+    """
+    target_ms = PASSWORD_HASH_TARGET_MS if target_ms is None else target_ms
+    scheme = scheme or PASSWORD_HASH_SCHEME
+    if scheme not in ('bcrypt', PBKDF2_SCHEME):
+        raise ValueError(f'Unsupported password hash scheme: {scheme}')
+    if target_ms <= 0:
+        return HashCost(scheme, BCRYPT_MIN_ROUNDS, PBKDF2_MIN_ITERATIONS)
+    target = target_ms / 1000.0
+
+    _, elapsed = _timed(bcrypt_hash, 'calibration', BCRYPT_MIN_ROUNDS)
+    rounds = BCRYPT_MIN_ROUNDS
+    while rounds < 31 and elapsed * 2 <= target:
+        elapsed *= 2
+        rounds += 1
+
+    sample = 20000
+    _, elapsed = _timed(pbkdf2_hash, 'calibration', sample)
+    iterations = int(sample * target / elapsed) // 1000 * 1000
+    return HashCost(scheme, rounds, max(iterations, PBKDF2_MIN_ITERATIONS))
+
+
+# Process-wide calibrated cost.
+_hash_cost = None
+_hash_cost_lock = threading.Lock()
+
+
+def get_hash_cost():
+    """
+    Returns the process-wide HashCost, calibrating on first use.
+
+    The apps call this when the server starts (create_app, initialize_main_server), not on
+    import, so that no request pays for the calibration.
+    """
+    global _hash_cost
+    if _hash_cost is None:
+        with _hash_cost_lock:
+            if _hash_cost is None:
+                _hash_cost = calibrate_hash_cost()
+    return _hash_cost
+
+
+def needs_rehash(hashed_password, cost=None):
+    """
+    Tells whether a stored hash should be replaced after a successful login.
+
+    A hash needs upgrading when it uses another scheme than the preferred one, the legacy
+    PBKDF2 format, or a lower work factor than the calibrated one. Hashes with a higher work
+    factor are kept, so moving to faster hardware never weakens them.
+
+    Parameters:
+    - hashed_password (str): The stored hash.
+    - cost (HashCost, optional): Defaults to the process-wide calibrated cost.
+
+    Returns:
+    - bool: True if the password should be hashed again.
+    """
+    cost = cost or get_hash_cost()
+    try:
+        scheme, work = identify_hash(hashed_password)
+    except ValueError:
+        return True
+    if scheme != cost.scheme:
+        return True
+    if scheme == 'bcrypt':
+        return work < cost.bcrypt_rounds
+    return not hashed_password.startswith(PBKDF2_SCHEME + '$') or work < cost.pbkdf2_iterations
+
+
+class HashingExecutor:
+    """
+    A process pool with a bounded admission queue for CPU-bound password work.
+
+    At most `workers + max_pending` jobs are in flight at any time. Further submissions are
+    rejected with HashingPoolFull rather than blocking the calling request thread.
+
+    Attributes:
+        workers (int): Number of worker processes.
+        max_pending (int): Number of jobs allowed to wait behind the busy workers.
+        timeout (float): Seconds a caller waits for a result before giving up.
+    """
+
+    def __init__(self, workers=None, max_pending=None, timeout=None):
+        """
+        Initializes the executor. The worker processes are started on first submission.
+
+        Parameters:
+        - workers (int, optional): Pool size; defaults to HASH_POOL_WORKERS or the CPU count.
+        - max_pending (int, optional): Queue bound; defaults to HASH_POOL_MAX_PENDING.
+        - timeout (float, optional): Result timeout in seconds; defaults to HASH_POOL_TIMEOUT.
+        """
+        self.workers = workers or HASH_POOL_WORKERS or os.cpu_count() or 1
+        self.max_pending = HASH_POOL_MAX_PENDING if max_pending is None else max_pending
+        self.timeout = timeout or HASH_POOL_TIMEOUT
+        self._slots = threading.BoundedSemaphore(self.workers + self.max_pending)
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self):
+        # Create the pool lazily so that importing this module never forks processes.
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def submit(self, fn, *args):
+        """
+        Schedules fn(*args) on the pool if there is room.
+
+        Parameters:
+        - fn (callable): A module-level (picklable) function.
+        - *args: Positional arguments for fn.
+
+        Returns:
+        - concurrent.futures.Future: The pending result.
+
+        Raises:
+        - HashingPoolFull: If the bounded queue is already full.
+        """
+        if not self._slots.acquire(blocking=False):
+            raise HashingPoolFull('Password hashing pool is at capacity.')
+        try:
+            future = self._get_pool().submit(fn, *args)
+        except Exception:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def run(self, fn, *args):
+        """
+        Runs fn(*args) on the pool and waits for the result.
+
+        Raises:
+        - HashingPoolFull: If the bounded queue is already full.
+        - HashingTimeout: If the result is not ready within the timeout.
+        """
+        future = self.submit(fn, *args)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            raise HashingTimeout(f'Password hashing did not finish within {self.timeout}s.') from None
+
+    def _run_timed(self, metric, fn, *args):
+        # Runs fn on the pool and records the worker-side duration, excluding queueing.
+        value, seconds = self.run(_timed, fn, *args)
+        metrics.observe(metric, seconds)
+        return value
+
+    def _hash_job(self, rounds=None):
+        # The hash function and work factor for new hashes.
+        cost = get_hash_cost()
+        if rounds is None and cost.scheme == PBKDF2_SCHEME:
+            return pbkdf2_hash, cost.pbkdf2_iterations
+        return bcrypt_hash, rounds or cost.bcrypt_rounds
+
+    def hash_password(self, password, rounds=None):
+        """
+        Hashes a password on the pool with the preferred scheme and calibrated cost.
+
+        Parameters:
+        - password (str): The plain text password.
+        - rounds (int, optional): Forces bcrypt with this cost factor.
+        """
+        fn, work = self._hash_job(rounds)
+        return self._run_timed('password_hash_seconds', fn, password, work)
+
+    def check_password(self, password, hashed_password):
+        """Verifies a password against a bcrypt or PBKDF2 hash on the pool."""
+        return self._run_timed('password_verify_seconds', check_hash, password, hashed_password)
+
+    def submit_hash(self, password):
+        """
+        Schedules hash_password's work without waiting, for callers on an event loop.
+
+        Returns:
+        - concurrent.futures.Future: The future hash; await it with asyncio.wrap_future.
+
+        Raises:
+        - HashingPoolFull: If the bounded queue is already full.
+        """
+        fn, work = self._hash_job()
+        return self.submit(fn, password, work)
+
+    def submit_check(self, password, hashed_password):
+        """
+        Schedules check_password's work without waiting, for callers on an event loop.
+
+        Returns:
+        - concurrent.futures.Future: The future result of the verification.
+        """
+        return self.submit(check_hash, password, hashed_password)
+
+    def hash_many(self, passwords, rounds=None):
+        """
+        Hashes a batch of passwords in parallel, for bulk provisioning.
+
+        At most `workers` batch jobs are in flight at once, so interactive logins keep the
+        pending slots. When the pool is full the batch waits for its own oldest job instead
+        of failing.
+
+        Parameters:
+        - passwords (list of str): The plain text passwords.
+        - rounds (int, optional): Forces bcrypt with this cost factor.
+
+        Returns:
+        - list of str: The hashes, in input order.
+
+        Raises:
+        - HashingTimeout: If a job's result is not ready within the timeout.
+        """
+        fn, work = self._hash_job(rounds)
+        results = [None] * len(passwords)
+        in_flight = deque()
+
+        def collect_oldest():
+            index, future = in_flight.popleft()
+            try:
+                results[index], seconds = future.result(timeout=self.timeout)
+            except FutureTimeout:
+                raise HashingTimeout(f'Password hashing did not finish within {self.timeout}s.') from None
+            metrics.observe('password_hash_seconds', seconds)
+
+        for index, password in enumerate(passwords):
+            while True:
+                if len(in_flight) >= self.workers:
+                    collect_oldest()
+                try:
+                    in_flight.append((index, self.submit(_timed, fn, password, work)))
+                    break
+                except HashingPoolFull:
+                    if in_flight:
+                        collect_oldest()
+                    else:
+                        time.sleep(0.01)
+        while in_flight:
+            collect_oldest()
+        return results
+
+    def shutdown(self, wait=True):
+        """Stops the worker processes. A later submission starts a fresh pool."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=wait)
+                self._pool = None
+
+
+# Process-wide executor shared by the authentication utilities and the main server models.
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_hashing_executor():
+    """
+    Returns the process-wide HashingExecutor, creating it on first use.
+
+    Returns:
+    - HashingExecutor: The shared executor.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = HashingExecutor()
+    return _executor
@@ -0,0 +1,237 @@
+"""
+Shared JSON serialization for the Flask services: a fast pluggable backend, native Decimal and
+date handling, and NDJSON streaming for list responses.
+
+`init_json(app)` makes `jsonify` (and every route returning a dict or list) serialize through
+`dumps_bytes`. That uses orjson when it is installed and falls back to the standard library
+otherwise. Both backends write the same compact UTF-8 JSON:
+- Decimal as a string, so that amounts keep their exact digits,
+- date, time and datetime as ISO 8601 strings,
+- UUIDs as strings and dataclasses as objects,
+- dict keys in insertion order, as the models' to_dict build them.
+
+A list endpoint can also answer `Accept: application/x-ndjson` with one JSON document per line,
+written while the rows are serialized (see `wants_ndjson` and `ndjson_response`).
+
+This module only depends on Flask and the standard library; orjson is optional.
+
+Requirements Addressed:
+- Reporting and Analytics
+  - Location: Technical Specification/5.6 Feature ID: F-006
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import dataclasses
+import datetime
+import decimal
+import json
+import os
+import uuid
+
+# Flask==2.0.1
+from flask import Response, has_request_context, request, stream_with_context
+
+try:
+    # Flask 2.2 and later: pluggable JSON providers.
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:  # Flask < 2.2 configures an encoder class instead.
+    DefaultJSONProvider = None
+
+try:
+    import orjson  # Optional (orjson>=3.6): several times faster than the standard library.
+except ImportError:
+    orjson = None
+
+# JSON_BACKEND: 'auto' (orjson when installed, else the standard library), 'orjson' or 'stdlib'.
+JSON_BACKEND = os.getenv('JSON_BACKEND', 'auto')
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+
+def _default(obj):
+    # Types neither backend serializes on its own. Raises TypeError for anything else.
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if isinstance(obj, (datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+
+
+def _stdlib_dumps(obj, sort_keys=False, indent=None):
+    separators = (',', ':') if indent is None else (',', ': ')
+    return json.dumps(obj, default=_default, ensure_ascii=False, sort_keys=sort_keys,
+                      indent=indent, separators=separators).encode('utf-8')
+
+
+def _orjson_dumps(obj, sort_keys=False, indent=None):
+    # orjson writes date, time, datetime, UUID and dataclass values natively, in the same format as _default.
+    option = orjson.OPT_NON_STR_KEYS
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(obj, default=_default, option=option)
+    except TypeError:
+        # orjson.JSONEncodeError: e.g. integers beyond 64 bits, or keys it cannot convert.
+        return _stdlib_dumps(obj, sort_keys=sort_keys, indent=indent)
+
+
+BACKENDS = {'stdlib': _stdlib_dumps}
+if orjson is not None:
+    BACKENDS['orjson'] = _orjson_dumps
+
+
+def resolve_backend(name=None):
+    """
+    Returns the name of the backend to serialize with.
+
+    Parameters:
+    - name (str): 'auto', 'orjson' or 'stdlib'; defaults to JSON_BACKEND.
+
+    Returns:
+    - str: 'orjson' or 'stdlib'.
+
+    Raises:
+    - ValueError: If the backend is unknown, or is 'orjson' and orjson is not installed.
+    """
+    name = name or JSON_BACKEND
+    if name == 'auto':
+        return 'orjson' if 'orjson' in BACKENDS else 'stdlib'
+    if name not in BACKENDS:
+        raise ValueError(f'Unavailable JSON backend: {name!r} (available: {", ".join(sorted(BACKENDS))})')
+    return name
+
+
+_backend = resolve_backend()
+
+
+def dumps_bytes(obj, sort_keys=False, indent=None, backend=None):
+    """
+    Serializes an object to compact UTF-8 JSON.
+
+    Parameters:
+    - obj: The object.
+    - sort_keys (bool): Whether to sort object keys.
+    - indent (int): Pretty-print with this indent (orjson always indents by 2).
+    - backend (str): Overrides the configured backend, e.g. for benchmarks.
+
+    Returns:
+    - bytes: The JSON document.
+    """
+    dumps = BACKENDS[resolve_backend(backend)] if backend else BACKENDS[_backend]
+    return dumps(obj, sort_keys=sort_keys, indent=indent)
+
+
+def loads(data):
+    """
+    Parses a JSON document (str or bytes) with the configured backend.
+    """
+    if _backend == 'orjson':
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+if DefaultJSONProvider is not None:
+
+    class FastJSONProvider(DefaultJSONProvider):
+        """
+        Flask JSON provider serializing with dumps_bytes.
+
+        Keys are written in insertion order unless sort_keys is set; responses are indented only
+        in debug mode, as with Flask's default provider.
+        """
+
+        sort_keys = False
+
+        def __init__(self, app, backend=None):
+            super().__init__(app)
+            self.backend = backend
+
+        def dumps(self, obj, **kwargs):
+            return dumps_bytes(obj, sort_keys=kwargs.get('sort_keys', self.sort_keys),
+                               indent=kwargs.get('indent'), backend=self.backend).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return loads(s)
+
+        def response(self, *args, **kwargs):
+            obj = self._prepare_response_obj(args, kwargs)
+            indent = 2 if self.compact is False or (self.compact is None and self._app.debug) else None
+            body = dumps_bytes(obj, sort_keys=self.sort_keys, indent=indent, backend=self.backend)
+            return self._app.response_class(body + b'\n', mimetype=self.mimetype)
+
+else:
+    FastJSONProvider = None
+
+
+class FastJSONEncoder(json.JSONEncoder):
+    """
+    Encoder for Flask < 2.2, whose jsonify calls json.dumps with the app's encoder class.
+    Compact documents go through dumps_bytes; indented ones through the standard library.
+    """
+
+    def default(self, o):
+        return _default(o)
+
+    def encode(self, o):
+        if self.indent is None:
+            return dumps_bytes(o, sort_keys=self.sort_keys).decode('utf-8')
+        return super().encode(o)
+
+
+def init_json(app, backend=None):
+    """
+    Makes a Flask app serialize its JSON responses with dumps_bytes.
+
+    Parameters:
+    - app (Flask): The application.
+    - backend (str): Overrides JSON_BACKEND for this app.
+
+    Returns:
+    - Flask: The application.
+    """
+    if FastJSONProvider is not None:
+        app.json = FastJSONProvider(app, backend=backend)
+    else:
+        app.json_encoder = FastJSONEncoder
+        app.config['JSON_SORT_KEYS'] = False
+    return app
+
+
+def wants_ndjson():
+    """
+    Returns whether the current request prefers NDJSON to a JSON document.
+    """
+    best = request.accept_mimetypes.best_match(['application/json', NDJSON_MIMETYPE])
+    return best == NDJSON_MIMETYPE
+
+
+def ndjson_response(items, status=200, headers=None, backend=None):
+    """
+    Streams an iterable as newline-delimited JSON, one item per line.
+
+    Items are serialized while the response is written, within the request context, so the
+    response starts before the last row is serialized and the rows are never held as one document.
+
+    Parameters:
+    - items (iterable): JSON-serializable items, e.g. a generator of to_dict() results.
+    - status (int): The response status.
+    - headers (dict): Extra response headers, e.g. the cursor of the next page.
+    - backend (str): Overrides the configured backend.
+
+    Returns:
+    - Response: A streamed application/x-ndjson response.
+    """
+    def generate():
+        for item in items:
+            yield dumps_bytes(item, backend=backend) + b'\n'
+
+    body = stream_with_context(generate()) if has_request_context() else generate()
+    return Response(body, status=status, headers=headers, mimetype=NDJSON_MIMETYPE)
@@ -0,0 +1,212 @@
+"""
+Local verification of authentication service tokens against its published JWKS.
+
+The authentication service signs tokens with a private Ed25519 or RSA key and publishes the public
+keys at `/.well-known/jwks.json`. Other services (policy engine, reporting module, notification
+service) verify tokens with `JWKSVerifier`. It needs no shared secret and makes no call to the
+authentication service per request. Public keys are fetched once and kept in memory by `kid`. An
+unknown `kid` (after a key rotation) triggers a rate-limited refetch, and the whole set is
+refreshed periodically so that retired keys drop out.
+
+This module only depends on PyJWT, cryptography and the standard library, so that any service can
+import it without loading the authentication service's configuration.
+
+Requirements Addressed:
+- Secure User Authentication and Role-Based Authorization
+  - Location: Technical Specification/5.1 Feature ID: F-001
+    - TR-F001.4: Define role-based access levels.
+- System Integrations
+  - Location: Technical Specification/5.9 Feature ID: F-009
+"""
+
+# Standard library
+import base64
+import json
+import logging
+import threading
+import time
+import urllib.request
+from functools import wraps
+
+# Flask==2.0.1
+from flask import request, jsonify, g  # Request access for the require_token decorator.
+
+# PyJWT==2.3.0
+import jwt  # Token decoding and signature verification.
+
+# cryptography==3.4.8
+from cryptography.hazmat.primitives.asymmetric import rsa  # RSA public keys from JWK members.
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey  # Ed25519 keys.
+
+logger = logging.getLogger(__name__)
+
+# Signature algorithms accepted from the authentication service. HS256 is deliberately absent.
+SUPPORTED_ALGORITHMS = ('EdDSA', 'RS256')
+
+
+def b64url_decode(value):
+    """Decodes unpadded base64url, as used by JWK members."""
+    return base64.urlsafe_b64decode(value + '=' * (-len(value) % 4))
+
+
+def key_from_jwk(jwk):
+    """
+    Builds a public key object from a JWK dictionary.
+
+    Parameters:
+    - jwk (dict): An 'OKP' (Ed25519) or 'RSA' JSON Web Key.
+
+    Returns:
+    - tuple: (public key, algorithm name).
+
+    Raises:
+    - ValueError: If the key type or curve is not supported.
+    """
+    kty = jwk.get('kty')
+    if kty == 'OKP' and jwk.get('crv') == 'Ed25519':
+        return Ed25519PublicKey.from_public_bytes(b64url_decode(jwk['x'])), 'EdDSA'
+    if kty == 'RSA':
+        n = int.from_bytes(b64url_decode(jwk['n']), 'big')
+        e = int.from_bytes(b64url_decode(jwk['e']), 'big')
+        return rsa.RSAPublicNumbers(e, n).public_key(), jwk.get('alg', 'RS256')
+    raise ValueError(f'Unsupported JWK type: {kty} {jwk.get("crv", "")}'.strip())
+
+
+def _fetch_json(url, timeout):
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return json.loads(response.read().decode('utf-8'))
+
+
+class JWKSVerifier:
+    """
+    Verifies JWTs locally with public keys from a JWKS endpoint, cached in memory by `kid`.
+
+    Attributes:
+        jwks_url (str): URL of the authentication service's `/.well-known/jwks.json`.
+        cache_ttl (float): Seconds after which the key set is refetched on the next verification.
+        min_refresh_interval (float): Minimum seconds between fetches triggered by unknown `kid`s.
+        timeout (float): HTTP timeout for fetching the key set.
+    """
+
+    def __init__(self, jwks_url, cache_ttl=300, min_refresh_interval=30, timeout=2,
+                 audience=None, issuer=None, leeway=0, fetch=None):
+        """
+        Initializes the verifier. No request is made until the first token is verified.
+
+        Parameters:
+        - jwks_url (str): The JWKS endpoint.
+        - cache_ttl (float): Key set lifetime in seconds.
+        - min_refresh_interval (float): Rate limit for refetches on unknown `kid`s.
+        - timeout (float): HTTP timeout in seconds.
+        - audience (str, optional): Required `aud` claim.
+        - issuer (str, optional): Required `iss` claim.
+        - leeway (float): Clock skew tolerance for `exp` and `nbf`, in seconds.
+        - fetch (callable, optional): fetch(url, timeout) -> JWKS dict; replaces the HTTP fetch.
+        """
+        self.jwks_url = jwks_url
+        self.cache_ttl = cache_ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+        self.audience = audience
+        self.issuer = issuer
+        self.leeway = leeway
+        self._fetch = fetch or _fetch_json
+        self._keys = {}  # kid -> (public key, algorithm)
+        self._fetched_at = None
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """
+        Fetches the key set and replaces the cached keys.
+
+        A failed fetch keeps the current keys, so a brief outage of the authentication service
+        does not stop verification of tokens signed with keys that are already known.
+
+        Returns:
+        - bool: True if the key set was fetched.
+        """
+        with self._lock:
+            self._fetched_at = time.monotonic()
+            try:
+                document = self._fetch(self.jwks_url, self.timeout)
+            except Exception as e:
+                logger.warning('Could not fetch JWKS from %s: %s', self.jwks_url, e)
+                return False
+            keys = {}
+            for jwk in document.get('keys', []):
+                if jwk.get('use', 'sig') != 'sig' or 'kid' not in jwk:
+                    continue
+                try:
+                    keys[jwk['kid']] = key_from_jwk(jwk)
+                except (ValueError, KeyError) as e:
+                    logger.warning('Skipping JWK %s: %s', jwk.get('kid'), e)
+            self._keys = keys
+            return True
+
+    def get_key(self, kid):
+        """
+        Returns the (public key, algorithm) for a `kid`, fetching the key set when needed.
+
+        Parameters:
+        - kid (str): The key id from the token header.
+
+        Returns:
+        - tuple or None: The key and algorithm, or None if the key is not published.
+        """
+        now = time.monotonic()
+        fetched_at = self._fetched_at
+        stale = fetched_at is None or now - fetched_at >= self.cache_ttl
+        key = self._keys.get(kid)
+        if key is None or stale:
+            may_refetch = fetched_at is None or now - fetched_at >= self.min_refresh_interval
+            if stale or may_refetch:
+                self.refresh()
+                key = self._keys.get(kid)
+        return key
+
+    def verify(self, token):
+        """
+        Verifies a token's signature and standard claims.
+
+        Parameters:
+        - token (str): The encoded JWT.
+
+        Returns:
+        - dict: The decoded claims.
+
+        Raises:
+        - jwt.InvalidTokenError: If the token is malformed, signed with an unknown key or
+          algorithm, expired, or fails the audience or issuer check.
+        """
+        header = jwt.get_unverified_header(token)
+        kid = header.get('kid')
+        if not kid:
+            raise jwt.InvalidTokenError('Token has no key id.')
+        key = self.get_key(kid)
+        if key is None:
+            raise jwt.InvalidTokenError(f'Unknown signing key: {kid}.')
+        public_key, algorithm = key
+        if header.get('alg') != algorithm or algorithm not in SUPPORTED_ALGORITHMS:
+            raise jwt.InvalidTokenError('Token algorithm does not match its key.')
+        options = {'verify_aud': self.audience is not None}
+        return jwt.decode(token, public_key, algorithms=[algorithm], audience=self.audience,
+                          issuer=self.issuer, leeway=self.leeway, options=options)
+
+    def require_token(self, view):
+        """
+        Route decorator that verifies the Bearer token locally.
+
+        The decoded claims are available to the view as `flask.g.token_claims`.
+        Responds with 401 when the token is missing or invalid.
+        """
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            auth_header = request.headers.get('Authorization', '')
+            if not auth_header.startswith('Bearer '):
+                return jsonify({'message': 'Missing authorization token.'}), 401
+            try:
+                g.token_claims = self.verify(auth_header[len('Bearer '):])
+            except jwt.InvalidTokenError as e:
+                return jsonify({'message': 'Invalid or expired token.', 'error': str(e)}), 401
+            return view(*args, **kwargs)
+        return wrapper
@@ -0,0 +1,101 @@
+"""
+In-process metrics for the backend services.
+
+A small registry of counters, histograms and gauges that each service's subsystems record into and
+that its `/metrics` route serves as JSON. It has no external dependencies, and each worker process
+reports its own numbers.
+
+Requirements Addressed:
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import bisect
+import threading
+
+# Default histogram bucket upper bounds, in seconds.
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Histogram:
+    """
+    Cumulative-free bucketed histogram with a running count and sum.
+
+    Attributes:
+        buckets (tuple of float): Upper bounds of the buckets; larger values land in '+Inf'.
+    """
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+
+    def observe(self, value):
+        """Records one observation. Caller holds the registry lock."""
+        self._counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._count += 1
+        self._sum += value
+
+    def snapshot(self):
+        """Returns the bucket counts, total count and sum."""
+        labels = [str(bound) for bound in self.buckets] + ['+Inf']
+        return {
+            'buckets': dict(zip(labels, self._counts)),
+            'count': self._count,
+            'sum': self._sum,
+        }
+
+
+class MetricsRegistry:
+    """
+    Thread-safe collection of named counters, histograms and gauges.
+    """
+
+    def __init__(self):
+        self._counters = {}
+        self._histograms = {}
+        self._gauges = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name, amount=1):
+        """Increments a counter, creating it at zero on first use."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + amount
+
+    def observe(self, name, value, buckets=DEFAULT_BUCKETS):
+        """Records a value in a histogram, creating it with the given buckets on first use."""
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram(buckets)
+            histogram.observe(value)
+
+    def gauge(self, name, fn):
+        """Registers a callable whose current value is read at snapshot time."""
+        with self._lock:
+            self._gauges[name] = fn
+
+    def snapshot(self):
+        """
+        Returns every metric's current value.
+
+        Returns:
+        - dict: {'counters': {...}, 'histograms': {...}, 'gauges': {...}}
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {name: h.snapshot() for name, h in self._histograms.items()}
+            gauges = dict(self._gauges)
+        gauge_values = {}
+        for name, fn in gauges.items():
+            try:
+                gauge_values[name] = fn()
+            except Exception:
+                gauge_values[name] = None
+        return {'counters': counters, 'histograms': histograms, 'gauges': gauge_values}
+
+
+# Process-wide registry.
+metrics = MetricsRegistry()
@@ -0,0 +1,206 @@
+"""
+Role-based permissions compiled into integer bitsets.
+
+Each permission is one bit of `Permission`. A role's permissions are the OR of its bits, compiled
+once per process by `PermissionRegistry` from the defaults below, overridden per role by the
+`roles.permissions` column where the authentication service has one. Tokens carry the user's
+bitset as the compact `perm` claim, so a route guard authorizes with one bitwise AND on claims it
+already holds, with no role name comparison and no query.
+
+Bit positions are part of issued tokens and stored role rows: append new permissions, never
+renumber or reuse a bit.
+
+This module only depends on Flask and the standard library, so that any service can import it
+without loading the authentication service's configuration.
+
+Requirements Addressed:
+- Secure User Authentication and Role-Based Authorization
+  - Location: Technical Specification/5.1 Feature ID: F-001
+    - TR-F001.4: Define role-based access levels for Employees, Managers, Finance Team, and Administrators.
+"""
+
+# Standard library
+import enum
+import logging
+import threading
+import time
+from functools import wraps
+
+# Flask==2.0.1
+from flask import jsonify, g  # Responses and request-scoped claims for the require_permissions decorator.
+
+logger = logging.getLogger(__name__)
+
+# The token claim holding the user's permission bitset.
+PERMISSIONS_CLAIM = 'perm'
+
+
+class Permission(enum.IntFlag):
+    """
+    Individual permissions, one bit each.
+    """
+    SUBMIT_EXPENSES = 1 << 0
+    VIEW_REPORTS = 1 << 1
+    APPROVE_EXPENSES = 1 << 2
+    PROCESS_REIMBURSEMENTS = 1 << 3
+    VIEW_ANALYTICS = 1 << 4
+    SEND_NOTIFICATIONS = 1 << 5
+    MANAGE_POLICIES = 1 << 6
+    MANAGE_USERS = 1 << 7
+    IMPORT_EXPENSES = 1 << 8
+
+
+ALL_PERMISSIONS = int(sum(Permission))
+
+_EMPLOYEE = Permission.SUBMIT_EXPENSES | Permission.VIEW_REPORTS
+
+# Permissions of the built-in roles (TR-F001.4). A role stored without its own bitset uses these.
+DEFAULT_ROLE_PERMISSIONS = {
+    'Employee': int(_EMPLOYEE),
+    'Manager': int(_EMPLOYEE | Permission.APPROVE_EXPENSES | Permission.VIEW_ANALYTICS
+                   | Permission.SEND_NOTIFICATIONS),
+    'Finance': int(_EMPLOYEE | Permission.PROCESS_REIMBURSEMENTS | Permission.VIEW_ANALYTICS
+                   | Permission.SEND_NOTIFICATIONS | Permission.MANAGE_POLICIES
+                   | Permission.IMPORT_EXPENSES),
+    'Administrator': ALL_PERMISSIONS,
+}
+
+# Other spellings of the built-in roles used across the services.
+ROLE_ALIASES = {
+    'Finance Team': 'Finance',
+    'Admin': 'Administrator',
+}
+
+
+def has_permissions(granted, required):
+    """
+    Tells whether a permission bitset includes every required bit.
+
+    Parameters:
+    - granted (int): The user's bitset.
+    - required (int): The bits the operation needs.
+
+    Returns:
+    - bool: True if all required bits are granted.
+    """
+    return granted & required == required
+
+
+class PermissionRegistry:
+    """
+    Role name -> permission bitset, compiled once and refreshed when roles change.
+
+    Lookups read a plain dictionary. The dictionary is rebuilt after invalidate() (called when
+    this process commits a role change) and, when a loader is set, after `ttl` seconds, so that
+    role changes made by other processes are picked up too.
+
+    Attributes:
+        ttl (float): Seconds between reloads from the loader; 0 disables periodic reloads.
+    """
+
+    def __init__(self, loader=None, ttl=60):
+        """
+        Initializes the registry. Nothing is loaded until the first lookup.
+
+        Parameters:
+        - loader (callable, optional): Returns {role name: bitset or None} for the stored roles;
+          None keeps the role's default bitset.
+        - ttl (float): Seconds between reloads from the loader.
+        """
+        self._loader = loader
+        self.ttl = ttl
+        self._masks = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def _compile(self):
+        masks = dict(DEFAULT_ROLE_PERMISSIONS)
+        if self._loader is not None:
+            for name, mask in self._loader().items():
+                masks[name] = int(mask) if mask is not None else masks.get(name, 0)
+        for alias, name in ROLE_ALIASES.items():
+            masks.setdefault(alias, masks.get(name, 0))
+        return masks
+
+    def refresh(self):
+        """
+        Recompiles the bitsets. If the loader fails, the previous bitsets (or the defaults, on
+        first load) stay in use and the next lookup after `ttl` tries again.
+        """
+        with self._lock:
+            try:
+                masks = self._compile()
+            except Exception:
+                logger.exception('Could not load role permissions')
+                masks = self._masks or dict(DEFAULT_ROLE_PERMISSIONS)
+            self._masks = masks
+            self._loaded_at = time.monotonic()
+
+    def invalidate(self):
+        """
+        Marks the bitsets stale so that the next lookup recompiles them.
+        """
+        self._masks = None
+
+    def mask(self, role_name):
+        """
+        Returns the permission bitset of a role.
+
+        Parameters:
+        - role_name (str): The role's name.
+
+        Returns:
+        - int: The bitset; 0 for an unknown role.
+        """
+        masks = self._masks
+        if masks is None or (self._loader is not None and self.ttl
+                             and time.monotonic() - self._loaded_at > self.ttl):
+            self.refresh()
+            masks = self._masks
+        return masks.get(role_name, 0)
+
+
+# Bitsets of the built-in roles, for services without a roles table.
+default_registry = PermissionRegistry()
+
+
+def claims_permissions(claims):
+    """
+    Returns the permission bitset carried by decoded token claims.
+
+    Tokens issued before the `perm` claim existed fall back to the default bitset of their
+    `role` claim.
+
+    Parameters:
+    - claims (dict): Decoded JWT claims.
+
+    Returns:
+    - int: The bitset; 0 when the token carries neither claim.
+    """
+    if PERMISSIONS_CLAIM in claims:
+        return int(claims[PERMISSIONS_CLAIM])
+    return default_registry.mask(claims.get('role'))
+
+
+def require_permissions(required, granted=None):
+    """
+    Route decorator that answers 403 unless the caller holds every required permission.
+
+    Apply it below the decorator that authenticates the request.
+
+    Parameters:
+    - required (int): The Permission bits the route needs.
+    - granted (callable, optional): Returns the caller's bitset. Defaults to the claims that
+      `JWKSVerifier.require_token` puts in `flask.g.token_claims`.
+    """
+    required = int(required)
+    granted = granted or (lambda: claims_permissions(g.token_claims))
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if not has_permissions(granted(), required):
+                return jsonify({'message': 'Insufficient permissions.'}), 403
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
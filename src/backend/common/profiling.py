@@ -0,0 +1,289 @@
+"""
+Opt-in sampling profiler for the Flask services, with per-route collapsed stacks.
+
+`init_profiling(app)` profiles:
+- a fraction PROFILE_SAMPLE_RATE of the requests (0 by default), and
+- requests whose PROFILE_HEADER header (X-Debug-Profile) equals PROFILE_TOKEN.
+While a profiled request runs, one background thread reads the request thread's stack every
+PROFILE_INTERVAL seconds with `sys._current_frames()`. The profiled code runs unchanged: no
+tracing hook is installed. Because the samples are of wall time, time spent waiting on the
+database or another service shows up as well as CPU time. Stacks are counted per route
+('POST /validate_expense'), at most PROFILE_MAX_STACKS distinct stacks per route, and at most
+PROFILE_MAX_ACTIVE requests are profiled at once.
+
+`GET /admin/profile` returns the stacks in the collapsed format of flamegraph.pl and speedscope,
+one 'route;frame;...;frame samples' line per stack. `?route=` selects one route and
+`?format=json` returns requests and samples per route. `DELETE /admin/profile` clears the
+stacks. The endpoint requires the PROFILE_TOKEN in the PROFILE_HEADER header and does not exist
+without a token.
+
+The check runs in a WSGI middleware around the app. With neither a sample rate nor a token
+configured, the middleware is not installed and requests pay nothing. Otherwise a request that is
+not profiled pays for one environ lookup and, with a sample rate, one random draw. See
+benchmarks/bench_profiling.py for the overhead.
+
+This module only depends on Flask and the standard library.
+
+Requirements Addressed:
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import hmac
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+# Flask==2.0.1
+from flask import Response, abort, jsonify, request
+from werkzeug.wsgi import ClosingIterator  # Werkzeug==2.0.1
+
+# Internal dependencies
+from .metrics import metrics
+
+# PROFILE_SAMPLE_RATE: Fraction of requests profiled, from 0 (none) to 1 (all).
+PROFILE_SAMPLE_RATE = float(os.getenv('PROFILE_SAMPLE_RATE', '0'))
+
+# PROFILE_TOKEN: Secret that profiles a request sent with it in PROFILE_HEADER, and guards
+# /admin/profile. Unset, debug requests and the endpoint are disabled.
+PROFILE_TOKEN = os.getenv('PROFILE_TOKEN')
+
+# PROFILE_HEADER: Request header carrying the PROFILE_TOKEN.
+PROFILE_HEADER = os.getenv('PROFILE_HEADER', 'X-Debug-Profile')
+
+# PROFILE_INTERVAL: Seconds between two samples of a profiled request's stack.
+PROFILE_INTERVAL = float(os.getenv('PROFILE_INTERVAL', '0.005'))
+
+# PROFILE_MAX_ACTIVE: Requests profiled at the same time; others run unprofiled.
+PROFILE_MAX_ACTIVE = int(os.getenv('PROFILE_MAX_ACTIVE', '8'))
+
+# PROFILE_MAX_STACKS: Distinct stacks kept per route; further stacks are counted as '[other]'.
+PROFILE_MAX_STACKS = int(os.getenv('PROFILE_MAX_STACKS', '5000'))
+
+# Frames kept per stack, innermost first.
+MAX_DEPTH = 128
+
+
+def collapse(frame):
+    """
+    Returns a stack as 'file:function;...' from the outermost to the innermost frame.
+    """
+    names = []
+    while frame is not None and len(names) < MAX_DEPTH:
+        code = frame.f_code
+        names.append(f'{os.path.basename(code.co_filename)}:{code.co_name}')
+        frame = frame.f_back
+    return ';'.join(reversed(names))
+
+
+class SamplingProfiler:
+    """
+    Samples the stacks of registered threads from one background thread, per route.
+
+    Attributes:
+        interval (float): Seconds between samples.
+        max_active (int): Threads sampled at the same time.
+        max_stacks (int): Distinct stacks kept per route.
+    """
+
+    def __init__(self, interval=None, max_active=None, max_stacks=None):
+        """
+        Initializes the profiler. The sampling thread starts with the first profiled request
+        and sleeps while none is running.
+        """
+        self.interval = interval or PROFILE_INTERVAL
+        self.max_active = max_active or PROFILE_MAX_ACTIVE
+        self.max_stacks = max_stacks or PROFILE_MAX_STACKS
+        self._active = {}  # thread id -> route
+        self._stacks = defaultdict(Counter)  # route -> stack -> samples
+        self._requests = Counter()  # route -> profiled requests
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def start(self, route):
+        """
+        Starts sampling the calling thread under a route.
+
+        Returns:
+        - int: The thread's id, to pass to stop(); None if max_active requests are already
+          profiled.
+        """
+        thread_id = threading.get_ident()
+        with self._lock:
+            if len(self._active) >= self.max_active:
+                return None
+            self._active[thread_id] = route
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='profiler', daemon=True)
+                self._thread.start()
+        self._wake.set()
+        return thread_id
+
+    def stop(self, thread_id):
+        """Stops sampling a thread and counts its request."""
+        with self._lock:
+            route = self._active.pop(thread_id, None)
+            if route is None:
+                return
+            self._requests[route] += 1
+        metrics.inc('profiled_requests')
+
+    def sample(self):
+        """Records one sample of every registered thread."""
+        frames = sys._current_frames()
+        with self._lock:
+            for thread_id, route in self._active.items():
+                frame = frames.get(thread_id)
+                if frame is None:
+                    continue
+                stacks = self._stacks[route]
+                stack = collapse(frame)
+                if stack not in stacks and len(stacks) >= self.max_stacks:
+                    stack = '[other]'
+                stacks[stack] += 1
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            with self._lock:
+                if not self._active:
+                    # Cleared under the lock, so a concurrent start() sets it again afterwards.
+                    self._wake.clear()
+                    continue
+            time.sleep(self.interval)
+            self.sample()
+
+    def collapsed(self, route=None):
+        """
+        Returns the stacks in the collapsed format, 'route;frame;...;frame samples' per line.
+
+        Parameters:
+        - route (str, optional): Only this route's stacks.
+        """
+        with self._lock:
+            lines = [f'{name};{stack} {samples}'
+                     for name, stacks in sorted(self._stacks.items()) if route in (None, name)
+                     for stack, samples in stacks.most_common()]
+        return ''.join(line + '\n' for line in lines)
+
+    def summary(self):
+        """Returns {route: {'requests', 'samples'}}."""
+        with self._lock:
+            routes = set(self._requests) | set(self._stacks)
+            return {route: {'requests': self._requests[route], 'samples': sum(self._stacks[route].values())}
+                    for route in sorted(routes)}
+
+    def reset(self):
+        """Clears the stacks and request counts."""
+        with self._lock:
+            self._stacks.clear()
+            self._requests.clear()
+
+
+# Process-wide profiler shared by all apps of the process.
+_profiler = None
+_profiler_lock = threading.Lock()
+
+
+def get_profiler():
+    """
+    Returns the process-wide SamplingProfiler, creating it on first use.
+    """
+    global _profiler
+    if _profiler is None:
+        with _profiler_lock:
+            if _profiler is None:
+                _profiler = SamplingProfiler()
+    return _profiler
+
+
+class ProfilingMiddleware:
+    """
+    WSGI middleware profiling sampled requests and requests carrying the debug token.
+
+    A request that is not profiled costs one environ lookup and, with a sample rate, one random
+    draw. A profiled request is sampled from the start of the app's dispatch until its response
+    has been sent.
+    """
+
+    def __init__(self, wsgi_app, url_map, profiler, sample_rate, token, header):
+        self.wsgi_app = wsgi_app
+        self.url_map = url_map
+        self.profiler = profiler
+        self.sample_rate = sample_rate
+        self.token = token
+        self.environ_key = 'HTTP_' + header.upper().replace('-', '_')
+
+    def has_token(self, environ):
+        sent = environ.get(self.environ_key)
+        return sent is not None and bool(self.token) and hmac.compare_digest(sent, self.token)
+
+    def route(self, environ):
+        # 'METHOD /rule/<id>' for a routed request, or None for the profile endpoint itself.
+        try:
+            rule, _ = self.url_map.bind_to_environ(environ).match(return_rule=True)
+        except Exception:  # NotFound, MethodNotAllowed, RequestRedirect
+            return f'{environ.get("REQUEST_METHOD")} [unmatched]'
+        if rule.endpoint == 'admin_profile':
+            return None
+        return f'{environ.get("REQUEST_METHOD")} {rule.rule}'
+
+    def __call__(self, environ, start_response):
+        if not ((self.sample_rate and random.random() < self.sample_rate) or self.has_token(environ)):
+            return self.wsgi_app(environ, start_response)
+        route = self.route(environ)
+        thread_id = self.profiler.start(route) if route else None
+        if thread_id is None:
+            return self.wsgi_app(environ, start_response)
+        try:
+            body = self.wsgi_app(environ, start_response)
+        except BaseException:
+            self.profiler.stop(thread_id)
+            raise
+        return ClosingIterator(body, lambda: self.profiler.stop(thread_id))
+
+
+def init_profiling(app, sample_rate=None, token=None, header=None, profiler=None):
+    """
+    Profiles a Flask app's sampled and debug requests and serves their stacks on /admin/profile.
+
+    Parameters:
+    - app (Flask): The application.
+    - sample_rate (float, optional): Defaults to PROFILE_SAMPLE_RATE.
+    - token (str, optional): Defaults to PROFILE_TOKEN.
+    - header (str, optional): Defaults to PROFILE_HEADER.
+    - profiler (SamplingProfiler, optional): Defaults to the process-wide profiler.
+
+    Returns:
+    - Flask: The application.
+    """
+    sample_rate = PROFILE_SAMPLE_RATE if sample_rate is None else sample_rate
+    token = PROFILE_TOKEN if token is None else token
+    header = header or PROFILE_HEADER
+    if not sample_rate and not token:
+        return app
+    profiler = profiler or get_profiler()
+    middleware = ProfilingMiddleware(app.wsgi_app, app.url_map, profiler, sample_rate, token, header)
+    app.wsgi_app = middleware
+
+    if token:
+        def profile_route():
+            """
+            Returns the profiled stacks in the collapsed format, or per-route counts as JSON.
+            """
+            if not middleware.has_token(request.environ):
+                abort(404)
+            if request.method == 'DELETE':
+                profiler.reset()
+                return '', 204
+            if request.args.get('format') == 'json':
+                return jsonify(profiler.summary()), 200
+            return Response(profiler.collapsed(request.args.get('route')), mimetype='text/plain')
+
+        app.add_url_rule('/admin/profile', 'admin_profile', profile_route, methods=['GET', 'DELETE'])
+    return app
@@ -0,0 +1,232 @@
+"""
+Token-bucket admission control for login attempts.
+
+Every login attempt costs a full password hash, so a credential-stuffing burst can keep the hashing
+pool busy and starve real users. Before any hashing or database lookup, the login routes take one
+token from the client IP's bucket and one from the username's bucket. Each bucket refills at a
+steady rate up to its burst size. An attempt that finds either bucket empty is refused with 429
+and a Retry-After header.
+
+Buckets live in a per-process dictionary by default. For several worker processes on one host,
+LOGIN_RATE_LIMIT_STORE='sqlite' keeps them in a shared SQLite file, so the limits hold across
+workers. Rejections are counted as `login_rate_limited_ip` and `login_rate_limited_username` on
+`/metrics`.
+
+Requirements Addressed:
+- Secure User Authentication and Role-Based Authorization
+  - Location: Technical Specification/5.1 Feature ID: F-001
+    - TR-F001.1: Implement secure login using unique username and password.
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import math
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+# Internal dependencies
+from .config import (
+    LOGIN_RATE_LIMIT_STORE,
+    LOGIN_RATE_LIMIT_SQLITE_PATH,
+    LOGIN_IP_BURST,
+    LOGIN_IP_PER_MINUTE,
+    LOGIN_USERNAME_BURST,
+    LOGIN_USERNAME_PER_MINUTE,
+)
+from .metrics import metrics
+
+# Outcome of an admission check.
+# - allowed (bool): Whether the attempt may proceed.
+# - retry_after (int): Seconds until the exhausted bucket has a token again; 0 when allowed.
+# - scope (str or None): 'ip' or 'username' for the bucket that refused the attempt.
+RateLimitDecision = namedtuple('RateLimitDecision', ['allowed', 'retry_after', 'scope'])
+
+
+def _refill(tokens, updated_at, capacity, rate, now):
+    # Tokens available now, given the bucket's last state and refill rate (tokens per second).
+    return min(capacity, tokens + (now - updated_at) * rate)
+
+
+class MemoryBucketStore:
+    """
+    Per-process token buckets in an LRU-bounded dictionary.
+
+    Attributes:
+        max_keys (int): Buckets kept at most; the least recently used are dropped first. A dropped
+            bucket comes back full, which only ever errs towards admitting.
+    """
+
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()  # key -> (tokens, updated_at)
+        self._lock = threading.Lock()
+
+    def take(self, key, capacity, rate, now=None):
+        """
+        Takes one token from a bucket if it has one.
+
+        Parameters:
+        - key (str): The bucket key.
+        - capacity (float): Burst size.
+        - rate (float): Refill rate in tokens per second.
+        - now (float, optional): Current time in seconds.
+
+        Returns:
+        - float: 0 if a token was taken, otherwise seconds until one is available.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            tokens, updated_at = self._buckets.pop(key, (capacity, now))
+            tokens = _refill(tokens, updated_at, capacity, rate, now)
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / rate
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+            return wait
+
+
+class SQLiteBucketStore:
+    """
+    Token buckets in a SQLite file shared by the worker processes on one host.
+
+    Each take runs in its own IMMEDIATE transaction, so concurrent workers serialize on the
+    bucket update. Buckets that have refilled completely are purged periodically.
+
+    Attributes:
+        path (str): The SQLite database file.
+    """
+
+    PURGE_EVERY = 1000  # Takes between purges of full buckets.
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._takes = 0
+        self._max_refill_seconds = 0.0
+
+    def _connection(self):
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS login_buckets '
+                '(key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated_at REAL NOT NULL)'
+            )
+            self._local.connection = connection
+        return connection
+
+    def take(self, key, capacity, rate, now=None):
+        """
+        Takes one token from a bucket if it has one. See MemoryBucketStore.take.
+        """
+        # Wall-clock time, since the buckets are shared between processes.
+        now = time.time() if now is None else now
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            row = connection.execute(
+                'SELECT tokens, updated_at FROM login_buckets WHERE key = ?', (key,)
+            ).fetchone()
+            tokens = _refill(*(row or (capacity, now)), capacity, rate, now)
+            wait = 0.0
+            if tokens >= 1:
+                tokens -= 1
+            else:
+                wait = (1 - tokens) / rate
+            connection.execute(
+                'INSERT OR REPLACE INTO login_buckets (key, tokens, updated_at) VALUES (?, ?, ?)',
+                (key, tokens, now),
+            )
+            connection.execute('COMMIT')
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+        self._max_refill_seconds = max(self._max_refill_seconds, capacity / rate)
+        self._takes += 1
+        if self._takes % self.PURGE_EVERY == 0:
+            self._purge(now)
+        return wait
+
+    def _purge(self, now):
+        # A bucket untouched for longer than any bucket takes to refill is full: forget it.
+        self._connection().execute(
+            'DELETE FROM login_buckets WHERE updated_at < ?', (now - self._max_refill_seconds,)
+        )
+
+
+class LoginRateLimiter:
+    """
+    Per-IP and per-username token buckets in front of password verification.
+
+    Attributes:
+        store: A MemoryBucketStore or SQLiteBucketStore.
+        ip_limit (tuple): (burst, tokens per second) for each client IP.
+        username_limit (tuple): (burst, tokens per second) for each username.
+    """
+
+    def __init__(self, store, ip_burst=None, ip_per_minute=None, username_burst=None, username_per_minute=None):
+        """
+        Initializes the limiter. Limits default to the LOGIN_* configuration values.
+        """
+        self.store = store
+        self.ip_limit = (
+            ip_burst or LOGIN_IP_BURST,
+            (ip_per_minute or LOGIN_IP_PER_MINUTE) / 60.0,
+        )
+        self.username_limit = (
+            username_burst or LOGIN_USERNAME_BURST,
+            (username_per_minute or LOGIN_USERNAME_PER_MINUTE) / 60.0,
+        )
+
+    def check(self, username, ip):
+        """
+        Admits or refuses a login attempt. Does no hashing and no database lookup.
+
+        The IP bucket is checked first. An attempt refused by it does not spend a token from the
+        username's bucket, so a flood from one address does not also lock the account.
+
+        Parameters:
+        - username (str): The submitted username; compared case-insensitively.
+        - ip (str): The client address.
+
+        Returns:
+        - RateLimitDecision: The outcome; rejections are counted per scope.
+        """
+        wait = self.store.take(f'ip:{ip}', *self.ip_limit)
+        if wait:
+            metrics.inc('login_rate_limited_ip')
+            return RateLimitDecision(False, math.ceil(wait), 'ip')
+        wait = self.store.take(f'user:{(username or "").strip().lower()}', *self.username_limit)
+        if wait:
+            metrics.inc('login_rate_limited_username')
+            return RateLimitDecision(False, math.ceil(wait), 'username')
+        return RateLimitDecision(True, 0, None)
+
+
+# Process-wide limiter built from the configuration.
+_limiter = None
+_limiter_lock = threading.Lock()
+
+
+def get_login_rate_limiter():
+    """
+    Returns the process-wide LoginRateLimiter, creating its store on first use.
+    """
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                if LOGIN_RATE_LIMIT_STORE == 'sqlite':
+                    store = SQLiteBucketStore(LOGIN_RATE_LIMIT_SQLITE_PATH)
+                else:
+                    store = MemoryBucketStore()
+                _limiter = LoginRateLimiter(store)
+    return _limiter
@@ -0,0 +1,216 @@
+"""
+Read-replica routing for SQLAlchemy sessions.
+
+A `ReplicaRouter` holds the primary engine and one engine per read replica. A `RoutingSession` asks
+it where each statement goes:
+- Flushes and INSERT, UPDATE and DELETE statements always go to the primary.
+- Reads go to a replica only when they are marked: inside `read_replica(session)`, or in a GET or
+  HEAD request to a blueprint installed with `route_reads(blueprint, session, read_only=True)`.
+- After a session has written, its later reads go to the primary, so it reads its own writes.
+- A response to a request that wrote sets a short-lived cookie. While the cookie is present, that
+  client's reads stay on the primary, in every worker, until the replicas have caught up.
+- A replica is used only while its replication lag is within the staleness bound. The lag is
+  probed at most once per check interval. A replica that lags too far or cannot be reached is
+  skipped, and the read falls back to the primary when no replica qualifies.
+
+Replica choices and primary fallbacks are counted as `replica_reads` and `replica_fallbacks`.
+
+Requirements Addressed:
+- Reporting and Analytics
+  - Location: Technical Specification/5.6 Feature ID: F-006
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+# Flask==2.0.1
+from flask import request
+
+# SQLAlchemy version 1.4.25
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+# Internal dependency
+from .metrics import metrics  # Shared in-process metrics
+
+logger = logging.getLogger(__name__)
+
+# Cookie marking a client whose reads stay on the primary after its own write.
+STICKY_COOKIE = 'read_primary'
+
+# Request methods that never write, and so may read from a replica.
+SAFE_METHODS = ('GET', 'HEAD')
+
+# Seconds a PostgreSQL standby is behind the primary. A standby that has replayed everything it
+# received is current, however old its last replayed transaction is; the primary itself has no lag.
+_POSTGRES_LAG = text(
+    'SELECT CASE WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() '
+    'THEN 0 ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END'
+)
+
+
+def replication_lag(engine):
+    """
+    Measures how many seconds a replica is behind its primary.
+
+    Parameters:
+    - engine (Engine): The replica's engine.
+
+    Returns:
+    - float: The lag in seconds. Databases other than PostgreSQL are assumed to be current.
+    """
+    if engine.dialect.name != 'postgresql':
+        return 0.0
+    with engine.connect() as connection:
+        return float(connection.execute(_POSTGRES_LAG).scalar() or 0.0)
+
+
+class ReplicaRouter:
+    """
+    Chooses the engine for each read: a sufficiently fresh replica, or the primary.
+
+    Attributes:
+        primary (Engine): The primary's engine, for all writes and unmarked reads.
+        replicas (list of Engine): The replicas' engines, used in turn.
+        max_lag (float): Staleness bound; replicas further behind are skipped.
+        check_interval (float): Seconds a replica's measured lag is reused.
+    """
+
+    def __init__(self, primary, replicas=(), max_lag=5.0, check_interval=1.0, lag_probe=replication_lag):
+        """
+        Initializes the router.
+
+        Parameters:
+        - primary (Engine): The primary's engine.
+        - replicas (iterable of Engine): The replicas' engines.
+        - max_lag (float): Staleness bound in seconds.
+        - check_interval (float): Seconds between lag probes of each replica.
+        - lag_probe (callable): lag_probe(engine) -> seconds of lag; replication_lag by default.
+        """
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._lag_probe = lag_probe
+        self._lags = {}  # replica index -> (lag, monotonic time of the probe)
+        self._next = itertools.cycle(range(len(self.replicas)))
+        self._lock = threading.Lock()
+
+    def lag(self, index):
+        """
+        Returns a replica's replication lag, probing it if the last probe is older than
+        check_interval. A replica whose probe fails counts as infinitely far behind until the next
+        probe.
+        """
+        now = time.monotonic()
+        with self._lock:
+            lag, checked_at = self._lags.get(index, (float('inf'), None))
+            if checked_at is not None and now - checked_at < self.check_interval:
+                return lag
+            # Other threads keep the previous measurement while this one probes.
+            self._lags[index] = (lag, now)
+        try:
+            lag = self._lag_probe(self.replicas[index])
+        except Exception as e:
+            logger.warning(f'Read replica {index} is unavailable: {e}')
+            lag = float('inf')
+        with self._lock:
+            self._lags[index] = (lag, time.monotonic())
+        return lag
+
+    def for_read(self):
+        """
+        Returns the engine for a read that may be served by a replica: the next replica, in turn,
+        whose lag is within max_lag, or the primary if there is none.
+        """
+        if not self.replicas:
+            return self.primary
+        with self._lock:
+            order = [next(self._next) for _ in self.replicas]
+        for index in order:
+            if self.lag(index) <= self.max_lag:
+                metrics.inc('replica_reads')
+                return self.replicas[index]
+        metrics.inc('replica_fallbacks')
+        return self.primary
+
+
+class RoutingSession(Session):
+    """
+    Session that sends writes to the primary and marked reads to a replica.
+
+    The routing state lives in `session.info`:
+    - 'read_replica' (int): Nesting depth of read_replica() blocks, or 1 in a read-only request.
+    - 'pin_primary' (bool): The client wrote recently; read from the primary.
+    - 'wrote' (bool): This session has written; read from the primary from now on.
+    """
+
+    def __init__(self, router, **kwargs):
+        super().__init__(**kwargs)
+        self.router = router
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info['wrote'] = True
+            return self.router.primary
+        info = self.info
+        if info.get('read_replica') and not info.get('wrote') and not info.get('pin_primary'):
+            return self.router.for_read()
+        return self.router.primary
+
+
+@contextmanager
+def read_replica(session):
+    """
+    Marks the reads in a block as servable by a replica.
+
+    Parameters:
+    - session: A RoutingSession, or a scoped_session of them.
+
+    Example:
+        with read_replica(db_session):
+            reports = db_session.query(ExpenseReport).all()
+    """
+    session.info['read_replica'] = session.info.get('read_replica', 0) + 1
+    try:
+        yield session
+    finally:
+        session.info['read_replica'] -= 1
+
+
+def route_reads(scaffold, session, sticky_seconds=10, read_only=False):
+    """
+    Installs read routing on a Flask app or blueprint.
+
+    Every request checks the sticky cookie, and a response to a request that wrote sets it. With
+    read_only, GET and HEAD requests read from a replica.
+
+    Parameters:
+    - scaffold (Flask or Blueprint): Where to install the hooks; a blueprint's hooks only run for
+      its own requests, wherever it is registered.
+    - session: The scoped_session of RoutingSessions the routes use.
+    - sticky_seconds (int): How long a client reads from the primary after writing; set it above
+      the replicas' usual lag.
+    - read_only (bool): Whether safe requests may read from a replica.
+    """
+
+    def mark_request():
+        if request.cookies.get(STICKY_COOKIE):
+            session.info['pin_primary'] = True
+        elif read_only and request.method in SAFE_METHODS:
+            session.info['read_replica'] = 1
+
+    def stick_after_write(response):
+        if session.info.get('wrote'):
+            response.set_cookie(STICKY_COOKIE, '1', max_age=sticky_seconds, httponly=True, samesite='Lax')
+        return response
+
+    scaffold.before_request(mark_request)
+    scaffold.after_request(stick_after_write)
@@ -0,0 +1,169 @@
+"""
+Compact in-memory record of revoked token ids, checked in O(1) on every authenticated request.
+
+Revoked ids (`jti`) are grouped into buckets by the token's expiry time. Each bucket holds a Bloom
+filter and the exact set of ids. A lookup goes only to the bucket of the token's own `exp`. Most
+tokens are not revoked, so the Bloom filter answers "no" without touching the set. A positive is
+confirmed against the exact set, so a false positive never logs anyone out. Once every token in a
+bucket has expired, its revocations no longer matter and the bucket is dropped. A background
+thread does this on a schedule and can also pull new revocations from shared storage, so all
+worker processes converge without a database query per request.
+
+Requirements Addressed:
+- Secure User Authentication and Role-Based Authorization
+  - Location: Technical Specification/5.1 Feature ID: F-001
+    - TR-F001.1: Implement secure login using unique username and password.
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import hashlib
+import logging
+import math
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    A fixed-size Bloom filter over strings.
+
+    Attributes:
+        size (int): Number of bits.
+        hashes (int): Number of bit positions per item.
+    """
+
+    def __init__(self, capacity, error_rate=0.001):
+        """
+        Sizes the filter for `capacity` items at the given false positive rate.
+        """
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        # Double hashing: position i is h1 + i * h2, from one 128-bit digest.
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, item):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item):
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class _Bucket:
+    # The revocations for tokens expiring within one bucket interval.
+    __slots__ = ('bloom', 'ids')
+
+    def __init__(self, capacity, error_rate):
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.ids = set()
+
+
+class RevocationList:
+    """
+    Revoked token ids, bucketed by token expiry, each bucket a Bloom filter plus an exact set.
+
+    Attributes:
+        bucket_seconds (int): Width of an expiry bucket.
+        bucket_capacity (int): Expected revocations per bucket, used to size its Bloom filter.
+        max_ttl (int): Lifetime assumed for tokens revoked without a known `exp`.
+    """
+
+    def __init__(self, bucket_seconds=3600, bucket_capacity=10000, error_rate=0.001, max_ttl=86400):
+        self.bucket_seconds = bucket_seconds
+        self.bucket_capacity = bucket_capacity
+        self.error_rate = error_rate
+        self.max_ttl = max_ttl
+        self._buckets = {}  # bucket index -> _Bucket
+        self._lock = threading.Lock()
+        self._purger = None
+
+    def __len__(self):
+        return sum(len(bucket.ids) for bucket in list(self._buckets.values()))
+
+    def _index(self, exp):
+        return int(exp // self.bucket_seconds)
+
+    def revoke(self, jti, exp=None):
+        """
+        Records a revoked token id.
+
+        Parameters:
+        - jti (str): The token id.
+        - exp (float, optional): The token's expiry; assumed to be max_ttl from now when unknown.
+        """
+        if exp is None:
+            exp = time.time() + self.max_ttl
+        if exp <= time.time():
+            return  # Already expired; nothing to refuse.
+        index = self._index(exp)
+        with self._lock:
+            bucket = self._buckets.get(index)
+            if bucket is None:
+                bucket = self._buckets[index] = _Bucket(self.bucket_capacity, self.error_rate)
+            bucket.bloom.add(jti)
+            bucket.ids.add(jti)
+
+    def is_revoked(self, jti, exp=None):
+        """
+        Tells whether a token id has been revoked. Runs without locks or I/O.
+
+        Parameters:
+        - jti (str): The token id.
+        - exp (float, optional): The token's expiry; when given, only its bucket is checked.
+
+        Returns:
+        - bool: True if the id was revoked.
+        """
+        if exp is not None:
+            bucket = self._buckets.get(self._index(exp))
+            return bucket is not None and jti in bucket.bloom and jti in bucket.ids
+        return any(jti in bucket.bloom and jti in bucket.ids for bucket in list(self._buckets.values()))
+
+    def purge_expired(self, now=None):
+        """
+        Drops buckets in which every token has expired.
+
+        Returns:
+        - int: Number of buckets dropped.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            expired = [index for index in self._buckets if (index + 1) * self.bucket_seconds <= now]
+            for index in expired:
+                del self._buckets[index]
+        return len(expired)
+
+    def start_purger(self, interval=60, sync=None):
+        """
+        Starts a daemon thread that drops expired buckets and optionally syncs new revocations.
+
+        Parameters:
+        - interval (float): Seconds between runs.
+        - sync (callable, optional): sync(revocation_list) adds revocations recorded elsewhere,
+          e.g. by other worker processes.
+        """
+        if self._purger is not None:
+            return
+
+        def run():
+            while True:
+                try:
+                    if sync is not None:
+                        sync(self)
+                    self.purge_expired()
+                except Exception:
+                    logger.exception('Revocation list maintenance failed')
+                time.sleep(interval)
+
+        self._purger = threading.Thread(target=run, name='revocation-purger', daemon=True)
+        self._purger.start()
@@ -0,0 +1,81 @@
+# Standard library
+import unittest  # Plain test cases for components that do not need a service app.
+
+# External dependencies
+from flask import Flask  # Request contexts for reading batches.
+
+# Internal dependencies
+from src.backend.common.batch import BatchPayloadError, read_batch, validate_batch  # Batch expense validation.
+
+
+class TestBatchValidation(unittest.TestCase):
+    """
+    Test suite for the shared batch validation of the /validate_expense/batch routes.
+    """
+
+    def test_read_batch_accepts_arrays_and_ndjson(self):
+        """
+        Tests that a batch is read from a JSON array or from NDJSON, and that malformed or
+        oversized batches are refused.
+        """
+        app = Flask(__name__)
+        with app.test_request_context(method='POST', data='[{"amount": 1}, 2]', content_type='application/json'):
+            assert read_batch() == [{'amount': 1}, 2]
+        with app.test_request_context(method='POST', data='{"amount": 1}\n\n{"amount": 2}\n',
+                                      content_type='application/x-ndjson'):
+            assert read_batch() == [{'amount': 1}, {'amount': 2}]
+        for data, content_type, status in (('{"amount": 1}', 'application/json', 400),
+                                           ('{"amount": 1}\n{oops', 'application/x-ndjson', 400),
+                                           ('[1, 2, 3]', 'application/json', 413),
+                                           ('1\n2\n3\n', 'application/x-ndjson', 413)):
+            with app.test_request_context(method='POST', data=data, content_type=content_type):
+                with self.assertRaises(BatchPayloadError) as raised:
+                    read_batch(max_items=2)
+                assert raised.exception.status == status, data
+
+    def test_policies_resolved_once_per_key_and_results_in_order(self):
+        """
+        Tests that policies are resolved once per (category, region, employee level), and that
+        results come back in input order, with per-expense errors.
+        """
+        resolved = []
+
+        def resolve(expense):
+            resolved.append((expense['category'], expense.get('region')))
+            return 100 if expense['category'] == 'Meals' else 500
+
+        def check(expense, limit):
+            if expense['amount'] < 0:
+                raise ValueError('Negative amount')
+            return {'n': expense['n'], 'compliant': expense['amount'] <= limit}
+
+        expenses = [{'n': n, 'category': ('Meals', 'Lodging')[n % 2], 'region': 'EU', 'amount': n * 20}
+                    for n in range(10)]
+        expenses[3]['amount'] = -1
+        expenses.insert(5, 'not an expense')
+        result = validate_batch(expenses, resolve, check)
+        assert result['policy_keys'] == 2 and resolved == [('Meals', 'EU'), ('Lodging', 'EU')]
+        results = result['results']
+        assert len(results) == 11
+        assert results[3] == {'error': 'Negative amount'} and 'error' in results[5]
+        assert [r['n'] for r in results if 'n' in r] == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+        assert [r['compliant'] for r in results if 'n' in r] == [True, True, True, True, True, False, True, False, True]
+
+    def test_unhashable_keys_and_failed_resolutions_are_per_expense_errors(self):
+        """
+        Tests that an expense whose key cannot be computed, or whose key fails to resolve, gets
+        an error result while the rest of the batch is still checked.
+        """
+        def resolve(expense):
+            if expense['category'] == 'Unknown':
+                raise LookupError('No policies for this category')
+            return 100
+
+        expenses = [{'category': ['Meals'], 'amount': 1}, {'category': 'Meals', 'region': {'EU': 1}, 'amount': 1},
+                    {'category': 'Unknown', 'amount': 1}, {'category': 'Unknown', 'amount': 2},
+                    {'category': 'Meals', 'amount': 50}]
+        result = validate_batch(expenses, resolve, lambda expense, limit: {'compliant': expense['amount'] <= limit})
+        results = result['results']
+        assert 'error' in results[0] and 'error' in results[1]
+        assert results[2] == results[3] == {'error': 'No policies for this category'}
+        assert results[4] == {'compliant': True} and result['policy_keys'] == 2
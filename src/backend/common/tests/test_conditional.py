@@ -0,0 +1,54 @@
+# Standard library
+import unittest  # Plain test cases for components that do not need a service app.
+
+# External dependencies
+from flask import Flask  # Request contexts for the conditional GET tests.
+
+# Internal dependencies
+from src.backend.common.conditional import VersionedResponseCache  # ETags and versioned payload cache.
+
+
+class TestVersionedResponseCache(unittest.TestCase):
+    """
+    Test suite for strong ETags and the version-keyed payload cache.
+    """
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.cache = VersionedResponseCache('report', maxsize=2)
+        self.builds = []
+
+    def _get(self, key, version, if_none_match=None):
+        def build():
+            self.builds.append((key, version))
+            return version, {'report_id': key, 'version': version}
+        headers = {'If-None-Match': f'"{if_none_match}"'} if if_none_match else {}
+        with self.app.test_request_context(headers=headers):
+            return self.cache.respond(key, version, build)
+
+    def test_matching_etag_is_not_modified(self):
+        """
+        Tests that the ETag names the version, that a matching If-None-Match gets 304 without
+        building the payload, and that a new version is served in full.
+        """
+        response = self._get(7, 1)
+        assert response.status_code == 200 and response.get_etag() == ('report-7-v1', False)
+        assert self._get(7, 1, if_none_match='report-7-v1').status_code == 304
+        response = self._get(7, 2, if_none_match='report-7-v1')
+        assert response.status_code == 200 and response.get_json()['version'] == 2
+        assert self.builds == [(7, 1), (7, 2)]
+
+    def test_payloads_are_cached_per_version_with_lru_eviction(self):
+        """
+        Tests that repeated reads are served from the cache, that a version bump rebuilds, and
+        that the least recently used report is evicted.
+        """
+        self._get(1, 1)
+        self._get(1, 1)
+        assert self.builds == [(1, 1)]
+        self._get(1, 2)
+        self._get(2, 1)
+        self._get(1, 2)
+        self._get(3, 1)  # Evicts report 2, the least recently used.
+        assert len(self.cache) == 2 and self.cache.get(2, 1) is None
+        assert self.builds == [(1, 1), (1, 2), (2, 1), (3, 1)]
@@ -0,0 +1,94 @@
+# Standard library
+import time  # Used to occupy pool workers in the hashing executor tests.
+import unittest  # Plain test cases for components that do not need the Flask app.
+
+# Internal dependencies
+from src.backend.common.hashing import HashingExecutor, HashingPoolFull, HashingTimeout  # Bounded password hashing pool.
+from src.backend.common.hashing import HashCost, bcrypt_hash, pbkdf2_hash, check_hash, calibrate_hash_cost, needs_rehash  # Hash cost tuning.
+
+
+class TestHashingExecutor(unittest.TestCase):
+    """
+    Test suite for the bounded password hashing pool used by login and registration.
+    """
+
+    def setUp(self):
+        """
+        Create a single-worker executor with no spare queue slots.
+        """
+        self.executor = HashingExecutor(workers=1, max_pending=0, timeout=30)
+
+    def tearDown(self):
+        """
+        Stop the worker process.
+        """
+        self.executor.shutdown()
+
+    def test_hash_and_check_round_trip(self):
+        """
+        Tests that a password hashed on the pool verifies on the pool, and a wrong one does not.
+        """
+        hashed = self.executor.hash_password('TestPassword123!', 4)
+        assert self.executor.check_password('TestPassword123!', hashed)
+        assert not self.executor.check_password('WrongPassword', hashed)
+
+    def test_rejects_when_saturated(self):
+        """
+        Tests that a submission beyond workers + max_pending raises HashingPoolFull
+        instead of queueing, and that capacity returns once the busy job finishes.
+        """
+        busy = self.executor.submit(time.sleep, 0.5)
+        with self.assertRaises(HashingPoolFull):
+            self.executor.submit(time.sleep, 0)
+        busy.result(timeout=30)
+        time.sleep(0.1)  # Slots are released by a done-callback that may trail result().
+        self.executor.submit(time.sleep, 0).result(timeout=30)
+
+    def test_slow_job_raises_hashing_timeout(self):
+        """
+        Tests that a job outliving the timeout raises HashingTimeout, a HashingPoolFull the
+        routes answer with 503, in run() and in hash_many().
+        """
+        executor = HashingExecutor(workers=1, max_pending=0, timeout=0.05)
+        try:
+            with self.assertRaises(HashingTimeout) as raised:
+                executor.run(time.sleep, 0.5)
+            assert isinstance(raised.exception, HashingPoolFull)
+            time.sleep(0.6)  # Let the slow job finish and release its slot.
+            with self.assertRaises(HashingTimeout):
+                executor.hash_many(['TestPassword123!'], rounds=12)
+        finally:
+            executor.shutdown()
+
+
+class TestPasswordHashCost(unittest.TestCase):
+    """
+    Test suite for hash cost calibration and rehash-on-login decisions.
+    """
+
+    cost = HashCost('bcrypt', 5, 200000)
+
+    def test_outdated_hashes_need_rehash(self):
+        """
+        Tests that other schemes, the legacy PBKDF2 format and lower costs are upgraded, while
+        hashes at or above the calibrated cost are kept.
+        """
+        legacy = pbkdf2_hash('TestPassword123!', 100000).split('$')
+        legacy_hash = f'{legacy[3]}:{legacy[2]}'
+        assert check_hash('TestPassword123!', legacy_hash)
+        assert needs_rehash(legacy_hash, self.cost)
+        assert needs_rehash(bcrypt_hash('TestPassword123!', 4), self.cost)
+        assert not needs_rehash(bcrypt_hash('TestPassword123!', 5), self.cost)
+        assert not needs_rehash(bcrypt_hash('TestPassword123!', 6), self.cost)
+        pbkdf2_cost = HashCost('pbkdf2_sha256', 5, 200000)
+        assert needs_rehash(bcrypt_hash('TestPassword123!', 5), pbkdf2_cost)
+        assert not needs_rehash(pbkdf2_hash('TestPassword123!', 200000), pbkdf2_cost)
+
+    def test_calibration_respects_minimums(self):
+        """
+        Tests that calibration never picks a cost below the configured minimums.
+        """
+        cost = calibrate_hash_cost(target_ms=1)
+        assert cost.bcrypt_rounds >= 4
+        assert cost.pbkdf2_iterations >= 100000
+        assert calibrate_hash_cost(target_ms=0).scheme == 'bcrypt'
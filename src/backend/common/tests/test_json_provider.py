@@ -0,0 +1,53 @@
+# Standard library
+import datetime  # Date values for the JSON provider tests.
+import unittest  # Plain test cases for components that do not need a service app.
+from decimal import Decimal  # Amounts for the JSON provider tests.
+
+# External dependencies
+from flask import Flask, jsonify  # Request contexts for the JSON provider tests.
+
+# Internal dependencies
+from src.backend.common.json_provider import BACKENDS, dumps_bytes, init_json, ndjson_response, wants_ndjson  # Shared JSON serialization.
+
+
+class TestJSONProvider(unittest.TestCase):
+    """
+    Test suite for the shared JSON provider and its NDJSON list responses.
+    """
+
+    payload = {
+        'report_id': 3,
+        'total_amount': Decimal('1234.50'),
+        'submission_date': datetime.date(2024, 3, 1),
+        'created_at': datetime.datetime(2024, 3, 1, 9, 30, 15, 250000),
+        'description': 'Zürich',
+        'items': [{'amount': Decimal('0.10')}],
+    }
+
+    def test_backends_write_identical_json(self):
+        """
+        Tests that every backend writes Decimal as an exact string and dates in ISO 8601, in
+        insertion order, and that the outputs are byte for byte the same.
+        """
+        expected = ('{"report_id":3,"total_amount":"1234.50","submission_date":"2024-03-01",'
+                    '"created_at":"2024-03-01T09:30:15.250000","description":"Zürich",'
+                    '"items":[{"amount":"0.10"}]}').encode('utf-8')
+        for backend in BACKENDS:
+            assert dumps_bytes(self.payload, backend=backend) == expected, backend
+        with self.assertRaises(TypeError):
+            dumps_bytes({'value': object()}, backend='stdlib')
+
+    def test_jsonify_and_ndjson_responses(self):
+        """
+        Tests that jsonify serializes through the provider, and that NDJSON is streamed one item
+        per line when the client asks for it.
+        """
+        app = init_json(Flask(__name__))
+        with app.test_request_context():
+            assert jsonify(self.payload).get_json()['total_amount'] == '1234.50'
+            assert not wants_ndjson()
+        with app.test_request_context(headers={'Accept': 'application/x-ndjson'}):
+            assert wants_ndjson()
+            response = ndjson_response(({'n': n} for n in range(3)), headers={'X-Next-Cursor': 'abc'})
+            assert response.mimetype == 'application/x-ndjson' and response.headers['X-Next-Cursor'] == 'abc'
+            assert b''.join(response.response) == b'{"n":0}\n{"n":1}\n{"n":2}\n'
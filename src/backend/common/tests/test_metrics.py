@@ -0,0 +1,29 @@
+# Standard library
+import unittest  # Plain test cases for components that do not need the Flask app.
+
+# Internal dependencies
+from src.backend.common.metrics import MetricsRegistry  # In-process metrics, including pool checkouts.
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """
+    Test suite for the in-process metrics registry used for connection pool checkouts.
+    """
+
+    def test_snapshot_reports_counters_histograms_and_gauges(self):
+        """
+        Tests that counters accumulate, histogram observations land in the right bucket,
+        and gauges are read when the snapshot is taken.
+        """
+        registry = MetricsRegistry()
+        registry.inc('db_pool_checkouts')
+        registry.inc('db_pool_checkouts')
+        registry.observe('db_pool_checkout_seconds', 0.003)
+        registry.gauge('db_pool_checkedout', lambda: 2)
+
+        snapshot = registry.snapshot()
+        assert snapshot['counters']['db_pool_checkouts'] == 2
+        histogram = snapshot['histograms']['db_pool_checkout_seconds']
+        assert histogram['count'] == 1
+        assert histogram['buckets']['0.005'] == 1
+        assert snapshot['gauges']['db_pool_checkedout'] == 2
@@ -0,0 +1,51 @@
+# Standard library
+import unittest  # Plain test cases for components that do not need the Flask app.
+
+# Internal dependencies
+from src.backend.common.permissions import Permission, PermissionRegistry, has_permissions, claims_permissions  # Role permission bitsets.
+
+
+class TestPermissionRegistry(unittest.TestCase):
+    """
+    Test suite for role permission bitsets and bitwise authorization.
+    """
+
+    def test_roles_compile_to_bitsets(self):
+        """
+        Tests the built-in role bitsets, role aliases and stored overrides.
+        """
+        registry = PermissionRegistry(loader=lambda: {'Auditor': int(Permission.VIEW_ANALYTICS), 'Manager': None})
+        assert has_permissions(registry.mask('Administrator'), Permission.MANAGE_USERS | Permission.MANAGE_POLICIES)
+        assert not has_permissions(registry.mask('Employee'), Permission.APPROVE_EXPENSES)
+        assert has_permissions(registry.mask('Manager'), Permission.APPROVE_EXPENSES)
+        assert registry.mask('Finance Team') == registry.mask('Finance')
+        assert registry.mask('Auditor') == Permission.VIEW_ANALYTICS
+        assert registry.mask('Unknown') == 0
+
+    def test_invalidate_reloads_roles(self):
+        """
+        Tests that bitsets are compiled once and recompiled after invalidation.
+        """
+        stored = {'Employee': int(Permission.SUBMIT_EXPENSES)}
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return dict(stored)
+
+        registry = PermissionRegistry(loader=loader, ttl=0)
+        assert registry.mask('Employee') == Permission.SUBMIT_EXPENSES
+        assert registry.mask('Employee') == Permission.SUBMIT_EXPENSES
+        assert len(calls) == 1
+        stored['Employee'] = int(Permission.SUBMIT_EXPENSES | Permission.VIEW_REPORTS)
+        registry.invalidate()
+        assert has_permissions(registry.mask('Employee'), Permission.VIEW_REPORTS)
+        assert len(calls) == 2
+
+    def test_claims_carry_permissions(self):
+        """
+        Tests that the compact 'perm' claim is used, with the role's defaults for older tokens.
+        """
+        assert claims_permissions({'perm': int(Permission.VIEW_REPORTS), 'role': 'Administrator'}) == Permission.VIEW_REPORTS
+        assert has_permissions(claims_permissions({'role': 'Administrator'}), Permission.MANAGE_USERS)
+        assert claims_permissions({}) == 0
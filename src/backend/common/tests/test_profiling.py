@@ -0,0 +1,78 @@
+# Standard library
+import time  # Keeps the profiled route busy.
+import unittest  # Plain test cases for components that do not need a service app.
+
+# External dependencies
+from flask import Flask, jsonify  # Apps for the profiler middleware tests.
+
+# Internal dependencies
+from src.backend.common.profiling import SamplingProfiler, init_profiling  # Per-route sampling profiler.
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    """
+    Test suite for the opt-in sampling profiler middleware and its admin endpoint.
+    """
+
+    def _app(self, **profiling):
+        app = Flask(__name__)
+
+        @app.route('/reports/<int:report_id>')
+        def busy_report(report_id):
+            deadline = time.monotonic() + 0.05
+            while time.monotonic() < deadline:
+                pass
+            return jsonify({'report_id': report_id})
+
+        return init_profiling(app, **profiling)
+
+    def test_unconfigured_app_is_untouched(self):
+        """
+        Tests that without a sample rate or token no middleware or endpoint is installed.
+        """
+        app = Flask(__name__)
+        wsgi_app = app.wsgi_app
+        init_profiling(app, sample_rate=0, token='')
+        assert app.wsgi_app == wsgi_app
+        assert app.test_client().get('/admin/profile').status_code == 404
+
+    def test_debug_requests_are_profiled_per_route(self):
+        """
+        Tests that only requests with the debug token are sampled, that stacks are aggregated
+        per route rule, and that the endpoint requires the token.
+        """
+        profiler = SamplingProfiler(interval=0.001)
+        client = self._app(sample_rate=0, token='secret', profiler=profiler).test_client()
+        client.get('/reports/1').close()
+        client.get('/reports/2', headers={'X-Debug-Profile': 'wrong'}).close()
+        assert profiler.summary() == {}
+
+        for report_id in (1, 2):
+            # The profile ends when the server closes the response, as WSGI servers do.
+            with client.get(f'/reports/{report_id}', headers={'X-Debug-Profile': 'secret'}) as response:
+                assert response.status_code == 200
+        summary = profiler.summary()
+        assert list(summary) == ['GET /reports/<int:report_id>']
+        assert summary['GET /reports/<int:report_id>']['requests'] == 2
+        assert summary['GET /reports/<int:report_id>']['samples'] > 0
+
+        assert client.get('/admin/profile').status_code == 404
+        response = client.get('/admin/profile', headers={'X-Debug-Profile': 'secret'})
+        lines = response.get_data(as_text=True).splitlines()
+        assert lines and all(line.startswith('GET /reports/<int:report_id>;') for line in lines)
+        assert any(':busy_report' in line for line in lines)
+        assert int(lines[0].rsplit(' ', 1)[1]) > 0
+        assert client.delete('/admin/profile', headers={'X-Debug-Profile': 'secret'}).status_code == 204
+        assert profiler.collapsed() == ''
+
+    def test_sample_rate_profiles_without_header(self):
+        """
+        Tests that a sample rate of 1 profiles every request, up to max_active at once.
+        """
+        profiler = SamplingProfiler(interval=0.001)
+        client = self._app(sample_rate=1.0, token='', profiler=profiler).test_client()
+        client.get('/reports/3').close()
+        assert profiler.summary()['GET /reports/<int:report_id>']['requests'] == 1
+        profiler.max_active = 0
+        client.get('/reports/4').close()
+        assert profiler.summary()['GET /reports/<int:report_id>']['requests'] == 1
@@ -0,0 +1,36 @@
+# Standard library
+import unittest  # Plain test cases for components that do not need the Flask app.
+
+# Internal dependencies
+from src.backend.common.rate_limit import LoginRateLimiter, MemoryBucketStore  # Login admission control.
+
+
+class TestLoginRateLimiter(unittest.TestCase):
+    """
+    Test suite for token-bucket admission control in front of password verification.
+    """
+
+    def test_bucket_refills_at_its_rate(self):
+        """
+        Tests that a bucket admits its burst, refuses the next attempt with the wait until the
+        next token, and admits again once that token has refilled.
+        """
+        store = MemoryBucketStore()
+        assert store.take('ip:10.0.0.1', 2, 1.0, now=100.0) == 0
+        assert store.take('ip:10.0.0.1', 2, 1.0, now=100.0) == 0
+        assert store.take('ip:10.0.0.1', 2, 1.0, now=100.0) == 1.0
+        assert store.take('ip:10.0.0.1', 2, 1.0, now=101.0) == 0
+
+    def test_username_limit_applies_across_addresses(self):
+        """
+        Tests that one account is limited across client IPs and usernames match case-insensitively,
+        while an IP refusal does not spend the username's tokens.
+        """
+        limiter = LoginRateLimiter(MemoryBucketStore(), ip_burst=1, ip_per_minute=1,
+                                   username_burst=2, username_per_minute=1)
+        assert limiter.check('jdoe', '10.0.0.1').allowed
+        assert limiter.check('other', '10.0.0.1').scope == 'ip'
+        assert limiter.check('JDoe', '10.0.0.2').allowed
+        decision = limiter.check('jdoe', '10.0.0.3')
+        assert not decision.allowed and decision.scope == 'username'
+        assert decision.retry_after > 0
@@ -0,0 +1,101 @@
+# Standard library
+import tempfile  # Primary and replica database files for the replica routing tests.
+import unittest  # Plain test cases for components that do not need a service app.
+
+# External dependencies
+from flask import Flask, Blueprint, jsonify  # Apps for the read-only blueprint tests.
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, select  # Replica routing test schema. SQLAlchemy version 1.4.25
+from sqlalchemy.orm import scoped_session  # Request-scoped routing sessions.
+
+# Internal dependencies
+from src.backend.common.replicas import ReplicaRouter, RoutingSession, read_replica, route_reads  # Read-replica routing.
+
+
+class TestReadReplicaRouting(unittest.TestCase):
+    """
+    Test suite for read-replica routing, with a primary and a replica in two SQLite files that
+    each hold one row naming the database.
+    """
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.notes = Table('notes', MetaData(), Column('id', Integer, primary_key=True), Column('source', String(20)))
+        self.engines = {}
+        for name in ('primary', 'replica'):
+            engine = create_engine(f'sqlite:///{self.directory.name}/{name}.db')
+            self.notes.metadata.create_all(engine)
+            with engine.begin() as connection:
+                connection.execute(self.notes.insert().values(source=name))
+            self.engines[name] = engine
+        self.lag = 0.0
+        self.router = ReplicaRouter(self.engines['primary'], [self.engines['replica']],
+                                    max_lag=5, check_interval=0, lag_probe=lambda engine: self._probe())
+        self.session = scoped_session(lambda: RoutingSession(self.router))
+
+    def tearDown(self):
+        self.session.remove()
+        for engine in self.engines.values():
+            engine.dispose()
+        self.directory.cleanup()
+
+    def _probe(self):
+        if isinstance(self.lag, Exception):
+            raise self.lag
+        return self.lag
+
+    def _source(self):
+        return self.session.execute(select(self.notes.c.source).order_by(self.notes.c.id)).scalar()
+
+    def test_marked_reads_use_a_replica_within_the_staleness_bound(self):
+        """
+        Tests that only marked reads go to the replica, and that they fall back to the primary
+        when the replica lags beyond the bound or cannot be reached.
+        """
+        assert self._source() == 'primary'
+        with read_replica(self.session):
+            assert self._source() == 'replica'
+            self.lag = 30.0
+            assert self._source() == 'primary'
+            self.lag = ConnectionError('replica down')
+            assert self._source() == 'primary'
+        self.lag = 0.0
+        assert self._source() == 'primary'
+
+    def test_session_reads_its_own_writes_from_the_primary(self):
+        """
+        Tests that writes go to the primary even in a replica block, and that the session's later
+        reads follow them there.
+        """
+        with read_replica(self.session):
+            assert self._source() == 'replica'
+            self.session.execute(self.notes.delete())
+            self.session.commit()
+            assert self._source() is None
+        with self.engines['replica'].connect() as connection:
+            assert connection.execute(select(self.notes.c.source)).scalar() == 'replica'
+
+    def test_read_only_blueprint_and_sticky_reads_after_a_write(self):
+        """
+        Tests that GET requests to a read-only blueprint read from the replica, and that a client
+        reads from the primary after its own write while other clients do not.
+        """
+        blueprint = Blueprint('reads', __name__)
+        blueprint.add_url_rule('/source', 'source', lambda: jsonify({'source': self._source()}))
+
+        def write():
+            self.session.execute(self.notes.insert().values(source='written'))
+            self.session.commit()
+            return jsonify({'written': True}), 201
+
+        blueprint.add_url_rule('/notes', 'write', write, methods=['POST'])
+        route_reads(blueprint, self.session, sticky_seconds=10, read_only=True)
+        blueprint.teardown_request(lambda exception: self.session.remove())
+        app = Flask(__name__)
+        app.register_blueprint(blueprint)
+
+        writer, other = app.test_client(), app.test_client()
+        assert writer.get('/source').get_json()['source'] == 'replica'
+        response = writer.post('/notes')
+        assert response.status_code == 201 and 'read_primary=1' in response.headers['Set-Cookie']
+        assert writer.get('/source').get_json()['source'] == 'primary'
+        assert other.get('/source').get_json()['source'] == 'replica'
@@ -0,0 +1,99 @@
+# Standard library
+import time  # Token expiry times.
+import unittest  # Plain test cases for components that do not need the Flask app.
+
+# External dependencies
+import jwt  # Token encoding for the token cache tests. PyJWT version 2.3.0
+
+# Internal dependencies
+from src.backend.common.token_cache import VerifiedTokenCache, TokenRevokedError  # Verified JWT cache.
+
+
+class TestVerifiedTokenCache(unittest.TestCase):
+    """
+    Test suite for the verified-JWT cache used by validate_token and protected routes.
+    """
+
+    def setUp(self):
+        """
+        Create a small cache and a verifier that counts decode calls.
+        """
+        self.cache = VerifiedTokenCache(maxsize=2, max_ttl=60)
+        self.decode_calls = 0
+
+    def _verify(self, token):
+        self.decode_calls += 1
+        return jwt.decode(token, 'test_secret', algorithms=['HS256'])
+
+    def _token(self, subject, expires_in=300):
+        return jwt.encode({'sub': subject, 'exp': int(time.time()) + expires_in}, 'test_secret', algorithm='HS256')
+
+    def test_repeat_verification_is_cached(self):
+        """
+        Tests that a token is decoded and resolved only once while it stays cached.
+        """
+        token = self._token('1')
+        resolve = lambda claims: {'id': claims['sub'], 'username': 'testuser', 'role': 'Employee'}
+        first = self.cache.get_or_verify(token, self._verify, resolve)
+        second = self.cache.get_or_verify(token, self._verify, resolve)
+        assert self.decode_calls == 1
+        assert second.principal == first.principal
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """
+        Tests that the cache holds at most maxsize tokens.
+        """
+        tokens = [self._token(str(i)) for i in range(3)]
+        for token in tokens:
+            self.cache.get_or_verify(token, self._verify)
+        assert len(self.cache) == 2
+        assert self.cache.get(tokens[0]) is None
+
+    def test_entry_expires_at_token_exp(self):
+        """
+        Tests that an entry is discarded once the token's exp has passed.
+        """
+        self.cache.put('expired-token', {'sub': '1', 'exp': time.time() - 1})
+        assert self.cache.get('expired-token') is None
+
+    def test_entry_without_principal_is_resolved_on_a_resolving_hit(self):
+        """
+        Tests that a token first cached by validate_token (no resolve) gets its principal when
+        authenticate_token (with resolve) hits it, without decoding it again.
+        """
+        token = self._token('1')
+        assert self.cache.get_or_verify(token, self._verify).principal is None
+        resolve = lambda claims: {'id': claims['sub'], 'username': 'testuser', 'role': 'Employee'}
+        assert self.cache.get_or_verify(token, self._verify, resolve).principal['id'] == '1'
+        assert self.cache.get_or_verify(token, self._verify).principal['id'] == '1'
+        assert self.decode_calls == 1
+
+    def test_expired_revocations_are_swept(self):
+        """
+        Tests that revocations of expired tokens are forgotten once their number outgrows the
+        cache, while live revocations are kept.
+        """
+        self.cache.revoke('live-token', expires_at=time.time() + 300)
+        for index in range(10):
+            self.cache.revoke(f'expired-token-{index}', expires_at=time.time() - 1)
+        assert len(self.cache._revoked) <= 4
+        with self.assertRaises(TokenRevokedError):
+            self.cache.get('live-token')
+
+    def test_principals_expire_after_principal_ttl(self):
+        """
+        Tests that an entry with a principal lives at most principal_ttl.
+        """
+        cache = VerifiedTokenCache(maxsize=10, max_ttl=60, principal_ttl=5)
+        entry = cache.put(self._token('1'), {'sub': '1', 'exp': time.time() + 300}, {'id': 1})
+        assert entry.expires_at <= time.time() + 5
+
+    def test_revoked_token_is_refused(self):
+        """
+        Tests that a revoked token is refused even though its signature is still valid.
+        """
+        token = self._token('1')
+        self.cache.get_or_verify(token, self._verify)
+        self.cache.revoke(token)
+        with self.assertRaises(TokenRevokedError):
+            self.cache.get_or_verify(token, self._verify)
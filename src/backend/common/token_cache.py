@@ -0,0 +1,236 @@
+"""
+In-process cache of verified JWTs.
+
+Every protected request used to run jwt.decode and then load the user row again. This module
+keeps the outcome of that work in an LRU keyed by a SHA-256 digest of the token. Each entry holds
+the decoded claims and the resolved principal (user id, username, role and its permissions).
+Entries expire at the token's own `exp`, and entries with a principal after at most
+ROLE_PERMISSIONS_TTL seconds, so that role changes made by other workers reach cached tokens
+within that interval, as they reach the permission registry. This worker's own role changes drop
+the affected entries at commit (see models.py). A token can also be revoked explicitly, so that
+it is refused while its signature is still valid. Revocations are forgotten once their token has
+expired; they are swept whenever their number doubles, so memory is bounded by the revoked tokens
+still alive.
+
+Requirements Addressed:
+- Secure User Authentication and Role-Based Authorization
+  - Location: Technical Specification/5.1 Feature ID: F-001
+    - TR-F001.4: Define role-based access levels.
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import hashlib
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+# PyJWT==2.3.0
+import jwt  # Base exception type for rejected tokens.
+
+# Internal dependency
+from .config import TOKEN_CACHE_SIZE, TOKEN_CACHE_MAX_TTL, ROLE_PERMISSIONS_TTL
+
+
+class TokenRevokedError(jwt.InvalidTokenError):
+    """
+    Raised when a token with a valid signature has been explicitly revoked.
+    """
+
+
+# One cached verification result.
+# - claims (dict): The decoded JWT payload.
+# - principal (dict or None): Snapshot of the resolved user, e.g. {'id', 'username', 'role'}.
+# - expires_at (float): Epoch seconds after which the entry is discarded.
+CachedToken = namedtuple('CachedToken', ['claims', 'principal', 'expires_at'])
+
+
+def token_digest(token, scope=''):
+    """
+    Computes the cache key for a token.
+
+    Parameters:
+    - token (str): The encoded JWT.
+    - scope (str): Distinguishes verifiers that use different keys for the same token.
+
+    Returns:
+    - str: Hex SHA-256 digest.
+    """
+    return hashlib.sha256(f'{scope}\x00{token}'.encode('utf-8')).hexdigest()
+
+
+class VerifiedTokenCache:
+    """
+    Thread-safe LRU of verified tokens with expiry at `exp` and explicit revocation.
+
+    Attributes:
+        maxsize (int): Maximum number of cached tokens.
+        max_ttl (float): Upper bound on how long an entry lives, for tokens without `exp`.
+        principal_ttl (float): Upper bound on how long a resolved principal is reused.
+    """
+
+    def __init__(self, maxsize=None, max_ttl=None, principal_ttl=None):
+        """
+        Initializes an empty cache.
+
+        Parameters:
+        - maxsize (int, optional): Defaults to TOKEN_CACHE_SIZE.
+        - max_ttl (float, optional): Defaults to TOKEN_CACHE_MAX_TTL.
+        - principal_ttl (float, optional): Defaults to ROLE_PERMISSIONS_TTL.
+        """
+        self.maxsize = maxsize or TOKEN_CACHE_SIZE
+        self.max_ttl = max_ttl or TOKEN_CACHE_MAX_TTL
+        self.principal_ttl = principal_ttl or ROLE_PERMISSIONS_TTL
+        self._entries = OrderedDict()
+        self._revoked = {}  # digest -> epoch seconds after which the revocation can be forgotten
+        self._revoked_sweep_at = self.maxsize  # Size of _revoked that triggers the next sweep
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, token, scope=''):
+        """
+        Returns the cached verification for a token, or None on a miss or expiry.
+
+        Raises:
+        - TokenRevokedError: If the token has been revoked.
+        """
+        digest = token_digest(token, scope)
+        now = time.time()
+        with self._lock:
+            self._check_revoked(digest, now)
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+            if entry.expires_at <= now:
+                del self._entries[digest]
+                return None
+            self._entries.move_to_end(digest)
+            return entry
+
+    def put(self, token, claims, principal=None, scope=''):
+        """
+        Stores a verified token. The entry expires at the token's `exp` claim, or earlier when
+        it holds a principal, after principal_ttl.
+
+        Returns:
+        - CachedToken: The stored entry.
+        """
+        now = time.time()
+        expires_at = now + self.max_ttl
+        if claims.get('exp') is not None:
+            expires_at = min(expires_at, float(claims['exp']))
+        if principal is not None:
+            expires_at = min(expires_at, now + self.principal_ttl)
+        entry = CachedToken(claims, principal, expires_at)
+        digest = token_digest(token, scope)
+        with self._lock:
+            self._entries[digest] = entry
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def get_or_verify(self, token, verify, resolve=None, scope=''):
+        """
+        Returns the cached entry for a token, verifying and resolving it on a miss.
+
+        An entry cached without a principal (by a caller that passed no resolve) is resolved on
+        the first hit that passes one, so callers with and without resolve can share a scope.
+
+        Parameters:
+        - token (str): The encoded JWT.
+        - verify (callable): verify(token) -> claims; raises jwt.InvalidTokenError when invalid.
+        - resolve (callable, optional): resolve(claims) -> principal snapshot, or None to reject.
+        - scope (str): Cache namespace for the verifier's key.
+
+        Returns:
+        - CachedToken: The verification result.
+
+        Raises:
+        - jwt.InvalidTokenError: If the token is invalid, expired, revoked or has no principal.
+        """
+        entry = self.get(token, scope)
+        if entry is not None and (resolve is None or entry.principal is not None):
+            return entry
+        claims = entry.claims if entry is not None else verify(token)
+        principal = None
+        if resolve is not None:
+            principal = resolve(claims)
+            if principal is None:
+                raise jwt.InvalidTokenError('Token subject does not exist.')
+        return self.put(token, claims, principal, scope)
+
+    def revoke(self, token, expires_at=None, scope=''):
+        """
+        Revokes a token: drops its entry and refuses it until it would have expired anyway.
+
+        Parameters:
+        - token (str): The encoded JWT.
+        - expires_at (float, optional): The token's `exp`; taken from the cached entry if known.
+        - scope (str): Cache namespace for the verifier's key.
+        """
+        digest = token_digest(token, scope)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.pop(digest, None)
+            if expires_at is None:
+                expires_at = entry.expires_at if entry else now + self.max_ttl
+            self._revoked[digest] = expires_at
+            if len(self._revoked) > self._revoked_sweep_at:
+                self._sweep_revoked(now)
+
+    def invalidate_principal(self, user_id=None):
+        """
+        Drops every cached entry for a user, e.g. after a role change, without revoking tokens.
+
+        Parameters:
+        - user_id (int, optional): The user; None drops the entries of every user, e.g. after a
+          role's permissions changed.
+        """
+        with self._lock:
+            for digest in [d for d, e in self._entries.items()
+                           if e.principal and user_id in (None, e.principal.get('id'))]:
+                del self._entries[digest]
+
+    def clear(self):
+        """Drops all cached entries and revocations."""
+        with self._lock:
+            self._entries.clear()
+            self._revoked.clear()
+
+    def _sweep_revoked(self, now):
+        # Caller holds the lock. Forgets the revocations of tokens that have expired anyway. The
+        # next sweep waits until the live revocations have doubled, so sweeps stay amortized O(1).
+        for digest in [d for d, until in self._revoked.items() if until <= now]:
+            del self._revoked[digest]
+        self._revoked_sweep_at = max(self.maxsize, 2 * len(self._revoked))
+
+    def _check_revoked(self, digest, now):
+        # Caller holds the lock.
+        revoked_until = self._revoked.get(digest)
+        if revoked_until is None:
+            return
+        if revoked_until <= now:
+            del self._revoked[digest]
+            return
+        raise TokenRevokedError('Token has been revoked.')
+
+
+# Process-wide cache used by the authentication utilities.
+_token_cache = None
+_token_cache_lock = threading.Lock()
+
+
+def get_token_cache():
+    """
+    Returns the process-wide VerifiedTokenCache, creating it on first use.
+    """
+    global _token_cache
+    if _token_cache is None:
+        with _token_cache_lock:
+            if _token_cache is None:
+                _token_cache = VerifiedTokenCache()
+    return _token_cache
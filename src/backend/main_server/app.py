@@ -1,26 +1,36 @@
+# Standard library
+import argparse
+import json
+import sys
+
 # External dependencies
+import click  # Installed with Flask; arguments of the CLI commands.
 from flask import Flask  # Flask==2.0.1
 from flask_sqlalchemy import SQLAlchemy  # SQLAlchemy==1.4.25
 from flask_jwt_extended import JWTManager  # Flask-JWT-Extended==4.3.1
 
 # Internal dependencies
-from config import load_config  # Internal: Loads configuration settings for the main server.
-from src.models import MainServerModel  # Internal: Represents the main server data model.
-from src.utils import (
+from src.backend.main_server.config import load_config  # Internal: Loads configuration settings for the main server.
+from src.backend.main_server.src.utils import (
     hash_and_store_password,  # Internal: Hashes and stores a user's password securely.
     check_policy_compliance,  # Internal: Checks if an expense complies with defined policies.
     send_notification,        # Internal: Sends a formatted notification message to a user.
     generate_expense_report   # Internal: Generates a report from processed expense data.
 )
 
-# Importing routes from other backend services
-from authentication_service.src.routes import auth_bp  # Internal: Authentication service routes.
-from policy_engine.src.routes import policy_bp          # Internal: Policy engine service routes.
-from notification_service.src.routes import notification_bp  # Internal: Notification service routes.
-from reporting_module.src.routes import reporting_bp          # Internal: Reporting module routes.
+# Routes of the other backend services are imported on the first request to their URL prefix
+from src.backend.main_server.src.lazy_services import mount_services  # Internal: Deferred service route loading.
+from src.backend.common.hashing import get_hash_cost  # Internal: Calibrates password hashing cost.
+from src.backend.common.json_provider import init_json  # Internal: Fast JSON responses.
+from src.backend.common.profiling import init_profiling  # Internal: Opt-in request profiling.
+from src.backend.main_server.src.tokens import is_token_revoked, start_revocation_maintenance  # Internal: Access token revocation.
+from src.backend.main_server.src.database import remove_session, route_reads  # Internal: Returns request sessions to the pool; read-replica routing.
+from src.backend.main_server.src.query_detector import QueryDetector  # Internal: Per-request query counts and N+1 detection.
 
 # Initialize the Flask application
 app = Flask(__name__)
+init_json(app)  # Serialize JSON responses with the shared fast provider
+init_profiling(app)  # Profile sampled and debug requests when PROFILE_SAMPLE_RATE or PROFILE_TOKEN is set
 
 # Initialize the database connection
 db = SQLAlchemy()  # Will be initialized with the app in the initialize_main_server function.
@@ -28,6 +38,42 @@ db = SQLAlchemy()  # Will be initialized with the app in the initialize_main_ser
 # Initialize JWT Manager for handling authentication tokens
 jwt = JWTManager()
 
+# Counts each request's queries and reports statements repeated more than N_PLUS_ONE_THRESHOLD times
+query_detector = QueryDetector()
+
+@app.cli.command('import-expenses')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(['ndjson', 'csv']),
+              help='Feed format; defaults to the file extension.')
+@click.option('--chunk-size', type=int, help='Rows per transaction; defaults to EXPENSE_BULK_CHUNK_SIZE.')
+def import_expenses_command(path, fmt, chunk_size):
+    """
+    Imports an NDJSON or CSV expense feed, as POST /expenses/bulk does:
+    `flask import-expenses feed.csv`. Prints the counts and failed rows as JSON.
+    """
+    # Imported here so that starting a worker does not load the ingestion module.
+    from src.backend.main_server.src.ingestion import BulkPayloadError, ingest_expenses, iter_expense_rows
+    fmt = fmt or ('csv' if path.lower().endswith('.csv') else 'ndjson')
+    with open(path, encoding='utf-8', newline='') as feed:
+        rows = iter_expense_rows(feed, 'text/csv' if fmt == 'csv' else 'application/x-ndjson')
+        try:
+            result = ingest_expenses(rows, chunk_size=chunk_size)
+        except BulkPayloadError as e:
+            raise click.ClickException(str(e))
+    click.echo(json.dumps(result, indent=2))
+
+@app.cli.command('reconcile-report-totals')
+@click.option('--dry-run', is_flag=True, help='Report drifted totals without correcting them.')
+@click.option('--chunk-size', type=int, help='Reports per transaction; defaults to REPORT_RECONCILE_CHUNK_SIZE.')
+def reconcile_report_totals_command(dry_run, chunk_size):
+    """
+    Checks every report's total_amount against the sum of its expenses and fixes any drift:
+    `flask reconcile-report-totals`. Prints the counts and drifted reports as JSON.
+    """
+    # Imported here so that starting a worker does not load the reconciliation module.
+    from src.backend.main_server.src.reconciliation import reconcile_report_totals
+    click.echo(json.dumps(reconcile_report_totals(chunk_size=chunk_size, fix=not dry_run), indent=2))
+
 def initialize_main_server():
     """
     Initializes the main server application by setting up configurations, routes, and integrating backend services.
@@ -54,13 +100,33 @@ def initialize_main_server():
     config = load_config()
     app.config.update(config)
 
-    # Step 2: Initialize extensions with the Flask app.
-    # Initialize the SQLAlchemy database connection using the app configurations.
-    db.init_app(app)
-    # Initialize JWT Manager for handling secure user authentication tokens.
-    jwt.init_app(app)
-    # These initializations satisfy the requirement for secure user authentication and token management.
-    # (Technical Specification/5.1 Feature ID: F-001)
+    # Step 2: Initialize extensions with the Flask app, once; later calls (e.g. one per test case)
+    # reuse the initialized app.
+    if 'sqlalchemy' not in app.extensions:
+        # Initialize the SQLAlchemy database connection using the app configurations.
+        db.init_app(app)
+        # Initialize JWT Manager for handling secure user authentication tokens.
+        jwt.init_app(app)
+        # These initializations satisfy the requirement for secure user authentication and token management.
+        # (Technical Specification/5.1 Feature ID: F-001)
+
+        # Refuse revoked access tokens on @jwt_required routes from the in-memory revocation list,
+        # which a background thread keeps in sync with other workers and prunes as buckets expire.
+        jwt.token_in_blocklist_loader(is_token_revoked)
+        start_revocation_maintenance()
+
+        # Return each request's database session to the pool when the request ends.
+        app.teardown_appcontext(remove_session)
+
+        # Keep a client's reads on the primary for READ_AFTER_WRITE_SECONDS after a request that wrote.
+        route_reads(app)
+
+        # Count each request's queries; repeated statement shapes are logged or raised (N_PLUS_ONE_ACTION).
+        query_detector.init_app(app)
+
+    # Calibrate the password hashing cost to PASSWORD_HASH_TARGET_MS on this host now,
+    # so that the first registration or login does not pay for the measurement.
+    get_hash_cost()
 
     # Step 3: Set up the database connection using SQLAlchemy.
     # The database models defined in src.models will be associated with this database instance.
@@ -68,32 +134,26 @@ def initialize_main_server():
     # providing a layer of abstraction and facilitating data integrity.
     # (Technical Specification/6.3.3 Data Storage)
 
-    # Step 4: Register API routes for user registration, login, expense validation,
-    # notification sending, and report retrieval.
-
-    # Register authentication routes for user registration and login.
-    app.register_blueprint(auth_bp)
-    # Requirements Addressed:
-    # - Secure User Authentication and Role-Based Authorization
+    # Step 4: Register the main server's own routes (token refresh and logout, expense listings
+    # and bulk import, batch validation, report retrieval, metrics) at the root of the URL space.
+    # Imported here so that importing this module does not load the routes' dependencies.
+    from src.backend.main_server.src.routes import main_routes
+    if 'main_routes' not in app.blueprints:
+        app.register_blueprint(main_routes)
+
+    # Mount the other services' routes under their own prefixes, which no main server route
+    # uses. Each service's routes are imported on the first request under its prefix, so a
+    # worker only loads the services it serves:
+    # - /auth: Secure User Authentication and Role-Based Authorization
     #   (Technical Specification/5.1 Feature ID: F-001)
-
-    # Register policy validation routes for validating expenses against policies.
-    app.register_blueprint(policy_bp)
-    # Requirements Addressed:
-    # - Policy and Compliance Engine
+    # - /policy: Policy and Compliance Engine
     #   (Technical Specification/5.3 Feature ID: F-003)
-
-    # Register notification routes for sending notifications to users.
-    app.register_blueprint(notification_bp)
-    # Requirements Addressed:
-    # - Notification and Alerting System
+    # - /notifications: Notification and Alerting System
     #   (Technical Specification/5.17 Feature ID: F-017)
-
-    # Register reporting routes for generating and retrieving expense reports.
-    app.register_blueprint(reporting_bp)
-    # Requirements Addressed:
-    # - Reporting and Analytics
+    # - /reporting: Reporting and Analytics
     #   (Technical Specification/5.6 Feature ID: F-006)
+    if 'lazy_services' not in app.extensions:
+        mount_services(app)
 
     # Additional routes can be registered here as needed for other functionalities.
 
@@ -108,6 +168,16 @@ def initialize_main_server():
 
 # Run the application if this file is executed directly.
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Main server')
+    parser.add_argument('--import-profile', action='store_true',
+                        help='Print the modules ranked by cold-start import time and exit.')
+    parser.add_argument('--top', type=int, default=30, help='Modules shown by --import-profile.')
+    args = parser.parse_args()
+    if args.import_profile:
+        from src.backend.main_server.src.import_profile import profile_imports, format_profile
+        print(format_profile(profile_imports(), top=args.top))
+        sys.exit(0)
+
     # Initialize the main server application.
     app = initialize_main_server()
     # Run the Flask development server.
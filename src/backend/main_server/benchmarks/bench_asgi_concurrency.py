@@ -0,0 +1,241 @@
+"""
+Benchmark: concurrent-connection capacity of the ASGI entry point against the WSGI path.
+
+Each request to POST /send_notification waits on the notification service. This benchmark makes
+that wait explicit with a stand-in notification service that answers after --latency seconds,
+then drives the endpoint with an increasing number of concurrent connections:
+- asgi: src/asgi.py under uvicorn, forwarding with the shared async HTTP client.
+- wsgi: a Flask app under gunicorn's threaded worker, making the same call with a blocking
+  client, as the Flask routes do. The main server's own routes are not mounted on its app (and
+  its /send_notification delivers in-process), so the stand-in below keeps the comparison to the
+  serving model: a worker thread per open request against coroutines.
+
+Both servers run --workers processes; gunicorn gets --threads threads per worker. Once the
+concurrency exceeds workers * threads, WSGI requests queue for a thread and their latency grows
+with the concurrency, while the ASGI latency stays near the upstream latency.
+
+Prints requests per second, p50/p95/p99 latency in milliseconds and errors per server and
+concurrency level, and writes them to --output if given.
+
+Usage (from the repository root):
+    python -m src.backend.main_server.benchmarks.bench_asgi_concurrency \\
+        --concurrency 10,100,500,1000 --latency 0.2 --workers 2 --threads 8 --duration 10
+
+Requirements Addressed:
+- Notification and Alerting System
+  - Location: Technical Specification/5.17 Feature ID: F-017
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# External dependencies
+import httpx  # httpx==0.19.0
+from flask import Flask, jsonify, request  # Flask==2.0.1
+
+# NOTIFICATION_SERVICE_URL: The stand-in service, set by the benchmark for both servers.
+NOTIFICATION_SERVICE_URL = os.getenv('NOTIFICATION_SERVICE_URL', 'http://127.0.0.1:8090')
+
+PAYLOAD = {'user_id': 1, 'message': 'Your expense report was approved.'}
+
+# The WSGI stand-in, served by gunicorn: one blocking outbound call per request.
+wsgi_app = Flask('bench_wsgi')
+
+
+@wsgi_app.route('/send_notification', methods=['POST'])
+def wsgi_send_notification():
+    upstream = urllib.request.Request(
+        f'{NOTIFICATION_SERVICE_URL}/notifications/send', data=request.get_data(),
+        headers={'Content-Type': 'application/json'}, method='POST')
+    with urllib.request.urlopen(upstream, timeout=30) as response:
+        return jsonify(json.loads(response.read())), response.status
+
+
+def start_notification_service(port, latency):
+    """
+    Starts the stand-in notification service in a background thread.
+
+    Parameters:
+    - port (int): Port to listen on.
+    - latency (float): Seconds each request waits before it is answered.
+
+    Returns:
+    - ThreadingHTTPServer: The server; call shutdown() to stop it.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length') or 0))
+            time.sleep(latency)
+            body = b'{"status":"sent"}'
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', port), Handler)
+    server.daemon_threads = True
+    server.request_queue_size = 4096
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def free_port():
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+def start_server(kind, port, workers, threads, env):
+    """
+    Starts the server under test in a subprocess and waits until it accepts connections.
+
+    Parameters:
+    - kind (str): 'asgi' or 'wsgi'.
+    - port (int): Port to listen on.
+    - workers (int): Worker processes.
+    - threads (int): Threads per gunicorn worker.
+    - env (dict): The environment of the server.
+
+    Returns:
+    - Popen: The server process.
+    """
+    if kind == 'asgi':
+        command = [sys.executable, '-m', 'uvicorn', 'src.backend.main_server.src.asgi:app',
+                   '--port', str(port), '--workers', str(workers), '--log-level', 'warning',
+                   '--backlog', '4096']
+    else:
+        command = [sys.executable, '-m', 'gunicorn', 'src.backend.main_server.benchmarks.bench_asgi_concurrency:wsgi_app',
+                   '--bind', f'127.0.0.1:{port}', '--workers', str(workers), '--worker-class', 'gthread',
+                   '--threads', str(threads), '--backlog', '4096', '--log-level', 'warning']
+    process = subprocess.Popen(command, env=env)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.5).close()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError(f'The {kind} server did not start on port {port}.')
+
+
+def percentile(sorted_values, fraction):
+    """
+    Nearest-rank percentile of an ascending list, or 0.0 for no samples.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(-(-fraction * len(sorted_values) // 1)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+async def drive(url, concurrency, duration):
+    """
+    Keeps `concurrency` requests open against a URL for `duration` seconds.
+
+    Returns:
+    - dict: requests, errors, requests_per_second and p50/p95/p99 in milliseconds.
+    """
+    latencies, errors = [], 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+        deadline = time.perf_counter() + duration
+
+        async def connection():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await client.post(url, json=PAYLOAD)
+                    if response.status_code != 200:
+                        errors += 1
+                        continue
+                    latencies.append((time.perf_counter() - started) * 1000.0)
+                except httpx.HTTPError:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(connection() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'requests_per_second': round(len(latencies) / elapsed, 2),
+        'p50_ms': round(percentile(latencies, 0.50), 1),
+        'p95_ms': round(percentile(latencies, 0.95), 1),
+        'p99_ms': round(percentile(latencies, 0.99), 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--concurrency', default='10,100,500,1000', help='Comma-separated concurrent connections.')
+    parser.add_argument('--latency', type=float, default=0.2, help='Seconds the notification service takes.')
+    parser.add_argument('--workers', type=int, default=2, help='Worker processes per server.')
+    parser.add_argument('--threads', type=int, default=8, help='Threads per gunicorn worker.')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds per concurrency level.')
+    parser.add_argument('--servers', default='wsgi,asgi', help='Comma-separated servers to run.')
+    parser.add_argument('--output', help='Write the results as JSON to this file.')
+    args = parser.parse_args()
+
+    upstream_port = free_port()
+    upstream = start_notification_service(upstream_port, args.latency)
+    # The ASGI app checks revocations against this database in the background.
+    scratch = tempfile.NamedTemporaryFile(suffix='.db', delete=False)
+    scratch.close()
+    env = dict(os.environ, NOTIFICATION_SERVICE_URL=f'http://127.0.0.1:{upstream_port}',
+               DATABASE_URI=f'sqlite:///{scratch.name}', SECRET_KEY=os.getenv('SECRET_KEY', 'bench'))
+    from sqlalchemy import create_engine
+    from src.backend.main_server.src.models import Base
+    Base.metadata.create_all(create_engine(env['DATABASE_URI']))
+
+    levels = [int(level) for level in args.concurrency.split(',')]
+    results = []
+    print(f'latency={args.latency}s workers={args.workers} threads={args.threads} duration={args.duration}s')
+    print(f'{"server":>6} {"conns":>6} {"req/s":>9} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8} {"errors":>7}')
+    try:
+        for kind in args.servers.split(','):
+            port = free_port()
+            server = start_server(kind, port, args.workers, args.threads, env)
+            try:
+                for concurrency in levels:
+                    result = asyncio.run(drive(f'http://127.0.0.1:{port}/send_notification', concurrency, args.duration))
+                    result.update(server=kind, concurrency=concurrency)
+                    results.append(result)
+                    print(f'{kind:>6} {concurrency:>6} {result["requests_per_second"]:>9} {result["p50_ms"]:>8} '
+                          f'{result["p95_ms"]:>8} {result["p99_ms"]:>8} {result["errors"]:>7}')
+            finally:
+                server.terminate()
+                server.wait()
+    finally:
+        upstream.shutdown()
+        os.remove(scratch.name)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump({'latency': args.latency, 'workers': args.workers, 'threads': args.threads,
+                       'results': results}, output, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: expense report summaries with the Python loop and with the NumPy columnar path.
+
+Builds the same expenses as rows (dicts with a float amount and one of --categories categories)
+and as columns (an amount array and a category list), and times, per expense count:
+- loop: summarize_rows over the rows, the single-pass loop,
+- from_rows: building the columns from the rows, then summarize_columns,
+- columns: summarize_columns on the columns, the path summarize_expenses takes for columns of
+  REPORT_VECTORIZE_MIN_ROWS or more expenses.
+
+Prints the median time per run and the speedup over the loop, and checks the paths agree.
+
+Usage (from the repository root):
+    python -m src.backend.main_server.benchmarks.bench_expense_summary --rows 10000,1000000,10000000
+
+10M rows of dicts take several GB of memory; pass --repeat 1 for that size.
+
+Requirements Addressed:
+- Reporting and Analytics
+  - Location: Technical Specification/5.6 Feature ID: F-006
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import argparse
+import math
+import random
+import statistics
+import time
+
+# External dependency
+import numpy as np  # numpy==1.21.2
+
+# Internal dependency
+from src.backend.main_server.src.expense_summary import summarize_columns, summarize_rows
+
+
+def build_rows(rows, categories, seed=7):
+    """
+    Builds expense rows with float amounts in cents and random categories.
+    """
+    rng = random.Random(seed)
+    names = [f'Category {index}' for index in range(categories)]
+    return [{'amount': rng.randrange(100, 500000) / 100, 'category': rng.choice(names)} for _ in range(rows)]
+
+
+def median_ms(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def columns_from_rows(data):
+    """
+    Builds the columns from the rows, as a caller holding rows would have to.
+    """
+    return np.array([item['amount'] for item in data]), [item['category'] for item in data]
+
+
+def bench_size(rows, categories, repeat):
+    """
+    Times the three paths on one size and returns its table row. The rows and columns are
+    freed when it returns, before the next size is built.
+    """
+    data = build_rows(rows, categories)
+    amounts, names = columns_from_rows(data)
+
+    loop, vectorized = summarize_rows(data), summarize_columns(amounts, names)
+    assert list(loop['expenses_by_category']) == list(vectorized['expenses_by_category'])
+    assert math.isclose(loop['total_expense'], vectorized['total_expense'], rel_tol=1e-9)
+
+    loop_ms = median_ms(lambda: summarize_rows(data), repeat)
+    from_rows_ms = median_ms(lambda: summarize_columns(*columns_from_rows(data)), repeat)
+    columns_ms = median_ms(lambda: summarize_columns(amounts, names), repeat)
+    return (f'{rows:>10} {loop_ms:>10.2f} {from_rows_ms:>13.2f} {columns_ms:>11.2f} '
+            f'{loop_ms / from_rows_ms:>9.1f}x {loop_ms / columns_ms:>7.1f}x')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', default='10000,1000000,10000000', help='Comma-separated expense counts.')
+    parser.add_argument('--categories', type=int, default=12, help='Distinct categories.')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per path.')
+    args = parser.parse_args()
+
+    print(f'{"rows":>10} {"loop ms":>10} {"from_rows ms":>13} {"columns ms":>11} {"from_rows":>10} {"columns":>8}')
+    for rows in (int(count) for count in args.rows.split(',')):
+        print(bench_size(rows, args.categories, args.repeat))
+
+
+if __name__ == '__main__':
+    main()
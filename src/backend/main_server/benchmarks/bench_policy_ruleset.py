@@ -0,0 +1,102 @@
+"""
+Benchmark: expenses checked per second with per-expense policy queries and with the compiled
+ruleset.
+
+Creates --policies policies over --regions regions in a scratch SQLite database, then checks
+--expenses random expenses (amounts and regions) per run, the way a report's lines are checked:
+- query: every expense reads all policies from the database and interprets each one, as
+  check_policy_compliance did before the ruleset cache.
+- compiled: every expense asks PolicyRulesetCache for the current ruleset, which is compiled
+  once, and is checked against it in memory.
+
+Prints the median expenses per second of each path and the speedup, and checks they agree.
+
+Usage (from the repository root):
+    python -m src.backend.main_server.benchmarks.bench_policy_ruleset --policies 10,100,1000 --expenses 500
+
+Requirements Addressed:
+- Policy and Compliance Engine
+  - Location: Technical Specification/5.3 Feature ID: F-003
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import argparse
+import random
+import statistics
+import time
+from decimal import Decimal
+
+# External dependencies
+from sqlalchemy import create_engine, select  # SQLAlchemy version 1.4.25
+from sqlalchemy.orm import Session  # SQLAlchemy version 1.4.25
+
+# Internal dependencies
+from src.backend.main_server.src.models import Base, Policy
+from src.backend.main_server.src.policy_ruleset import PolicyRulesetCache
+
+
+def build(session, policies, regions, expenses, seed=7):
+    """
+    Adds the policies, a quarter of them applying everywhere, and returns random expenses.
+    """
+    rng = random.Random(seed)
+    names = [f'R{index}' for index in range(regions)]
+    session.add_all(
+        Policy(f'Policy {index}', None, Decimal(rng.randrange(5000, 500000)) / 100,
+               None if index % 4 == 0 else ','.join(rng.sample(names, min(3, regions))))
+        for index in range(policies))
+    session.commit()
+    return [{'amount': str(Decimal(rng.randrange(100, 500000)) / 100), 'region': rng.choice(names)}
+            for _ in range(expenses)]
+
+
+def query_check(session, expense):
+    """
+    Checks one expense the way check_policy_compliance did: fetch every policy, interpret each.
+    """
+    amount = Decimal(str(expense['amount']))
+    for policy in session.execute(select(Policy)).scalars():
+        regions = [r.strip() for r in (policy.applicable_regions or '').split(',') if r.strip()]
+        if regions and expense['region'] not in regions:
+            continue
+        if amount > policy.max_amount:
+            return False
+    return True
+
+
+def median_rate(fn, expenses, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = [fn(expense) for expense in expenses]
+        timings.append(time.perf_counter() - started)
+    return len(expenses) / statistics.median(timings), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--policies', default='10,100,1000', help='Comma-separated policy counts.')
+    parser.add_argument('--regions', type=int, default=20, help='Distinct regions.')
+    parser.add_argument('--expenses', type=int, default=500, help='Expenses checked per run.')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per path.')
+    args = parser.parse_args()
+
+    print(f'{"policies":>9} {"query exp/s":>12} {"compiled exp/s":>15} {"speedup":>8}')
+    for policies in (int(count) for count in args.policies.split(',')):
+        engine = create_engine('sqlite://')
+        Base.metadata.create_all(engine)
+        with Session(bind=engine) as session:
+            expenses = build(session, policies, args.regions, args.expenses)
+            cache = PolicyRulesetCache(session=session)
+
+            query_rate, expected = median_rate(lambda expense: query_check(session, expense), expenses, args.repeat)
+            compiled_rate, results = median_rate(lambda expense: cache.get().is_compliant(expense), expenses, args.repeat)
+            assert results == expected
+            print(f'{policies:>9} {query_rate:>12.0f} {compiled_rate:>15.0f} {compiled_rate / query_rate:>7.0f}x')
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
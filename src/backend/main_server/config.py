@@ -4,10 +4,6 @@ import os
 from flask import Flask  # Flask version 2.0.1
 from sqlalchemy import create_engine  # SQLAlchemy version 1.4.25
 
-# Internal dependencies
-from src.backend.main_server.src.models import MainServerModel  # Represents the main server data model, integrating various components such as users, policies, notifications, and expense reports.
-from src.backend.main_server.app import initialize_main_server  # Initializes the main server application, setting up configurations, routes, and integrating various backend services.
-
 # Configuration file for the main server component of the Global Employee Travel Expense Tracking App.
 # This configuration manages environment variables, database connections, and other settings required for the server's operation.
 # It addresses the following requirements:
@@ -0,0 +1,463 @@
+"""
+ASGI entry point for the main server: the same API, served from an event loop.
+
+The Flask app (app.py) holds a worker thread for every open request, including the time it
+spends waiting on the database, on the password hashing pool or on another service. This app
+serves the same routes as coroutines:
+- database access goes through async SQLAlchemy sessions (see async_database.py),
+- password hashing and verification are awaited on the shared hashing pool,
+- notifications are forwarded to the notification service over a shared, pooled HTTP client.
+One worker can then keep thousands of slow requests open at once.
+
+Tokens are interchangeable with the WSGI path: access tokens use Flask-JWT-Extended's claims
+and secret, and are checked against the same in-memory revocation list; refresh tokens go to the
+same table. Reports share the ETags and metric names of GET /reports/<id>.
+
+Run with:
+    uvicorn src.backend.main_server.src.asgi:app --workers 4
+
+Requirements Addressed:
+- Secure User Authentication and Role-Based Authorization
+  - Location: Technical Specification/5.1 Feature ID: F-001
+- Policy and Compliance Engine
+  - Location: Technical Specification/5.3 Feature ID: F-003
+- Reporting and Analytics
+  - Location: Technical Specification/5.6 Feature ID: F-006
+- Notification and Alerting System
+  - Location: Technical Specification/5.17 Feature ID: F-017
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import asyncio
+import contextlib
+import datetime
+import os
+import uuid
+
+# External dependencies
+import httpx  # httpx==0.19.0
+import jwt  # PyJWT==2.3.0
+from sqlalchemy import insert, select  # SQLAlchemy version 1.4.25
+from sqlalchemy.exc import IntegrityError
+from starlette.applications import Starlette  # starlette==0.16.0
+from starlette.responses import Response
+from starlette.routing import Route
+from werkzeug.http import parse_etags  # Installed with Flask; If-None-Match parsing.
+
+# Internal imports
+from src.backend.main_server.src.async_database import async_session, dispose_async_engine  # Async sessions
+from src.backend.main_server.src.models import Employee, ExpenseReport, User  # ORM models
+from src.backend.main_server.src.policy_ruleset import (
+    POLICY_COLUMNS,
+    RULESET_VERSION,
+    compile_ruleset,
+    get_policy_ruleset_cache
+)  # Versioned, precompiled policies
+from src.backend.main_server.src.loading import loading_options  # Named relationship loading profiles
+from src.backend.main_server.src.tokens import (
+    NEW_USER_ROLE,
+    access_token_claims,
+    build_refresh_token,
+    is_token_revoked,
+    start_revocation_maintenance
+)  # Refresh tokens and access token revocation
+from src.backend.common.conditional import CACHE_CONTROL, VersionedResponseCache  # Report ETags
+from src.backend.common.hashing import (
+    HashingPoolFull,
+    HashingTimeout,
+    get_hashing_executor,
+    needs_rehash
+)  # Hashing pool
+from src.backend.common.json_provider import dumps_bytes, loads  # Shared JSON serialization
+from src.backend.common.metrics import metrics  # Shared in-process metrics
+from src.backend.common.permissions import (
+    Permission,
+    claims_permissions,
+    has_permissions
+)  # Bitwise role permission guards
+from src.backend.common.rate_limit import get_login_rate_limiter  # Login admission control
+
+# JWT_SECRET_KEY: Key of the access tokens; as with Flask-JWT-Extended, defaults to SECRET_KEY.
+JWT_SECRET_KEY = os.getenv('JWT_SECRET_KEY') or os.getenv('SECRET_KEY')
+
+# JWT_ACCESS_TOKEN_EXPIRES: Access token lifetime in seconds (Flask-JWT-Extended's default).
+JWT_ACCESS_TOKEN_EXPIRES = int(os.getenv('JWT_ACCESS_TOKEN_EXPIRES', '900'))
+
+# NOTIFICATION_SERVICE_URL: Base URL of the notification service that delivers notifications.
+NOTIFICATION_SERVICE_URL = os.getenv('NOTIFICATION_SERVICE_URL', 'http://notification_service:5000')
+
+# OUTBOUND_TIMEOUT_SECONDS: Timeout of each call to another service.
+OUTBOUND_TIMEOUT_SECONDS = float(os.getenv('OUTBOUND_TIMEOUT_SECONDS', '5'))
+
+# OUTBOUND_MAX_CONNECTIONS: Pooled connections to other services per worker.
+OUTBOUND_MAX_CONNECTIONS = int(os.getenv('OUTBOUND_MAX_CONNECTIONS', '100'))
+
+# REPORT_CACHE_SIZE: Serialized expense reports kept per worker for repeated polls.
+REPORT_CACHE_SIZE = int(os.getenv('REPORT_CACHE_SIZE', '1024'))
+
+# Serialized expense reports by report id, each valid for one report version
+report_cache = VersionedResponseCache('report', maxsize=REPORT_CACHE_SIZE)
+
+# Shared HTTP client, opened when the app starts
+_http = None
+
+
+def json_response(payload, status=200, headers=None):
+    """
+    Returns a JSON response serialized by the shared provider.
+    """
+    return Response(dumps_bytes(payload), status_code=status, headers=headers, media_type='application/json')
+
+
+async def _json_body(request):
+    # The request's JSON object, or an empty one.
+    body = await request.body()
+    return loads(body) if body else {}
+
+
+def _busy():
+    # The hashing pool is saturated or too slow; ask the client to retry shortly
+    return json_response({'message': 'Service busy, please retry'}, 503, {'Retry-After': '1'})
+
+
+async def _on_pool(future):
+    # Awaits a job of the hashing pool without holding the event loop; HashingTimeout, a
+    # HashingPoolFull, if it does not finish in time, as with the executor's own waits.
+    timeout = get_hashing_executor().timeout
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+    except asyncio.TimeoutError:
+        raise HashingTimeout(f'Password hashing did not finish within {timeout}s.') from None
+
+
+def create_access_token(user_id, additional_claims=None):
+    """
+    Creates an access token as Flask-JWT-Extended's create_access_token does, so that tokens
+    issued by either entry point are accepted by both.
+
+    Parameters:
+        user_id (int): The token's identity.
+        additional_claims (dict): Extra claims, e.g. access_token_claims(user).
+
+    Returns:
+        str: The encoded token.
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    claims = {
+        'fresh': False,
+        'iat': now,
+        'jti': str(uuid.uuid4()),
+        'type': 'access',
+        'sub': str(user_id),
+        'nbf': now,
+        'exp': now + datetime.timedelta(seconds=JWT_ACCESS_TOKEN_EXPIRES),
+    }
+    claims.update(additional_claims or {})
+    return jwt.encode(claims, JWT_SECRET_KEY, algorithm='HS256')
+
+
+def authorize(request, required):
+    """
+    Checks the request's bearer access token.
+
+    Parameters:
+        request (Request): The request.
+        required (int): The Permission bits the route needs.
+
+    Returns:
+        tuple: (claims, None) when authorized, else (None, error response).
+    """
+    scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+    if scheme != 'Bearer' or not token:
+        return None, json_response({'message': 'Missing Authorization Header'}, 401)
+    try:
+        claims = jwt.decode(token, JWT_SECRET_KEY, algorithms=['HS256'])
+    except jwt.InvalidTokenError:
+        return None, json_response({'message': 'Invalid token'}, 401)
+    if claims.get('type') != 'access' or is_token_revoked(None, claims):
+        return None, json_response({'message': 'Token has been revoked'}, 401)
+    if not has_permissions(claims_permissions(claims), int(required)):
+        return None, json_response({'message': 'Insufficient permissions.'}, 403)
+    return claims, None
+
+
+async def register_user(request):
+    """
+    API route for user registration; see register_user_route.
+
+    Addresses:
+    - Secure User Authentication and Role-Based Authorization
+      (Technical Specification/5.1 Feature ID: F-001)
+        - TR-F001.1 Implement secure login using unique username and password
+    """
+    # Step 1: Extract user data from the request payload; the username defaults to the email
+    # address and a client cannot choose its own role
+    data = await _json_body(request)
+    first_name = data.get('first_name')
+    last_name = data.get('last_name')
+    email = data.get('email')
+    password = data.get('password')
+    username = data.get('username') or email
+    if not (first_name and last_name and email and password):
+        return json_response({'message': 'first_name, last_name, email and password are required'}, 400)
+
+    # Step 2: Hash the password on the hashing pool while the event loop serves other requests
+    try:
+        password_hash = await _on_pool(get_hashing_executor().submit_hash(password))
+    except HashingPoolFull:
+        return _busy()
+
+    # Step 3: Save the employee record and its login in one transaction; User.__init__ would hash
+    # again on this thread, so the user row is inserted directly
+    async with async_session() as session:
+        try:
+            employee = Employee(first_name, last_name, email, NEW_USER_ROLE, None)
+            session.add(employee)
+            await session.flush()
+            result = await session.execute(insert(User).values(
+                username=username, password_hash=password_hash, role=NEW_USER_ROLE,
+                employee_id=employee.employee_id))
+            await session.commit()
+        except IntegrityError:
+            # The username or email address is already registered
+            return json_response({'message': 'User registration failed: username or email already registered'}, 409)
+
+        # Step 4: Return a success response with an access token carrying the stored role's permissions
+        user = await session.get(User, result.inserted_primary_key[0])
+    access_token = create_access_token(user.user_id, access_token_claims(user))
+    return json_response({
+        'message': 'User registered successfully',
+        'token': access_token,
+        'access_token': access_token  # Earlier name of 'token', kept for existing clients
+    }, 201)
+
+
+async def login_user(request):
+    """
+    API route for user login; see login_user_route.
+
+    Addresses:
+    - Secure User Authentication and Role-Based Authorization
+      (Technical Specification/5.1 Feature ID: F-001)
+        - TR-F001.1 Implement secure login using unique username and password
+    """
+    # Step 1: Extract login credentials from the request payload
+    data = await _json_body(request)
+    username = data.get('username') or data.get('email')
+    password = data.get('password')
+
+    # Refuse attempts over the per-IP or per-username rate before any lookup or hashing
+    client_ip = request.client.host if request.client else None
+    decision = get_login_rate_limiter().check(username, client_ip)
+    if not decision.allowed:
+        return json_response({'message': 'Too many login attempts, please retry later'}, 429,
+                             {'Retry-After': str(decision.retry_after)})
+
+    async with async_session() as session:
+        # Step 2: Retrieve the user
+        user = (await session.execute(select(User).where(User.username == username))).scalars().first()
+        if user is None and data.get('email'):
+            user = (await session.execute(
+                select(User).join(User.employee).where(Employee.email == data['email']))).scalars().first()
+        if user is None:
+            return json_response({'message': 'User not found'}, 404)
+
+        # Step 3: Verify the password on the hashing pool
+        executor = get_hashing_executor()
+        try:
+            password_matches = await _on_pool(executor.submit_check(password, user.password_hash))
+        except HashingPoolFull:
+            return _busy()
+        if not password_matches:
+            return json_response({'message': 'Invalid credentials'}, 401)
+
+        # Transparently upgrade a hash that predates the current scheme or calibrated cost
+        if needs_rehash(user.password_hash):
+            try:
+                user.password_hash = await _on_pool(executor.submit_hash(password))
+            except HashingPoolFull:
+                pass  # Upgrade on a later login when the pool has capacity
+
+        # Step 4: Issue an access token and a server-side refresh token
+        record, refresh_token = build_refresh_token(user.user_id)
+        session.add(record)
+        await session.commit()
+
+    # Step 5: Return a success response with the tokens
+    access_token = create_access_token(user.user_id, access_token_claims(user))
+    return json_response({
+        'message': 'Login successful',
+        'token': access_token,
+        'access_token': access_token,  # Earlier name of 'token', kept for existing clients
+        'refresh_token': refresh_token
+    })
+
+
+async def current_policy_ruleset():
+    # The worker's compiled policies (see policy_ruleset.py), with the version read asynchronously.
+    cache = get_policy_ruleset_cache()
+    ruleset = cache.fresh()
+    if ruleset is not None:
+        return ruleset
+    async with async_session() as session:
+        version = (await session.execute(RULESET_VERSION)).scalar() or 0
+        ruleset = cache.current
+        if ruleset is None or ruleset.version != version:
+            ruleset = compile_ruleset(version, (await session.execute(POLICY_COLUMNS)).all())
+    return cache.install(ruleset)
+
+
+async def validate_expense(request):
+    """
+    API route to validate an expense against the policies table; see validate_expense_route.
+
+    Addresses:
+    - Policy and Compliance Engine
+      (Technical Specification/5.3 Feature ID: F-003)
+        - TR-F003.2 Perform real-time policy checks during expense submission
+        - TR-F003.5 Flag expenses that exceed policy limits or require additional approval
+    """
+    claims, error = authorize(request, Permission.SUBMIT_EXPENSES)
+    if error:
+        return error
+
+    # Step 1: Parse the expense and get the compiled policies
+    expense_data = await _json_body(request)
+    ruleset = await current_policy_ruleset()
+
+    # Step 2: Return the compliance status and any violations
+    violations = ruleset.violations(expense_data)
+    return json_response({'compliance_status': {
+        'policy_compliant': not violations,
+        'policy_violations': violations,
+    }})
+
+
+async def send_notification(request):
+    """
+    API route for sending notifications, forwarded to the notification service without
+    blocking the worker; see send_notification_route.
+
+    Addresses:
+    - Notification and Alerting System
+      (Technical Specification/5.17 Feature ID: F-017)
+        - TR-F017.1 Send email and in-app notifications for pending expense approvals
+    """
+    data = await _json_body(request)
+    headers = {}
+    if 'Authorization' in request.headers:
+        headers['Authorization'] = request.headers['Authorization']
+    try:
+        upstream = await _http.post(f'{NOTIFICATION_SERVICE_URL}/notifications/send', json=data, headers=headers)
+    except httpx.HTTPError as e:
+        metrics.inc('notification_forward_errors')
+        return json_response({'message': 'Notification service unavailable', 'error': str(e)}, 502)
+    if upstream.status_code >= 500:
+        metrics.inc('notification_forward_errors')
+        return json_response({'message': 'Notification service error'}, 502)
+    return Response(upstream.content, status_code=upstream.status_code,
+                    media_type=upstream.headers.get('content-type', 'application/json'))
+
+
+def _report_response(body=None, status=200, etag=None):
+    return Response(body, status_code=status, media_type='application/json',
+                    headers={'ETag': f'"{etag}"', 'Cache-Control': CACHE_CONTROL})
+
+
+async def get_expense_report(request):
+    """
+    API route to retrieve an expense report by ID, with the ETags of get_expense_report_route.
+
+    Addresses:
+    - Reporting and Analytics
+      (Technical Specification/5.6 Feature ID: F-006)
+        - TR-F006.2 Generate detailed expense reports by employee, department, project, or cost center
+    """
+    claims, error = authorize(request, Permission.VIEW_REPORTS)
+    if error:
+        return error
+    report_id = request.path_params['report_id']
+
+    async with async_session() as session:
+        # Step 1: Look up the report's current version, one primary key probe
+        version = await session.scalar(select(ExpenseReport.version).where(ExpenseReport.report_id == report_id))
+        if version is None:
+            return json_response({'message': 'Expense report not found'}, 404)
+
+        # Step 2: Answer 304 if the client holds this version, else serve it from the cache
+        etag = report_cache.etag(report_id, version)
+        if parse_etags(request.headers.get('If-None-Match')).contains_weak(etag):
+            metrics.inc('report_not_modified')
+            return _report_response(status=304, etag=etag)
+        body = report_cache.get(report_id, version)
+        if body is not None:
+            metrics.inc('report_cache_hits')
+            return _report_response(body, etag=etag)
+
+        # Step 3: Load the report with its employee and items, two queries
+        metrics.inc('report_cache_misses')
+        report = (await session.execute(
+            select(ExpenseReport)
+            .options(*loading_options(ExpenseReport, 'report_with_items'))
+            .where(ExpenseReport.report_id == report_id)
+        )).scalars().first()
+        if report is None:
+            return json_response({'message': 'Expense report not found'}, 404)
+        payload = {'expense_report': report.to_dict()}
+
+    etag = report_cache.etag(report_id, report.version)
+    body = dumps_bytes(payload)
+    report_cache.put(report_id, report.version, body)
+    return _report_response(body, etag=etag)
+
+
+async def metrics_route(request):
+    """
+    API route reporting the worker's in-process metrics.
+    """
+    return json_response(metrics.snapshot())
+
+
+async def startup():
+    """Opens the outbound HTTP client and starts the revocation maintenance thread."""
+    global _http
+    _http = httpx.AsyncClient(
+        timeout=OUTBOUND_TIMEOUT_SECONDS,
+        limits=httpx.Limits(max_connections=OUTBOUND_MAX_CONNECTIONS),
+    )
+    start_revocation_maintenance()
+
+
+async def shutdown():
+    """Closes the outbound HTTP client and the async engine's connections."""
+    global _http
+    if _http is not None:
+        await _http.aclose()
+        _http = None
+    await dispose_async_engine()
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    # A lifespan context rather than on_startup/on_shutdown, which Starlette 1.0 removed;
+    # both the pinned 0.16 and current releases accept it.
+    await startup()
+    try:
+        yield
+    finally:
+        await shutdown()
+
+
+app = Starlette(
+    routes=[
+        Route('/register', register_user, methods=['POST']),
+        Route('/login', login_user, methods=['POST']),
+        Route('/validate_expense', validate_expense, methods=['POST']),
+        Route('/send_notification', send_notification, methods=['POST']),
+        Route('/reports/{report_id:int}', get_expense_report, methods=['GET']),
+        Route('/metrics', metrics_route, methods=['GET']),
+    ],
+    lifespan=lifespan,
+)
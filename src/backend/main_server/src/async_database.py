@@ -0,0 +1,108 @@
+"""
+Async database engine and sessions for the main server's ASGI entry point (see asgi.py).
+
+The engine is created on first use from ASYNC_DATABASE_URI, or else from DATABASE_URI with its
+driver swapped for the async driver of the same database (asyncpg for PostgreSQL, aiosqlite for
+SQLite). The models and their events are shared with the WSGI path. Queries must load every
+relationship they use up front (see loading.py), because lazy loads are not available on an
+AsyncSession.
+
+Requirements Addressed:
+- Data Management
+  - Location: Technical Specification/5.10 Feature ID: F-010
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import os
+
+# SQLAlchemy version 1.4.25 (with the asyncio extra)
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+# Internal imports
+from src.backend.main_server.src.database import DATABASE_URI
+
+# ASYNC_DATABASE_URI: Connection string with an async driver; defaults to DATABASE_URI with its
+# driver replaced per ASYNC_DRIVERS.
+ASYNC_DATABASE_URI = os.getenv('ASYNC_DATABASE_URI')
+
+# ASYNC_DB_POOL_SIZE: Connections per ASGI worker. Coroutines wait for a connection beyond it,
+# so size it for the number of queries in flight rather than the number of open requests.
+ASYNC_DB_POOL_SIZE = int(os.getenv('ASYNC_DB_POOL_SIZE', '20'))
+
+# Database backend -> async driver name.
+ASYNC_DRIVERS = {
+    'postgresql': 'postgresql+asyncpg',
+    'sqlite': 'sqlite+aiosqlite',
+}
+
+_engine = None
+
+
+def async_url(url):
+    """
+    Returns a connection string for the async driver of the same database.
+
+    Parameters:
+        url (str): A synchronous connection string, e.g. 'postgresql://...' or 'sqlite:///app.db'.
+
+    Returns:
+        str: The string with its driver replaced, e.g. 'postgresql+asyncpg://...'.
+
+    Raises:
+        ValueError: For databases without a known async driver.
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f'No async driver configured for {backend}; set ASYNC_DATABASE_URI.')
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+def init_async_engine(url=None):
+    """
+    Creates the process-wide async engine.
+
+    Parameters:
+        url (str): Connection string with an async driver; defaults to ASYNC_DATABASE_URI, or
+            DATABASE_URI converted with async_url.
+
+    Returns:
+        AsyncEngine: The engine.
+    """
+    global _engine
+    url = url or ASYNC_DATABASE_URI or async_url(DATABASE_URI)
+    options = {'pool_pre_ping': True}
+    if make_url(url).get_backend_name() != 'sqlite':
+        options['pool_size'] = ASYNC_DB_POOL_SIZE
+    _engine = create_async_engine(url, **options)
+    return _engine
+
+
+def get_async_engine():
+    """
+    Returns the process-wide async engine, creating it on first use. The ASGI app runs on one
+    event loop per worker, so no lock is needed.
+    """
+    return _engine or init_async_engine()
+
+
+def async_session():
+    """
+    Returns a new AsyncSession; use it as `async with async_session() as session:`.
+
+    Objects stay loaded after commit, so that routes can serialize them without another query.
+    """
+    return AsyncSession(bind=get_async_engine(), expire_on_commit=False)
+
+
+async def dispose_async_engine():
+    """
+    Closes the async engine's pooled connections; called when the ASGI app shuts down.
+    """
+    global _engine
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
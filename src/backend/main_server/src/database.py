@@ -0,0 +1,140 @@
+"""
+Database engine and request-scoped session for the main server.
+
+The engine is created on first use from the DATABASE_URI environment variable (see config.py), so
+importing the models or utilities never opens a connection. `db_session` is a thread-local
+session; the app removes it at the end of each request. With QUERY_CAPTURE_FILE set, the engine
+records its statements for the index advisor.
+
+With DATABASE_REPLICA_URLS set, sessions route marked reads to the replicas (see
+common/replicas.py): reads inside `read_replica()` and GET requests to
+read-only blueprints, unless the session or the client has just written.
+
+Requirements Addressed:
+- Data Management
+  - Location: Technical Specification/5.10 Feature ID: F-010
+"""
+
+# Standard library
+import os
+import threading
+
+# SQLAlchemy version 1.4.25
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session
+
+# Internal imports
+from src.backend.common import replicas  # Read-replica routing
+
+# DATABASE_URI: The main server's database connection string (read here as well as in config.py,
+# which imports the application and so cannot be imported from the model layer).
+DATABASE_URI = os.getenv('DATABASE_URI', 'sqlite:///main_server.db')
+
+# QUERY_CAPTURE_FILE: When set, the engine appends the statements it executes to this file for the
+# index advisor (see index_advisor.py). For benchmark runs only.
+QUERY_CAPTURE_FILE = os.getenv('QUERY_CAPTURE_FILE')
+
+# DATABASE_REPLICA_URLS: Comma-separated connection strings of read replicas; empty for none.
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv('DATABASE_REPLICA_URLS', '').split(',') if url.strip()]
+
+# REPLICA_MAX_LAG_SECONDS: Staleness bound; a replica further behind the primary is not read from.
+REPLICA_MAX_LAG_SECONDS = float(os.getenv('REPLICA_MAX_LAG_SECONDS', '5'))
+
+# REPLICA_LAG_CHECK_SECONDS: How long a replica's measured lag is reused before probing it again.
+REPLICA_LAG_CHECK_SECONDS = float(os.getenv('REPLICA_LAG_CHECK_SECONDS', '1'))
+
+# READ_AFTER_WRITE_SECONDS: How long a client's reads stay on the primary after it wrote.
+READ_AFTER_WRITE_SECONDS = int(os.getenv('READ_AFTER_WRITE_SECONDS', '10'))
+
+_engine = None
+_router = None
+_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """
+    Returns the process-wide engine, creating it on first use.
+
+    Returns:
+        Engine: The SQLAlchemy engine with pre-ping enabled.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = create_engine(DATABASE_URI, pool_pre_ping=True)
+                if QUERY_CAPTURE_FILE:
+                    from src.backend.main_server.src.index_advisor import capture_statements
+                    capture_statements(_engine, QUERY_CAPTURE_FILE)
+    return _engine
+
+
+def bind_engine(engine):
+    """
+    Makes an engine the process-wide one, e.g. an in-memory database in the tests.
+
+    Parameters:
+        engine (Engine): The engine db_session and the read router use from now on.
+    """
+    global _engine, _router
+    with _engine_lock:
+        db_session.remove()
+        _engine = engine
+        _router = None
+
+
+def get_router():
+    """
+    Returns the process-wide read router over the primary and DATABASE_REPLICA_URLS, creating
+    the replica engines on first use.
+
+    Returns:
+        ReplicaRouter: The router; without replicas, it sends every statement to the primary.
+    """
+    global _router
+    if _router is None:
+        primary = get_engine()
+        with _engine_lock:
+            if _router is None:
+                _router = replicas.ReplicaRouter(
+                    primary,
+                    [create_engine(url, pool_pre_ping=True) for url in DATABASE_REPLICA_URLS],
+                    max_lag=REPLICA_MAX_LAG_SECONDS,
+                    check_interval=REPLICA_LAG_CHECK_SECONDS,
+                )
+    return _router
+
+
+def _new_session():
+    return replicas.RoutingSession(get_router())
+
+
+# Thread-local session used by the models, utilities and routes.
+db_session = scoped_session(_new_session)
+
+
+def remove_session(exception=None):
+    """
+    Closes the current thread's session and returns its connection to the pool.
+
+    Registered as an app teardown handler.
+    """
+    db_session.remove()
+
+
+def read_replica():
+    """
+    Marks the db_session reads in a block as servable by a read replica.
+
+    Example:
+        with read_replica():
+            reports = db_session.query(ExpenseReport).all()
+    """
+    return replicas.read_replica(db_session)
+
+
+def route_reads(scaffold, read_only=False):
+    """
+    Installs read routing for db_session on a Flask app or blueprint (see replicas.route_reads).
+    """
+    replicas.route_reads(scaffold, db_session, sticky_seconds=READ_AFTER_WRITE_SECONDS, read_only=read_only)
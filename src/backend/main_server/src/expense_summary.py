@@ -0,0 +1,134 @@
+"""
+Summary statistics of expenses for generate_expense_report: total, average, count and the total
+per category.
+
+Expenses come either as rows, a list of dicts with 'amount' and 'category' keys, or as columns,
+a dict {'amount': [...], 'category': [...]} of equal-length sequences or NumPy arrays:
+- Rows are summed by `summarize_rows`, a single loop over the rows.
+- Columns of REPORT_VECTORIZE_MIN_ROWS or more expenses are summed by `summarize_columns` with
+  NumPy. The total is one array sum. The categories become integer codes, in order of first
+  appearance, and the per-category totals are one `np.bincount` weighted by the amounts.
+  Smaller columns, and columns that are not all ints or floats (e.g. Decimal), are summed by the
+  loop, so that they keep Python's exact arithmetic and types.
+
+Rows are not converted to columns: pulling the fields out of the dicts takes about as long as the
+loop itself (see benchmarks/bench_expense_summary.py), so callers that hold large data should
+build the columns once at the source.
+
+Both paths return the same summary. Integer amounts give exactly the same sums. Float amounts
+can differ in the last bits, because NumPy adds in a different order.
+NumPy is optional; without it every input uses the loop.
+
+Requirements Addressed:
+- Reporting and Analytics
+  - Location: Technical Specification/5.6 Feature ID: F-006
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import itertools
+import os
+from collections import defaultdict
+from collections.abc import Mapping
+
+try:
+    import numpy as np  # Optional (numpy>=1.21): vectorized sums for large inputs.
+except ImportError:
+    np = None
+
+# REPORT_VECTORIZE_MIN_ROWS: Expenses from which columns are summed with NumPy. Below it, coding
+# the categories costs more than the loop it replaces.
+REPORT_VECTORIZE_MIN_ROWS = int(os.getenv('REPORT_VECTORIZE_MIN_ROWS', '200'))
+
+# Category of rows without one.
+UNCATEGORIZED = 'Uncategorized'
+
+
+def summarize_rows(processed_data):
+    """
+    Summarizes expense rows in one Python loop; the path for small and non-numeric inputs.
+
+    Parameters:
+        processed_data (list): Expense dicts with optional 'amount' and 'category' keys.
+
+    Returns:
+        dict: total_expense, average_expense, expense_count and expenses_by_category.
+    """
+    total_expense = 0
+    expenses_by_category = {}
+    for item in processed_data:
+        amount = item.get('amount', 0)
+        category = item.get('category', UNCATEGORIZED)
+        total_expense += amount
+        expenses_by_category[category] = expenses_by_category.get(category, 0) + amount
+    expense_count = len(processed_data)
+    return {
+        'total_expense': total_expense,
+        'average_expense': total_expense / expense_count if expense_count > 0 else 0,
+        'expense_count': expense_count,
+        'expenses_by_category': expenses_by_category,
+    }
+
+
+def _category_codes(categories, count):
+    # Integer code of each category, in order of first appearance, and the categories by code.
+    # The defaultdict numbers new keys as they are looked up, without a Python-level loop.
+    codes_by_category = defaultdict(itertools.count().__next__)
+    codes = np.fromiter(map(codes_by_category.__getitem__, categories), dtype=np.intp, count=count)
+    return codes, list(codes_by_category)
+
+
+def summarize_columns(amounts, categories):
+    """
+    Summarizes expenses given as columns, with NumPy.
+
+    Parameters:
+        amounts (sequence or ndarray): Amounts, all ints or all floats.
+        categories (iterable): The category of each amount, in the same order.
+
+    Returns:
+        dict: As summarize_rows, with categories in order of first appearance and plain Python
+        numbers (int for integer amounts, else float).
+    """
+    amounts = np.asarray(amounts)
+    expense_count = len(amounts)
+    codes, labels = _category_codes(categories, expense_count)
+    sums = np.bincount(codes, weights=amounts, minlength=len(labels))
+    if amounts.dtype.kind in 'iu':
+        # bincount sums in float64; exact for integer totals below 2**53.
+        sums = sums.astype(np.int64)
+    total_expense = amounts.sum().item()
+    return {
+        'total_expense': total_expense,
+        'average_expense': total_expense / expense_count if expense_count > 0 else 0,
+        'expense_count': expense_count,
+        'expenses_by_category': dict(zip(labels, sums.tolist())),
+    }
+
+
+def summarize_expenses(processed_data, min_rows=None):
+    """
+    Summarizes expenses given as rows or as columns, with NumPy for large numeric columns and a
+    loop otherwise.
+
+    Parameters:
+        processed_data (list or dict): Expense dicts with optional 'amount' and 'category' keys,
+            or a dict of columns {'amount': [...], 'category': [...]}.
+        min_rows (int): Overrides REPORT_VECTORIZE_MIN_ROWS, e.g. for benchmarks.
+
+    Returns:
+        dict: total_expense, average_expense, expense_count and expenses_by_category.
+    """
+    if not isinstance(processed_data, Mapping):
+        return summarize_rows(processed_data)
+    amounts, categories = processed_data['amount'], processed_data['category']
+    if len(amounts) != len(categories):
+        raise ValueError('The amount and category columns differ in length.')
+    min_rows = REPORT_VECTORIZE_MIN_ROWS if min_rows is None else min_rows
+    if np is not None and len(amounts) >= min_rows:
+        array = np.asarray(amounts)
+        if array.dtype.kind in 'iuf':
+            return summarize_columns(array, categories)
+    # Small or non-numeric columns: Decimal and other amounts keep Python's arithmetic.
+    return summarize_rows([{'amount': amount, 'category': category} for amount, category in zip(amounts, categories)])
@@ -0,0 +1,105 @@
+"""
+Cold-start import profiling for the main server.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter and ranks the modules by
+cumulative import time. `python app.py --import-profile` prints the ranking. The test suite uses
+`cold_start_ms` to fail when importing the app exceeds MAIN_SERVER_IMPORT_BUDGET_MS.
+
+Requirements Addressed:
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import os
+import subprocess
+import sys
+from collections import namedtuple
+
+# MAIN_SERVER_IMPORT_BUDGET_MS: Most milliseconds importing the main server app may take in a fresh
+# interpreter before the import-time test fails.
+MAIN_SERVER_IMPORT_BUDGET_MS = float(os.getenv('MAIN_SERVER_IMPORT_BUDGET_MS', '1500'))
+
+# The module a worker imports at startup.
+APP_MODULE = 'src.backend.main_server.app'
+
+# One line of -X importtime output.
+# - module (str): The imported module.
+# - self_us (int): Microseconds spent in the module itself.
+# - cumulative_us (int): Microseconds including the modules it imported.
+# - depth (int): Nesting level; 0 for modules imported directly by the profiled statement.
+ImportTiming = namedtuple('ImportTiming', ['module', 'self_us', 'cumulative_us', 'depth'])
+
+# The repository root, so that 'src.backend...' imports resolve in the child interpreter.
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
+
+
+def profile_imports(module=APP_MODULE, cwd=REPO_ROOT):
+    """
+    Imports a module in a fresh interpreter and collects its import timings.
+
+    Parameters:
+        module (str): The module to import.
+        cwd (str): Working directory of the child interpreter.
+
+    Returns:
+        list of ImportTiming: One entry per module imported, in import order.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    if completed.returncode != 0:
+        tail = '\n'.join(completed.stderr.strip().splitlines()[-5:])
+        raise RuntimeError(f'Importing {module} failed:\n{tail}')
+    timings = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        timings.append(ImportTiming(name.strip(), int(self_us), int(cumulative_us), depth))
+    return timings
+
+
+def cold_start_ms(module=APP_MODULE, runs=3):
+    """
+    Measures how long importing a module takes in a fresh interpreter.
+
+    Parameters:
+        module (str): The module to import.
+        runs (int): Attempts; the fastest is reported, to discount scheduling noise.
+
+    Returns:
+        float: Milliseconds of cumulative import time of the module.
+    """
+    best = None
+    for _ in range(runs):
+        total = sum(t.cumulative_us for t in profile_imports(module) if t.depth == 0)
+        best = total if best is None else min(best, total)
+    return best / 1000.0
+
+
+def format_profile(timings, top=30):
+    """
+    Ranks import timings by cumulative time.
+
+    Parameters:
+        timings (list of ImportTiming): From profile_imports.
+        top (int): Number of modules to show.
+
+    Returns:
+        str: A table of the slowest modules and the total.
+    """
+    total_us = sum(t.cumulative_us for t in timings if t.depth == 0)
+    lines = [f'{"cumulative ms":>14} {"self ms":>9} {"share":>6}  module']
+    for timing in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        share = timing.cumulative_us / total_us * 100 if total_us else 0.0
+        lines.append(f'{timing.cumulative_us / 1000:>14.1f} {timing.self_us / 1000:>9.1f} '
+                     f'{share:>5.1f}%  {"  " * timing.depth}{timing.module}')
+    lines.append(f'{"":>14} {"":>9} {"":>6}  total {total_us / 1000:.1f} ms '
+                 f'(budget {MAIN_SERVER_IMPORT_BUDGET_MS:.0f} ms)')
+    return '\n'.join(lines)
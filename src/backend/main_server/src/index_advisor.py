@@ -0,0 +1,229 @@
+"""
+Index advice from the statements a benchmark actually runs.
+
+Two steps:
+1. Capture: with QUERY_CAPTURE_FILE set, the main server's engine appends every SELECT, UPDATE
+   and DELETE it executes to that file as NDJSON ({"statement", "parameters"}). Run a benchmark
+   or load test against the server with it set.
+2. Advise: `python -m src.backend.main_server.src.index_advisor CAPTURE_FILE` groups the captured
+   statements by shape (see query_detector.statement_shape) and runs EXPLAIN on one sample of each.
+   It lists every sequential scan with the columns the statement filters that table on, and
+   suggests an index: equality columns first, then range columns. Shapes are ranked by how often
+   they ran.
+
+PostgreSQL plans are read from EXPLAIN (FORMAT JSON); SQLite plans from EXPLAIN QUERY PLAN. The
+planner prefers sequential scans on small tables, so advise against a database holding realistic
+volumes.
+
+Requirements Addressed:
+- Data Management
+  - Location: Technical Specification/5.10 Feature ID: F-010
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import argparse
+import json
+import os
+import re
+import threading
+from collections import Counter, namedtuple
+
+# SQLAlchemy version 1.4.25
+from sqlalchemy import create_engine, event
+
+# Internal imports
+from src.backend.main_server.src.query_detector import statement_shape
+
+# Statements worth explaining; inserts and DDL never scan.
+_EXPLAINABLE = ('SELECT', 'UPDATE', 'DELETE', 'WITH')
+
+# "column <op>" in a Postgres Filter or a SQL WHERE clause, e.g. "(status)::text = " or "expenses.status IN".
+_COMPARISON = r'\(?{qualifier}"?(\w+)"?\)?(?:::[\w ]+)?\s*(=|<>|!=|<=|>=|<|>|~~|\bIN\b|\bBETWEEN\b|\bLIKE\b|\bIS\b)'
+_EQUALITY = {'=', 'IN', 'IS'}
+
+# One sequential scan found in a plan.
+# - table (str): The scanned table.
+# - equality (tuple): Columns compared for equality, in the order they appear.
+# - ranges (tuple): Columns compared by range or pattern.
+SeqScan = namedtuple('SeqScan', ['table', 'equality', 'ranges'])
+
+# One piece of advice.
+# - scan (SeqScan): The scan.
+# - executions (int): How often statements of this shape ran during the capture.
+# - statement (str): A sample statement.
+# - suggestion (str or None): CREATE INDEX statement, or None when the scan has no filter.
+Advice = namedtuple('Advice', ['scan', 'executions', 'statement', 'suggestion'])
+
+
+def capture_statements(engine, path):
+    """
+    Appends the explainable statements the engine executes to an NDJSON file.
+
+    Parameters:
+        engine (Engine): The engine to listen on.
+        path (str): The capture file; appended to, so several workers can share it.
+    """
+    lock = threading.Lock()
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(_EXPLAINABLE):
+            return
+        if executemany:
+            parameters = parameters[0] if parameters else None
+        line = json.dumps({'statement': statement, 'parameters': parameters}, default=str)
+        with lock, open(path, 'a', encoding='utf-8') as capture:
+            capture.write(line + '\n')
+
+
+def load_capture(path):
+    """
+    Groups a capture file by statement shape.
+
+    Parameters:
+        path (str): A file written by capture_statements.
+
+    Returns:
+        list: (executions, statement, parameters) per shape, most frequent first, with the
+        first sample of each shape.
+    """
+    counts, samples = Counter(), {}
+    with open(path, encoding='utf-8') as capture:
+        for line in capture:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            shape = statement_shape(entry['statement'])
+            counts[shape] += 1
+            samples.setdefault(shape, (entry['statement'], entry['parameters']))
+    return [(count, *samples[shape]) for shape, count in counts.most_common()]
+
+
+def _filter_columns(text, qualifier=''):
+    # (equality columns, range columns) compared in a filter or WHERE clause.
+    equality, ranges = [], []
+    for column, operator in re.findall(_COMPARISON.format(qualifier=qualifier), text, re.IGNORECASE):
+        target = equality if operator.upper() in _EQUALITY else ranges
+        if column not in equality and column not in ranges:
+            target.append(column)
+    return tuple(equality), tuple(ranges)
+
+
+def _driver_parameters(parameters):
+    # JSON turned tuples into lists; DBAPI drivers want a tuple for positional parameters.
+    return tuple(parameters) if isinstance(parameters, list) else (parameters or ())
+
+
+def _postgres_scans(connection, statement, parameters):
+    plan = connection.exec_driver_sql(f'EXPLAIN (FORMAT JSON) {statement}', _driver_parameters(parameters)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    scans, nodes = [], [plan[0]['Plan']]
+    while nodes:
+        node = nodes.pop()
+        nodes.extend(node.get('Plans', ()))
+        if node.get('Node Type') == 'Seq Scan':
+            scans.append(SeqScan(node['Relation Name'], *_filter_columns(node.get('Filter', ''))))
+    return scans
+
+
+def _sqlite_scans(connection, statement, parameters):
+    scans = []
+    for row in connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {statement}', _driver_parameters(parameters)):
+        match = re.match(r'SCAN (?:TABLE )?(\w+)(?: AS (\w+))?$', row[-1])
+        if match:
+            # SQLite plans name the table but not the filter; take the columns from the WHERE clause.
+            table, alias = match.group(1), match.group(2) or match.group(1)
+            where = re.search(r'\bWHERE\b', statement, re.IGNORECASE)
+            text = statement[where.end():] if where else ''
+            scans.append(SeqScan(table, *_filter_columns(text, qualifier=rf'{re.escape(alias)}\.')))
+    return scans
+
+
+def explain_scans(connection, statement, parameters=None):
+    """
+    Runs EXPLAIN on a statement and returns its sequential scans.
+
+    Parameters:
+        connection (Connection): A connection to the database the statement ran against.
+        statement (str): The statement as sent to the driver.
+        parameters: Its driver parameters (list or dict), or None.
+
+    Returns:
+        list of SeqScan: The full table scans in the plan.
+
+    Raises:
+        NotImplementedError: For databases other than PostgreSQL and SQLite.
+    """
+    dialect = connection.dialect.name
+    if dialect == 'postgresql':
+        return _postgres_scans(connection, statement, parameters)
+    if dialect == 'sqlite':
+        return _sqlite_scans(connection, statement, parameters)
+    raise NotImplementedError(f'EXPLAIN parsing is not implemented for {dialect}')
+
+
+def suggest_index(scan):
+    """
+    Suggests an index for a sequential scan.
+
+    Parameters:
+        scan (SeqScan): The scan.
+
+    Returns:
+        str or None: A CREATE INDEX statement, or None if the scan filters on no column.
+    """
+    columns = scan.equality + scan.ranges[:1]  # A B-tree only narrows on one range column.
+    if not columns:
+        return None
+    return f'CREATE INDEX idx_{scan.table}_{"_".join(columns)} ON {scan.table} ({", ".join(columns)});'
+
+
+def advise(connection, captured):
+    """
+    Explains the captured statements and lists their sequential scans.
+
+    Parameters:
+        connection (Connection): A connection to the database to explain against.
+        captured (list): From load_capture.
+
+    Returns:
+        list of Advice: One entry per scan, most executed statements first.
+    """
+    advice = []
+    for executions, statement, parameters in captured:
+        for scan in explain_scans(connection, statement, parameters):
+            advice.append(Advice(scan, executions, statement, suggest_index(scan)))
+    return advice
+
+
+def format_advice(advice):
+    """
+    Formats advice as a readable report.
+
+    Parameters:
+        advice (list of Advice): From advise.
+
+    Returns:
+        str: One paragraph per scan.
+    """
+    if not advice:
+        return 'No sequential scans found.'
+    lines = []
+    for item in advice:
+        lines.append(f'{item.executions:>8}x  Seq Scan on {item.scan.table}')
+        lines.append(f'           {" ".join(item.statement.split())[:200]}')
+        lines.append(f'           suggest: {item.suggestion or "(no filter; the statement reads the whole table)"}')
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Suggest indexes from the statements captured during a benchmark run.')
+    parser.add_argument('capture', help='File written while QUERY_CAPTURE_FILE was set.')
+    parser.add_argument('--database-url', default=os.getenv('DATABASE_URI', 'sqlite:///main_server.db'),
+                        help='Database to explain against; defaults to DATABASE_URI.')
+    args = parser.parse_args()
+    with create_engine(args.database_url).connect() as connection:
+        print(format_advice(advise(connection, load_capture(args.capture))))
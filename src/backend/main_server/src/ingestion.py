@@ -0,0 +1,320 @@
+"""
+Bulk expense ingestion for corporate card feeds.
+
+Entering a feed one `Expense` at a time costs a report lookup, an ORM flush and a commit per line.
+This module streams an NDJSON or CSV feed and works in chunks of EXPENSE_BULK_CHUNK_SIZE rows:
+- rows are validated in batches,
+- referenced report and employee ids are resolved with one set-based query per chunk, and known
+  ids are not queried again,
+- valid rows are inserted with a single executemany (COPY on PostgreSQL with psycopg2),
+- each report's total_amount is updated once per chunk with the sum of its new rows, in the same
+  transaction as the inserts, so totals never disagree with the committed items.
+Only failing rows are reported back, as (row number, error) pairs.
+
+Requirements Addressed:
+- Expense Submission
+  - Location: Technical Specification/5.2 Feature ID: F-002
+- System Integrations
+  - Location: Technical Specification/5.9 Feature ID: F-009
+"""
+
+# Standard library
+import csv
+import datetime
+import io
+import json
+import os
+import re
+from collections import defaultdict
+from decimal import Decimal, InvalidOperation
+
+# SQLAlchemy version 1.4.25
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+# Internal imports
+from src.backend.main_server.src.models import Employee, Expense, ExpenseReport
+from src.backend.main_server.src.database import get_engine
+
+# EXPENSE_BULK_CHUNK_SIZE: Rows per lookup, insert and transaction.
+EXPENSE_BULK_CHUNK_SIZE = int(os.getenv('EXPENSE_BULK_CHUNK_SIZE', '1000'))
+
+# EXPENSE_BULK_MAX_ROWS: Rows accepted per upload; further rows are not read.
+EXPENSE_BULK_MAX_ROWS = int(os.getenv('EXPENSE_BULK_MAX_ROWS', '200000'))
+
+# EXPENSE_BULK_MAX_ERRORS: Row errors listed in the response; the rest are only counted.
+EXPENSE_BULK_MAX_ERRORS = int(os.getenv('EXPENSE_BULK_MAX_ERRORS', '1000'))
+
+# Fields every row must provide.
+REQUIRED_FIELDS = ('report_id', 'employee_id', 'category', 'amount', 'currency', 'expense_date')
+
+# Columns written per row, in COPY order.
+EXPENSE_COLUMNS = ('report_id', 'employee_id', 'category', 'amount', 'currency', 'expense_date', 'description')
+
+_CURRENCY = re.compile(r'^[A-Z]{3}$')
+_MAX_AMOUNT = Decimal('100000000')  # Numeric(10, 2)
+
+
+class BulkPayloadError(ValueError):
+    """
+    Raised when an upload cannot be read at all, as opposed to individual bad rows.
+    """
+
+
+def iter_expense_rows(stream, content_type):
+    """
+    Reads an NDJSON or CSV feed row by row, without loading it into memory.
+
+    Parameters:
+        stream: A binary or text file-like object, e.g. the request stream.
+        content_type (str): 'text/csv' selects CSV; anything else is read as NDJSON.
+
+    Yields:
+        dict: One row per record. A record that is not a JSON object is yielded as
+        {'_error': message} so it still gets a row number and a result.
+
+    Raises:
+        BulkPayloadError: If the feed is not UTF-8 or not well-formed CSV, when the reader
+        reaches the bad bytes.
+    """
+    text = stream if isinstance(stream, io.TextIOBase) else io.TextIOWrapper(stream, encoding='utf-8', newline='')
+    try:
+        yield from _read_rows(text, content_type)
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise BulkPayloadError(f'The upload cannot be read: {e}') from e
+
+
+def _read_rows(text, content_type):
+    if content_type == 'text/csv':
+        for row in csv.DictReader(text):
+            yield dict(row)
+        return
+    for line in text:
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield {'_error': f'Invalid JSON: {e}'}
+            continue
+        yield row if isinstance(row, dict) else {'_error': 'Row must be a JSON object.'}
+
+
+def validate_expense_row(row):
+    """
+    Checks one row's fields and converts them to column values.
+
+    Parameters:
+        row (dict): The raw row.
+
+    Returns:
+        tuple: (values, None) for a valid row, or (None, error message).
+    """
+    if '_error' in row:
+        return None, row['_error']
+    missing = [field for field in REQUIRED_FIELDS if row.get(field) in (None, '')]
+    if missing:
+        return None, f'Missing required fields: {", ".join(missing)}.'
+    try:
+        report_id = int(row['report_id'])
+        employee_id = int(row['employee_id'])
+    except (TypeError, ValueError):
+        return None, 'report_id and employee_id must be integers.'
+    try:
+        amount = Decimal(str(row['amount']))
+        if not amount.is_finite():  # NaN and Infinity parse, but cannot be compared or stored
+            raise ValueError(amount)
+        amount = amount.quantize(Decimal('0.01'))
+    except (InvalidOperation, ValueError):
+        return None, 'amount must be a number.'
+    if amount <= 0 or amount >= _MAX_AMOUNT:
+        return None, 'amount must be positive and below 100000000.'
+    currency = str(row['currency']).strip().upper()
+    if not _CURRENCY.match(currency):
+        return None, 'currency must be a three-letter ISO 4217 code.'
+    try:
+        expense_date = datetime.date.fromisoformat(str(row['expense_date']))
+    except ValueError:
+        return None, 'expense_date must be an ISO date (YYYY-MM-DD).'
+    category = str(row['category']).strip()
+    description = row.get('description') or None
+    if len(category) > 100 or (description and len(str(description)) > 255):
+        return None, 'category or description is too long.'
+    return {
+        'report_id': report_id,
+        'employee_id': employee_id,
+        'category': category,
+        'amount': amount,
+        'currency': currency,
+        'expense_date': expense_date,
+        'description': str(description) if description else None,
+    }, None
+
+
+def _copy_rows(session, records):
+    """
+    Inserts rows with PostgreSQL COPY. Returns False when the driver has no COPY support.
+    """
+    if session.get_bind().dialect.name != 'postgresql':
+        return False
+    cursor = session.connection().connection.cursor()
+    if not hasattr(cursor, 'copy_expert'):
+        cursor.close()
+        return False
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for values in records:
+        writer.writerow(['' if values[column] is None else values[column] for column in EXPENSE_COLUMNS])
+    buffer.seek(0)
+    try:
+        cursor.copy_expert(
+            f'COPY {Expense.__tablename__} ({", ".join(EXPENSE_COLUMNS)}) FROM STDIN WITH (FORMAT csv)',
+            buffer,
+        )
+    finally:
+        cursor.close()
+    return True
+
+
+def _write_chunk(session, records, use_copy):
+    """
+    Inserts a chunk, adds its amounts to the report totals and bumps their versions, in one transaction.
+    """
+    totals = defaultdict(Decimal)
+    for values in records:
+        totals[values['report_id']] += values['amount']
+    with session.begin():
+        if not (use_copy and _copy_rows(session, records)):
+            session.execute(insert(Expense.__table__), records)
+        session.execute(
+            update(ExpenseReport.__table__)
+            .where(ExpenseReport.__table__.c.report_id == bindparam('b_report_id'))
+            .values(total_amount=ExpenseReport.__table__.c.total_amount + bindparam('b_amount'),
+                    version=ExpenseReport.__table__.c.version + 1),
+            [{'b_report_id': report_id, 'b_amount': amount} for report_id, amount in totals.items()],
+        )
+
+
+class _ChunkIngester:
+    # Per-upload state: known ids, counts and the compact error list.
+
+    def __init__(self, session, use_copy):
+        self.session = session
+        self.use_copy = use_copy
+        self.report_owners = {}  # report_id -> employee_id, or None if the report does not exist
+        self.employees = {}  # employee_id -> exists
+        self.inserted = 0
+        self.failed = 0
+        self.errors = []
+
+    def fail(self, row_number, message):
+        self.failed += 1
+        if len(self.errors) < EXPENSE_BULK_MAX_ERRORS:
+            self.errors.append({'row': row_number, 'error': message})
+
+    def _resolve(self, entries):
+        # One query for the reports and one for the employees not seen in earlier chunks.
+        report_ids = {values['report_id'] for _, values in entries} - self.report_owners.keys()
+        if report_ids:
+            self.report_owners.update(dict.fromkeys(report_ids))
+            self.report_owners.update(self.session.execute(
+                select(ExpenseReport.report_id, ExpenseReport.employee_id)
+                .where(ExpenseReport.report_id.in_(report_ids))
+            ).all())
+        employee_ids = {values['employee_id'] for _, values in entries} - self.employees.keys()
+        if employee_ids:
+            self.employees.update(dict.fromkeys(employee_ids, False))
+            self.employees.update((employee_id, True) for employee_id in self.session.execute(
+                select(Employee.employee_id).where(Employee.employee_id.in_(employee_ids))
+            ).scalars())
+        self.session.rollback()  # End the read transaction; the chunk is written in its own.
+
+    def ingest(self, chunk):
+        """
+        Validates, resolves and writes one chunk of (row number, raw row) pairs.
+        """
+        entries = []
+        for row_number, row in chunk:
+            values, error = validate_expense_row(row)
+            if error:
+                self.fail(row_number, error)
+            else:
+                entries.append((row_number, values))
+        if not entries:
+            return
+        self._resolve(entries)
+
+        accepted = []
+        for row_number, values in entries:
+            if not self.employees[values['employee_id']]:
+                self.fail(row_number, 'Unknown employee_id.')
+            elif self.report_owners[values['report_id']] is None:
+                self.fail(row_number, 'Unknown report_id.')
+            elif self.report_owners[values['report_id']] != values['employee_id']:
+                self.fail(row_number, 'Report belongs to another employee.')
+            else:
+                accepted.append((row_number, values))
+        if not accepted:
+            return
+
+        try:
+            _write_chunk(self.session, [values for _, values in accepted], self.use_copy)
+            self.inserted += len(accepted)
+        except IntegrityError:
+            # A referenced row changed since it was resolved: write row by row to isolate it.
+            for row_number, values in accepted:
+                try:
+                    _write_chunk(self.session, [values], use_copy=False)
+                    self.inserted += 1
+                except IntegrityError as e:
+                    self.fail(row_number, f'Rejected by the database: {e.orig}')
+
+
+def ingest_expenses(rows, chunk_size=None, max_rows=None, use_copy=True, engine=None):
+    """
+    Inserts expenses in bulk and reports the rows that failed.
+
+    Parameters:
+        rows (iterable of dict): Raw rows, e.g. from iter_expense_rows; consumed lazily.
+        chunk_size (int, optional): Rows per lookup and transaction; defaults to EXPENSE_BULK_CHUNK_SIZE.
+        max_rows (int, optional): Rows read at most; defaults to EXPENSE_BULK_MAX_ROWS.
+        use_copy (bool): Use COPY on PostgreSQL when the driver supports it.
+        engine (Engine, optional): Defaults to the main server's engine.
+
+    Returns:
+        dict: 'received', 'inserted' and 'failed' counts, 'errors' as [{'row', 'error'}] for up to
+        EXPENSE_BULK_MAX_ERRORS failed rows (row numbers start at 1), and 'truncated' when the
+        upload had more than max_rows rows.
+
+    Raises:
+        BulkPayloadError: If the upload has no rows.
+    """
+    chunk_size = chunk_size or EXPENSE_BULK_CHUNK_SIZE
+    max_rows = max_rows or EXPENSE_BULK_MAX_ROWS
+    received = 0
+    truncated = False
+    # A dedicated session (not the request's) so each chunk commits independently.
+    with Session(bind=engine or get_engine()) as session:
+        ingester = _ChunkIngester(session, use_copy)
+        chunk = []
+        for row in rows:
+            if received == max_rows:
+                truncated = True
+                break
+            received += 1
+            chunk.append((received, row))
+            if len(chunk) == chunk_size:
+                ingester.ingest(chunk)
+                chunk = []
+        if chunk:
+            ingester.ingest(chunk)
+    if not received:
+        raise BulkPayloadError('No rows found in the upload.')
+    return {
+        'received': received,
+        'inserted': ingester.inserted,
+        'failed': ingester.failed,
+        'errors': ingester.errors,
+        'truncated': truncated,
+    }
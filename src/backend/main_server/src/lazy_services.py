@@ -0,0 +1,187 @@
+"""
+Deferred loading of the backend service routes mounted in the main server.
+
+Importing the authentication, policy, notification and reporting route modules is expensive. Some
+build their own Flask app, configure logging, or pull in database and crypto libraries. The main
+server therefore mounts each service under a URL prefix as a `LazyService` and imports nothing
+at startup. The first request under a prefix imports the service module and builds its WSGI app;
+later requests go straight to it. A worker pays only for the services it actually serves.
+
+Flask does not allow blueprints to be registered once the app has handled a request, so services
+are dispatched by path in front of the main app (werkzeug's DispatcherMiddleware) rather than
+registered on it. A service exposed as a Blueprint gets its own small Flask app with the main
+server's configuration. Service routes that clients reached at the root before the move keep
+answering there (LEGACY_ALIASES), unless the main server now serves that path itself.
+
+Requirements Addressed:
+- System Integrations
+  - Location: Technical Specification/5.9 Feature ID: F-009
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import importlib
+import logging
+import threading
+import time
+
+# External dependencies
+from flask import Blueprint, Flask  # Flask==2.0.1
+from werkzeug.middleware.dispatcher import DispatcherMiddleware  # Werkzeug==2.0.1
+from werkzeug.wrappers import Response  # Werkzeug==2.0.1
+
+# Internal dependencies
+from src.backend.common.json_provider import init_json  # Shared fast JSON responses
+from src.backend.common.profiling import init_profiling  # Opt-in request profiling
+from src.backend.common.metrics import metrics  # Shared in-process metrics
+
+logger = logging.getLogger(__name__)
+
+# URL prefix -> ('module:attribute', strip_prefix). With strip_prefix the service sees paths
+# relative to its prefix (/auth/login -> /login); without it the service's routes already
+# include the prefix (/notifications/send). A prefix takes every path under it away from the
+# main server's own routes, so none may be a prefix of theirs: the reporting module's
+# /reports/<id> is served as /reporting/reports/<id>, next to the main server's /reports.
+SERVICE_MOUNTS = {
+    '/auth': ('src.backend.authentication_service.src.routes:auth_routes', True),
+    '/policy': ('src.backend.policy_engine.src.routes:policy_bp', True),
+    '/notifications': ('src.backend.notification_service.src.routes:notification_bp', False),
+    '/reporting': ('src.backend.reporting_module.src.routes:reporting_bp', True),
+}
+
+# (method, root path) -> prefix: the service routes that were served at the root before the
+# services moved under their prefixes, and that still answer there for existing clients. The
+# root paths the main server serves itself (POST /login, /register, /validate_expense and
+# /validate_expense/batch, GET /reports/<id>, GET /metrics) are not aliased.
+LEGACY_ALIASES = {
+    ('POST', '/register/bulk'): '/auth',
+    ('GET', '/protected'): '/auth',
+    ('GET', '/.well-known/jwks.json'): '/auth',
+    ('POST', '/reports'): '/reporting',
+    ('GET', '/reports/summary'): '/reporting',
+}
+
+
+class LazyService:
+    """
+    A WSGI app that imports and builds a service on the first request to its prefix.
+
+    Attributes:
+        prefix (str): The URL prefix the service is mounted at.
+        target (str): 'module:attribute' naming a Flask app or Blueprint.
+        strip_prefix (bool): Whether the service sees paths without the prefix.
+        loaded (bool): Whether the service has been imported.
+    """
+
+    def __init__(self, prefix, target, parent, strip_prefix=True):
+        """
+        Initializes the mount. Nothing is imported until the first request.
+
+        Parameters:
+            prefix (str): The URL prefix.
+            target (str): 'module:attribute' of the service's Flask app or Blueprint.
+            parent (Flask): The main server app, whose configuration Blueprint services share.
+            strip_prefix (bool): Whether to hide the prefix from the service.
+        """
+        self.prefix = prefix
+        self.target = target
+        self.strip_prefix = strip_prefix
+        self._parent = parent
+        self._app = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        return self._app is not None
+
+    def _build(self):
+        module_name, _, attribute = self.target.partition(':')
+        service = getattr(importlib.import_module(module_name), attribute)
+        if isinstance(service, Blueprint):
+            service_app = Flask(service.import_name)
+            service_app.config.update(self._parent.config)
+            init_json(service_app)
+            init_profiling(service_app)
+            service_app.register_blueprint(service)
+            return service_app
+        return service
+
+    def load(self):
+        """
+        Imports the service and builds its WSGI app, once.
+
+        Returns:
+            The service's WSGI app.
+        """
+        if self._app is None:
+            with self._lock:
+                if self._app is None:
+                    started = time.perf_counter()
+                    self._app = self._build()
+                    elapsed = time.perf_counter() - started
+                    metrics.observe('service_load_seconds', elapsed)
+                    logger.info('Loaded %s for %s in %.1f ms', self.target, self.prefix, elapsed * 1000)
+        return self._app
+
+    def __call__(self, environ, start_response):
+        try:
+            service_app = self.load()
+        except Exception:
+            # Leave the mount unloaded so that the next request tries again.
+            logger.exception('Could not load %s', self.target)
+            response = Response('{"message": "Service unavailable"}', status=503,
+                                mimetype='application/json', headers={'Retry-After': '1'})
+            return response(environ, start_response)
+        if not self.strip_prefix:
+            # DispatcherMiddleware moved the prefix into SCRIPT_NAME; give it back to the path.
+            script_name = environ.get('SCRIPT_NAME', '')
+            environ['SCRIPT_NAME'] = script_name[:len(script_name) - len(self.prefix)]
+            environ['PATH_INFO'] = self.prefix + environ.get('PATH_INFO', '')
+        return service_app(environ, start_response)
+
+
+class LegacyAliases:
+    """
+    A WSGI middleware that sends requests for a service's former root path to its prefix.
+
+    Attributes:
+        aliases (dict): (method, path) -> prefix; HEAD requests follow the GET aliases.
+    """
+
+    def __init__(self, wsgi_app, aliases):
+        self.wsgi_app = wsgi_app
+        self.aliases = aliases
+
+    def __call__(self, environ, start_response):
+        method = environ.get('REQUEST_METHOD', 'GET')
+        path = environ.get('PATH_INFO', '')
+        prefix = self.aliases.get(('GET' if method == 'HEAD' else method, path))
+        if prefix is not None:
+            metrics.inc('legacy_path_requests')
+            environ['PATH_INFO'] = prefix + path
+        return self.wsgi_app(environ, start_response)
+
+
+def mount_services(app, mounts=None, aliases=None):
+    """
+    Puts the lazily loaded services in front of the main server app.
+
+    Parameters:
+        app (Flask): The main server app.
+        mounts (dict, optional): Prefix -> ('module:attribute', strip_prefix); defaults to
+            SERVICE_MOUNTS.
+        aliases (dict, optional): (method, root path) -> prefix of the mounted service that
+            serves it; defaults to LEGACY_ALIASES.
+
+    Returns:
+        dict: Prefix -> LazyService, also kept in app.extensions['lazy_services'].
+    """
+    services = {
+        prefix: LazyService(prefix, target, app, strip_prefix)
+        for prefix, (target, strip_prefix) in (mounts or SERVICE_MOUNTS).items()
+    }
+    app.wsgi_app = LegacyAliases(DispatcherMiddleware(app.wsgi_app, services),
+                                 LEGACY_ALIASES if aliases is None else aliases)
+    app.extensions['lazy_services'] = services
+    return services
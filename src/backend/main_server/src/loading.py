@@ -0,0 +1,103 @@
+"""
+Named relationship loading profiles for the main server models.
+
+The relationships in models.py load lazily, so walking a report's items, or a department's
+employees, costs one query per parent row. A route that knows what it will serialize asks for a
+named profile instead. The profile loads the related rows up front with a fixed number of
+queries: selectin loads for collections, joined loads for single parents.
+
+Requirements Addressed:
+- Data Management
+  - Location: Technical Specification/5.10 Feature ID: F-010
+- Reporting and Analytics
+  - Location: Technical Specification/5.6 Feature ID: F-006
+"""
+
+# SQLAlchemy version 1.4.25
+from sqlalchemy.orm import joinedload, selectinload
+
+# Internal imports
+from src.backend.main_server.src.models import Department, Employee, ExpenseReport
+from src.backend.main_server.src.database import db_session  # Database session for ORM operations
+
+# Profile name -> (entity, factory of loader options). Each profile loads its relationships
+# with a query count that does not grow with the number of rows.
+LOADING_PROFILES = {
+    # A report, its employee and its line items: 2 queries.
+    'report_with_items': (ExpenseReport, lambda: [
+        joinedload(ExpenseReport.employee),
+        selectinload(ExpenseReport.expenses),
+    ]),
+    # Reports with their employee, for listings without items: 1 query.
+    'report_with_employee': (ExpenseReport, lambda: [
+        joinedload(ExpenseReport.employee),
+    ]),
+    # An employee, their department, reports and the reports' line items: 3 queries.
+    'employee_with_reports': (Employee, lambda: [
+        joinedload(Employee.department),
+        selectinload(Employee.expense_reports).selectinload(ExpenseReport.expenses),
+    ]),
+    # An employee, their department and all of their expenses: 2 queries.
+    'employee_with_expenses': (Employee, lambda: [
+        joinedload(Employee.department),
+        selectinload(Employee.expenses),
+    ]),
+    # A department and its employees: 2 queries.
+    'department_with_employees': (Department, lambda: [
+        selectinload(Department.employees),
+    ]),
+}
+
+
+def loading_options(entity, profile):
+    """
+    Returns the loader options of a profile.
+
+    Parameters:
+        entity (type): The model being queried.
+        profile (str): A LOADING_PROFILES name.
+
+    Returns:
+        list: Options for Query.options() or Session.get().
+
+    Raises:
+        ValueError: If the profile is unknown or belongs to another model.
+    """
+    try:
+        profile_entity, options = LOADING_PROFILES[profile]
+    except KeyError:
+        raise ValueError(f'Unknown loading profile: {profile}')
+    if profile_entity is not entity:
+        raise ValueError(f'Loading profile {profile} is for {profile_entity.__name__}, not {entity.__name__}')
+    return options()
+
+
+def query_with_profile(entity, profile, session=None):
+    """
+    Starts a query for a model with a loading profile applied.
+
+    Parameters:
+        entity (type): The model to query.
+        profile (str): A LOADING_PROFILES name.
+        session (Session, optional): Defaults to the request-scoped db_session.
+
+    Returns:
+        Query: The query, ready for filtering.
+    """
+    return (session or db_session).query(entity).options(*loading_options(entity, profile))
+
+
+def get_with_profile(entity, primary_key, profile, session=None):
+    """
+    Loads one row by primary key with a loading profile applied.
+
+    Parameters:
+        entity (type): The model to load.
+        primary_key: The row's primary key.
+        profile (str): A LOADING_PROFILES name.
+        session (Session, optional): Defaults to the request-scoped db_session.
+
+    Returns:
+        The instance, or None if there is no such row.
+    """
+    return (session or db_session).get(entity, primary_key, options=loading_options(entity, profile))
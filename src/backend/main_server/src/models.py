@@ -5,16 +5,29 @@ to interact with the database.
 """
 
 # Third-party imports with version numbers as comments
-from sqlalchemy import Column, Integer, String, Date, Numeric, ForeignKey  # SQLAlchemy version 1.4.25
+from sqlalchemy import Column, Integer, String, Date, DateTime, Numeric, ForeignKey, Index, bindparam, event, inspect, update  # SQLAlchemy version 1.4.25
 from sqlalchemy.ext.declarative import declarative_base  # SQLAlchemy version 1.4.25
-from sqlalchemy.orm import relationship  # SQLAlchemy version 1.4.25
-import bcrypt  # bcrypt version 3.2.0
+from sqlalchemy.orm import Session, column_property, relationship  # SQLAlchemy version 1.4.25
 import jwt  # PyJWT version 2.3.0
 import datetime
+import uuid
+from collections import defaultdict
+from decimal import Decimal
+
+# Internal imports
+from src.backend.common.hashing import get_hashing_executor  # Bounded bcrypt process pool
+from src.backend.common.token_cache import VerifiedTokenCache, token_digest  # Verified JWT cache
+from src.backend.common.revocation import RevocationList  # Bloom-filtered revoked token ids
 
 # Base class for declarative class definitions
 Base = declarative_base()
 
+# Verified authentication tokens, so repeat requests skip jwt.decode (see User.verify_auth_token)
+auth_token_cache = VerifiedTokenCache()
+
+# Revoked access token ids, checked in memory on every authenticated request (see src/tokens.py)
+revocation_list = RevocationList()
+
 class Department(Base):
     """
     Represents a department within the organization.
@@ -171,11 +184,14 @@ class User(Base):
             password (str): The plaintext password to be hashed.
 
         Steps:
-        - Hashes the password using bcrypt.
+        - Hashes the password with the preferred scheme (PASSWORD_HASH_SCHEME) on the shared hashing pool.
         - Stores the hashed password in the password_hash attribute.
+
+        Raises:
+            HashingPoolFull: If the hashing pool has no free capacity, or (HashingTimeout) does
+                not finish the job within its timeout.
         """
-        salt = bcrypt.gensalt()
-        self.password_hash = bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+        self.password_hash = get_hashing_executor().hash_password(password)
 
     def check_password(self, password):
         """
@@ -188,11 +204,15 @@ class User(Base):
             bool: True if the password matches, False otherwise.
 
         Steps:
-        - Hashes the provided password with the stored salt.
+        - Hashes the provided password with the stored salt on the shared hashing pool.
         - Compares the hashed password with the stored password_hash.
         - Returns True if they match, False otherwise.
+
+        Raises:
+            HashingPoolFull: If the hashing pool has no free capacity, or (HashingTimeout) does
+                not finish the job within its timeout.
         """
-        return bcrypt.checkpw(password.encode('utf-8'), self.password_hash.encode('utf-8'))
+        return get_hashing_executor().check_password(password, self.password_hash)
 
     def generate_auth_token(self, secret_key, expires_in=3600):
         """
@@ -217,11 +237,31 @@ class User(Base):
         """
         payload = {
             'user_id': self.user_id,
+            'jti': uuid.uuid4().hex,
             'exp': datetime.datetime.utcnow() + datetime.timedelta(seconds=expires_in)
         }
         token = jwt.encode(payload, secret_key, algorithm='HS256')
         return token
 
+    @staticmethod
+    def revoke_auth_token(token, secret_key):
+        """
+        Revokes an authentication token so verify_auth_token refuses it until it expires.
+
+        Parameters:
+            token (str): The JWT token to revoke.
+            secret_key (str): The secret key the token was signed with.
+        """
+        try:
+            claims = jwt.decode(token, secret_key, algorithms=['HS256'])
+        except jwt.InvalidTokenError:
+            claims = {}
+        auth_token_cache.revoke(token, claims.get('exp'), scope=token_digest(secret_key))
+        if claims.get('jti'):
+            # Record the revocation for every worker, not just this process's cache.
+            from src.backend.main_server.src.tokens import revoke_access_token
+            revoke_access_token(claims['jti'], claims.get('exp'))
+
     @staticmethod
     def verify_auth_token(token, secret_key):
         """
@@ -240,13 +280,24 @@ class User(Base):
             int: The user ID if token is valid, None otherwise.
 
         Steps:
-        - Decodes the token using the secret key.
+        - Returns the cached payload if this token was verified recently and has not expired.
+        - Otherwise decodes the token using the secret key and caches the payload until its expiry.
+        - Refuses the token if its id is in the in-memory revocation list.
         - Retrieves the user ID from the payload.
         - Returns the user ID if token is valid.
         """
+        # Scope cache entries by key so a token is never accepted under a different secret.
+        scope = token_digest(secret_key)
         try:
-            payload = jwt.decode(token, secret_key, algorithms=['HS256'])
-            return payload['user_id']
+            entry = auth_token_cache.get_or_verify(
+                token,
+                lambda t: jwt.decode(t, secret_key, algorithms=['HS256']),
+                scope=scope
+            )
+            if revocation_list.is_revoked(entry.claims.get('jti'), entry.claims.get('exp')):
+                # Revoked, possibly by another worker process
+                return None
+            return entry.claims['user_id']
         except jwt.ExpiredSignatureError:
             # Token has expired
             return None
@@ -254,6 +305,54 @@ class User(Base):
             # Token is invalid
             return None
 
+class RefreshToken(Base):
+    """
+    A server-side refresh token, used to obtain new access tokens without a password check.
+
+    This class addresses the following requirements:
+    - Secure User Authentication and Role-Based Authorization
+        - Location: Technical Specification/5.1 Feature ID: F-001
+        - Description: Lets sessions outlive short access tokens and be revoked centrally.
+
+    Attributes:
+        token_id (str): Public identifier; the first part of the token handed to the client.
+        user_id (int): The user the token was issued to.
+        token_hash (str): SHA-256 of the token's secret part; the secret itself is never stored.
+        issued_at (datetime): Issue time (UTC).
+        expires_at (datetime): Expiry time (UTC).
+        revoked_at (datetime): Revocation or rotation time (UTC), if any.
+        replaced_by (str): token_id of the token issued when this one was rotated.
+    """
+
+    __tablename__ = 'refresh_tokens'
+
+    token_id = Column(String(64), primary_key=True)
+    user_id = Column(Integer, ForeignKey('users.user_id'), nullable=False, index=True)
+    token_hash = Column(String(64), nullable=False)
+    issued_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    revoked_at = Column(DateTime)
+    replaced_by = Column(String(64))
+
+class RevokedToken(Base):
+    """
+    A revoked access token id, kept until the token would have expired.
+
+    Each worker loads new rows into its in-memory revocation list on a schedule, so that
+    authenticated requests check revocation without a database query.
+
+    Attributes:
+        jti (str): The access token's id.
+        expires_at (datetime): The access token's expiry (UTC).
+        revoked_at (datetime): Revocation time (UTC).
+    """
+
+    __tablename__ = 'revoked_tokens'
+
+    jti = Column(String(64), primary_key=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+    revoked_at = Column(DateTime, nullable=False, index=True)
+
 class ExpenseReport(Base):
     """
     Represents an expense report submitted by an employee.
@@ -271,22 +370,35 @@ class ExpenseReport(Base):
         employee_id (int): Reference to the submitting employee.
         submission_date (date): Date of report submission.
         status (str): Current status of the report (e.g., Pending, Approved, Rejected).
-        total_amount (decimal): Total amount of expenses in the report.
+        total_amount (decimal): Total amount of expenses in the report. Maintained from the
+            report's expenses: every ORM insert, update and delete of an Expense applies its
+            delta in the same transaction, and reconciliation.py repairs any drift, so reads
+            never need to sum the items.
+        version (int): Incremented on every write to the report or its expenses, and when its
+            employee is renamed. Names the report's current representation (to_dict) for ETags
+            and the response cache.
     """
 
     __tablename__ = 'expense_reports'
+    # Listing indexes: filter columns followed by the keyset sort key (see src/pagination.py)
+    __table_args__ = (
+        Index('idx_expense_reports_employee_listing', 'employee_id', 'submission_date', 'report_id'),
+        Index('idx_expense_reports_status_listing', 'status', 'submission_date', 'report_id'),
+        Index('idx_expense_reports_employee_status', 'employee_id', 'status', 'submission_date', 'report_id'),
+    )
 
     report_id = Column(Integer, primary_key=True, autoincrement=True)
     employee_id = Column(Integer, ForeignKey('employees.employee_id'), nullable=False)
     submission_date = Column(Date, nullable=False)
     status = Column(String(50), nullable=False)
     total_amount = Column(Numeric(10, 2), nullable=False)
+    version = Column(Integer, nullable=False, default=1, server_default='1')
 
     # Relationships
     employee = relationship('Employee', back_populates='expense_reports')
     expenses = relationship('Expense', back_populates='expense_report', cascade='all, delete-orphan')
 
-    def __init__(self, employee_id, submission_date, status, total_amount):
+    def __init__(self, employee_id, submission_date, status, total_amount=0):
         """
         Initializes an ExpenseReport instance with the provided attributes.
 
@@ -294,7 +406,8 @@ class ExpenseReport(Base):
             employee_id (int): Reference to the submitting employee.
             submission_date (date): Date of report submission.
             status (str): Current status of the report.
-            total_amount (decimal): Total amount of expenses in the report.
+            total_amount (decimal): Opening total, 0 for a new report. Expenses added to the
+                report are added to it automatically.
 
         Steps:
         - Assigns the provided employee_id to the instance.
@@ -307,6 +420,42 @@ class ExpenseReport(Base):
         self.status = status
         self.total_amount = total_amount
 
+    def to_dict(self, include_items=True):
+        """
+        Serializes the report, its employee and, optionally, its line items.
+
+        Load the report with the 'report_with_items' profile (see loading.py) so that the
+        employee and the items come from two queries rather than one query per item.
+
+        Parameters:
+            include_items (bool): Whether to include the line items.
+
+        Returns:
+            dict: The report's fields, with amounts as strings to keep their precision.
+        """
+        data = {
+            'report_id': self.report_id,
+            'employee_id': self.employee_id,
+            'employee_name': f'{self.employee.first_name} {self.employee.last_name}' if self.employee else None,
+            'submission_date': self.submission_date.isoformat() if self.submission_date else None,
+            'status': self.status,
+            'total_amount': str(self.total_amount),
+            'version': self.version,
+        }
+        if include_items:
+            data['expenses'] = [
+                {
+                    'expense_id': expense.expense_id,
+                    'category': expense.category,
+                    'amount': str(expense.amount),
+                    'currency': expense.currency,
+                    'expense_date': expense.expense_date.isoformat() if expense.expense_date else None,
+                    'description': expense.description,
+                }
+                for expense in self.expenses
+            ]
+        return data
+
 class Expense(Base):
     """
     Represents an expense item submitted by an employee, including details such as category,
@@ -335,12 +484,20 @@ class Expense(Base):
     """
 
     __tablename__ = 'expenses'
+    # Listing indexes: filter columns followed by the keyset sort key (see src/pagination.py)
+    __table_args__ = (
+        Index('idx_expenses_employee_listing', 'employee_id', 'expense_date', 'expense_id'),
+        Index('idx_expenses_employee_category_listing', 'employee_id', 'category', 'expense_date', 'expense_id'),
+        Index('idx_expenses_report_id', 'report_id'),
+    )
 
     expense_id = Column(Integer, primary_key=True, autoincrement=True)
-    report_id = Column(Integer, ForeignKey('expense_reports.report_id'), nullable=False)
+    # active_history keeps the previous report and amount of a changed row for the total deltas
+    report_id = column_property(Column(Integer, ForeignKey('expense_reports.report_id'), nullable=False),
+                                active_history=True)
     employee_id = Column(Integer, ForeignKey('employees.employee_id'), nullable=False)
     category = Column(String(100), nullable=False)
-    amount = Column(Numeric(10, 2), nullable=False)
+    amount = column_property(Column(Numeric(10, 2), nullable=False), active_history=True)
     currency = Column(String(10), nullable=False)
     expense_date = Column(Date, nullable=False)
     description = Column(String(255))
@@ -379,6 +536,24 @@ class Expense(Base):
         self.expense_date = expense_date
         self.description = description
 
+    def to_dict(self):
+        """
+        Serializes the expense.
+
+        Returns:
+            dict: The expense's fields, with the amount as a string to keep its precision.
+        """
+        return {
+            'expense_id': self.expense_id,
+            'report_id': self.report_id,
+            'employee_id': self.employee_id,
+            'category': self.category,
+            'amount': str(self.amount),
+            'currency': self.currency,
+            'expense_date': self.expense_date.isoformat() if self.expense_date else None,
+            'description': self.description,
+        }
+
 class Policy(Base):
     """
     Represents a company policy governing expense submissions.
@@ -423,4 +598,140 @@ class Policy(Base):
         self.policy_name = policy_name
         self.description = description
         self.max_amount = max_amount
-        self.applicable_regions = applicable_regions
\ No newline at end of file
+        self.applicable_regions = applicable_regions
+
+
+class PolicyRuleset(Base):
+    """
+    The version of the policies table as a whole: a single row whose counter is incremented in
+    the same transaction as every change to a policy.
+
+    Each worker keeps the policies compiled in memory (see policy_ruleset.py) and reloads them
+    only when this version moves.
+
+    Attributes:
+        ruleset_id (int): Always 1.
+        version (int): Incremented by each flush that inserts, updates or deletes policies.
+    """
+
+    __tablename__ = 'policy_ruleset'
+
+    ruleset_id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=1, server_default='1')
+
+
+def _add_report_delta(target, report_id, amount):
+    # Flush-time: accumulate per-report deltas; they are applied once per flush.
+    deltas = Session.object_session(target).info.setdefault('report_total_deltas', defaultdict(Decimal))
+    deltas[report_id] += Decimal(str(amount))
+
+
+@event.listens_for(Expense, 'after_insert')
+def _expense_inserted(mapper, connection, target):
+    _add_report_delta(target, target.report_id, target.amount)
+
+
+@event.listens_for(Expense, 'after_update')
+def _expense_updated(mapper, connection, target):
+    state = inspect(target)
+    amount, report_id = state.attrs.amount.history, state.attrs.report_id.history
+    if not (amount.has_changes() or report_id.has_changes()):
+        # Other columns (category, description, ...) are part of the report's representation.
+        if Session.object_session(target).is_modified(target, include_collections=False):
+            _add_report_delta(target, target.report_id, 0)
+        return
+    old_amount = amount.deleted[0] if amount.deleted else target.amount
+    old_report_id = report_id.deleted[0] if report_id.deleted else target.report_id
+    _add_report_delta(target, old_report_id, -Decimal(str(old_amount)))
+    _add_report_delta(target, target.report_id, target.amount)
+
+
+@event.listens_for(Expense, 'after_delete')
+def _expense_deleted(mapper, connection, target):
+    _add_report_delta(target, target.report_id, -Decimal(str(target.amount)))
+
+
+@event.listens_for(Session, 'after_flush')
+def _apply_report_deltas(session, flush_context):
+    """
+    Adds the flush's expense deltas to the report totals and bumps the versions of every report
+    whose expenses changed, in the flush's transaction.
+
+    One executemany covers every report the flush touched. Bulk Query.update()/delete() and Core
+    statements do not fire these events; callers using them adjust the totals themselves (as
+    ingestion.py does), and the reconciliation job repairs anything missed.
+    """
+    deltas = session.info.pop('report_total_deltas', None)
+    if not deltas:
+        return
+    session.connection().execute(
+        update(ExpenseReport.__table__)
+        .where(ExpenseReport.__table__.c.report_id == bindparam('b_report_id'))
+        .values(total_amount=ExpenseReport.__table__.c.total_amount + bindparam('b_delta'),
+                version=ExpenseReport.__table__.c.version + 1),
+        [{'b_report_id': report_id, 'b_delta': delta} for report_id, delta in deltas.items()],
+    )
+    session.info.setdefault('report_totals_stale', set()).update(deltas)
+
+
+@event.listens_for(Employee, 'after_update')
+def _employee_updated(mapper, connection, target):
+    # Reports include the employee's name, so a rename is a new version of each of their reports.
+    state = inspect(target)
+    if state.attrs.first_name.history.has_changes() or state.attrs.last_name.history.has_changes():
+        Session.object_session(target).info.setdefault('renamed_employees', set()).add(target.employee_id)
+
+
+@event.listens_for(Session, 'after_flush')
+def _bump_renamed_employee_reports(session, flush_context):
+    """
+    Bumps the versions of the reports of employees renamed in the flush, with one UPDATE.
+    """
+    renamed = session.info.pop('renamed_employees', None)
+    if not renamed:
+        return
+    table = ExpenseReport.__table__
+    session.connection().execute(
+        update(table).where(table.c.employee_id.in_(renamed)).values(version=table.c.version + 1))
+    stale = session.info.setdefault('report_totals_stale', set())
+    stale.update(report.report_id for report in session.identity_map.values()
+                 if isinstance(report, ExpenseReport) and report.employee_id in renamed)
+
+
+@event.listens_for(Session, 'after_flush_postexec')
+def _expire_report_totals(session, flush_context):
+    # Loaded reports hold the total and version from before the delta; reload them on next access.
+    for report_id in session.info.pop('report_totals_stale', ()):
+        report = session.identity_map.get(inspect(ExpenseReport).identity_key_from_primary_key((report_id,)))
+        if report is not None:
+            session.expire(report, ['total_amount', 'version'])
+
+
+@event.listens_for(ExpenseReport, 'before_update')
+def _bump_report_version(mapper, connection, target):
+    # Any change to the report's own columns is a new version; incremented in SQL so that
+    # concurrent writers never reuse a number. The ORM reloads the value on next access.
+    if Session.object_session(target).is_modified(target, include_collections=False):
+        target.version = ExpenseReport.version + 1
+
+
+@event.listens_for(Session, 'before_flush')
+def _detect_policy_changes(session, flush_context, instances):
+    # Deleted objects are only listed before the flush.
+    if any(isinstance(obj, Policy) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info['policies_changed'] = True
+
+
+@event.listens_for(Session, 'after_flush')
+def _bump_policy_ruleset_version(session, flush_context):
+    """
+    Increments the policy ruleset version in the flush's transaction when policies changed, so
+    that every worker recompiles its rules after the commit.
+    """
+    if not session.info.pop('policies_changed', False):
+        return
+    table = PolicyRuleset.__table__
+    result = session.connection().execute(update(table).where(table.c.ruleset_id == 1).values(version=table.c.version + 1))
+    if result.rowcount == 0:
+        session.connection().execute(table.insert().values(ruleset_id=1, version=1))
+    session.info['policy_ruleset_changed'] = True
@@ -0,0 +1,231 @@
+"""
+Concurrent delivery of a notification over several channels.
+
+`send_notification` (utils.py) used to call email, SMS and in-app one after the other, so a
+request waited for the sum of their latencies. `ChannelFanout` submits every channel's send at
+once to a shared thread pool and waits:
+- by default, until the first channel durably accepts the message (the SMTP relay answered 250,
+  or the SMS or in-app gateway answered 2xx); the other sends finish in the background,
+- in strict mode, until every channel has accepted, failed or timed out.
+Each channel has its own timeout, applied both to its socket and to the wait. The pool holds at
+most NOTIFY_WORKERS running and NOTIFY_MAX_PENDING waiting sends; a send beyond that is refused
+at once as 'busy' rather than queued.
+
+Per channel, send times are recorded in the `notification_<channel>_seconds` histogram. Outcomes
+are counted as `notification_<channel>_accepted`, `_failed`, `_timeouts` and `_busy`.
+
+Requirements Addressed:
+- Notification and Alerting System
+  - Location: Technical Specification/5.17 Feature ID: F-017
+    - TR-F017.1: Send email and in-app notifications for pending expense approvals.
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import json
+import os
+import smtplib
+import threading
+import time
+import urllib.request
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from email.message import EmailMessage
+
+# Internal imports
+from src.backend.common.metrics import metrics  # Shared in-process metrics
+
+# NOTIFY_WORKERS: Threads sending notifications, shared by all requests of a worker process.
+NOTIFY_WORKERS = int(os.getenv('NOTIFY_WORKERS', '16'))
+
+# NOTIFY_MAX_PENDING: Sends allowed to wait for a free thread; further sends are refused as busy.
+NOTIFY_MAX_PENDING = int(os.getenv('NOTIFY_MAX_PENDING', '64'))
+
+# NOTIFY_TIMEOUT: Default seconds a channel has to accept a message.
+NOTIFY_TIMEOUT = float(os.getenv('NOTIFY_TIMEOUT', '5'))
+
+# NOTIFY_<CHANNEL>_TIMEOUT: Per-channel overrides of NOTIFY_TIMEOUT.
+CHANNEL_TIMEOUTS = {
+    'email': float(os.getenv('NOTIFY_EMAIL_TIMEOUT', NOTIFY_TIMEOUT)),
+    'sms': float(os.getenv('NOTIFY_SMS_TIMEOUT', NOTIFY_TIMEOUT)),
+    'in_app': float(os.getenv('NOTIFY_IN_APP_TIMEOUT', NOTIFY_TIMEOUT)),
+}
+
+# NOTIFY_STRICT: Wait for every channel instead of the first acceptance.
+NOTIFY_STRICT = os.getenv('NOTIFY_STRICT', 'false').lower() in ('1', 'true', 'yes')
+
+# SMTP relay for email notifications.
+SMTP_HOST = os.getenv('SMTP_HOST', 'localhost')
+SMTP_PORT = int(os.getenv('SMTP_PORT', '25'))
+SMTP_FROM = os.getenv('SMTP_FROM', 'notifications@expenses.invalid')
+
+# HTTP gateways accepting {"to": ..., "message": ...} for SMS and {"user_id": ..., "message": ...}
+# for in-app notifications; a channel without a URL fails.
+SMS_GATEWAY_URL = os.getenv('SMS_GATEWAY_URL')
+IN_APP_GATEWAY_URL = os.getenv('IN_APP_GATEWAY_URL')
+
+# Outcomes of a channel's send, as reported by ChannelFanout.send.
+ACCEPTED = 'accepted'
+PENDING = 'pending'
+TIMED_OUT = 'timed out'
+BUSY = 'busy'
+
+
+def send_email(address, message, timeout, host=None, port=None):
+    """
+    Hands an email notification to the SMTP relay.
+
+    Parameters:
+        address (str): The recipient.
+        message (str): The formatted notification.
+        timeout (float): Socket timeout in seconds.
+        host (str), port (int): The relay; default to SMTP_HOST and SMTP_PORT.
+
+    Raises:
+        smtplib.SMTPException, OSError: If the relay refuses the message or cannot be reached.
+    """
+    email = EmailMessage()
+    email['From'] = SMTP_FROM
+    email['To'] = address
+    email['Subject'] = 'Expense notification'
+    email.set_content(message)
+    with smtplib.SMTP(host or SMTP_HOST, port or SMTP_PORT, timeout=timeout) as relay:
+        relay.send_message(email)
+
+
+def _post_json(url, payload, timeout):
+    if not url:
+        raise RuntimeError('No gateway URL is configured for this channel.')
+    request = urllib.request.Request(url, data=json.dumps(payload).encode('utf-8'),
+                                     headers={'Content-Type': 'application/json'}, method='POST')
+    # urlopen raises HTTPError for non-2xx answers.
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        response.read()
+
+
+def send_sms(number, message, timeout, url=None):
+    """
+    Hands an SMS notification to the SMS gateway (SMS_GATEWAY_URL by default).
+
+    Raises:
+        urllib.error.URLError, OSError, RuntimeError: If the gateway refuses the message, cannot
+        be reached or is not configured.
+    """
+    _post_json(url or SMS_GATEWAY_URL, {'to': number, 'message': message}, timeout)
+
+
+def send_in_app(user_id, message, timeout, url=None):
+    """
+    Hands an in-app notification to the in-app gateway (IN_APP_GATEWAY_URL by default).
+    """
+    _post_json(url or IN_APP_GATEWAY_URL, {'user_id': user_id, 'message': message}, timeout)
+
+
+class ChannelFanout:
+    """
+    A bounded thread pool that sends one message over several channels at once.
+
+    Attributes:
+        workers (int): Threads sending notifications.
+        max_pending (int): Sends allowed to wait behind the busy threads.
+        timeouts (dict): Seconds each channel has to accept; other channels get NOTIFY_TIMEOUT.
+    """
+
+    def __init__(self, workers=None, max_pending=None, timeouts=None):
+        """
+        Initializes the fan-out. The threads are started on first use.
+
+        Parameters:
+        - workers (int, optional): Pool size; defaults to NOTIFY_WORKERS.
+        - max_pending (int, optional): Queue bound; defaults to NOTIFY_MAX_PENDING.
+        - timeouts (dict, optional): Channel timeouts; default to CHANNEL_TIMEOUTS.
+        """
+        self.workers = workers or NOTIFY_WORKERS
+        self.max_pending = NOTIFY_MAX_PENDING if max_pending is None else max_pending
+        self.timeouts = dict(CHANNEL_TIMEOUTS if timeouts is None else timeouts)
+        self._slots = threading.BoundedSemaphore(self.workers + self.max_pending)
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='notify')
+
+    def timeout(self, channel):
+        """Returns the seconds a channel has to accept a message."""
+        return self.timeouts.get(channel, NOTIFY_TIMEOUT)
+
+    def _run(self, channel, send, timeout):
+        # On a pool thread: send, and record the time and outcome whether or not anyone waits.
+        started = time.monotonic()
+        try:
+            send(timeout)
+        except Exception:
+            metrics.inc(f'notification_{channel}_failed')
+            raise
+        finally:
+            metrics.observe(f'notification_{channel}_seconds', time.monotonic() - started)
+            self._slots.release()
+        metrics.inc(f'notification_{channel}_accepted')
+
+    def send(self, sends, strict=None):
+        """
+        Starts every channel's send, and waits for the first acceptance or, if strict, for all.
+
+        Parameters:
+        - sends (dict): Channel name -> send(timeout); a send returns once the channel has
+          accepted the message and raises otherwise.
+        - strict (bool): Wait for every channel; defaults to NOTIFY_STRICT.
+
+        Returns:
+        - dict: Channel name -> ACCEPTED, PENDING (still running when the call returned),
+          TIMED_OUT, BUSY, or 'failed: <error>'; in the order of `sends`.
+        """
+        strict = NOTIFY_STRICT if strict is None else strict
+        outcomes = dict.fromkeys(sends, PENDING)
+        started = time.monotonic()
+        deadlines = {}  # future -> (channel, deadline)
+        for channel, send in sends.items():
+            if not self._slots.acquire(blocking=False):
+                metrics.inc(f'notification_{channel}_busy')
+                outcomes[channel] = BUSY
+                continue
+            timeout = self.timeout(channel)
+            future = self._pool.submit(self._run, channel, send, timeout)
+            deadlines[future] = (channel, started + timeout)
+
+        pending = set(deadlines)
+        while pending:
+            now = time.monotonic()
+            for future in [future for future in pending if deadlines[future][1] <= now]:
+                # The send keeps running until its socket times out; it is no longer waited for.
+                metrics.inc(f'notification_{deadlines[future][0]}_timeouts')
+                outcomes[deadlines[future][0]] = TIMED_OUT
+                pending.discard(future)
+            if not pending:
+                break
+            done, pending = wait(pending, timeout=min(deadlines[future][1] for future in pending) - now,
+                                 return_when=FIRST_COMPLETED)
+            for future in done:
+                channel = deadlines[future][0]
+                error = future.exception()
+                outcomes[channel] = ACCEPTED if error is None else f'failed: {error}'
+            if not strict and ACCEPTED in outcomes.values():
+                break
+        return outcomes
+
+    def shutdown(self, wait=True):
+        """Stops the pool threads once their sends are done."""
+        self._pool.shutdown(wait=wait)
+
+
+# Process-wide fan-out shared by all requests.
+_fanout = None
+_fanout_lock = threading.Lock()
+
+
+def get_notification_fanout():
+    """
+    Returns the process-wide ChannelFanout, creating it on first use.
+    """
+    global _fanout
+    if _fanout is None:
+        with _fanout_lock:
+            if _fanout is None:
+                _fanout = ChannelFanout()
+    return _fanout
@@ -0,0 +1,128 @@
+"""
+Keyset pagination with opaque cursors for the listing routes.
+
+An OFFSET page makes the database read and discard every row before it, so page 500 costs 500
+times page one. Here each page is ordered newest first on a sort key that ends with the primary
+key, e.g. (expense_date, expense_id), and a page continues strictly after the last key of the
+previous one: `WHERE (expense_date, expense_id) < (:date, :id) ORDER BY ... DESC LIMIT :n`.
+With a composite index on the filter columns followed by the sort key (see
+src/database/migrations/add_listing_indexes.sql), every page is one index range scan of `n` rows,
+however deep it is.
+
+The cursor handed to clients is the last row's sort key, JSON-encoded in URL-safe base64. Clients
+only pass it back; its content is not part of the API.
+
+Requirements Addressed:
+- Data Management
+  - Location: Technical Specification/5.10 Feature ID: F-010
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import base64
+import binascii
+import datetime
+import json
+import os
+
+# SQLAlchemy version 1.4.25
+from sqlalchemy import Date, tuple_
+
+# PAGE_SIZE_DEFAULT: Rows per page when the client does not ask for a size.
+PAGE_SIZE_DEFAULT = int(os.getenv('PAGE_SIZE_DEFAULT', '50'))
+
+# PAGE_SIZE_MAX: Largest page a client may ask for.
+PAGE_SIZE_MAX = int(os.getenv('PAGE_SIZE_MAX', '200'))
+
+
+class InvalidCursor(ValueError):
+    """
+    Raised when a cursor was not issued for the listing it is used with.
+    """
+
+
+def encode_cursor(values):
+    """
+    Encodes a sort key as an opaque cursor.
+
+    Parameters:
+        values (tuple): The last row's sort key values (dates or integers).
+
+    Returns:
+        str: URL-safe base64 without padding.
+    """
+    payload = json.dumps([value.isoformat() if isinstance(value, datetime.date) else value for value in values],
+                         separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).rstrip(b'=').decode()
+
+
+def decode_cursor(cursor, columns):
+    """
+    Decodes a cursor into sort key values for the given columns.
+
+    Parameters:
+        cursor (str): A cursor from encode_cursor.
+        columns (tuple): The sort key columns, to check the shape and convert dates.
+
+    Returns:
+        tuple: The sort key values.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed or has the wrong shape.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError
+        return tuple(
+            datetime.date.fromisoformat(value) if isinstance(column.type, Date) else int(value)
+            for column, value in zip(columns, values)
+        )
+    except (ValueError, TypeError, binascii.Error):
+        raise InvalidCursor('Invalid cursor.')
+
+
+def page_size(requested):
+    """
+    Clamps a requested page size to 1..PAGE_SIZE_MAX.
+
+    Parameters:
+        requested (str or int, optional): The client's value; PAGE_SIZE_DEFAULT if missing.
+
+    Returns:
+        int: The page size.
+
+    Raises:
+        ValueError: If the value is not an integer.
+    """
+    if requested in (None, ''):
+        return PAGE_SIZE_DEFAULT
+    return max(1, min(int(requested), PAGE_SIZE_MAX))
+
+
+def keyset_page(query, columns, cursor=None, limit=PAGE_SIZE_DEFAULT):
+    """
+    Fetches one page of a query, newest first by the given sort key.
+
+    Parameters:
+        query (Query): The filtered query, without ordering.
+        columns (tuple): Sort key columns, ending with the primary key so the key is unique.
+        cursor (str, optional): The previous page's next_cursor; None for the first page.
+        limit (int): Rows per page.
+
+    Returns:
+        tuple: (rows, next_cursor); next_cursor is None on the last page.
+
+    Raises:
+        InvalidCursor: If the cursor is malformed.
+    """
+    if cursor:
+        query = query.filter(tuple_(*columns) < tuple_(*decode_cursor(cursor, columns)))
+    # One extra row tells whether another page follows, without a count query.
+    rows = query.order_by(*(column.desc() for column in columns)).limit(limit + 1).all()
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(tuple(getattr(last, column.key) for column in columns))
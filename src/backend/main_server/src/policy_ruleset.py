@@ -0,0 +1,265 @@
+"""
+Process-wide, precompiled expense policies for check_policy_compliance and /validate_expense.
+
+Checking an expense used to fetch every policy from the database and interpret each one, so a
+500-line report cost 500 policy fetches. Instead, each worker compiles the `policies` table once
+into a `CompiledRuleset` and checks expenses against it in memory:
+- A policy applies in the regions listed in `applicable_regions`, or everywhere if none are.
+- An expense violates an applicable policy when its amount is above the policy's `max_amount`.
+The ruleset keeps, per region, the applicable policies sorted by `max_amount`, so a compliance
+check is one dict lookup and one comparison with the lowest limit, and the violations are a
+prefix of that list.
+
+A ruleset is tied to the version in the `policy_ruleset` table, which models.py increments in
+the same transaction as every change to a policy. `PolicyRulesetCache` reads that version at
+most once per POLICY_RULESET_CHECK_SECONDS and recompiles only when it moved; the new ruleset
+replaces the old one in a single assignment, so a check sees either the old or the new policies,
+never a mix. A commit that changes policies invalidates this worker's cache at once; the other
+workers follow within the check interval.
+
+Reloads are counted as `policy_ruleset_reloads` and timed in `policy_ruleset_compile_seconds`.
+
+Requirements Addressed:
+- Policy and Compliance Engine
+  - Location: Technical Specification/5.3 Feature ID: F-003
+    - TR-F003.2: Perform real-time policy checks during expense submission.
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import os
+import threading
+import time
+from decimal import Decimal, InvalidOperation
+from typing import NamedTuple
+
+# External dependencies
+from sqlalchemy import event, select  # SQLAlchemy version 1.4.25
+from sqlalchemy.orm import Session  # SQLAlchemy version 1.4.25
+
+# Internal imports
+from src.backend.main_server.src.models import Policy, PolicyRuleset  # ORM models
+from src.backend.common.metrics import metrics  # Shared in-process metrics
+
+# POLICY_RULESET_CHECK_SECONDS: How long a worker uses its ruleset before checking the version.
+POLICY_RULESET_CHECK_SECONDS = float(os.getenv('POLICY_RULESET_CHECK_SECONDS', '5'))
+
+# The policy columns a ruleset is compiled from.
+POLICY_COLUMNS = select(Policy.policy_name, Policy.max_amount, Policy.applicable_regions)
+
+# The ruleset version statement; a missing row reads as version 0.
+RULESET_VERSION = select(PolicyRuleset.version).where(PolicyRuleset.ruleset_id == 1)
+
+
+class CompiledPolicy(NamedTuple):
+    """A policy reduced to what a check needs."""
+
+    name: str
+    max_amount: Decimal
+
+
+class CompiledRuleset:
+    """
+    An immutable, indexed snapshot of the policies at one ruleset version.
+
+    Attributes:
+        version (int): The ruleset version the policies were read at.
+        size (int): The number of policies.
+    """
+
+    def __init__(self, version, policies):
+        """
+        Compiles policy rows.
+
+        Parameters:
+        - version (int): The ruleset version the rows were read at.
+        - policies (iterable): Rows or objects with policy_name, max_amount and
+          applicable_regions.
+        """
+        self.version = version or 0
+        everywhere, by_region = [], {}
+        self.size = 0
+        for policy in policies:
+            self.size += 1
+            compiled = CompiledPolicy(policy.policy_name, Decimal(policy.max_amount))
+            regions = {region.strip() for region in (policy.applicable_regions or '').split(',') if region.strip()}
+            if not regions:
+                everywhere.append(compiled)
+            for region in regions:
+                by_region.setdefault(region, []).append(compiled)
+
+        def by_limit(policies):
+            return tuple(sorted(policies, key=lambda policy: policy.max_amount))
+
+        # Policies applying to expenses of each listed region, and to expenses of other regions
+        self._everywhere = by_limit(everywhere)
+        self._by_region = {region: by_limit(everywhere + regional) for region, regional in by_region.items()}
+
+    def applicable(self, region):
+        """Returns the policies applying in a region, lowest limit first."""
+        return self._by_region.get(region, self._everywhere)
+
+    @staticmethod
+    def _fields(expense):
+        # Expenses are dicts (request bodies) or objects (Expense rows, which have no region).
+        if isinstance(expense, dict):
+            amount, region = expense.get('amount'), expense.get('region')
+        else:
+            amount, region = getattr(expense, 'amount', None), getattr(expense, 'region', None)
+        amount = Decimal(str(amount))
+        if not amount.is_finite():
+            # NaN and Infinity parse, but cannot be compared with a limit.
+            raise ValueError('The amount is not a finite number.')
+        return amount, region
+
+    def violations(self, expense, applicable=None):
+        """
+        Lists the policies an expense violates.
+
+        Parameters:
+        - expense (dict or object): With an amount and an optional region.
+        - applicable (tuple, optional): The expense region's policies, if already looked up
+          with applicable(); batches resolve them once per region.
+
+        Returns:
+        - list: {'policy', 'message'} dicts, lowest limit first; a single one with policy None if
+          the amount is not a number.
+        """
+        try:
+            amount, region = self._fields(expense)
+        except (InvalidOperation, ValueError):
+            return [{'policy': None, 'message': 'Invalid expense amount'}]
+        violations = []
+        for policy in self.applicable(region) if applicable is None else applicable:
+            if amount <= policy.max_amount:
+                break
+            violations.append({
+                'policy': policy.name,
+                'message': f'Amount {amount} exceeds the limit of {policy.max_amount}',
+            })
+        return violations
+
+    def is_compliant(self, expense):
+        """Returns True if an expense violates no policy."""
+        try:
+            amount, region = self._fields(expense)
+        except (InvalidOperation, ValueError):
+            return False
+        policies = self.applicable(region)
+        return not policies or amount <= policies[0].max_amount
+
+
+def compile_ruleset(version, policies):
+    """
+    Compiles policy rows into a CompiledRuleset, recording the compile time.
+    """
+    started = time.monotonic()
+    ruleset = CompiledRuleset(version, policies)
+    metrics.observe('policy_ruleset_compile_seconds', time.monotonic() - started)
+    metrics.inc('policy_ruleset_reloads')
+    return ruleset
+
+
+class PolicyRulesetCache:
+    """
+    Holds a worker's current CompiledRuleset and replaces it when the ruleset version moves.
+
+    Attributes:
+        check_interval (float): Seconds a ruleset is used before the version is read again.
+    """
+
+    def __init__(self, session=None, check_interval=None):
+        """
+        Initializes an empty cache; the ruleset is compiled on first use.
+
+        Parameters:
+        - session (Session, optional): Session to read policies with; defaults to db_session.
+        - check_interval (float, optional): Defaults to POLICY_RULESET_CHECK_SECONDS.
+        """
+        self._session = session
+        self.check_interval = POLICY_RULESET_CHECK_SECONDS if check_interval is None else check_interval
+        self._ruleset = None
+        self._checked_at = float('-inf')
+        self._lock = threading.Lock()
+
+    @property
+    def current(self):
+        """The last compiled ruleset, or None; never triggers a reload."""
+        return self._ruleset
+
+    def fresh(self):
+        """Returns the current ruleset if its version was checked within the interval, else None."""
+        if time.monotonic() - self._checked_at < self.check_interval:
+            return self._ruleset
+        return None
+
+    def install(self, ruleset):
+        """Makes a ruleset current and restarts the check interval; returns the ruleset."""
+        self._ruleset = ruleset
+        self._checked_at = time.monotonic()
+        return ruleset
+
+    def invalidate(self):
+        """Reads the version again on next use; the ruleset is recompiled only if it moved."""
+        self._checked_at = float('-inf')
+
+    def get(self):
+        """
+        Returns the current ruleset, checking the version and recompiling when needed.
+
+        One thread reloads while the others wait for its result rather than reloading too.
+        """
+        ruleset = self.fresh()
+        if ruleset is not None:
+            return ruleset
+        with self._lock:
+            ruleset = self.fresh()
+            if ruleset is not None:
+                return ruleset
+            if self._session is None:
+                from src.backend.main_server.src.database import db_session
+                self._session = db_session
+            # The version is read before the policies: a change committed in between is then
+            # compiled under the older version and picked up again by the next check.
+            version = self._session.execute(RULESET_VERSION).scalar() or 0
+            ruleset = self._ruleset
+            if ruleset is None or ruleset.version != version:
+                ruleset = compile_ruleset(version, self._session.execute(POLICY_COLUMNS).all())
+            return self.install(ruleset)
+
+
+# Process-wide cache shared by all requests.
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_policy_ruleset_cache():
+    """
+    Returns the process-wide PolicyRulesetCache, creating it on first use.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = PolicyRulesetCache()
+    return _cache
+
+
+def get_policy_ruleset():
+    """
+    Returns the worker's current CompiledRuleset.
+    """
+    return get_policy_ruleset_cache().get()
+
+
+@event.listens_for(Session, 'after_commit')
+def _policies_committed(session):
+    # This worker's own policy changes take effect with the commit rather than the next check.
+    if session.info.pop('policy_ruleset_changed', False) and _cache is not None:
+        _cache.invalidate()
+
+
+@event.listens_for(Session, 'after_rollback')
+def _policies_rolled_back(session):
+    session.info.pop('policy_ruleset_changed', None)
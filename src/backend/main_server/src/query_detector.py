@@ -0,0 +1,191 @@
+"""
+Per-request query counting and N+1 detection.
+
+`QueryDetector` listens to every statement SQLAlchemy sends to the database. While a request is
+being handled it counts the statements by shape: the SQL text with whitespace collapsed and
+parameter lists folded, so the same query with different parameters counts as one shape. When a
+shape repeats more than N_PLUS_ONE_THRESHOLD times in one request, the detector logs a warning
+with the statement and the route ('log') or raises RepeatedQueryError ('raise', for development
+and tests). Usually the fix is a loading profile from loading.py. Queries per request are
+recorded as the `db_queries_per_request` histogram, and detections as `n_plus_one_detected`.
+
+Requirements Addressed:
+- Data Management
+  - Location: Technical Specification/5.10 Feature ID: F-010
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import contextvars
+import logging
+import os
+import re
+from collections import Counter
+from contextlib import contextmanager
+
+# External dependencies
+from flask import g, request  # Flask==2.0.1
+from sqlalchemy import event  # SQLAlchemy version 1.4.25
+from sqlalchemy.engine import Engine  # SQLAlchemy version 1.4.25
+
+# Internal imports
+from src.backend.common.metrics import metrics  # Shared in-process metrics
+
+logger = logging.getLogger(__name__)
+
+# N_PLUS_ONE_THRESHOLD: Executions of one statement shape per request before it is reported.
+N_PLUS_ONE_THRESHOLD = int(os.getenv('N_PLUS_ONE_THRESHOLD', '10'))
+
+# N_PLUS_ONE_ACTION: 'log' (default), 'raise' or 'off'.
+N_PLUS_ONE_ACTION = os.getenv('N_PLUS_ONE_ACTION', 'log')
+
+# Histogram buckets for statements per request.
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+# Placeholder lists such as IN (?, ?, ?) or VALUES (%(a)s, %(b)s).
+_PARAMETER_LIST = re.compile(r'\(\s*(?:\?|%s|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|:\w+))*\s*\)')
+
+# The tracking in effect for the current request, if any.
+_tracking = contextvars.ContextVar('query_tracking', default=None)
+
+
+class RepeatedQueryError(Exception):
+    """
+    Raised when one statement shape repeats more often than allowed in a single request.
+    """
+
+
+def statement_shape(statement):
+    """
+    Normalizes a SQL statement so that executions differing only in parameters compare equal.
+
+    Parameters:
+        statement (str): The SQL text as sent to the driver.
+
+    Returns:
+        str: The statement with whitespace collapsed and placeholder lists folded to '(?)'.
+    """
+    return _PARAMETER_LIST.sub('(?)', ' '.join(statement.split()))
+
+
+class QueryTracking:
+    """
+    Statement counts for one request or block of code.
+
+    Attributes:
+        threshold (int): Executions of one shape allowed before it is reported.
+        action (str): 'log' or 'raise'.
+        label (str): Names the request in reports, e.g. 'GET /reports/1'.
+        shapes (Counter): Statement shape -> executions.
+    """
+
+    def __init__(self, threshold, action, label=''):
+        self.threshold = threshold
+        self.action = action
+        self.label = label
+        self.shapes = Counter()
+        self.reported = set()
+
+    @property
+    def total(self):
+        return sum(self.shapes.values())
+
+    def record(self, statement):
+        """
+        Counts one execution and reports the shape once it passes the threshold.
+
+        Raises:
+            RepeatedQueryError: If the action is 'raise' and the shape passed the threshold.
+        """
+        shape = statement_shape(statement)
+        self.shapes[shape] += 1
+        count = self.shapes[shape]
+        if count <= self.threshold or shape in self.reported:
+            return
+        self.reported.add(shape)
+        metrics.inc('n_plus_one_detected')
+        message = (f'Statement executed {count} times in {self.label or "one block"} '
+                   f'(threshold {self.threshold}); consider a loading profile: {shape}')
+        if self.action == 'raise':
+            raise RepeatedQueryError(message)
+        logger.warning(message)
+
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    tracking = _tracking.get()
+    if tracking is not None:
+        tracking.record(statement)
+
+
+@contextmanager
+def track_queries(threshold=None, action=None, label=''):
+    """
+    Counts the statements executed inside the block, reporting repeated shapes.
+
+    Parameters:
+        threshold (int, optional): Defaults to N_PLUS_ONE_THRESHOLD.
+        action (str, optional): 'log' or 'raise'; defaults to N_PLUS_ONE_ACTION.
+        label (str): Names the block in reports.
+
+    Yields:
+        QueryTracking: The counts, readable after the block.
+    """
+    tracking = QueryTracking(N_PLUS_ONE_THRESHOLD if threshold is None else threshold,
+                             action or N_PLUS_ONE_ACTION, label)
+    token = _tracking.set(tracking)
+    try:
+        yield tracking
+    finally:
+        _tracking.reset(token)
+
+
+class QueryDetector:
+    """
+    Flask extension that tracks the queries of every request.
+
+    Usage:
+        query_detector = QueryDetector()
+        query_detector.init_app(app)
+    """
+
+    def __init__(self, app=None, threshold=None, action=None):
+        """
+        Initializes the detector, and registers it on the app if one is given.
+
+        Parameters:
+            app (Flask, optional): The application.
+            threshold (int, optional): Defaults to N_PLUS_ONE_THRESHOLD.
+            action (str, optional): 'log', 'raise' or 'off'; defaults to N_PLUS_ONE_ACTION.
+        """
+        self.threshold = N_PLUS_ONE_THRESHOLD if threshold is None else threshold
+        self.action = action or N_PLUS_ONE_ACTION
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """
+        Registers the request hooks on the app. Does nothing when the action is 'off'.
+        """
+        app.extensions['query_detector'] = self
+        if self.action == 'off':
+            return
+        app.before_request(self._start)
+        app.teardown_request(self._finish)
+
+    def _start(self):
+        g._query_tracking = QueryTracking(self.threshold, self.action, f'{request.method} {request.path}')
+        g._query_tracking_token = _tracking.set(g._query_tracking)
+
+    def _finish(self, exception=None):
+        tracking = g.pop('_query_tracking', None)
+        token = g.pop('_query_tracking_token', None)
+        if token is not None:
+            try:
+                _tracking.reset(token)
+            except ValueError:
+                # Torn down in another context than the one the request started in.
+                _tracking.set(None)
+        if tracking is not None:
+            metrics.observe('db_queries_per_request', tracking.total, buckets=QUERY_COUNT_BUCKETS)
@@ -0,0 +1,101 @@
+"""
+Batch reconciliation of `ExpenseReport.total_amount` against the report's expenses.
+
+The ORM events in models.py keep the totals current, but writes that bypass them, such as bulk
+Query.update()/delete(), raw SQL or manual fixes, can leave a total out of step with its items.
+This job walks the reports in primary-key chunks of REPORT_RECONCILE_CHUNK_SIZE. Each chunk is
+compared with one `SUM(amount) ... GROUP BY report_id` statement, and drifted totals are corrected
+in the same transaction. The correction is a compare-and-set on the total that was read, so a
+delta committed concurrently is never overwritten; the next run picks that report up again.
+Fixes are logged and counted as the `report_totals_drift_fixed` metric.
+
+Requirements Addressed:
+- Data Management
+  - Location: Technical Specification/5.10 Feature ID: F-010
+- Reporting and Analytics
+  - Location: Technical Specification/5.6 Feature ID: F-006
+"""
+
+# Standard library
+import logging
+import os
+
+# SQLAlchemy version 1.4.25
+from sqlalchemy import and_, func, select, update
+from sqlalchemy.orm import Session
+
+# Internal imports
+from src.backend.main_server.src.models import Expense, ExpenseReport
+from src.backend.main_server.src.database import get_engine
+from src.backend.common.metrics import metrics  # Shared in-process metrics
+
+logger = logging.getLogger(__name__)
+
+# REPORT_RECONCILE_CHUNK_SIZE: Reports compared and fixed per transaction.
+REPORT_RECONCILE_CHUNK_SIZE = int(os.getenv('REPORT_RECONCILE_CHUNK_SIZE', '1000'))
+
+_reports = ExpenseReport.__table__
+_expenses = Expense.__table__
+
+
+def _chunk_drift(connection, first_id, last_id):
+    # (report_id, stored total, sum of items) for the reports in [first_id, last_id] that disagree.
+    items = (
+        select(_expenses.c.report_id, func.sum(_expenses.c.amount).label('items_total'))
+        .where(_expenses.c.report_id.between(first_id, last_id))
+        .group_by(_expenses.c.report_id)
+        .subquery()
+    )
+    items_total = func.coalesce(items.c.items_total, 0)
+    return connection.execute(
+        select(_reports.c.report_id, _reports.c.total_amount, items_total)
+        .select_from(_reports.outerjoin(items, items.c.report_id == _reports.c.report_id))
+        .where(_reports.c.report_id.between(first_id, last_id))
+        .where(_reports.c.total_amount != items_total)
+    ).all()
+
+
+def reconcile_report_totals(chunk_size=None, fix=True, engine=None):
+    """
+    Compares every report's total with the sum of its expenses and corrects the differences.
+
+    Parameters:
+        chunk_size (int, optional): Reports per transaction; defaults to REPORT_RECONCILE_CHUNK_SIZE.
+        fix (bool): Correct drifted totals; False only reports them.
+        engine (Engine, optional): Defaults to the main server's engine.
+
+    Returns:
+        dict: 'checked' reports, 'drifted' reports and 'fixed' reports, and 'drift' as
+        [{'report_id', 'stored', 'expected'}] for the reports found drifted.
+    """
+    chunk_size = chunk_size or REPORT_RECONCILE_CHUNK_SIZE
+    result = {'checked': 0, 'drifted': 0, 'fixed': 0, 'drift': []}
+    last_id = None
+    with Session(bind=engine or get_engine()) as session:
+        while True:
+            # Keyset paging: the next chunk of report ids after the last one checked.
+            query = select(_reports.c.report_id).order_by(_reports.c.report_id).limit(chunk_size)
+            if last_id is not None:
+                query = query.where(_reports.c.report_id > last_id)
+            with session.begin():
+                connection = session.connection()
+                ids = connection.execute(query).scalars().all()
+                if not ids:
+                    break
+                drifted = _chunk_drift(connection, ids[0], ids[-1])
+                if fix:
+                    # Drift is rare: one compare-and-set per drifted report, counting actual fixes.
+                    for report_id, stored, expected in drifted:
+                        result['fixed'] += connection.execute(
+                            update(_reports)
+                            .where(and_(_reports.c.report_id == report_id, _reports.c.total_amount == stored))
+                            .values(total_amount=expected, version=_reports.c.version + 1)
+                        ).rowcount
+            result['checked'] += len(ids)
+            result['drifted'] += len(drifted)
+            for report_id, stored, expected in drifted:
+                logger.warning('Report %s total %s differs from its items (%s)', report_id, stored, expected)
+                result['drift'].append({'report_id': report_id, 'stored': str(stored), 'expected': str(expected)})
+            last_id = ids[-1]
+    metrics.inc('report_totals_drift_fixed', result['fixed'])
+    return result
@@ -1,27 +1,105 @@
 # External dependencies (Flask version 2.0.1)
-from flask import Flask, request, jsonify, Blueprint
+from flask import Flask, request, jsonify, Blueprint, abort, current_app
 # Flask-JWT-Extended version 4.3.1
 from flask_jwt_extended import (
-    JWTManager, create_access_token, jwt_required, get_jwt_identity
+    JWTManager, create_access_token, jwt_required, get_jwt_identity, get_jwt
 )
+from sqlalchemy.exc import IntegrityError  # Duplicate usernames and email addresses
+import datetime  # Date range filters of the listing routes
+from functools import partial  # Binds each channel's recipient and message
+import os  # Cache size setting
 
 # Internal dependencies
-from models import User, Expense, PolicyModel, ExpenseReportModel
-from utils import (
-    hash_and_store_password,
-    verify_password,
-    check_policy_compliance,
-    validate_tax_compliance,
-    send_notification,
-    format_message,
-    get_delivery_method,
-    generate_timestamp,
-    generate_expense_report
-)
+from src.backend.main_server.src.models import User, Employee, Expense, ExpenseReport  # ORM models
+from src.backend.main_server.src.utils import hash_and_store_password  # Password storage
+from src.backend.main_server.src.notifications import (
+    ACCEPTED,
+    get_notification_fanout,
+    send_email,
+    send_in_app
+)  # Concurrent multi-channel notification delivery
+from src.backend.common.hashing import HashingPoolFull  # Raised when the hashing pool is saturated or times out
+from src.backend.common.hashing import needs_rehash  # Detects outdated password hashes
+from src.backend.common.rate_limit import get_login_rate_limiter  # Login admission control
+from src.backend.common.metrics import metrics  # Shared in-process metrics
+from src.backend.main_server.src.database import db_session  # Database session for ORM operations
+from src.backend.main_server.src.loading import get_with_profile, query_with_profile  # Named relationship loading profiles
+from src.backend.main_server.src.pagination import keyset_page, page_size  # Keyset pagination with opaque cursors
+from src.backend.common.conditional import VersionedResponseCache  # ETags and versioned payload cache
+from src.backend.common.json_provider import ndjson_response, wants_ndjson  # NDJSON list responses
+from src.backend.common.batch import BatchPayloadError, read_batch, validate_batch  # Batch validation
+from src.backend.main_server.src.policy_ruleset import get_policy_ruleset  # Versioned, precompiled policies
+from src.backend.main_server.src.ingestion import (
+    BulkPayloadError,
+    ingest_expenses,
+    iter_expense_rows
+)  # Chunked bulk expense ingestion
+from src.backend.common.permissions import (
+    Permission,
+    claims_permissions,
+    has_permissions,
+    require_permissions
+)  # Bitwise role permission guards
+from src.backend.main_server.src.tokens import (
+    NEW_USER_ROLE,
+    access_token_claims,
+    issue_refresh_token,
+    rotate_refresh_token,
+    revoke_refresh_token,
+    revoke_access_token,
+    InvalidRefreshToken
+)  # Server-side refresh tokens and access token revocation
 
 # Create a Blueprint for the main server routes
 main_routes = Blueprint('main_routes', __name__)
 
+# REPORT_CACHE_SIZE: Serialized expense reports kept per worker for repeated polls.
+REPORT_CACHE_SIZE = int(os.getenv('REPORT_CACHE_SIZE', '1024'))
+
+# Serialized expense reports by report id, each valid for one report version
+report_cache = VersionedResponseCache('report', maxsize=REPORT_CACHE_SIZE)
+
+def _jwt_permissions():
+    # The permission bitset of the current access token, for require_permissions.
+    return claims_permissions(get_jwt())
+
+def _current_employee_id():
+    # The employee record of the authenticated user, or None if the user has none.
+    user = db_session.get(User, int(get_jwt_identity()))
+    return user.employee_id if user else None
+
+def _date_arg(name):
+    # An optional ISO date query parameter; ValueError names the parameter.
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f'{name} must be an ISO date (YYYY-MM-DD).')
+
+def _int_arg(name):
+    # An optional integer query parameter; ValueError names the parameter.
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f'{name} must be an integer.')
+
+def _listing_args():
+    # (page size, date_from, date_to) of a listing request.
+    try:
+        limit = page_size(request.args.get('limit'))
+    except ValueError:
+        raise ValueError('limit must be an integer.')
+    return limit, _date_arg('date_from'), _date_arg('date_to')
+
+def _ndjson_page(items, next_cursor):
+    # A listing page as NDJSON, one item per line; the next page's cursor travels in a header.
+    return ndjson_response(items, headers={'X-Next-Cursor': next_cursor} if next_cursor else None)
+
 @main_routes.route('/register', methods=['POST'])
 def register_user_route():
     """
@@ -35,38 +113,43 @@ def register_user_route():
         - TR-F001.5 Provide password recovery and reset functionality
     """
     # Step 1: Extract user data from the request payload
-    # Retrieves 'username', 'password', and 'role' from the JSON request
-    data = request.get_json()
-    username = data.get('username')
+    # The username defaults to the email address; a client cannot choose its own role
+    data = request.get_json(silent=True) or {}
+    first_name = data.get('first_name')
+    last_name = data.get('last_name')
+    email = data.get('email')
     password = data.get('password')
-    role = data.get('role', 'Employee')  # Default role is 'Employee'
-
-    # Step 2: Hash the user's password using hash_and_store_password utility
-    # Ensures passwords are stored securely in the database
-    hashed_password = hash_and_store_password(password)
-
-    # Step 3: Create a new User instance with the provided data
-    new_user = User(
-        username=username,
-        password=hashed_password,
-        role=role
-    )
+    username = data.get('username') or email
+    if not (first_name and last_name and email and password):
+        return jsonify({'message': 'first_name, last_name, email and password are required'}), 400
 
-    # Step 4: Save the User instance to the database
     try:
-        new_user.save_to_db()
-    except Exception as e:
-        # Handles exceptions such as duplicate usernames
-        return jsonify({'message': 'User registration failed', 'error': str(e)}), 400
-
-    # Step 5: Generate a JWT token
+        # Step 2: Create the employee record and its login in one transaction; the User model
+        # hashes the password once, on the shared hashing pool
+        employee = Employee(first_name, last_name, email, NEW_USER_ROLE, None)
+        db_session.add(employee)
+        db_session.flush()
+        new_user = User(username, password, NEW_USER_ROLE, employee.employee_id)
+        db_session.add(new_user)
+        db_session.commit()
+    except HashingPoolFull:
+        # The hashing pool is saturated or too slow; ask the client to retry shortly
+        db_session.rollback()
+        return jsonify({'message': 'Service busy, please retry'}), 503, {'Retry-After': '1'}
+    except IntegrityError:
+        # The username or email address is already registered
+        db_session.rollback()
+        return jsonify({'message': 'User registration failed: username or email already registered'}), 409
+
+    # Step 3: Generate a JWT token with the same role and permission claims as login
     # Provides authentication token for the newly registered user
-    access_token = create_access_token(identity=new_user.id)
+    access_token = create_access_token(identity=str(new_user.user_id), additional_claims=access_token_claims(new_user))
 
-    # Step 6: Return a success response with a generated JWT token
+    # Step 4: Return a success response with a generated JWT token
     return jsonify({
         'message': 'User registered successfully',
-        'access_token': access_token
+        'token': access_token,
+        'access_token': access_token  # Earlier name of 'token', kept for existing clients
     }), 201
 
 @main_routes.route('/login', methods=['POST'])
@@ -80,68 +163,212 @@ def login_user_route():
         - TR-F001.1 Implement secure login using unique username and password
         - TR-F001.5 Provide password recovery and reset functionality
     """
-    # Step 1: Extract login credentials from the request payload
-    data = request.get_json()
-    username = data.get('username')
+    # Step 1: Extract login credentials from the request payload; registered users may log in
+    # with their email address, which is their username unless they chose another
+    data = request.get_json(silent=True) or {}
+    username = data.get('username') or data.get('email')
     password = data.get('password')
 
+    # Refuse attempts over the per-IP or per-username rate before any lookup or hashing
+    decision = get_login_rate_limiter().check(username, request.remote_addr)
+    if not decision.allowed:
+        return (jsonify({'message': 'Too many login attempts, please retry later'}), 429,
+                {'Retry-After': str(decision.retry_after)})
+
     # Step 2: Retrieve the User instance from the database using the provided username
-    user = User.find_by_username(username)
+    user = db_session.query(User).filter_by(username=username).first()
+    if not user and data.get('email'):
+        user = db_session.query(User).join(User.employee).filter(Employee.email == data['email']).first()
     if not user:
         return jsonify({'message': 'User not found'}), 404
 
-    # Step 3: Verify the provided password using verify_password utility
-    if not verify_password(password, user.password):
+    # Step 3: Verify the provided password on the shared hashing pool
+    try:
+        password_matches = user.check_password(password)
+    except HashingPoolFull:
+        # The hashing pool is saturated or too slow; ask the client to retry shortly
+        return jsonify({'message': 'Service busy, please retry'}), 503, {'Retry-After': '1'}
+    if not password_matches:
         # Password does not match
         return jsonify({'message': 'Invalid credentials'}), 401
 
-    # Step 4: Generate a JWT token using create_access_token
+    # Transparently upgrade a hash that predates the current scheme or calibrated cost
+    if needs_rehash(user.password_hash):
+        try:
+            hash_and_store_password(user, password)
+        except HashingPoolFull:
+            pass  # Upgrade on a later login when the pool has capacity
+
+    # Step 4: Generate a JWT token using create_access_token, and a server-side refresh token
     # Generates a token for authenticated user sessions
-    access_token = create_access_token(identity=user.id)
+    access_token = create_access_token(identity=str(user.user_id), additional_claims=access_token_claims(user))
+    refresh_token = issue_refresh_token(user.user_id)
 
     # Step 5: Return a success response with the JWT token
     return jsonify({
         'message': 'Login successful',
-        'access_token': access_token
+        'token': access_token,
+        'access_token': access_token,  # Earlier name of 'token', kept for existing clients
+        'refresh_token': refresh_token
+    }), 200
+
+@main_routes.route('/token/refresh', methods=['POST'])
+def refresh_token_route():
+    """
+    API route exchanging a refresh token for a new access token and a new refresh token.
+
+    Addresses:
+    - Secure User Authentication and Role-Based Authorization
+      (Technical Specification/5.1 Feature ID: F-001)
+        - TR-F001.1 Implement secure login using unique username and password
+    """
+    # Step 1: Extract the refresh token from the request payload
+    data = request.get_json() or {}
+
+    # Step 2: Rotate the refresh token; a reused token revokes all of the user's refresh tokens
+    try:
+        user_id, refresh_token = rotate_refresh_token(data.get('refresh_token'))
+    except InvalidRefreshToken as e:
+        return jsonify({'message': str(e)}), 401
+
+    # Step 3: Reload the user so the new access token carries the current role and permissions
+    user = db_session.get(User, user_id)
+    if user is None:
+        return jsonify({'message': 'Unknown refresh token.'}), 401
+
+    # Step 4: Return a fresh access token with the rotated refresh token, no password check needed
+    return jsonify({
+        'access_token': create_access_token(identity=str(user_id), additional_claims=access_token_claims(user)),
+        'refresh_token': refresh_token
     }), 200
 
+@main_routes.route('/logout', methods=['POST'])
+@jwt_required()
+def logout_route():
+    """
+    API route revoking the current access token and, if given, the session's refresh token.
+
+    Addresses:
+    - Secure User Authentication and Role-Based Authorization
+      (Technical Specification/5.1 Feature ID: F-001)
+    """
+    # Step 1: Revoke the access token; every worker refuses it within REVOCATION_SYNC_INTERVAL
+    claims = get_jwt()
+    revoke_access_token(claims['jti'], claims.get('exp'))
+
+    # Step 2: Revoke the refresh token so it cannot mint new access tokens
+    data = request.get_json(silent=True) or {}
+    if data.get('refresh_token'):
+        revoke_refresh_token(data['refresh_token'])
+
+    return jsonify({'message': 'Logged out'}), 200
+
 @main_routes.route('/validate_expense', methods=['POST'])
 @jwt_required()
+@require_permissions(Permission.SUBMIT_EXPENSES, granted=_jwt_permissions)
 def validate_expense_route():
     """
-    API route to validate an expense against policy and tax rules.
+    API route to validate an expense against the policy rules.
 
     Addresses:
     - Policy and Compliance Engine
       (Technical Specification/5.3 Feature ID: F-003)
         - TR-F003.2 Perform real-time policy checks during expense submission
-        - TR-F003.3 Integrate with global tax databases to ensure up-to-date tax compliance
         - TR-F003.5 Flag expenses that exceed policy limits or require additional approval
     """
     # Step 1: Parse the incoming request to extract expense data
-    expense_data = request.get_json()
+    expense_data = request.get_json(silent=True)
+    if not isinstance(expense_data, dict):
+        return jsonify({'message': 'The body must be a JSON object.'}), 400
 
-    # Step 2: Load the relevant policy and tax models using PolicyModel
-    # Retrieves current policies and tax regulations
-    policies = PolicyModel.get_current_policies()
+    # Step 2: Check the expense against the worker's compiled ruleset, as the batch route does;
+    # the ruleset is reloaded only when the policies change (see policy_ruleset.py)
+    ruleset = get_policy_ruleset()
+    violations = ruleset.violations(expense_data)
 
-    # Step 3: Validate the expense against policy rules using check_policy_compliance
-    policy_compliance_result = check_policy_compliance(expense_data, policies)
+    # Step 3: Return a JSON response with the compliance status and any violations
+    return jsonify({
+        'compliance_status': 'Non-Compliant' if violations else 'Compliant',
+        'ruleset_version': ruleset.version,
+        'policy_compliant': not violations,
+        'policy_violations': violations,
+    }), 200
 
-    # Step 4: Validate the expense against tax rules using validate_tax_compliance
-    tax_compliance_result = validate_tax_compliance(expense_data)
+@main_routes.route('/validate_expense/batch', methods=['POST'])
+@jwt_required()
+@require_permissions(Permission.SUBMIT_EXPENSES, granted=_jwt_permissions)
+def validate_expense_batch_route():
+    """
+    API route validating many expenses, e.g. a synced offline trip, in one request.
 
-    # Step 5: Return a JSON response with the compliance status and any violations
-    compliance_status = {
-        'policy_compliant': policy_compliance_result['is_compliant'],
-        'policy_violations': policy_compliance_result['violations'],
-        'tax_compliant': tax_compliance_result['is_compliant'],
-        'tax_violations': tax_compliance_result['violations'],
-    }
+    The body is a JSON array of expenses or NDJSON (application/x-ndjson), at most
+    BATCH_MAX_ITEMS expenses. Every expense is checked against the same ruleset version. The
+    applicable policies are looked up once per (category, region, employee level). The results are
+    in input order, as a JSON document or, if the client accepts it, as NDJSON.
 
-    return jsonify({'compliance_status': compliance_status}), 200
+    Addresses:
+    - Policy and Compliance Engine
+      (Technical Specification/5.3 Feature ID: F-003)
+        - TR-F003.2 Perform real-time policy checks during expense submission
+        - TR-F003.5 Flag expenses that exceed policy limits or require additional approval
+    """
+    # Step 1: Read the expenses from the JSON array or NDJSON body
+    try:
+        expenses = read_batch()
+    except BatchPayloadError as e:
+        return jsonify({'message': str(e)}), e.status
+
+    # Step 2: Take one ruleset for the whole batch and check each expense against its policies
+    ruleset = get_policy_ruleset()
+
+    def check(expense, applicable):
+        violations = ruleset.violations(expense, applicable)
+        return {'policy_compliant': not violations, 'policy_violations': violations}
+
+    result = validate_batch(expenses, resolve=lambda expense: ruleset.applicable(expense.get('region')), check=check)
+
+    # Step 3: Return the results in input order, streamed as NDJSON if the client asked for it
+    if wants_ndjson():
+        return ndjson_response(result['results'], headers={'X-Policy-Ruleset-Version': str(ruleset.version)})
+    return jsonify({
+        'ruleset_version': ruleset.version,
+        'policy_keys': result['policy_keys'],
+        'results': result['results'],
+    }), 200
+
+@main_routes.route('/expenses/bulk', methods=['POST'])
+@jwt_required()
+@require_permissions(Permission.IMPORT_EXPENSES, granted=_jwt_permissions)
+def bulk_expenses_route():
+    """
+    API route importing many expenses, e.g. a corporate card feed, in one request.
+
+    The body is NDJSON (application/x-ndjson) or CSV (text/csv) with report_id, employee_id,
+    category, amount, currency, expense_date and optional description per row. It is read as a
+    stream and written in chunks of EXPENSE_BULK_CHUNK_SIZE rows; only failed rows are listed.
+
+    Addresses:
+    - Expense Submission
+      (Technical Specification/5.2 Feature ID: F-002)
+    - System Integrations
+      (Technical Specification/5.9 Feature ID: F-009)
+    """
+    # Step 1: Read the rows from the request stream without buffering the upload
+    rows = iter_expense_rows(request.stream, request.mimetype)
+
+    # Step 2: Validate, resolve and insert the rows chunk by chunk
+    try:
+        result = ingest_expenses(rows)
+    except BulkPayloadError as e:
+        return jsonify({'message': str(e)}), 400
+    metrics.inc('expenses_bulk_inserted', result['inserted'])
+
+    # Step 3: Return the counts and the failed rows
+    return jsonify(result), 200
 
 @main_routes.route('/send_notification', methods=['POST'])
+@jwt_required()
+@require_permissions(Permission.SEND_NOTIFICATIONS, granted=_jwt_permissions)
 def send_notification_route():
     """
     API route for sending notifications.
@@ -155,68 +382,180 @@ def send_notification_route():
     """
     # Step 1: Log the request to send a notification
     # Records the incoming notification request for auditing
-    from app import app  # Assuming 'app' is defined in 'app.py'
-    app.logger.info('Received request to send notification')
-
-    # Step 2: Extract user_id and message from the request payload
-    data = request.get_json()
-    user_id = data.get('user_id')
-    message = data.get('message')
-
-    # Step 3: Create a Notification instance with the provided user_id and message
-    notification = {
-        'user_id': user_id,
-        'message': message
-    }
-
-    # Step 4: Format the message using format_message
-    formatted_message = format_message(notification['message'])
-
-    # Step 5: Determine the delivery method using get_delivery_method
-    delivery_method = get_delivery_method(user_id)
-
-    # Step 6: Generate a timestamp using generate_timestamp
-    timestamp = generate_timestamp()
-
-    # Step 7: Send the notification and log the result
-    send_status = send_notification(
-        user_id=user_id,
-        message=formatted_message,
-        method=delivery_method,
-        timestamp=timestamp
-    )
-    app.logger.info(
-        f'Notification sent to user {user_id} via {delivery_method} at {timestamp}'
-    )
-
-    # Step 8: Return the status of the send operation
+    current_app.logger.info('Received request to send notification')
+
+    # Step 2: Extract the recipient's user_id and the message from the request payload
+    data = request.get_json(silent=True) or {}
+    user_id = data.get('user_id', data.get('recipient_id'))
+    message = (data.get('message') or '').strip()
+    if not isinstance(user_id, int) or not message:
+        return jsonify({'message': 'user_id (an integer) and message are required'}), 400
+
+    # Step 3: Look up the recipient and their employee record's email address
+    user = db_session.get(User, user_id)
+    if user is None:
+        return jsonify({'message': 'User not found'}), 404
+
+    # Step 4: Send by email and in-app at once; the call returns at the first acceptance
+    sends = {'in_app': partial(send_in_app, user.user_id, message)}
+    if user.employee is not None:
+        sends['email'] = partial(send_email, user.employee.email, message)
+    outcomes = get_notification_fanout().send(sends)
+    accepted = [channel for channel, outcome in outcomes.items() if outcome == ACCEPTED]
+    current_app.logger.info(f'Notification to user {user_id}: {outcomes}')
+
+    # Step 5: Return the status of the send operation
     return jsonify({
-        'message': 'Notification sent successfully',
-        'status': send_status
-    }), 200
+        'message': 'Notification sent successfully' if accepted else 'Notification could not be delivered',
+        'status': 'Success' if accepted else 'Failed',
+        'channels': outcomes
+    }), 200 if accepted else 502
 
 @main_routes.route('/reports/<int:report_id>', methods=['GET'])
 @jwt_required()
+@require_permissions(Permission.VIEW_REPORTS, granted=_jwt_permissions)
 def get_expense_report_route(report_id):
     """
     API route to retrieve a specific expense report by ID.
 
+    Responses carry a strong ETag naming the report's version; a request with a matching
+    If-None-Match gets 304. Serialized reports are kept in an LRU of REPORT_CACHE_SIZE entries
+    that serves each payload only for the version it was built at.
+
     Addresses:
     - Reporting and Analytics
       (Technical Specification/5.6 Feature ID: F-006)
         - TR-F006.2 Generate detailed expense reports by employee, department, project, or cost center
         - TR-F006.4 Enable export of reports in multiple formats
     """
-    # Step 1: Extract the report_id from the request URL
-    # Already captured via the route parameter
-
-    # Step 2: Query the database for the expense report with the given report_id
-    report = ExpenseReportModel.find_by_id(report_id)
-    if not report:
+    # Step 1: Look up the report's current version, one primary key probe
+    version = db_session.query(ExpenseReport.version).filter(ExpenseReport.report_id == report_id).scalar()
+    if version is None:
         return jsonify({'message': 'Expense report not found'}), 404
 
-    # Step 3: Convert the report data to a dictionary using to_dict()
-    report_data = report.to_dict()
+    # Step 2: Answer 304 if the client holds this version, else serve the cached payload,
+    # building it only when this version has not been serialized yet
+    def build():
+        # Load the employee and line items up front rather than one query per item
+        report = get_with_profile(ExpenseReport, report_id, 'report_with_items')
+        if report is None:
+            abort(404)  # Deleted since the version lookup
+        return report.version, {'expense_report': report.to_dict()}
 
-    # Step 4: Return the report data as a JSON response
-    return jsonify({'expense_report': report_data}), 200
\ No newline at end of file
+    return report_cache.respond(report_id, version, build)
+
+@main_routes.route('/expenses', methods=['GET'])
+@jwt_required()
+@require_permissions(Permission.SUBMIT_EXPENSES, granted=_jwt_permissions)
+def list_expenses_route():
+    """
+    API route listing the current user's expenses, newest first, one page at a time.
+
+    Query parameters: limit, cursor (next_cursor of the previous page), category, status (of
+    the expense's report), report_id, date_from and date_to (inclusive ISO dates).
+
+    Addresses:
+    - Expense Submission
+      (Technical Specification/5.2 Feature ID: F-002)
+    - Scalability and Reliability
+      (Technical Specification/5.19 Feature ID: F-019)
+    """
+    # Step 1: Parse the page size and filters
+    try:
+        limit, date_from, date_to = _listing_args()
+        report_id = _int_arg('report_id')
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+
+    # Step 2: Restrict the query to the user's own expenses and apply the filters
+    query = db_session.query(Expense).filter(Expense.employee_id == _current_employee_id())
+    if request.args.get('category'):
+        query = query.filter(Expense.category == request.args['category'])
+    if report_id is not None:
+        query = query.filter(Expense.report_id == report_id)
+    if date_from:
+        query = query.filter(Expense.expense_date >= date_from)
+    if date_to:
+        query = query.filter(Expense.expense_date <= date_to)
+    if request.args.get('status'):
+        query = query.join(Expense.expense_report).filter(ExpenseReport.status == request.args['status'])
+
+    # Step 3: Fetch the page after the cursor on (expense_date, expense_id)
+    try:
+        expenses, next_cursor = keyset_page(query, (Expense.expense_date, Expense.expense_id),
+                                            request.args.get('cursor'), limit)
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+
+    # Step 4: Return the page, streamed as NDJSON if the client asked for it
+    if wants_ndjson():
+        return _ndjson_page((expense.to_dict() for expense in expenses), next_cursor)
+    return jsonify({'expenses': [expense.to_dict() for expense in expenses], 'next_cursor': next_cursor}), 200
+
+@main_routes.route('/reports', methods=['GET'])
+@jwt_required()
+@require_permissions(Permission.VIEW_REPORTS, granted=_jwt_permissions)
+def list_expense_reports_route():
+    """
+    API route listing expense reports, newest first, one page at a time.
+
+    Lists the user's own reports; with scope=all, users with the APPROVE_EXPENSES permission
+    list every employee's, e.g. `?scope=all&status=Pending` for the approval queue. Query
+    parameters: limit, cursor (next_cursor of the previous page), scope, status, employee_id
+    (with scope=all), date_from and date_to (inclusive ISO dates).
+
+    Addresses:
+    - Approval Workflows
+      (Technical Specification/5.4 Feature ID: F-004)
+    - Reporting and Analytics
+      (Technical Specification/5.6 Feature ID: F-006)
+    """
+    # Step 1: Parse the page size and filters
+    try:
+        limit, date_from, date_to = _listing_args()
+        employee_id = _int_arg('employee_id')
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+
+    # Step 2: Restrict the query to the user's reports unless an approver asks for all of them
+    query = query_with_profile(ExpenseReport, 'report_with_employee')
+    if request.args.get('scope') == 'all':
+        if not has_permissions(_jwt_permissions(), Permission.APPROVE_EXPENSES):
+            return jsonify({'message': 'Insufficient permissions.'}), 403
+        if employee_id is not None:
+            query = query.filter(ExpenseReport.employee_id == employee_id)
+    else:
+        query = query.filter(ExpenseReport.employee_id == _current_employee_id())
+    if request.args.get('status'):
+        query = query.filter(ExpenseReport.status == request.args['status'])
+    if date_from:
+        query = query.filter(ExpenseReport.submission_date >= date_from)
+    if date_to:
+        query = query.filter(ExpenseReport.submission_date <= date_to)
+
+    # Step 3: Fetch the page after the cursor on (submission_date, report_id)
+    try:
+        reports, next_cursor = keyset_page(query, (ExpenseReport.submission_date, ExpenseReport.report_id),
+                                           request.args.get('cursor'), limit)
+    except ValueError as e:
+        return jsonify({'message': str(e)}), 400
+
+    # Step 4: Return the page, streamed as NDJSON if the client asked for it
+    if wants_ndjson():
+        return _ndjson_page((report.to_dict(include_items=False) for report in reports), next_cursor)
+    return jsonify({
+        'expense_reports': [report.to_dict(include_items=False) for report in reports],
+        'next_cursor': next_cursor
+    }), 200
+
+@main_routes.route('/metrics', methods=['GET'])
+def metrics_route():
+    """
+    API route reporting the server's in-process metrics.
+
+    Addresses:
+    - Scalability and Reliability
+      (Technical Specification/5.19 Feature ID: F-019)
+        - Login rate limit rejections, password hashing times and other counters for this worker
+    """
+    return jsonify(metrics.snapshot()), 200
@@ -0,0 +1,252 @@
+"""
+Refresh tokens and access token revocation for the main server.
+
+Refresh tokens are opaque strings, '<token_id>.<secret>'. Only a SHA-256 of the secret is stored,
+in the refresh_tokens table. Each refresh rotates the token. Presenting a token that was already
+rotated or revoked is treated as theft, and every live refresh token of that user is revoked.
+
+Revoked access token ids are written to the revoked_tokens table and to the in-memory
+`revocation_list` (a Bloom filter plus an exact set per expiry bucket). `@jwt_required` routes and
+User.verify_auth_token consult only the in-memory list. A background thread loads revocations
+made by other workers, drops expired buckets and deletes the rows of expired tokens.
+
+Requirements Addressed:
+- Secure User Authentication and Role-Based Authorization
+  - Location: Technical Specification/5.1 Feature ID: F-001
+    - TR-F001.1: Implement secure login using unique username and password.
+- Scalability and Reliability
+  - Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+# Standard library
+import calendar
+import datetime
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+
+# Internal imports
+from src.backend.main_server.src.models import RefreshToken, RevokedToken, revocation_list  # Token tables and list
+from src.backend.main_server.src.database import db_session  # Database session for ORM operations
+from src.backend.common.permissions import (
+    PERMISSIONS_CLAIM,
+    default_registry,
+)  # Role permission bitsets
+
+# REFRESH_TOKEN_TTL: Lifetime of a refresh token in seconds (default 14 days).
+REFRESH_TOKEN_TTL = int(os.getenv('REFRESH_TOKEN_TTL', str(14 * 24 * 3600)))
+
+# NEW_USER_ROLE: The role of self-registered users. Registration ignores any role the client
+# sends; other roles are granted by an administrator.
+NEW_USER_ROLE = 'Employee'
+
+# REVOCATION_SYNC_INTERVAL: Seconds between loads of other workers' revocations and purges of
+# expired revocation buckets. A revoked token may be accepted by another worker for this long.
+REVOCATION_SYNC_INTERVAL = float(os.getenv('REVOCATION_SYNC_INTERVAL', '5'))
+
+
+class InvalidRefreshToken(Exception):
+    """
+    Raised when a refresh token is unknown, expired, revoked or malformed.
+    """
+
+
+def access_token_claims(user):
+    """
+    Extra access token claims: the user's role and its permission bitset.
+
+    Route guards authorize with one bitwise AND on the `perm` claim. The role is read again on
+    every login and refresh, so a role change applies from the next refresh on.
+
+    Parameters:
+        user (User): The authenticated user.
+
+    Returns:
+        dict: {'role': ..., 'perm': ...}, for create_access_token(additional_claims=...).
+    """
+    return {'role': user.role, PERMISSIONS_CLAIM: default_registry.mask(user.role)}
+
+
+def _utcnow():
+    return datetime.datetime.utcnow()
+
+
+def _to_epoch(value):
+    # Naive UTC datetimes, as stored, to epoch seconds.
+    return calendar.timegm(value.utctimetuple())
+
+
+def _hash_secret(secret):
+    return hashlib.sha256(secret.encode('utf-8')).hexdigest()
+
+
+def build_refresh_token(user_id, now=None):
+    """
+    Creates a new refresh token without storing it, for callers with their own session (the
+    ASGI entry point adds it to an AsyncSession).
+
+    Parameters:
+        user_id (int): The authenticated user.
+        now (datetime): Issue time (naive UTC); defaults to now.
+
+    Returns:
+        tuple: (RefreshToken row to add, refresh token to hand to the client).
+    """
+    now = now or _utcnow()
+    token_id = secrets.token_hex(16)
+    secret = secrets.token_urlsafe(32)
+    record = RefreshToken(
+        token_id=token_id,
+        user_id=user_id,
+        token_hash=_hash_secret(secret),
+        issued_at=now,
+        expires_at=now + datetime.timedelta(seconds=REFRESH_TOKEN_TTL),
+    )
+    return record, f'{token_id}.{secret}'
+
+
+def _new_refresh_token(user_id, now):
+    record, raw_token = build_refresh_token(user_id, now)
+    db_session.add(record)
+    return record.token_id, raw_token
+
+
+def issue_refresh_token(user_id):
+    """
+    Issues and stores a new refresh token.
+
+    Parameters:
+        user_id (int): The authenticated user.
+
+    Returns:
+        str: The refresh token to hand to the client.
+    """
+    _, raw_token = _new_refresh_token(user_id, _utcnow())
+    db_session.commit()
+    return raw_token
+
+
+def _load(raw_token):
+    token_id, _, secret = (raw_token or '').partition('.')
+    record = db_session.get(RefreshToken, token_id) if token_id and secret else None
+    if record is None or not hmac.compare_digest(record.token_hash, _hash_secret(secret)):
+        raise InvalidRefreshToken('Unknown refresh token.')
+    return record
+
+
+def rotate_refresh_token(raw_token):
+    """
+    Exchanges a refresh token for a new one.
+
+    Parameters:
+        raw_token (str): The refresh token presented by the client.
+
+    Returns:
+        tuple: (user_id, new refresh token).
+
+    Raises:
+        InvalidRefreshToken: If the token is unknown, expired or was already used. Reuse of a used
+            token revokes all of the user's refresh tokens.
+    """
+    now = _utcnow()
+    record = _load(raw_token)
+    if record.revoked_at is not None:
+        # A rotated token came back: assume it leaked and end every session of this user.
+        db_session.query(RefreshToken).filter(
+            RefreshToken.user_id == record.user_id,
+            RefreshToken.revoked_at.is_(None),
+        ).update({RefreshToken.revoked_at: now}, synchronize_session=False)
+        db_session.commit()
+        raise InvalidRefreshToken('Refresh token has already been used.')
+    if record.expires_at <= now:
+        raise InvalidRefreshToken('Refresh token has expired.')
+    new_id, new_token = _new_refresh_token(record.user_id, now)
+    record.revoked_at = now
+    record.replaced_by = new_id
+    db_session.commit()
+    return record.user_id, new_token
+
+
+def revoke_refresh_token(raw_token):
+    """
+    Revokes a refresh token, e.g. on logout. Unknown tokens are ignored.
+    """
+    try:
+        record = _load(raw_token)
+    except InvalidRefreshToken:
+        return
+    if record.revoked_at is None:
+        record.revoked_at = _utcnow()
+        db_session.commit()
+
+
+def revoke_access_token(jti, exp=None):
+    """
+    Revokes an access token in this process immediately and, through the database, in the others.
+
+    Parameters:
+        jti (str): The token id.
+        exp (float or datetime, optional): The token's expiry.
+    """
+    if isinstance(exp, datetime.datetime):
+        exp = _to_epoch(exp)
+    revocation_list.revoke(jti, exp)
+    expires_at = datetime.datetime.utcfromtimestamp(exp) if exp else (
+        _utcnow() + datetime.timedelta(seconds=revocation_list.max_ttl))
+    db_session.merge(RevokedToken(jti=jti, expires_at=expires_at, revoked_at=_utcnow()))
+    db_session.commit()
+
+
+def is_token_revoked(jwt_header, jwt_payload):
+    """
+    Flask-JWT-Extended blocklist callback for `@jwt_required` routes. In-memory only.
+    """
+    return revocation_list.is_revoked(jwt_payload.get('jti'), jwt_payload.get('exp'))
+
+
+# Upper bound of revocations already loaded from the database.
+_synced_until = None
+
+
+def sync_revocations(target, session=None):
+    """
+    Loads revocations recorded since the last sync into a revocation list, and deletes the rows
+    of revoked tokens that have expired since.
+
+    Parameters:
+        target (RevocationList): The list to update.
+        session (Session, optional): Session to read and purge with; defaults to db_session.
+    """
+    global _synced_until
+    own_session = session is None
+    session = db_session if own_session else session
+    now = _utcnow()
+    # Overlap by one interval so revocations committed out of order are not missed.
+    since = _synced_until - datetime.timedelta(seconds=REVOCATION_SYNC_INTERVAL) if _synced_until else None
+    query = session.query(RevokedToken.jti, RevokedToken.expires_at).filter(RevokedToken.expires_at > now)
+    if since is not None:
+        query = query.filter(RevokedToken.revoked_at >= since)
+    try:
+        for jti, expires_at in query:
+            target.revoke(jti, _to_epoch(expires_at))
+        # An expired token is refused on its expiry alone, so its row is no longer needed.
+        session.query(RevokedToken).filter(RevokedToken.expires_at <= now).delete(synchronize_session=False)
+        session.commit()
+    finally:
+        if own_session:
+            db_session.remove()
+    _synced_until = now
+
+
+_maintenance_lock = threading.Lock()
+
+
+def start_revocation_maintenance():
+    """
+    Starts the background thread that syncs revocations, drops expired buckets and deletes
+    expired revoked_tokens rows. Idempotent.
+    """
+    with _maintenance_lock:
+        revocation_list.start_purger(REVOCATION_SYNC_INTERVAL, sync=sync_revocations)
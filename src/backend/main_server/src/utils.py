@@ -5,17 +5,23 @@ notification sending, and expense report generation.
 """
 
 # External imports
-import bcrypt  # Version 3.2.0 - Password hashing for secure storage and verification
 import jwt  # Version 2.3.0 - Version 2.3.0 - JWT token generation and validation for authentication
 from datetime import datetime  # Built-in module - To handle date and time operations for notifications
+from functools import partial  # Built-in module - Binds each channel's recipient and message
+from typing import Union  # Built-in module - Rows or columns of expense data
 
 # Internal imports
-from src.backend.main_server.src.models import MainServerModel, User, Expense, Notification  # Main server data models
-from src.backend.authentication_service.src.utils import hash_password  # Hashes a user's password using bcrypt
-from src.backend.policy_engine.src.utils import check_policy_compliance as policy_engine_check_compliance  # Checks if an expense complies with the defined policies
-from src.backend.notification_service.src.utils import send_notification as notification_service_send  # Sends a formatted notification message to a user
-from src.backend.reporting_module.src.utils import generate_expense_report as reporting_module_generate_report  # Generates a report from processed expense data
+from src.backend.main_server.src.models import User, Expense  # Main server data models
+from src.backend.common.hashing import get_hashing_executor  # Bounded bcrypt process pool
 from src.backend.main_server.src.database import db_session  # Database session for ORM operations
+from src.backend.main_server.src.expense_summary import summarize_expenses  # Report totals, vectorized for large inputs
+from src.backend.main_server.src.policy_ruleset import get_policy_ruleset  # Versioned, precompiled policies
+from src.backend.main_server.src.notifications import (
+    get_notification_fanout,
+    send_email,
+    send_sms,
+    send_in_app
+)  # Concurrent multi-channel notification delivery
 
 def hash_and_store_password(user: User, password: str) -> str:
     """
@@ -40,17 +46,15 @@ def hash_and_store_password(user: User, password: str) -> str:
         4. Commit the changes to the database.
         5. Return the hashed password.
     """
-    # Step 1: Use bcrypt to generate a salt
-    salt = bcrypt.gensalt()
-    # Step 2: Hash the password with the generated salt
-    hashed_password = bcrypt.hashpw(password.encode('utf-8'), salt)
+    # Steps 1-2: Generate a salt and hash the password on the shared hashing pool
+    hashed_password = get_hashing_executor().hash_password(password)
     # Step 3: Store the hashed password in the user's record
-    user.password_hash = hashed_password.decode('utf-8')  # Assuming 'password_hash' field exists in User model
+    user.password_hash = hashed_password  # Assuming 'password_hash' field exists in User model
     # Step 4: Commit the changes to the database
     db_session.add(user)
     db_session.commit()
     # Step 5: Return the hashed password
-    return hashed_password.decode('utf-8')
+    return hashed_password
 
 def check_policy_compliance(expense: Expense) -> bool:
     """
@@ -68,30 +72,22 @@ def check_policy_compliance(expense: Expense) -> bool:
           Description: Ensures that all submitted expenses adhere to configurable company policies and international tax laws by performing real-time policy checks and applying relevant regulations automatically.
 
     Steps:
-        1. Retrieve the list of active policy rules.
-        2. Iterate over each rule in the policy.
-        3. Check if the expense satisfies the current rule using 'apply' method.
-        4. If any rule is violated, return False.
-        5. If all rules are satisfied, return True.
+        1. Retrieve the worker's compiled ruleset; it is reloaded only when the policies change
+           (see policy_ruleset.py).
+        2. Compare the expense amount with the lowest limit applying in its region.
     """
-    # Step 1: Retrieve the list of active policy rules
-    from src.backend.policy_engine.src.models import PolicyRule  # Assuming PolicyRule model exists
-    policy_rules = PolicyRule.get_all_active_rules()
-    # Step 2: Iterate over each rule in the policy
-    for rule in policy_rules:
-        # Step 3: Check if the expense satisfies the current rule using 'apply' method
-        if not rule.apply(expense):
-            # Step 4: If any rule is violated, return False
-            return False
-    # Step 5: If all rules are satisfied, return True
-    return True
-
-def send_notification(notification: Notification) -> str:
+    # Step 1: Retrieve the compiled policies of the current ruleset version
+    ruleset = get_policy_ruleset()
+    # Step 2: The expense complies if no applicable policy limit is exceeded
+    return ruleset.is_compliant(expense)
+
+def send_notification(notification, strict: bool = None) -> str:
     """
     Sends a formatted notification message to a user.
 
     Parameters:
-        notification (Notification): The notification object containing message content and user information.
+        notification: The notification object containing message content and user information.
+        strict (bool): Wait for every delivery method instead of the first acceptance; defaults to NOTIFY_STRICT.
 
     Returns:
         str: Status message indicating the result of the notification send operation.
@@ -104,7 +100,8 @@ def send_notification(notification: Notification) -> str:
     Steps:
         1. Format the notification message.
         2. Determine the delivery methods based on user preferences.
-        3. Send the notification using the selected delivery methods.
+        3. Send the notification over all selected delivery methods at once (see notifications.py),
+           returning at the first acceptance, or once every method is done in strict mode.
         4. Aggregate the results of sending notifications.
         5. Return the status message.
     """
@@ -114,29 +111,31 @@ def send_notification(notification: Notification) -> str:
     user = notification.user
     user_preferences = user.get_notification_preferences()  # Assumes method exists in User model
     delivery_methods = user_preferences.get('delivery_methods', ['email'])
-    # Step 3: Send the notification using the selected delivery methods
-    status_messages = []
+    # Step 3: Send the notification over the selected delivery methods concurrently
+    sends = {}
     for method in delivery_methods:
         if method == 'email':
-            result = notification_service_send.send_email(user.email, message)
+            sends[method] = partial(send_email, user.email, message)
         elif method == 'sms':
-            result = notification_service_send.send_sms(user.phone_number, message)
+            sends[method] = partial(send_sms, user.phone_number, message)
         elif method == 'in_app':
-            result = notification_service_send.send_in_app(user.id, message)
-        else:
-            result = f'Unsupported delivery method: {method}'
-        status_messages.append(result)
+            sends[method] = partial(send_in_app, user.id, message)
+    outcomes = get_notification_fanout().send(sends, strict=strict)
     # Step 4: Aggregate the results of sending notifications
-    status = '; '.join(status_messages)
+    status = '; '.join(
+        f'{method}: {outcomes[method]}' if method in outcomes else f'Unsupported delivery method: {method}'
+        for method in delivery_methods
+    )
     # Step 5: Return the status message
     return status
 
-def generate_expense_report(processed_data: list) -> dict:
+def generate_expense_report(processed_data: Union[list, dict]) -> dict:
     """
     Generates a report from processed expense data.
 
     Parameters:
-        processed_data (list): A list of processed expense data dictionaries.
+        processed_data (list or dict): A list of processed expense data dictionaries, or the
+            same data as columns: {'amount': [...], 'category': [...]}.
 
     Returns:
         dict: A dictionary containing the generated report data.
@@ -148,28 +147,16 @@ def generate_expense_report(processed_data: list) -> dict:
 
     Steps:
         1. Process the raw expense data if necessary.
-        2. Generate summary statistics from the processed data.
+        2. Generate summary statistics from the processed data (see expense_summary.py; large
+           numeric columns are summed with NumPy).
         3. Compile the report data into a dictionary format.
         4. Include metadata such as generation time.
         5. Return the generated report data.
     """
     # Step 1: Process the raw expense data if necessary
     # Assuming 'processed_data' is already processed; otherwise, include processing logic here
-    # Step 2: Generate summary statistics from the processed data
-    total_expense = sum(item.get('amount', 0) for item in processed_data)
-    expense_count = len(processed_data)
-    average_expense = total_expense / expense_count if expense_count > 0 else 0
-    expenses_by_category = {}
-    for item in processed_data:
-        category = item.get('category', 'Uncategorized')
-        expenses_by_category[category] = expenses_by_category.get(category, 0) + item.get('amount', 0)
-    # Step 3: Compile the report data into a dictionary format
-    report_data = {
-        'total_expense': total_expense,
-        'average_expense': average_expense,
-        'expense_count': expense_count,
-        'expenses_by_category': expenses_by_category,
-    }
+    # Steps 2-3: Generate the summary statistics; columns of REPORT_VECTORIZE_MIN_ROWS or more are vectorized
+    report_data = summarize_expenses(processed_data)
     # Step 4: Include metadata such as generation time
     report_data['generated_at'] = datetime.utcnow().isoformat() + 'Z'  # ISO 8601 format
     # Step 5: Return the generated report data
@@ -0,0 +1,103 @@
+# Standard library
+import datetime  # Dates for the report fixtures.
+import os  # Removes the database file; token key setting.
+import tempfile  # Database file shared by the sync fixtures and the async engine.
+import unittest  # Plain test cases for components that do not need the Flask app.
+
+# External dependencies
+import jwt  # Decodes the issued tokens. PyJWT version 2.3.0
+from sqlalchemy import create_engine  # Creates the fixtures.
+from sqlalchemy.orm import Session  # Session for the fixtures.
+from starlette.testclient import TestClient  # Drives the ASGI app. Starlette version 0.16.0
+
+# Key of the access tokens, read by the ASGI module on import.
+os.environ.setdefault('SECRET_KEY', 'test-secret-key')
+
+# Internal dependencies
+from src.backend.common.permissions import Permission, claims_permissions, default_registry  # Role permission bitsets.
+from src.backend.main_server.src import asgi  # ASGI entry point.
+from src.backend.main_server.src.async_database import async_url, init_async_engine  # Async database sessions.
+from src.backend.main_server.src.database import bind_engine, remove_session  # Synchronous database binding.
+from src.backend.main_server.src.models import Base, Department, Employee, ExpenseReport, Expense  # ORM models.
+
+
+class AsgiEntryPointTestCase(unittest.TestCase):
+    """
+    Test suite for the ASGI entry point and its async database sessions.
+    """
+
+    def setUp(self):
+        handle, self.db_path = tempfile.mkstemp(suffix='.db')
+        os.close(handle)
+        engine = create_engine(f'sqlite:///{self.db_path}')
+        Base.metadata.create_all(engine)
+        with Session(bind=engine) as session:
+            department = Department('Sales')
+            session.add(department)
+            session.flush()
+            employee = Employee('Ada', 'Lovelace', 'ada@example.com', 'Employee', department.department_id)
+            session.add(employee)
+            session.flush()
+            report = ExpenseReport(employee.employee_id, datetime.date(2024, 1, 31), 'Pending')
+            session.add(report)
+            session.flush()
+            session.add(Expense(report.report_id, employee.employee_id, 'Meals', 10, 'USD',
+                                datetime.date(2024, 1, 2), None))
+            session.commit()
+            self.report_id = report.report_id
+            self.report_version = report.version  # Adding the expense moved the version
+        # The revocation maintenance started with the app reads revoked tokens synchronously
+        self.engine = engine
+        bind_engine(engine)
+
+    def tearDown(self):
+        remove_session()
+        self.engine.dispose()
+        os.remove(self.db_path)
+
+    def test_async_url_swaps_the_driver(self):
+        """
+        Tests that synchronous connection strings map to the async driver of the same database.
+        """
+        assert async_url('postgresql://app:secret@db:5432/expenses') == 'postgresql+asyncpg://app:secret@db:5432/expenses'
+        assert async_url('postgresql+psycopg2://db/expenses') == 'postgresql+asyncpg://db/expenses'
+        assert async_url('sqlite:///app.db') == 'sqlite+aiosqlite:///app.db'
+        with self.assertRaises(ValueError):
+            async_url('mysql://db/expenses')
+
+    def test_report_is_served_with_etag_and_revalidated(self):
+        """
+        Tests that GET /reports/<id> returns the report with its version ETag through an async
+        session, and 304 for a client presenting that ETag.
+        """
+        init_async_engine(f'sqlite+aiosqlite:///{self.db_path}')
+        asgi.report_cache.clear()
+        token = asgi.create_access_token(1, {'role': 'Employee', 'perm': int(Permission.VIEW_REPORTS)})
+        headers = {'Authorization': f'Bearer {token}'}
+        with TestClient(asgi.app) as client:
+            response = client.get(f'/reports/{self.report_id}', headers=headers)
+            assert response.status_code == 200
+            assert response.headers['ETag'] == f'"report-{self.report_id}-v{self.report_version}"'
+            assert response.json()['expense_report']['expenses'][0]['amount'] == '10.00'
+
+            response = client.get(f'/reports/{self.report_id}',
+                                  headers={**headers, 'If-None-Match': response.headers['ETag']})
+            assert response.status_code == 304
+            assert client.get('/reports/999', headers=headers).status_code == 404
+            assert client.get(f'/reports/{self.report_id}').status_code == 401
+
+    def test_registration_ignores_the_requested_role(self):
+        """
+        Tests that POST /register stores every new user as an Employee, whatever role the body
+        asks for, and issues a token with the stored role's permissions.
+        """
+        init_async_engine(f'sqlite+aiosqlite:///{self.db_path}')
+        with TestClient(asgi.app) as client:
+            response = client.post('/register', json={'first_name': 'Mallory', 'last_name': 'Doe',
+                                                      'email': 'mallory@example.com', 'password': 'Secret123!',
+                                                      'role': 'Administrator'})
+        assert response.status_code == 201
+        claims = jwt.decode(response.json()['access_token'], asgi.JWT_SECRET_KEY, algorithms=['HS256'])
+        assert claims['role'] == 'Employee'
+        assert claims_permissions(claims) == default_registry.mask('Employee')
+        assert not claims_permissions(claims) & Permission.MANAGE_USERS
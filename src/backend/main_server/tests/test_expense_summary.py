@@ -0,0 +1,45 @@
+# Standard library
+import unittest  # Plain test cases for components that do not need the Flask app.
+from decimal import Decimal  # Exact amounts for the loop path.
+
+# Internal dependencies
+from src.backend.main_server.src.expense_summary import UNCATEGORIZED, summarize_expenses, summarize_rows  # Expense summaries.
+
+
+class ExpenseSummaryTestCase(unittest.TestCase):
+    """
+    Test suite for the loop and NumPy summaries behind generate_expense_report.
+    """
+
+    def setUp(self):
+        categories = ['Airfare', 'Lodging', 'Meals', 'Ground Transport']
+        # Quarter amounts are exact in binary, so float sums agree whatever the order of addition.
+        self.rows = [{'amount': (index * 37 % 2000) / 4, 'category': categories[index * 7 % 4]}
+                     for index in range(5000)]
+        self.rows.append({'amount': 12.5})  # No category
+
+    def test_columns_match_the_loop(self):
+        """
+        Tests that the NumPy path gives the loop's summary for float and integer amounts, with
+        the categories in the same order.
+        """
+        for rows in (self.rows, [dict(row, amount=int(row['amount'] * 4)) for row in self.rows]):
+            columns = {'amount': [row['amount'] for row in rows],
+                       'category': [row.get('category', UNCATEGORIZED) for row in rows]}
+            expected = summarize_rows(rows)
+            summary = summarize_expenses(columns, min_rows=0)
+            assert summary == expected
+            assert list(summary['expenses_by_category']) == list(expected['expenses_by_category'])
+            assert type(summary['total_expense']) is type(expected['total_expense'])
+
+    def test_small_and_decimal_columns_use_the_loop(self):
+        """
+        Tests that Decimal amounts keep their exact sums and type, and that columns of unequal
+        length are refused.
+        """
+        summary = summarize_expenses({'amount': [Decimal('0.10')] * 3, 'category': ['Meals'] * 3}, min_rows=0)
+        assert summary['total_expense'] == Decimal('0.30')
+        assert summary['expenses_by_category'] == {'Meals': Decimal('0.30')}
+        assert summarize_expenses([])['expense_count'] == 0
+        with self.assertRaises(ValueError):
+            summarize_expenses({'amount': [1, 2], 'category': ['Meals']})
@@ -0,0 +1,21 @@
+# Standard library
+import unittest  # Plain test cases for components that do not need the Flask app.
+
+# Internal dependencies
+from src.backend.main_server.src.import_profile import cold_start_ms, MAIN_SERVER_IMPORT_BUDGET_MS  # Import-time budget.
+
+
+class ImportBudgetTestCase(unittest.TestCase):
+    """
+    Test suite keeping the main server's cold-start import time within its budget.
+    """
+
+    def test_app_import_within_budget(self):
+        """
+        Tests that importing the app in a fresh interpreter takes at most
+        MAIN_SERVER_IMPORT_BUDGET_MS. Run `python app.py --import-profile` to see where the time goes.
+        """
+        elapsed = cold_start_ms()
+        assert elapsed <= MAIN_SERVER_IMPORT_BUDGET_MS, (
+            f'Importing the main server took {elapsed:.0f} ms, over the {MAIN_SERVER_IMPORT_BUDGET_MS:.0f} ms budget'
+        )
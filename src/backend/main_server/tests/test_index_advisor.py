@@ -0,0 +1,50 @@
+# Standard library
+import datetime  # Dates filtered on by the captured queries.
+import os  # Removes the capture file.
+import tempfile  # Capture file for the index advisor tests.
+import unittest  # Plain test cases for components that do not need the Flask app.
+
+# External dependencies
+from sqlalchemy import create_engine  # In-memory database for the index advisor tests.
+from sqlalchemy.orm import Session  # Session for the index advisor tests.
+
+# Internal dependencies
+from src.backend.main_server.src.models import Base, Expense  # ORM models.
+from src.backend.main_server.src.index_advisor import capture_statements, load_capture, advise  # Index advice.
+
+
+class IndexAdvisorTestCase(unittest.TestCase):
+    """
+    Test suite for the statement capture and the EXPLAIN-based index advisor.
+    """
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        handle, self.capture_path = tempfile.mkstemp(suffix='.ndjson')
+        os.close(handle)
+        capture_statements(self.engine, self.capture_path)
+        self.session = Session(bind=self.engine)
+
+    def tearDown(self):
+        self.session.close()
+        os.remove(self.capture_path)
+
+    def test_unindexed_filter_is_reported_with_a_suggestion(self):
+        """
+        Tests that a repeated query filtering on unindexed columns is reported as a sequential
+        scan with an index on its equality column, then its range column, while an indexed
+        lookup is not reported.
+        """
+        for _ in range(3):
+            self.session.query(Expense).filter(Expense.expense_date >= datetime.date(2024, 1, 1),
+                                               Expense.currency == 'USD').all()
+        self.session.query(Expense).filter(Expense.employee_id == 1).all()
+
+        captured = load_capture(self.capture_path)
+        assert [executions for executions, _, _ in captured] == [3, 1]
+        with self.engine.connect() as connection:
+            advice = advise(connection, captured)
+        assert len(advice) == 1
+        assert advice[0].executions == 3
+        assert advice[0].suggestion == 'CREATE INDEX idx_expenses_currency_expense_date ON expenses (currency, expense_date);'
@@ -0,0 +1,94 @@
+# Standard library
+import datetime  # Dates for the report fixtures.
+import io  # In-memory feeds for the bulk ingestion tests.
+import unittest  # Plain test cases for components that do not need the Flask app.
+from decimal import Decimal  # Expected report totals.
+
+# External dependencies
+from sqlalchemy import create_engine  # In-memory database for the bulk ingestion tests.
+from sqlalchemy.orm import Session  # Session for the bulk ingestion tests.
+
+# Internal dependencies
+from src.backend.main_server.src.models import Base, Department, Employee, ExpenseReport, Expense  # ORM models.
+from src.backend.main_server.src.ingestion import BulkPayloadError, ingest_expenses, iter_expense_rows  # Bulk expense ingestion.
+from src.backend.main_server.src.query_detector import track_queries  # Counts the lookups per chunk.
+
+
+class BulkIngestionTestCase(unittest.TestCase):
+    """
+    Test suite for the chunked bulk expense ingestion.
+    """
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        with Session(bind=self.engine) as session:
+            department = Department('Sales')
+            session.add(department)
+            session.flush()
+            for first_name in ('Ada', 'Alan'):
+                session.add(Employee(first_name, 'Test', f'{first_name.lower()}@example.com', 'Employee',
+                                     department.department_id))
+            session.flush()
+            for employee_id in (1, 2):
+                session.add(ExpenseReport(employee_id, datetime.date(2024, 1, 31), 'Pending', 0))
+            session.commit()
+
+    def test_rows_are_inserted_in_chunks_and_added_to_totals(self):
+        """
+        Tests that valid rows across several chunks are inserted and added to their report's total,
+        and that one lookup per chunk resolves the referenced ids.
+        """
+        feed = io.BytesIO(b''.join(
+            f'{{"report_id": 1, "employee_id": 1, "category": "Meals", "amount": "12.50", '
+            f'"currency": "usd", "expense_date": "2024-01-{day:02d}"}}\n'.encode()
+            for day in range(1, 11)
+        ))
+        with track_queries(threshold=100) as tracking:
+            result = ingest_expenses(iter_expense_rows(feed, 'application/x-ndjson'), chunk_size=4, engine=self.engine)
+        assert result == {'received': 10, 'inserted': 10, 'failed': 0, 'errors': [], 'truncated': False}
+        with Session(bind=self.engine) as session:
+            assert session.get(ExpenseReport, 1).total_amount == 125
+            assert session.query(Expense).filter_by(currency='USD').count() == 10
+        lookups = [shape for shape in tracking.shapes if shape.startswith('SELECT')]
+        assert sum(tracking.shapes[shape] for shape in lookups) == 2  # Ids are resolved once, in the first chunk.
+
+    def test_only_failed_rows_are_reported(self):
+        """
+        Tests that invalid values, unknown ids and reports of another employee are reported by
+        row number, while the other rows of the CSV feed are inserted.
+        """
+        feed = io.BytesIO(
+            b'report_id,employee_id,category,amount,currency,expense_date,description\n'
+            b'1,1,Travel,100.00,EUR,2024-01-05,Taxi\n'
+            b'1,1,Travel,-5,EUR,2024-01-05,\n'
+            b'9,1,Travel,5,EUR,2024-01-05,\n'
+            b'2,1,Travel,5,EUR,2024-01-05,\n'
+            b'2,2,Travel,7.25,EUR,not-a-date,\n'
+            b'2,2,Travel,7.25,EUR,2024-01-06,\n'
+        )
+        result = ingest_expenses(iter_expense_rows(feed, 'text/csv'), engine=self.engine)
+        assert (result['inserted'], result['failed']) == (2, 4)
+        assert [error['row'] for error in result['errors']] == [2, 5, 3, 4]
+        assert result['errors'][2]['error'] == 'Unknown report_id.'
+        assert result['errors'][3]['error'] == 'Report belongs to another employee.'
+        with Session(bind=self.engine) as session:
+            assert session.get(ExpenseReport, 2).total_amount == Decimal('7.25')
+
+    def test_non_finite_amounts_and_unreadable_feeds(self):
+        """
+        Tests that NaN and Infinity amounts fail their own row only, and that a feed that is not
+        UTF-8 is refused as a payload error rather than crashing the upload.
+        """
+        feed = io.BytesIO(b''.join(
+            f'{{"report_id": 1, "employee_id": 1, "category": "Meals", "amount": {amount}, '
+            f'"currency": "EUR", "expense_date": "2024-01-05"}}\n'.encode()
+            for amount in ('"NaN"', 'NaN', '"Infinity"', '"9.99"')
+        ))
+        result = ingest_expenses(iter_expense_rows(feed, 'application/x-ndjson'), engine=self.engine)
+        assert (result['inserted'], result['failed']) == (1, 3)
+        assert {error['error'] for error in result['errors']} == {'amount must be a number.'}
+
+        with self.assertRaises(BulkPayloadError):
+            ingest_expenses(iter_expense_rows(io.BytesIO(b'report_id,amount\n1,\xff\xfe\n'), 'text/csv'),
+                            engine=self.engine)
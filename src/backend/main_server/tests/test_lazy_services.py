@@ -0,0 +1,78 @@
+# Standard library
+import sys  # Registers a stand-in service module for the lazy loading tests.
+import types  # Builds the stand-in service module.
+import unittest  # Plain test cases for components that do not need the Flask app.
+
+# External dependencies
+from flask import Flask, Blueprint, jsonify  # Flask version 2.0.1
+
+# Internal dependencies
+from src.backend.main_server.src.lazy_services import mount_services  # Deferred service route loading.
+
+
+class LazyServiceTestCase(unittest.TestCase):
+    """
+    Test suite for service routes that are imported on the first request to their prefix.
+    """
+
+    def setUp(self):
+        self.imports = 0
+        test_case = self
+
+        class StandInModule(types.ModuleType):
+            def __getattr__(self, name):
+                # Counts how often the mount resolves the blueprint, i.e. loads the service.
+                if name != 'service_bp':
+                    raise AttributeError(name)
+                test_case.imports += 1
+                service_bp = Blueprint('stand_in', __name__)
+                service_bp.add_url_rule('/items/<int:item_id>', 'item', lambda item_id: jsonify({'id': item_id}))
+                service_bp.add_url_rule('/ping', 'ping', lambda: 'pong')
+                return service_bp
+
+        sys.modules['stand_in_service'] = StandInModule('stand_in_service')
+        self.app = Flask(__name__)
+        self.services = mount_services(self.app, {
+            '/items': ('stand_in_service:service_bp', False),
+            '/stand-in': ('stand_in_service:service_bp', True),
+        })
+
+    def tearDown(self):
+        sys.modules.pop('stand_in_service', None)
+
+    def test_service_loads_on_first_request_to_its_prefix(self):
+        """
+        Tests that nothing is loaded at startup, that the first request loads only its own
+        service, and that later requests reuse it.
+        """
+        client = self.app.test_client()
+        assert not any(service.loaded for service in self.services.values())
+        assert client.get('/items/7').get_json() == {'id': 7}
+        assert client.get('/items/8').get_json() == {'id': 8}
+        assert self.services['/items'].loaded and not self.services['/stand-in'].loaded
+        assert self.imports == 1
+        assert client.get('/stand-in/ping').data == b'pong'
+        assert client.get('/missing').status_code == 404
+
+    def test_legacy_root_paths_reach_their_service(self):
+        """
+        Tests that an aliased root path is served by its service under the prefix, for its
+        method only, and that other root paths stay with the main app.
+        """
+        self.app.add_url_rule('/ping', 'main_ping', lambda: 'main pong')
+        mount_services(self.app, {'/stand-in': ('stand_in_service:service_bp', True)},
+                       aliases={('GET', '/items/7'): '/stand-in'})
+        client = self.app.test_client()
+        assert client.get('/items/7').get_json() == {'id': 7}
+        assert client.head('/items/7').status_code == 200
+        assert client.post('/items/7').status_code != 200
+        assert client.get('/ping').data == b'main pong'
+
+    def test_failed_load_is_retried(self):
+        """
+        Tests that a service that cannot be imported answers 503 and is not marked as loaded.
+        """
+        mount_services(self.app, {'/broken': ('no_such_service_module:bp', True)})
+        response = self.app.test_client().get('/broken/anything')
+        assert response.status_code == 503
+        assert not self.app.extensions['lazy_services']['/broken'].loaded
@@ -0,0 +1,67 @@
+# Standard library
+import datetime  # Dates for the loading profile fixtures.
+import unittest  # Plain test cases for components that do not need the Flask app.
+
+# External dependencies
+from sqlalchemy import create_engine  # In-memory database for the loading profile tests.
+from sqlalchemy.orm import Session  # Session for the loading profile tests.
+
+# Internal dependencies
+from src.backend.main_server.src.models import Base, Department, Employee, ExpenseReport, Expense  # ORM models.
+from src.backend.main_server.src.loading import query_with_profile  # Named relationship loading profiles.
+from src.backend.main_server.src.query_detector import track_queries, statement_shape, RepeatedQueryError  # N+1 detection.
+
+
+class LoadingProfileTestCase(unittest.TestCase):
+    """
+    Test suite for relationship loading profiles and the N+1 query detector.
+    """
+
+    def setUp(self):
+        engine = create_engine('sqlite://')
+        Base.metadata.create_all(engine)
+        self.session = Session(bind=engine)
+        department = Department('Sales')
+        self.session.add(department)
+        self.session.flush()
+        employee = Employee('Ada', 'Lovelace', 'ada@example.com', 'Employee', department.department_id)
+        self.session.add(employee)
+        self.session.flush()
+        for _ in range(12):
+            report = ExpenseReport(employee.employee_id, datetime.date(2024, 1, 31), 'Pending')
+            self.session.add(report)
+            self.session.flush()
+            for amount in (10, 20):
+                self.session.add(Expense(report.report_id, employee.employee_id, 'Meals', amount, 'USD',
+                                         datetime.date(2024, 1, 15), 'Lunch'))
+        self.session.commit()
+        self.session.expunge_all()
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_lazy_loading_is_detected(self):
+        """
+        Tests that serializing reports with lazy loading repeats the item query per report and
+        that the detector raises once the repetition passes the threshold.
+        """
+        with self.assertRaises(RepeatedQueryError):
+            with track_queries(threshold=5, action='raise'):
+                [report.to_dict() for report in self.session.query(ExpenseReport).all()]
+
+    def test_profile_loads_with_a_fixed_number_of_queries(self):
+        """
+        Tests that the 'report_with_items' profile serializes every report in a constant number
+        of queries.
+        """
+        with track_queries(threshold=1, action='raise') as tracking:
+            reports = query_with_profile(ExpenseReport, 'report_with_items', session=self.session).all()
+            data = [report.to_dict() for report in reports]
+        assert len(data) == 12 and all(len(report['expenses']) == 2 for report in data)
+        assert tracking.total <= 2
+
+    def test_statement_shape_ignores_parameters(self):
+        """
+        Tests that statements differing only in placeholder lists have the same shape.
+        """
+        assert statement_shape('SELECT * FROM t WHERE id IN (?, ?)') == statement_shape('SELECT *  FROM t\nWHERE id IN (?)')
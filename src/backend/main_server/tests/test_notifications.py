@@ -0,0 +1,118 @@
+# Standard library
+import functools  # Binds the recipients and servers to the channel sends.
+import http.server  # Fake SMS gateway.
+import json  # SMS payloads.
+import socketserver  # Fake SMTP relay.
+import threading  # Serves the fake servers.
+import time  # Delays of the fake servers.
+import unittest  # Plain test cases for components that do not need the Flask app.
+
+# Internal dependencies
+from src.backend.common.metrics import metrics  # Shared in-process metrics.
+from src.backend.main_server.src.notifications import ChannelFanout, send_email, send_sms  # Multi-channel delivery.
+
+
+class _FakeSMTPHandler(socketserver.StreamRequestHandler):
+    # A minimal SMTP relay: accepts every message after server.delay seconds and keeps it.
+
+    def reply(self, line):
+        self.wfile.write(line.encode('ascii') + b'\r\n')
+
+    def handle(self):
+        self.reply('220 fake-smtp ready')
+        lines = []
+        for raw in self.rfile:
+            command = raw.decode('utf-8').rstrip('\r\n')
+            verb = command[:4].upper()
+            if verb == 'DATA':
+                self.reply('354 end with <CRLF>.<CRLF>')
+                for data in self.rfile:
+                    if data in (b'.\r\n', b'.\n'):
+                        break
+                    lines.append(data.decode('utf-8'))
+                time.sleep(self.server.delay)
+                self.server.messages.append(''.join(lines))
+                self.reply('250 queued')
+            elif verb == 'QUIT':
+                self.reply('221 bye')
+                return
+            else:
+                self.reply('250 ok')
+
+
+class _FakeSMSHandler(http.server.BaseHTTPRequestHandler):
+    # A minimal SMS gateway: answers server.status after server.delay seconds and keeps the payloads.
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        time.sleep(self.server.delay)
+        self.server.messages.append(payload)
+        self.send_response(self.server.status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class NotificationFanoutTestCase(unittest.TestCase):
+    """
+    Test suite for the concurrent multi-channel notification delivery, against local fake SMTP
+    and SMS servers.
+    """
+
+    def start(self, server, delay, **attributes):
+        server.delay, server.messages = delay, []
+        server.daemon_threads = True
+        for name, value in attributes.items():
+            setattr(server, name, value)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def setUp(self):
+        self.smtp = self.start(socketserver.ThreadingTCPServer(('127.0.0.1', 0), _FakeSMTPHandler), delay=0)
+        self.sms = self.start(http.server.ThreadingHTTPServer(('127.0.0.1', 0), _FakeSMSHandler), delay=0.8, status=200)
+        sms_url = f'http://127.0.0.1:{self.sms.server_address[1]}/messages'
+        self.sends = {
+            'email': functools.partial(send_email, 'ada@example.com', 'Report 42 was approved.',
+                                       host='127.0.0.1', port=self.smtp.server_address[1]),
+            'sms': functools.partial(send_sms, '+15550100', 'Report 42 was approved.', url=sms_url),
+        }
+        self.fanout = ChannelFanout(workers=4, max_pending=0, timeouts={'email': 2, 'sms': 2})
+        self.addCleanup(self.fanout.shutdown)
+
+    def test_returns_at_the_first_acceptance(self):
+        """
+        Tests that the call returns once the email is accepted, without waiting for the slower
+        SMS gateway, which still receives the message.
+        """
+        started = time.monotonic()
+        outcomes = self.fanout.send(self.sends, strict=False)
+        assert time.monotonic() - started < 0.6
+        assert outcomes == {'email': 'accepted', 'sms': 'pending'}
+        assert 'Report 42 was approved.' in self.smtp.messages[0]
+        self.fanout.shutdown(wait=True)
+        assert self.sms.messages == [{'to': '+15550100', 'message': 'Report 42 was approved.'}]
+        histograms = metrics.snapshot()['histograms']
+        assert histograms['notification_email_seconds']['count'] >= 1
+        assert histograms['notification_sms_seconds']['count'] >= 1
+
+    def test_strict_mode_waits_for_every_channel(self):
+        """
+        Tests that strict mode reports every channel: an accepted email, an SMS past its
+        timeout, a refused SMS and a send refused by the full pool.
+        """
+        self.fanout.timeouts['sms'] = 0.3
+        outcomes = self.fanout.send(self.sends, strict=True)
+        assert outcomes == {'email': 'accepted', 'sms': 'timed out'}
+
+        self.sms.delay, self.sms.status = 0, 503
+        self.fanout.timeouts['sms'] = 2
+        outcomes = self.fanout.send(self.sends, strict=True)
+        assert outcomes['email'] == 'accepted' and outcomes['sms'].startswith('failed: HTTP Error 503')
+
+        single = ChannelFanout(workers=1, max_pending=0)
+        self.addCleanup(single.shutdown)
+        assert single.send(self.sends, strict=True)['sms'] == 'busy'
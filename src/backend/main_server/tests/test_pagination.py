@@ -0,0 +1,66 @@
+# Standard library
+import datetime  # Dates for the pagination fixtures.
+import unittest  # Plain test cases for components that do not need the Flask app.
+
+# External dependencies
+from sqlalchemy import create_engine  # In-memory database for the pagination tests.
+from sqlalchemy.orm import Session  # Session for the pagination tests.
+
+# Internal dependencies
+from src.backend.main_server.src.models import Base, Department, Employee, ExpenseReport, Expense  # ORM models.
+from src.backend.main_server.src.pagination import keyset_page, InvalidCursor  # Keyset pagination.
+from src.backend.main_server.src.query_detector import track_queries  # Counts the queries per page.
+
+
+class KeysetPaginationTestCase(unittest.TestCase):
+    """
+    Test suite for the keyset pagination of the listing routes.
+    """
+
+    def setUp(self):
+        engine = create_engine('sqlite://')
+        Base.metadata.create_all(engine)
+        self.session = Session(bind=engine)
+        department = Department('Sales')
+        self.session.add(department)
+        self.session.flush()
+        employee = Employee('Ada', 'Lovelace', 'ada@example.com', 'Employee', department.department_id)
+        self.session.add(employee)
+        self.session.flush()
+        report = ExpenseReport(employee.employee_id, datetime.date(2024, 1, 31), 'Pending')
+        self.session.add(report)
+        self.session.flush()
+        # Several expenses share each date, so the primary key must break ties.
+        for index in range(25):
+            self.session.add(Expense(report.report_id, employee.employee_id, 'Meals', 10, 'USD',
+                                     datetime.date(2024, 1, 1 + index // 3), None))
+        self.session.commit()
+        self.columns = (Expense.expense_date, Expense.expense_id)
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_pages_cover_every_row_once_in_order(self):
+        """
+        Tests that following next_cursor visits every row once, newest first, with a single
+        query per page.
+        """
+        seen, cursor, pages = [], None, 0
+        while True:
+            with track_queries(threshold=100) as tracking:
+                rows, cursor = keyset_page(self.session.query(Expense), self.columns, cursor, limit=10)
+            assert tracking.total == 1
+            seen.extend((row.expense_date, row.expense_id) for row in rows)
+            pages += 1
+            if cursor is None:
+                break
+        assert pages == 3 and len(seen) == 25 and len(set(seen)) == 25
+        assert seen == sorted(seen, reverse=True)
+
+    def test_malformed_cursor_is_rejected(self):
+        """
+        Tests that a cursor that does not decode to the listing's sort key is refused.
+        """
+        for cursor in ('not-a-cursor', 'WzFd'):  # 'WzFd' is [1]: one value for a two-column key.
+            with self.assertRaises(InvalidCursor):
+                keyset_page(self.session.query(Expense), self.columns, cursor)
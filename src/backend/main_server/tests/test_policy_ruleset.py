@@ -0,0 +1,77 @@
+# Standard library
+import types  # Expense rows without a region.
+import unittest  # Plain test cases for components that do not need the Flask app.
+from decimal import Decimal  # Policy limits.
+
+# External dependencies
+from sqlalchemy import create_engine  # In-memory database for the policy ruleset tests.
+from sqlalchemy.orm import Session  # Session for the policy ruleset tests.
+
+# Internal dependencies
+from src.backend.main_server.src.models import Base, Policy, PolicyRuleset  # ORM models.
+from src.backend.main_server.src.policy_ruleset import CompiledRuleset, PolicyRulesetCache  # Compiled policies.
+
+
+class PolicyRulesetTestCase(unittest.TestCase):
+    """
+    Test suite for the versioned, precompiled policy ruleset.
+    """
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        self.session = Session(bind=self.engine)
+        self.session.add_all([
+            Policy('Meals', None, Decimal('50.00'), None),
+            Policy('EU travel', None, Decimal('500.00'), 'EU, UK'),
+            Policy('EU meals', None, Decimal('40.00'), 'EU'),
+        ])
+        self.session.commit()
+
+    def tearDown(self):
+        self.session.close()
+
+    def test_compiled_rules_apply_by_region_and_amount(self):
+        """
+        Tests that policies apply in their regions, or everywhere without regions, and that the
+        violations are the applicable limits below the amount.
+        """
+        ruleset = CompiledRuleset(3, self.session.execute(Policy.__table__.select()).all())
+        assert ruleset.is_compliant({'amount': '45', 'region': 'US'})
+        assert not ruleset.is_compliant({'amount': '45', 'region': 'EU'})
+        assert [v['policy'] for v in ruleset.violations({'amount': 600, 'region': 'EU'})] == ['EU meals', 'Meals', 'EU travel']
+        assert [v['policy'] for v in ruleset.violations({'amount': 60, 'region': 'UK'})] == ['Meals']
+        assert ruleset.violations({'amount': 'ten'}) == [{'policy': None, 'message': 'Invalid expense amount'}]
+        for amount in ('NaN', float('nan'), 'Infinity', '-inf'):
+            assert ruleset.violations({'amount': amount}) == [{'policy': None, 'message': 'Invalid expense amount'}]
+            assert not ruleset.is_compliant({'amount': amount})
+        assert not ruleset.is_compliant(types.SimpleNamespace(amount=Decimal('50.01')))
+        assert ruleset.is_compliant(types.SimpleNamespace(amount=Decimal('50.00')))
+
+    def test_policy_changes_swap_the_ruleset(self):
+        """
+        Tests that changing policies bumps the ruleset version, and that the cache recompiles
+        on the next version check only when the version moved.
+        """
+        version = self.session.get(PolicyRuleset, 1).version
+        cache = PolicyRulesetCache(session=self.session, check_interval=60)
+        first = cache.get()
+        assert first.version == version and first.size == 3
+        assert cache.get() is first
+        cache.invalidate()
+        assert cache.get() is first  # Same version: nothing is recompiled.
+
+        meals = self.session.query(Policy).filter_by(policy_name='Meals').one()
+        meals.max_amount = Decimal('30.00')
+        self.session.commit()
+        assert self.session.get(PolicyRuleset, 1).version == version + 1
+        assert cache.get() is first  # Until the next check.
+        cache.invalidate()
+        second = cache.get()
+        assert second is not first and second.version == version + 1
+        assert not second.is_compliant({'amount': 35, 'region': 'US'})
+
+        self.session.delete(meals)
+        self.session.commit()
+        cache.invalidate()
+        assert cache.get().version == version + 2 and cache.get().is_compliant({'amount': 35})
@@ -0,0 +1,105 @@
+# Standard library
+import datetime  # Dates for the report fixtures.
+import unittest  # Plain test cases for components that do not need the Flask app.
+from decimal import Decimal  # Expected report totals.
+
+# External dependencies
+from sqlalchemy import create_engine  # In-memory database for the report total tests.
+from sqlalchemy.orm import Session  # Session for the report total tests.
+
+# Internal dependencies
+from src.backend.main_server.src.models import Base, Department, Employee, ExpenseReport, Expense  # ORM models.
+from src.backend.main_server.src.reconciliation import reconcile_report_totals  # Report total repair job.
+
+
+class ReportTotalsTestCase(unittest.TestCase):
+    """
+    Test suite for the incrementally maintained report totals and their reconciliation.
+    """
+
+    def setUp(self):
+        self.engine = create_engine('sqlite://')
+        Base.metadata.create_all(self.engine)
+        self.session = Session(bind=self.engine)
+        department = Department('Sales')
+        self.session.add(department)
+        self.session.flush()
+        employee = Employee('Ada', 'Lovelace', 'ada@example.com', 'Employee', department.department_id)
+        self.session.add(employee)
+        self.session.flush()
+        self.reports = [ExpenseReport(employee.employee_id, datetime.date(2024, 1, 31), 'Pending') for _ in range(3)]
+        self.session.add_all(self.reports)
+        self.session.flush()
+        self.employee_id = employee.employee_id
+
+    def tearDown(self):
+        self.session.close()
+
+    def _expense(self, report, amount):
+        return Expense(report.report_id, self.employee_id, 'Meals', amount, 'USD', datetime.date(2024, 1, 15), None)
+
+    def test_totals_follow_inserts_updates_and_deletes(self):
+        """
+        Tests that adding, changing, moving and deleting expenses adjusts the report totals,
+        and that loaded reports see the new totals.
+        """
+        first, second = self.reports[0], self.reports[1]
+        lunch, taxi = self._expense(first, Decimal('12.50')), self._expense(first, 30)
+        self.session.add_all([lunch, taxi])
+        self.session.commit()
+        assert first.total_amount == Decimal('42.50')
+
+        lunch.amount = Decimal('15.00')
+        taxi.report_id = second.report_id
+        self.session.commit()
+        assert (first.total_amount, second.total_amount) == (Decimal('15.00'), Decimal('30.00'))
+
+        self.session.delete(taxi)
+        self.session.commit()
+        assert second.total_amount == 0
+
+    def test_reconciliation_repairs_drift(self):
+        """
+        Tests that the reconciliation job finds totals changed behind the ORM's back and resets
+        them to the sum of the items, chunk by chunk.
+        """
+        for report in self.reports:
+            self.session.add(self._expense(report, 10))
+        self.session.commit()
+        self.session.execute(ExpenseReport.__table__.update()
+                             .where(ExpenseReport.__table__.c.report_id != self.reports[1].report_id)
+                             .values(total_amount=99))
+        self.session.commit()
+
+        result = reconcile_report_totals(chunk_size=2, fix=False, engine=self.engine)
+        assert (result['checked'], result['drifted'], result['fixed']) == (3, 2, 0)
+        result = reconcile_report_totals(chunk_size=2, engine=self.engine)
+        assert (result['drifted'], result['fixed']) == (2, 2)
+        self.session.expire_all()
+        assert [report.total_amount for report in self.reports] == [10, 10, 10]
+        assert reconcile_report_totals(engine=self.engine)['drifted'] == 0
+
+
+    def test_writes_bump_the_report_version(self):
+        """
+        Tests that writing an expense, the report itself or its employee's name increments the
+        report's version, since each is part of the report's representation.
+        """
+        report = self.reports[0]
+        assert report.version == 1
+        expense = self._expense(report, 10)
+        self.session.add(expense)
+        self.session.commit()
+        assert report.version == 2
+        expense.category = 'Travel'  # Does not change the total, but is listed in the report.
+        self.session.commit()
+        assert report.version == 3
+        report.status = 'Approved'
+        self.session.commit()
+        assert report.version == 4
+        report.employee.last_name = 'King'
+        self.session.commit()
+        assert [report.version for report in self.reports] == [5, 2, 2]
+        report.employee.email = 'ada.king@example.com'  # Not part of the report.
+        self.session.commit()
+        assert report.version == 5
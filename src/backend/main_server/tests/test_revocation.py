@@ -0,0 +1,62 @@
+# Standard library
+import datetime  # Expiry times of the revoked token rows.
+import time  # Expiry times for the revocation list tests.
+import unittest  # Plain test cases for components that do not need the Flask app.
+
+# External dependencies
+from sqlalchemy import create_engine  # In-memory database for the revocation sync test.
+from sqlalchemy.orm import Session  # Session for the revocation sync test.
+
+# Internal dependencies
+from src.backend.common.revocation import RevocationList  # In-memory revoked token ids.
+from src.backend.main_server.src.models import Base, RevokedToken  # ORM models.
+from src.backend.main_server.src.tokens import sync_revocations  # Revocation sync and purge.
+
+
+class RevocationListTestCase(unittest.TestCase):
+    """
+    Test suite for the in-memory access token revocation list used by @jwt_required routes.
+    """
+
+    def test_revoked_ids_are_found_in_their_expiry_bucket(self):
+        """
+        Tests that revoked ids are reported as revoked and others are not, with and without
+        the token's expiry.
+        """
+        revocations = RevocationList(bucket_seconds=60, bucket_capacity=100)
+        exp = time.time() + 300
+        revocations.revoke('revoked-jti', exp)
+        assert revocations.is_revoked('revoked-jti', exp)
+        assert revocations.is_revoked('revoked-jti')
+        assert not any(revocations.is_revoked(f'jti-{i}', exp) for i in range(1000))
+
+    def test_expired_buckets_are_dropped(self):
+        """
+        Tests that a bucket is dropped once every token in it has expired.
+        """
+        revocations = RevocationList(bucket_seconds=60, bucket_capacity=100)
+        exp = time.time() + 30
+        revocations.revoke('revoked-jti', exp)
+        assert revocations.purge_expired(now=exp - 1) == 0
+        assert revocations.purge_expired(now=exp + 60) == 1
+        assert not revocations.is_revoked('revoked-jti', exp)
+
+    def test_sync_loads_live_revocations_and_deletes_expired_rows(self):
+        """
+        Tests that a sync loads the revocations of live tokens and deletes the rows of tokens
+        that have expired.
+        """
+        engine = create_engine('sqlite://')
+        Base.metadata.create_all(engine)
+        now = datetime.datetime.utcnow()
+        with Session(bind=engine) as session:
+            session.add_all([
+                RevokedToken(jti='live-jti', expires_at=now + datetime.timedelta(minutes=5), revoked_at=now),
+                RevokedToken(jti='expired-jti', expires_at=now - datetime.timedelta(minutes=5), revoked_at=now),
+            ])
+            session.commit()
+            revocations = RevocationList(bucket_seconds=60, bucket_capacity=100)
+            sync_revocations(revocations, session=session)
+            assert revocations.is_revoked('live-jti')
+            assert [jti for jti, in session.query(RevokedToken.jti)] == ['live-jti']
+        engine.dispose()
@@ -1,16 +1,28 @@
-import pytest  # pytest version 6.2.4
-from flask import Flask, url_for, jsonify
+# Standard library
+import datetime  # Submission date of the seeded expense report.
+from decimal import Decimal  # Limit of the seeded policy.
+import os  # Database and secret key settings read by load_config.
+from unittest import mock  # Stands in for the email and in-app notification channels.
+
+# External dependencies
+from flask import url_for
+from flask_jwt_extended import create_access_token, decode_token  # Access tokens for the seeded users.
 from flask_testing import TestCase  # Flask-Testing version 0.8.1
+from sqlalchemy import create_engine  # In-memory database for the route tests.
+from sqlalchemy.pool import StaticPool  # One shared connection, so every session sees the same database.
+from werkzeug.exceptions import HTTPException  # Raised by URL matching for paths the main routes do not serve.
+
+# Settings read by load_config when the app is initialized.
+os.environ.setdefault('DATABASE_URI', 'sqlite://')
+os.environ.setdefault('SECRET_KEY', 'test-secret-key')
 
 # Internal dependencies
 from src.backend.main_server.app import initialize_main_server  # Initialize the main server application for testing.
-from src.backend.main_server.src.routes import (
-    register_user_route,       # API route for registering a new user.
-    login_user_route,          # API route for user login.
-    validate_expense_route,    # API route to validate an expense against policy and tax rules.
-    send_notification_route,   # API route for sending notifications.
-    get_expense_report_route   # API route to retrieve a specific expense report by ID.
-)
+from src.backend.main_server.src.database import bind_engine, db_session, remove_session  # Test database binding.
+from src.backend.main_server.src.models import Base, Employee, User, ExpenseReport, Policy  # ORM models for the fixtures.
+from src.backend.main_server.src.tokens import NEW_USER_ROLE, access_token_claims  # Claims of the users' tokens.
+from src.backend.common.permissions import Permission, claims_permissions, has_permissions  # Permission claim checks.
+from src.backend.main_server.src.lazy_services import LEGACY_ALIASES, SERVICE_MOUNTS  # Mounted services and root aliases.
 
 
 class MainServerTestCase(TestCase):
@@ -28,21 +40,43 @@ class MainServerTestCase(TestCase):
     def create_app(self):
         """
         Creates and configures a new app instance for each test.
-        Sets up the test client for the Flask application.
+        Sets up the test client for the Flask application on a fresh in-memory database.
         """
+        self.engine = create_engine('sqlite://', poolclass=StaticPool)
+        bind_engine(self.engine)
+        Base.metadata.create_all(self.engine)
         app = initialize_main_server()
         app.config['TESTING'] = True
         return app
 
-    @pytest.mark.parametrize("test_data", [
-        {
-            'first_name': 'John',
-            'last_name': 'Doe',
-            'email': 'johndoe@example.com',
-            'password': 'Password123!'
-        }
-    ])
-    def test_register_user(self, test_data):
+    def tearDown(self):
+        """
+        Discards the test database.
+        """
+        remove_session()
+        self.engine.dispose()
+
+    def _create_user(self, role='Employee', email='johndoe@example.com'):
+        """
+        Adds an employee with a login and returns the user.
+        """
+        employee = Employee('John', 'Doe', email, role, None)
+        db_session.add(employee)
+        db_session.flush()
+        user = User(email, 'Password123!', role, employee.employee_id)
+        db_session.add(user)
+        db_session.commit()
+        return user
+
+    def _auth_headers(self, user):
+        """
+        Returns the Authorization header of an access token for the user, as the login route issues it.
+        """
+        token = create_access_token(identity=str(user.user_id), additional_claims=access_token_claims(user))
+        return {'Authorization': f'Bearer {token}'}
+
+    def test_register_user(self, test_data={'first_name': 'John', 'last_name': 'Doe',
+                                            'email': 'johndoe@example.com', 'password': 'Password123!'}):
         """
         Tests the user registration API endpoint for successful user creation and response.
 
@@ -57,10 +91,11 @@ class MainServerTestCase(TestCase):
         3. Send a POST request to the register_user_route with the test data.
         4. Assert that the response status code is 201 (Created).
         5. Assert that the response contains a valid JWT token.
+        6. Assert that the user and employee were stored, with the password hashed once.
         """
         # Send a POST request to the register_user_route with the test data
         response = self.client.post(
-            url_for('register_user_route'),
+            url_for('main_routes.register_user_route'),
             json=test_data
         )
 
@@ -72,13 +107,44 @@ class MainServerTestCase(TestCase):
         assert 'token' in data, "Response JSON does not contain 'token'"
         assert isinstance(data['token'], str), "Token is not a string"
 
-    @pytest.mark.parametrize("test_data", [
-        {
-            'email': 'johndoe@example.com',
-            'password': 'Password123!'
-        }
-    ])
-    def test_login_user(self, test_data):
+        # Assert that the user was stored with its employee record and a hash of the plain password
+        user = db_session.query(User).filter_by(username=test_data['email']).one()
+        assert user.employee.email == test_data['email'] and user.employee.first_name == test_data['first_name']
+        assert user.password_hash != test_data['password'] and user.check_password(test_data['password'])
+
+        # Assert that the same email address cannot register twice
+        response = self.client.post(url_for('main_routes.register_user_route'), json=test_data)
+        assert response.status_code == 409, f"Expected status code 409, got {response.status_code}"
+
+    def test_registration_token_carries_default_role_claims(self):
+        """
+        Tests that a self-registered user's token names the user and carries the default role's
+        permissions, whatever role the client asked for.
+        """
+        response = self.client.post(
+            url_for('main_routes.register_user_route'),
+            json={'first_name': 'John', 'last_name': 'Doe', 'email': 'johndoe@example.com',
+                  'password': 'Password123!', 'role': 'Administrator'}
+        )
+        assert response.status_code == 201, f"Expected status code 201, got {response.status_code}"
+        claims = decode_token(response.get_json()['token'])
+        user = db_session.query(User).filter_by(username='johndoe@example.com').one()
+        assert claims['sub'] == str(user.user_id)
+        assert claims['role'] == NEW_USER_ROLE
+        assert has_permissions(claims_permissions(claims), Permission.SUBMIT_EXPENSES)
+        assert not has_permissions(claims_permissions(claims), Permission.MANAGE_USERS)
+
+    def test_register_user_requires_fields(self):
+        """
+        Tests that a registration without a password or name is refused.
+        """
+        response = self.client.post(
+            url_for('main_routes.register_user_route'),
+            json={'email': 'johndoe@example.com'}
+        )
+        assert response.status_code == 400, f"Expected status code 400, got {response.status_code}"
+
+    def test_login_user(self, test_data={'email': 'johndoe@example.com', 'password': 'Password123!'}):
         """
         Tests the user login API endpoint for successful authentication and token issuance.
 
@@ -96,7 +162,7 @@ class MainServerTestCase(TestCase):
         """
         # Ensure the user exists by registering first
         self.client.post(
-            url_for('register_user_route'),
+            url_for('main_routes.register_user_route'),
             json={
                 'first_name': 'John',
                 'last_name': 'Doe',
@@ -107,7 +173,7 @@ class MainServerTestCase(TestCase):
 
         # Send a POST request to the login_user_route with the test data
         response = self.client.post(
-            url_for('login_user_route'),
+            url_for('main_routes.login_user_route'),
             json=test_data
         )
 
@@ -119,19 +185,11 @@ class MainServerTestCase(TestCase):
         assert 'token' in data, "Response JSON does not contain 'token'"
         assert isinstance(data['token'], str), "Token is not a string"
 
-    @pytest.mark.parametrize("test_data", [
-        {
-            'expense_date': '2023-01-01',
-            'category': 'Meals',
-            'amount': 50.00,
-            'currency': 'USD',
-            'description': 'Business lunch with client',
-            'receipt': 'base64encodedstring'
-        }
-    ])
-    def test_validate_expense(self, test_data):
+    def test_validate_expense(self, test_data={'expense_date': '2023-01-01', 'category': 'Meals', 'amount': 50.00,
+                                               'currency': 'USD', 'description': 'Business lunch with client',
+                                               'receipt': 'base64encodedstring'}):
         """
-        Tests the expense validation API endpoint for compliance with policy and tax rules.
+        Tests the expense validation API endpoint for compliance with the policy rules.
 
         Requirements Addressed:
         - Integration Testing (Feature ID: F-015)
@@ -145,10 +203,15 @@ class MainServerTestCase(TestCase):
         4. Assert that the response status code is 200 (OK).
         5. Assert that the response indicates compliance status and any violations.
         """
+        user = self._create_user()
+        db_session.add(Policy('Meals', None, Decimal('40.00'), None))
+        db_session.commit()
+
         # Send a POST request to the validate_expense_route with the test data
         response = self.client.post(
-            url_for('validate_expense_route'),
-            json=test_data
+            url_for('main_routes.validate_expense_route'),
+            json=test_data,
+            headers=self._auth_headers(user)
         )
 
         # Assert that the response status code is 200 (OK)
@@ -158,14 +221,18 @@ class MainServerTestCase(TestCase):
         data = response.get_json()
         assert 'compliance_status' in data, "Response JSON does not contain 'compliance_status'"
         assert data['compliance_status'] in ['Compliant', 'Non-Compliant'], f"Invalid compliance status: {data['compliance_status']}"
+        assert data['compliance_status'] == 'Non-Compliant'
+        assert [violation['policy'] for violation in data['policy_violations']] == ['Meals']
+
+        # An amount within the limit complies
+        response = self.client.post(
+            url_for('main_routes.validate_expense_route'),
+            json=dict(test_data, amount=25.00),
+            headers=self._auth_headers(user)
+        )
+        assert response.get_json()['compliance_status'] == 'Compliant'
 
-    @pytest.mark.parametrize("test_data", [
-        {
-            'recipient_id': 1,
-            'message': 'Your expense report has been approved.'
-        }
-    ])
-    def test_send_notification(self, test_data):
+    def test_send_notification(self, test_data={'recipient_id': 1, 'message': 'Your expense report has been approved.'}):
         """
         Tests the notification sending API endpoint for successful message dispatch.
 
@@ -181,11 +248,18 @@ class MainServerTestCase(TestCase):
         4. Assert that the response status code is 200 (OK).
         5. Assert that the response contains a success status message.
         """
-        # Send a POST request to the send_notification_route with the test data
-        response = self.client.post(
-            url_for('send_notification_route'),
-            json=test_data
-        )
+        recipient = self._create_user()
+        sender = self._create_user(role='Manager', email='manager@example.com')
+        assert recipient.user_id == test_data['recipient_id']
+
+        # Send a POST request to the send_notification_route with the delivery channels stubbed out
+        with mock.patch('src.backend.main_server.src.routes.send_email') as send_email, \
+                mock.patch('src.backend.main_server.src.routes.send_in_app') as send_in_app:
+            response = self.client.post(
+                url_for('main_routes.send_notification_route'),
+                json=test_data,
+                headers=self._auth_headers(sender)
+            )
 
         # Assert that the response status code is 200 (OK)
         assert response.status_code == 200, f"Expected status code 200, got {response.status_code}"
@@ -194,9 +268,23 @@ class MainServerTestCase(TestCase):
         data = response.get_json()
         assert 'status' in data, "Response JSON does not contain 'status'"
         assert data['status'] == 'Success', f"Expected status 'Success', got {data['status']}"
+        send_in_app.assert_called_once()
+        assert send_in_app.call_args.args[:2] == (recipient.user_id, test_data['message'])
+        assert send_email.call_args is None or send_email.call_args.args[0] == 'johndoe@example.com'
 
-    @pytest.mark.parametrize("report_id", [1])
-    def test_get_expense_report(self, report_id):
+    def test_send_notification_requires_permission(self):
+        """
+        Tests that a user without the SEND_NOTIFICATIONS permission cannot send notifications.
+        """
+        user = self._create_user()
+        response = self.client.post(
+            url_for('main_routes.send_notification_route'),
+            json={'recipient_id': user.user_id, 'message': 'Hello'},
+            headers=self._auth_headers(user)
+        )
+        assert response.status_code == 403, f"Expected status code 403, got {response.status_code}"
+
+    def test_get_expense_report(self, report_id=1):
         """
         Tests the expense report retrieval API endpoint for correct data fetching.
 
@@ -212,16 +300,41 @@ class MainServerTestCase(TestCase):
         4. Assert that the response status code is 200 (OK).
         5. Assert that the response contains the correct expense report data.
         """
-        # Create a mock expense report if necessary (assuming report_id 1 exists)
+        user = self._create_user()
+        db_session.add(ExpenseReport(user.employee_id, datetime.date(2024, 1, 31), 'Pending'))
+        db_session.commit()
+
         # Send a GET request to the get_expense_report_route with the report_id
         response = self.client.get(
-            url_for('get_expense_report_route', report_id=report_id)
+            url_for('main_routes.get_expense_report_route', report_id=report_id),
+            headers=self._auth_headers(user)
         )
 
         # Assert that the response status code is 200 (OK)
         assert response.status_code == 200, f"Expected status code 200, got {response.status_code}"
 
         # Assert that the response contains the correct expense report data
-        data = response.get_json()
+        data = response.get_json()['expense_report']
         assert 'report_id' in data, "Response JSON does not contain 'report_id'"
-        assert data['report_id'] == report_id, f"Expected report_id {report_id}, got {data['report_id']}"
\ No newline at end of file
+        assert data['report_id'] == report_id, f"Expected report_id {report_id}, got {data['report_id']}"
+
+    def test_service_prefixes_do_not_shadow_main_routes(self):
+        """
+        Tests that the main server's own routes are registered and that no service is mounted
+        under a prefix of one of them, which would take its requests away.
+        """
+        rules = [rule.rule for rule in self.app.url_map.iter_rules() if rule.endpoint.startswith('main_routes.')]
+        assert '/token/refresh' in rules and '/reports/<int:report_id>' in rules and '/metrics' in rules
+        for prefix in SERVICE_MOUNTS:
+            assert not [rule for rule in rules if rule == prefix or rule.startswith(prefix + '/')], prefix
+
+    def test_legacy_aliases_do_not_shadow_main_routes(self):
+        """
+        Tests that every service path kept at the root for existing clients is one the main
+        server does not serve itself, and that its prefix is mounted.
+        """
+        adapter = self.app.url_map.bind('localhost')
+        for (method, path), prefix in LEGACY_ALIASES.items():
+            assert prefix in SERVICE_MOUNTS, prefix
+            with self.assertRaises(HTTPException, msg=f'{method} {path}'):
+                adapter.match(path, method=method)
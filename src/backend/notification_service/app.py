@@ -23,9 +23,13 @@ from config import setup_logging  # Internal module: To configure logging for th
 from src.models import Notification  # Internal module: To create and manage notification instances.
 from src.utils import format_message, get_delivery_method, generate_timestamp  # Internal modules: To format messages, determine delivery methods, and generate timestamps.
 from src.routes import send_notification  # Internal module: To handle the sending of notifications.
+from src.backend.common.json_provider import init_json  # Internal module: To serialize JSON responses with the shared fast provider.
+from src.backend.common.profiling import init_profiling  # Internal module: To profile sampled and debug requests.
 
 # Create Flask application instance at module level
 app = Flask(__name__)
+init_json(app)
+init_profiling(app)
 logging.info("Flask application instance created.")
 
 def initialize_service():
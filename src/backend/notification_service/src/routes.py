@@ -7,6 +7,8 @@ from flask import Blueprint, request, jsonify  # Flask 2.0.1
 from models import Notification  # To create and manage notification instances.
 from utils import format_message, get_delivery_method, generate_timestamp  # To format messages before sending notifications and determine delivery methods.
 from config import setup_logging  # To configure logging for the notification service.
+from src.backend.common.jwks import JWKSVerifier  # To verify bearer tokens locally.
+from src.backend.common.permissions import Permission, require_permissions  # Bitwise permission guards.
 
 # Configure logging for the notification service.
 setup_logging()
@@ -17,7 +19,15 @@ logger = logging.getLogger(__name__)
 # Define a Blueprint for the notification routes.
 notification_bp = Blueprint('notification', __name__)
 
+# Verifies bearer tokens locally with the authentication service's cached public keys.
+# AUTH_JWKS_URL: the authentication service's JSON Web Key Set endpoint.
+token_verifier = JWKSVerifier(
+    os.getenv('AUTH_JWKS_URL', 'http://authentication_service:5000/.well-known/jwks.json')
+)
+
 @notification_bp.route('/notifications/send', methods=['POST'])
+@token_verifier.require_token
+@require_permissions(Permission.SEND_NOTIFICATIONS)
 def send_notification():
     """
     Handles the sending of notifications by creating a notification instance,
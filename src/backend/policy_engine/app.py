@@ -9,10 +9,14 @@ from .src.models import PolicyModel  # To represent and manage policy data struc
 from .src.utils import validate_policy_compliance  # To validate expenses against policy models
 from .src.rules.policy_rules import apply_policy_rules  # To apply policy rules to expenses
 from .src.rules.tax_rules import apply_tax_rules  # To apply tax rules to expenses
-from .src.routes import validate_expense_route  # To handle API requests for validating expenses
+from .src.routes import policy_bp  # Blueprint of the API routes for validating expenses
+from src.backend.common.json_provider import init_json  # To serialize JSON responses with the shared fast provider
+from src.backend.common.profiling import init_profiling  # To profile sampled and debug requests
 
 # Initialize the Flask application
 app = Flask(__name__)  # Global Flask application instance used throughout the policy engine
+init_json(app)
+init_profiling(app)
 
 def create_app():
     """
@@ -39,9 +43,10 @@ def create_app():
     app.config.from_object(Config)
 
     # Step 3: Register API routes
-    # The 'validate_expense_route' blueprint includes the endpoints required for validating expenses.
+    # The 'policy_bp' blueprint includes the endpoints required for validating expenses.
     # By registering it with the Flask app, we make these endpoints available to clients.
-    app.register_blueprint(validate_expense_route)
+    if 'policy_bp' not in app.blueprints:
+        app.register_blueprint(policy_bp)
 
     # Step 4: Return the initialized Flask application instance
     return app
@@ -9,8 +9,10 @@ Requirements Addressed:
     - Location: Technical Specification/5.3 Feature ID: F-003
 """
 
+import os
+
 # External Dependencies
-from flask import Flask, request, jsonify  # Flask==2.0.1
+from flask import Blueprint, request, jsonify  # Flask==2.0.1
 # To create and manage API routes.
 
 # Internal Dependencies
@@ -19,11 +21,24 @@ from .utils import validate_policy_compliance  # To validate expenses against po
 from .rules.policy_rules import apply_policy_rules  # To apply policy rules to expenses.
 from .rules.tax_rules import apply_tax_rules  # To apply tax rules to expenses.
 from ..config import config  # To load configuration settings for database connections and rules paths.
-
-# Initialize Flask application
-app = Flask(__name__)
-
-@app.route('/validate_expense', methods=['POST'])
+from src.backend.common.jwks import JWKSVerifier  # Local token verification.
+from src.backend.common.permissions import Permission, require_permissions  # Bitwise permission guards.
+from src.backend.common.json_provider import ndjson_response, wants_ndjson  # NDJSON list responses.
+from src.backend.common.batch import BatchPayloadError, read_batch, validate_batch  # Batch validation.
+
+# Blueprint of the policy engine's routes; registered on the app by app.py, or mounted under
+# /policy by the main server
+policy_bp = Blueprint('policy_bp', __name__)
+
+# Verifies bearer tokens locally with the authentication service's cached public keys
+# AUTH_JWKS_URL: the authentication service's JSON Web Key Set endpoint.
+token_verifier = JWKSVerifier(
+    os.getenv('AUTH_JWKS_URL', 'http://authentication_service:5000/.well-known/jwks.json')
+)
+
+@policy_bp.route('/validate_expense', methods=['POST'])
+@token_verifier.require_token
+@require_permissions(Permission.SUBMIT_EXPENSES)
 def validate_expense_route():
     """
     Handles API requests for validating expenses against policy and tax rules.
@@ -79,4 +94,63 @@ def validate_expense_route():
 
     except Exception as e:
         # Handle exceptions and return an error response.
-        return jsonify({'status': 'error', 'message': str(e)}), 500
\ No newline at end of file
+        return jsonify({'status': 'error', 'message': str(e)}), 500
+
+
+@policy_bp.route('/validate_expense/batch', methods=['POST'])
+@token_verifier.require_token
+@require_permissions(Permission.SUBMIT_EXPENSES)
+def validate_expense_batch_route():
+    """
+    Handles API requests validating many expenses against policy and tax rules at once.
+
+    Parameters:
+        request (Request): A JSON array of expenses, or NDJSON (application/x-ndjson) with one
+        expense per line; at most BATCH_MAX_ITEMS expenses.
+
+    Returns:
+        Response: The compliance of each expense, in input order, as JSON or, if the client
+        accepts it, as NDJSON.
+
+    Steps:
+        1. Read the expenses from the request body.
+        2. Resolve the company and tax policies once per (category, region, employee level).
+        3. Validate each expense against its resolved policies.
+        4. Return the per-expense compliance in input order.
+
+    Requirements Addressed:
+    - Policy and Compliance Engine
+        - Ensures that all submitted expenses adhere to configurable company policies and international tax laws by performing real-time policy checks and applying relevant regulations automatically.
+        - Location: Technical Specification/5.3 Feature ID: F-003
+    """
+    # Step 1: Read the expenses from the request body.
+    try:
+        expenses = read_batch()
+    except BatchPayloadError as e:
+        return jsonify({'status': 'error', 'message': str(e)}), e.status
+
+    try:
+        # Step 2: Resolve the company and tax policies once per distinct policy key.
+        policy_model = PolicyModel(config)
+
+        def resolve(expense):
+            return policy_model.get_applicable_policies(expense), policy_model.get_applicable_tax_policies(expense)
+
+        # Step 3: Validate each expense against the policies resolved for its key.
+        def check(expense, resolved):
+            policies, tax_policies = resolved
+            return {
+                'policy_compliance': validate_policy_compliance(expense, policies),
+                'tax_compliance': apply_tax_rules(expense, tax_policies),
+            }
+
+        result = validate_batch(expenses, resolve, check)
+
+        # Step 4: Return the per-expense compliance in input order.
+        if wants_ndjson():
+            return ndjson_response(result['results'])
+        return jsonify({'status': 'success', 'policy_keys': result['policy_keys'], 'compliance': result['results']}), 200
+
+    except Exception as e:
+        # Handle exceptions and return an error response.
+        return jsonify({'status': 'error', 'message': str(e)}), 500
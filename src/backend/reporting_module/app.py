@@ -47,6 +47,16 @@ from src.routes import (
 # - Expense Submission and Retrieval (Technical Specification/5.2 Feature ID: F-002).
 # - Reporting and Analytics (Technical Specification/5.6 Feature ID: F-006).
 
+from src.backend.common.json_provider import init_json
+# init_json serializes JSON responses, including Decimal amounts and dates, with the shared fast provider.
+# Addresses requirement:
+# - Reporting and Analytics (Technical Specification/5.6 Feature ID: F-006).
+
+from src.backend.common.profiling import init_profiling
+# init_profiling profiles sampled and debug requests per route when PROFILE_SAMPLE_RATE or PROFILE_TOKEN is set.
+# Addresses requirement:
+# - Scalability and Reliability (Technical Specification/5.19 Feature ID: F-019).
+
 
 def initialize_app():
     """
@@ -70,6 +80,8 @@ def initialize_app():
     """
     # Step 1: Create a Flask application instance.
     app = Flask(__name__)
+    init_json(app)
+    init_profiling(app)
     # The Flask app serves as the core of the reporting module, handling incoming HTTP requests.
 
     # Step 2: Configure the application using setup_logging and other configuration settings.
@@ -17,6 +17,26 @@ LOG_LEVEL = os.getenv('LOG_LEVEL', 'DEBUG')
 # enabling data retrieval for reporting functionalities (TR-F006.2, TR-F006.3)
 DATABASE_URL = os.getenv('DATABASE_URL')
 
+# DATABASE_REPLICA_URLS: Comma-separated connection strings of read replicas of DATABASE_URL
+# Report reads are served by a replica within REPLICA_MAX_LAG_SECONDS of the primary, so that
+# month-end reporting does not contend with expense submission and approval writes
+# Related to Technical Specification/5.19 Feature ID: F-019
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv('DATABASE_REPLICA_URLS', '').split(',') if url.strip()]
+
+# REPLICA_MAX_LAG_SECONDS: Staleness bound; reads fall back to the primary when every replica is further behind
+# REPLICA_LAG_CHECK_SECONDS: How long a replica's measured lag is reused before probing it again
+# READ_AFTER_WRITE_SECONDS: How long a client's reads stay on the primary after it wrote
+# Related to Technical Specification/5.19 Feature ID: F-019
+REPLICA_MAX_LAG_SECONDS = float(os.getenv('REPLICA_MAX_LAG_SECONDS', '5'))
+REPLICA_LAG_CHECK_SECONDS = float(os.getenv('REPLICA_LAG_CHECK_SECONDS', '1'))
+READ_AFTER_WRITE_SECONDS = int(os.getenv('READ_AFTER_WRITE_SECONDS', '10'))
+
+# AUTH_JWKS_URL: The authentication service's JSON Web Key Set endpoint
+# Report routes verify bearer tokens locally against these public keys, cached by key id,
+# with no shared secret and no call to the authentication service per request
+# Related to Technical Specification/5.1 Feature ID: F-001 (TR-F001.4)
+AUTH_JWKS_URL = os.getenv('AUTH_JWKS_URL', 'http://authentication_service:5000/.well-known/jwks.json')
+
 def setup_logging():
     """
     Configures the logging settings for the reporting module.
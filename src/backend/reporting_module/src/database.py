@@ -0,0 +1,79 @@
+"""
+Module: database.py
+
+Database access for the reporting module. Reports are read from the expense tables through a
+request-scoped session that routes reads to the read replicas in DATABASE_REPLICA_URLS (see
+common/replicas.py), so that month-end reporting does not contend with the
+writes of expense submission and approval on the primary.
+
+The engines are created on first use, so importing the module never opens a connection.
+
+Requirements Addressed:
+- Reporting and Analytics (Feature ID: F-006)
+  Location: Technical Specification/5.6 Feature ID: F-006
+- Scalability and Reliability (Feature ID: F-019)
+  Location: Technical Specification/5.19 Feature ID: F-019
+"""
+
+import threading
+
+from sqlalchemy import create_engine  # SQLAlchemy version 1.4.25
+from sqlalchemy.orm import scoped_session
+
+from src.backend.reporting_module.config import (
+    DATABASE_URL,
+    DATABASE_REPLICA_URLS,
+    REPLICA_MAX_LAG_SECONDS,
+    REPLICA_LAG_CHECK_SECONDS,
+    READ_AFTER_WRITE_SECONDS,
+)
+from src.backend.common import replicas  # Read-replica routing.
+
+_router = None
+_router_lock = threading.Lock()
+
+
+def get_router():
+    """
+    Returns the process-wide read router over DATABASE_URL and DATABASE_REPLICA_URLS, creating
+    the engines on first use.
+
+    Returns:
+        ReplicaRouter: The router.
+    """
+    global _router
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                _router = replicas.ReplicaRouter(
+                    create_engine(DATABASE_URL, pool_pre_ping=True),
+                    [create_engine(url, pool_pre_ping=True) for url in DATABASE_REPLICA_URLS],
+                    max_lag=REPLICA_MAX_LAG_SECONDS,
+                    check_interval=REPLICA_LAG_CHECK_SECONDS,
+                )
+    return _router
+
+
+# Thread-local session used by the models and routes.
+db_session = scoped_session(lambda: replicas.RoutingSession(get_router()))
+
+
+def remove_session(exception=None):
+    """
+    Closes the current thread's session and returns its connections to the pools.
+    """
+    db_session.remove()
+
+
+def read_replica():
+    """
+    Marks the db_session reads in a block as servable by a read replica.
+    """
+    return replicas.read_replica(db_session)
+
+
+def route_reads(scaffold, read_only=False):
+    """
+    Installs read routing for db_session on a Flask app or blueprint (see replicas.route_reads).
+    """
+    replicas.route_reads(scaffold, db_session, sticky_seconds=READ_AFTER_WRITE_SECONDS, read_only=read_only)
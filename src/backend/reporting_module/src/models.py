@@ -9,6 +9,14 @@ Requirements Addressed:
   Description: Provide comprehensive reporting tools and customizable dashboards to offer real-time visibility into travel expenses, supporting budgeting, forecasting, and financial analysis for various user roles.
 """
 
+from sqlalchemy import text  # SQLAlchemy version 1.4.25
+
+from .database import db_session, read_replica  # Request-scoped session with read-replica routing
+
+# Columns of the expense_reports table (src/database/schemas/schema.sql) that the model holds.
+_REPORT_COLUMNS = 'report_id, employee_id, submission_date, status, total_amount, version'
+
+
 class ExpenseReportModel:
     """
     Represents the structure of an expense report, including fields for report ID, employee details, submission date, status, and total amount.
@@ -24,9 +32,11 @@ class ExpenseReportModel:
         submission_date (str): The date the report was submitted.
         status (str): The current status of the expense report.
         total_amount (float): The total amount of all expenses in the report.
+        version (int): The report's version (expense_reports.version), incremented on every write
+            to the report or its expenses; names the representation for ETags.
     """
 
-    def __init__(self, report_id, employee_id, submission_date, status, total_amount):
+    def __init__(self, report_id, employee_id, submission_date, status, total_amount, version=1):
         """
         Initializes an instance of ExpenseReportModel with the given parameters.
 
@@ -36,6 +46,7 @@ class ExpenseReportModel:
             submission_date (str): The date the report was submitted.
             status (str): The current status of the expense report.
             total_amount (float): The total amount of all expenses in the report.
+            version (int): The report's version.
 
         Steps:
             1. Assign report_id to the instance.
@@ -43,12 +54,14 @@ class ExpenseReportModel:
             3. Assign submission_date to the instance.
             4. Assign status to the instance.
             5. Assign total_amount to the instance.
+            6. Assign version to the instance.
         """
         self.report_id = report_id
         self.employee_id = employee_id
         self.submission_date = submission_date
         self.status = status
         self.total_amount = total_amount
+        self.version = version
 
     def to_dict(self):
         """
@@ -73,5 +86,57 @@ class ExpenseReportModel:
             'submission_date': self.submission_date,
             'status': self.status,
             'total_amount': self.total_amount,
+            'version': self.version,
         }
-        return data
\ No newline at end of file
+        return data
+
+    @classmethod
+    def get_by_id(cls, report_id):
+        """
+        Loads one expense report.
+
+        Reads from a replica in GET requests to the reporting routes (see routes.py), unless the
+        client has just written.
+
+        Parameters:
+            report_id (int): The report's identifier.
+
+        Returns:
+            ExpenseReportModel or None: The report, or None if it does not exist.
+        """
+        row = db_session.execute(
+            text(f'SELECT {_REPORT_COLUMNS} FROM expense_reports WHERE report_id = :report_id'),
+            {'report_id': report_id},
+        ).first()
+        return cls(*row) if row else None
+
+    @classmethod
+    def get_version(cls, report_id):
+        """
+        Reads only an expense report's version, for conditional requests.
+
+        Parameters:
+            report_id (int): The report's identifier.
+
+        Returns:
+            int or None: The report's version, or None if it does not exist.
+        """
+        return db_session.execute(
+            text('SELECT version FROM expense_reports WHERE report_id = :report_id'),
+            {'report_id': report_id},
+        ).scalar()
+
+    @classmethod
+    def get_all(cls):
+        """
+        Loads every expense report, for summary statistics and dashboards.
+
+        Always marked as a replica read: the query scans the whole table, and a report that is a
+        few seconds stale does not change a summary.
+
+        Returns:
+            list of ExpenseReportModel: The reports.
+        """
+        with read_replica():
+            rows = db_session.execute(text(f'SELECT {_REPORT_COLUMNS} FROM expense_reports')).all()
+        return [cls(*row) for row in rows]
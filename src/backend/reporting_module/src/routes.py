@@ -6,14 +6,21 @@ Requirements Addressed:
 """
 
 # External dependencies
-from flask import Blueprint, request, jsonify  # Flask version 2.0.1
+from flask import Blueprint, request, jsonify, abort  # Flask version 2.0.1
+from werkzeug.exceptions import HTTPException  # Installed with Flask; lets abort() through the error handler.
 
 # Internal dependencies
 from src.backend.reporting_module.config import setup_logging  # To configure logging for the reporting module.
+from src.backend.reporting_module.config import AUTH_JWKS_URL  # The authentication service's public signing keys.
+from src.backend.common.jwks import JWKSVerifier  # To verify bearer tokens locally.
+from src.backend.common.permissions import Permission, require_permissions  # Bitwise permission guards.
+from src.backend.common.conditional import VersionedResponseCache  # ETags and versioned payload cache.
+from src.backend.reporting_module.src.database import remove_session, route_reads  # Read-replica routing and session cleanup.
 from src.backend.reporting_module.src.models import ExpenseReportModel  # To define the data structure for expense reports used in API responses.
 from src.backend.reporting_module.src.utils import process_expense_data, generate_summary_statistics  # To process raw expense data for reporting and generate summary statistics.
 
 import logging
+import os
 
 # Configure logging for the reporting module
 setup_logging()
@@ -22,7 +29,24 @@ logger = logging.getLogger(__name__)
 # Create a Blueprint for the reporting routes
 reporting_bp = Blueprint('reporting', __name__)
 
+# The reporting routes only read: GET requests are served by a read replica within the staleness
+# bound, unless the client wrote within READ_AFTER_WRITE_SECONDS. This holds wherever the blueprint
+# is registered, including when the main server mounts it.
+route_reads(reporting_bp, read_only=True)
+reporting_bp.teardown_request(remove_session)
+
+# Verifies bearer tokens locally with the authentication service's cached public keys
+token_verifier = JWKSVerifier(AUTH_JWKS_URL)
+
+# REPORT_CACHE_SIZE: Serialized expense reports kept per worker for repeated polls.
+REPORT_CACHE_SIZE = int(os.getenv('REPORT_CACHE_SIZE', '1024'))
+
+# Serialized expense reports by report id, each valid for one report version
+report_cache = VersionedResponseCache('report', maxsize=REPORT_CACHE_SIZE)
+
 @reporting_bp.route('/reports/<int:report_id>', methods=['GET'])
+@token_verifier.require_token
+@require_permissions(Permission.VIEW_REPORTS)
 def get_expense_report(report_id):
     """
     Handles GET requests to retrieve a specific expense report by its ID.
@@ -34,25 +58,34 @@ def get_expense_report(report_id):
     - report_id (int): The ID of the expense report to retrieve.
 
     Returns:
-    - dict: A dictionary containing the details of the requested expense report.
+    - dict: A dictionary containing the details of the requested expense report, with a strong
+      ETag naming the report's version. A request whose If-None-Match names the current
+      version gets 304, and a repeated poll is served from the versioned payload cache.
     """
     # Extract the report_id from the request URL.
     logger.info(f"Retrieving expense report with ID: {report_id}")
 
     try:
-        # Query the database for the expense report with the given report_id.
-        expense_report = ExpenseReportModel.get_by_id(report_id)
-        if expense_report is None:
+        # Read only the report's version; a revalidation or cache hit needs nothing else.
+        version = ExpenseReportModel.get_version(report_id)
+        if version is None:
             # Expense report not found.
             logger.warning(f"Expense report with ID {report_id} not found.")
             return jsonify({'error': 'Expense report not found.'}), 404
 
-        # Convert the report data to a dictionary using ExpenseReportModel.to_dict().
-        report_data = expense_report.to_dict()
+        # Answer 304 if the client holds this version; otherwise serve the payload cached for it,
+        # loading the full row and converting it with ExpenseReportModel.to_dict() only on a cache miss.
+        def build():
+            expense_report = ExpenseReportModel.get_by_id(report_id)
+            if expense_report is None:
+                abort(404)  # Deleted since the version lookup
+            return expense_report.version, expense_report.to_dict()
 
-        # Return the report data as a JSON response.
         logger.info(f"Expense report with ID {report_id} retrieved successfully.")
-        return jsonify(report_data), 200
+        return report_cache.respond(report_id, version, build)
+
+    except HTTPException:
+        raise
 
     except Exception as e:
         # Log the exception and return an error response.
@@ -60,6 +93,8 @@ def get_expense_report(report_id):
         return jsonify({'error': 'An internal error occurred.'}), 500
 
 @reporting_bp.route('/reports', methods=['POST'])
+@token_verifier.require_token
+@require_permissions(Permission.SUBMIT_EXPENSES)
 def post_expense_report():
     """
     Handles POST requests to create a new expense report.
@@ -101,6 +136,8 @@ def post_expense_report():
         return jsonify({'error': 'An internal error occurred.'}), 500
 
 @reporting_bp.route('/reports/summary', methods=['GET'])
+@token_verifier.require_token
+@require_permissions(Permission.VIEW_ANALYTICS)
 def get_summary_statistics():
     """
     Handles GET requests to retrieve summary statistics for expense reports.
@@ -114,11 +151,13 @@ def get_summary_statistics():
     logger.info("Request received to retrieve summary statistics.")
 
     try:
-        # Query the database for all processed expense data.
+        # Query a read replica for all expense reports.
         expense_reports = ExpenseReportModel.get_all()
 
-        # Generate summary statistics using generate_summary_statistics.
-        summary_stats = generate_summary_statistics(expense_reports)
+        # Generate summary statistics over the report totals using generate_summary_statistics.
+        summary_stats = generate_summary_statistics(
+            [{'amount': float(report.total_amount or 0)} for report in expense_reports]
+        )
 
         # Return the summary statistics as a JSON response.
         logger.info("Summary statistics generated successfully.")
@@ -154,4 +154,3 @@ def generate_summary_statistics(processed_data: List[Dict[str, Any]]) -> Dict[st
 
     # Step 4: Return the summary statistics.
     return summary_statistics
-```
\ No newline at end of file
@@ -0,0 +1,46 @@
+-- Migration Script: Add composite indexes for the keyset-paginated listings
+-- Description:
+--   GET /expenses and GET /reports in the main server page through rows newest first on
+--   (expense_date, expense_id) and (submission_date, report_id), continuing after the last key
+--   of the previous page (src/backend/main_server/src/pagination.py). Each index below starts
+--   with a listing's equality filters and ends with its sort key. Every page is then one index
+--   range scan of the page size, whatever its depth. B-tree indexes scan backwards, so the
+--   ascending indexes also serve the descending order.
+-- Requirements Addressed:
+--   - Data Management
+--     - Location: Technical Specification/5.10 Feature ID: F-010
+--   - Scalability and Reliability
+--     - Location: Technical Specification/5.19 Feature ID: F-019
+-- Dependencies:
+--   - Internal:
+--     - 'expenses' table in 'src/database/migrations/add_expense_table.sql'
+--     - 'expense_reports' table in 'src/database/schemas/schema.sql'. Its
+--       idx_expense_reports_employee_id is a prefix of idx_expense_reports_employee_listing and
+--       can be dropped once the new index is built.
+-- Note:
+--   On large live tables, run each statement on its own as CREATE INDEX CONCURRENTLY (outside
+--   this transaction) to avoid blocking writes while the index builds.
+
+BEGIN;
+
+-- An employee's expenses ("my expenses"), optionally within a date range.
+CREATE INDEX idx_expenses_employee_listing
+    ON expenses (employee_id, expense_date, expense_id);
+
+-- An employee's expenses filtered by category.
+CREATE INDEX idx_expenses_employee_category_listing
+    ON expenses (employee_id, category, expense_date, expense_id);
+
+-- A report's line items, and the per-report sums of the total reconciliation job.
+CREATE INDEX idx_expenses_report_id
+    ON expenses (report_id);
+
+-- An employee's reports, optionally filtered by status or date range.
+CREATE INDEX idx_expense_reports_employee_listing
+    ON expense_reports (employee_id, submission_date, report_id);
+
+-- Reports in a status across employees, e.g. the approval queue (status = 'Pending').
+CREATE INDEX idx_expense_reports_status_listing
+    ON expense_reports (status, submission_date, report_id);
+
+COMMIT;
@@ -0,0 +1,29 @@
+-- Migration Script: Add the 'policy_ruleset' table
+-- Description:
+--   Adds a single-row version counter for the 'policies' table as a whole. The main server
+--   increments it in the same transaction as every change to a policy
+--   (src/backend/main_server/src/models.py). Each worker keeps the policies compiled in memory
+--   and recompiles them only when this version moves (src/backend/main_server/src/policy_ruleset.py).
+-- Requirements Addressed:
+--   - Policy and Compliance Engine
+--     - Location: Technical Specification/5.3 Feature ID: F-003
+--   - Scalability and Reliability
+--     - Location: Technical Specification/5.19 Feature ID: F-019
+-- Dependencies:
+--   - Internal:
+--     - 'policies' table in 'src/database/schemas/schema.sql'
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS policy_ruleset (
+    ruleset_id INTEGER PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 1
+);
+-- 'ruleset_id': Always 1; the table holds a single row.
+-- 'version': Writers increment it with "version = version + 1" in the transaction that changes
+--   the policies, so a worker never keeps a ruleset older than a committed change.
+
+INSERT INTO policy_ruleset (ruleset_id, version) VALUES (1, 1)
+ON CONFLICT (ruleset_id) DO NOTHING;
+
+COMMIT;
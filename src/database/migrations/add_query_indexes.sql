@@ -0,0 +1,41 @@
+-- Migration Script: Add indexes on the columns the application filters on
+-- Description:
+--   Adds the indexes behind the most frequent lookups:
+--   - the line items of a report (expense_items.report_id),
+--   - an employee's reports in a status (expense_reports.employee_id, status),
+--   - an employee's expenses by date (expenses.employee_id, expense_date).
+--   Index statements use IF NOT EXISTS: databases created from the current
+--   src/database/schemas/schema.sql already have idx_expense_items_report_id, and
+--   add_listing_indexes.sql already creates the expenses index, whose columns begin with
+--   (employee_id, expense_date). To find further candidates, capture a benchmark run with
+--   QUERY_CAPTURE_FILE and run src/backend/main_server/src/index_advisor.py on it.
+-- Requirements Addressed:
+--   - Data Management
+--     - Location: Technical Specification/5.10 Feature ID: F-010
+--   - Scalability and Reliability
+--     - Location: Technical Specification/5.19 Feature ID: F-019
+-- Dependencies:
+--   - Internal:
+--     - 'expense_items' and 'expense_reports' tables in 'src/database/schemas/schema.sql'
+--     - 'expenses' table in 'src/database/migrations/add_expense_table.sql'
+--     - 'src/database/migrations/add_listing_indexes.sql'
+-- Note:
+--   On large live tables, run each statement on its own as CREATE INDEX CONCURRENTLY (outside
+--   this transaction) to avoid blocking writes while the index builds.
+
+BEGIN;
+
+-- A report's line items, and per-report sums.
+CREATE INDEX IF NOT EXISTS idx_expense_items_report_id
+    ON expense_items (report_id);
+
+-- An employee's reports in a status, newest first; the sort key lets keyset pages
+-- (src/backend/main_server/src/pagination.py) read the index in order.
+CREATE INDEX IF NOT EXISTS idx_expense_reports_employee_status
+    ON expense_reports (employee_id, status, submission_date, report_id);
+
+-- An employee's expenses by date. Same definition as in add_listing_indexes.sql.
+CREATE INDEX IF NOT EXISTS idx_expenses_employee_listing
+    ON expenses (employee_id, expense_date, expense_id);
+
+COMMIT;
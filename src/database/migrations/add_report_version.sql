@@ -0,0 +1,22 @@
+-- Migration Script: Add 'version' column to the 'expense_reports' table
+-- Description:
+--   Adds a per-report version counter. The main server increments it in the same transaction as
+--   every write to the report or its expenses (src/backend/main_server/src/models.py). Report
+--   reads use it as a strong ETag, so polling clients get 304 Not Modified, and as the key of
+--   the per-worker cache of serialized reports.
+-- Requirements Addressed:
+--   - Reporting and Analytics
+--     - Location: Technical Specification/5.6 Feature ID: F-006
+--   - Scalability and Reliability
+--     - Location: Technical Specification/5.19 Feature ID: F-019
+-- Dependencies:
+--   - Internal:
+--     - 'expense_reports' table in 'src/database/schemas/schema.sql'
+
+BEGIN;
+
+ALTER TABLE expense_reports ADD COLUMN version INTEGER NOT NULL DEFAULT 1;
+-- 'version': Starts at 1. Writers increment it with "version = version + 1", never by
+--   assigning a value read earlier, so concurrent writes always yield distinct versions.
+
+COMMIT;
@@ -0,0 +1,20 @@
+-- Migration Script: Add 'permissions' column to the 'roles' table
+-- Description:
+--   This script adds a permission bitset to each role of the authentication service
+--   (src/backend/authentication_service/src/permissions.py). The service compiles the bitsets
+--   once per process and embeds the user's bitset in issued tokens as the 'perm' claim.
+-- Requirements Addressed:
+--   - Secure User Authentication and Role-Based Authorization
+--     - Location: Technical Specification/5.1 Feature ID: F-001
+--     - Description: Define role-based access levels for Employees, Managers, Finance Team,
+--       and Administrators.
+
+BEGIN;
+
+ALTER TABLE roles ADD COLUMN permissions INTEGER;
+-- 'permissions': OR of Permission bits (SUBMIT_EXPENSES = 1, VIEW_REPORTS = 2,
+--   APPROVE_EXPENSES = 4, PROCESS_REIMBURSEMENTS = 8, VIEW_ANALYTICS = 16,
+--   SEND_NOTIFICATIONS = 32, MANAGE_POLICIES = 64, MANAGE_USERS = 128).
+--   NULL keeps the role's built-in default, so existing rows need no update.
+
+COMMIT;
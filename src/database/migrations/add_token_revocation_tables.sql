@@ -0,0 +1,57 @@
+-- Migration Script: Create 'refresh_tokens' and 'revoked_tokens' tables
+-- Description:
+--   This script creates the tables behind server-side refresh tokens and access token
+--   revocation in the main server (src/backend/main_server/src/tokens.py).
+-- Requirements Addressed:
+--   - Secure User Authentication and Role-Based Authorization
+--     - Location: Technical Specification/5.1 Feature ID: F-001
+--     - Description: Lets sessions outlive short access tokens and be revoked centrally.
+-- Dependencies:
+--   - Internal:
+--     - 'users' table in 'src/database/migrations/add_user_table.sql'
+--       - Purpose: Each refresh token belongs to a user.
+
+BEGIN;
+
+CREATE TABLE refresh_tokens (
+    token_id VARCHAR(64) PRIMARY KEY,
+    -- 'token_id': Public identifier, the first part of the token handed to the client.
+
+    user_id INT NOT NULL,
+    -- 'user_id': The user the token was issued to.
+
+    token_hash VARCHAR(64) NOT NULL,
+    -- 'token_hash': SHA-256 (hex) of the token's secret part. The secret itself is never stored.
+
+    issued_at TIMESTAMP NOT NULL,
+    expires_at TIMESTAMP NOT NULL,
+
+    revoked_at TIMESTAMP,
+    -- 'revoked_at': Set when the token is revoked or rotated. Presenting a token with
+    --   revoked_at set revokes every live refresh token of the user.
+
+    replaced_by VARCHAR(64),
+    -- 'replaced_by': token_id of the token issued when this one was rotated.
+
+    CONSTRAINT fk_refresh_tokens_user_id FOREIGN KEY (user_id)
+        REFERENCES users(user_id)
+);
+
+-- Revoking all of a user's sessions filters on user_id.
+CREATE INDEX idx_refresh_tokens_user_id ON refresh_tokens (user_id);
+
+CREATE TABLE revoked_tokens (
+    jti VARCHAR(64) PRIMARY KEY,
+    -- 'jti': Id of the revoked access token.
+
+    expires_at TIMESTAMP NOT NULL,
+    -- 'expires_at': The access token's expiry; rows past it can be deleted.
+
+    revoked_at TIMESTAMP NOT NULL
+    -- 'revoked_at': Each worker loads rows revoked since its last sync into memory.
+);
+
+CREATE INDEX idx_revoked_tokens_revoked_at ON revoked_tokens (revoked_at);
+CREATE INDEX idx_revoked_tokens_expires_at ON revoked_tokens (expires_at);
+
+COMMIT;
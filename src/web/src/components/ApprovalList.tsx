@@ -11,7 +11,7 @@ import useNotifications from '../hooks/useNotifications'; // To manage notificat
 /* Requirement Addressed: Notification and Alerting System
    Technical Specification Reference: 5.17 Feature ID: F-017 */
 
-import { fetchExpenses } from '../services/api'; // To retrieve the list of expenses pending approval from the backend API.
+import { fetchReportPage } from '../services/api'; // To retrieve the expense reports pending approval, one page at a time.
 /* Requirement Addressed: Fetch pending expense reports for approval
    Technical Specification Reference: 5.4 Feature ID: F-004 */
 
@@ -29,6 +29,19 @@ interface ExpenseReport {
   // Additional fields as necessary
 }
 
+// Pending reports fetched per page.
+const PAGE_SIZE = 50;
+
+// Maps a report of the /reports listing to the fields the approval list shows.
+const toExpenseReport = (report: any): ExpenseReport => ({
+  reportId: report.report_id,
+  employeeName: report.employee_name,
+  submissionDate: report.submission_date,
+  totalAmount: Number(report.total_amount),
+  currency: report.currency ?? '',
+  status: report.status,
+});
+
 const ApprovalList: React.FC = () => {
   // Use the useAuth hook to ensure the user is authenticated and has manager privileges.
   const { isAuthenticated, userRole } = useAuth();
@@ -36,7 +49,9 @@ const ApprovalList: React.FC = () => {
      Technical Specification Reference: 5.1 Feature ID: F-001 Secure User Authentication and Role-Based Authorization */
 
   const [pendingExpenses, setPendingExpenses] = useState<ExpenseReport[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null); // null once the last page is loaded
   const [isLoading, setIsLoading] = useState<boolean>(true);
+  const [isLoadingMore, setIsLoadingMore] = useState<boolean>(false);
   const [error, setError] = useState<string | null>(null);
 
   // Use useNotifications to handle notifications related to approvals.
@@ -44,12 +59,17 @@ const ApprovalList: React.FC = () => {
   /* Requirement Addressed: Send in-app notifications for actions taken.
      Technical Specification Reference: 5.17 Feature ID: F-017 Notification and Alerting System */
 
+  // Fetches the page of pending reports after the cursor; every employee's reports are listed.
+  const fetchPendingPage = (cursor: string | null) =>
+    fetchReportPage({ scope: 'all', status: 'Pending', cursor, limit: PAGE_SIZE });
+
   useEffect(() => {
     if (isAuthenticated && userRole === 'Manager') {
-      // Fetch pending expenses using fetchExpenses from services/api.ts.
-      fetchExpenses()
-        .then((expenses: ExpenseReport[]) => {
-          setPendingExpenses(expenses);
+      // Fetch the first page of pending reports using fetchReportPage from services/api.ts.
+      fetchPendingPage(null)
+        .then((page) => {
+          setPendingExpenses(page.items.map(toExpenseReport));
+          setNextCursor(page.nextCursor);
           setIsLoading(false);
         })
         .catch((error: any) => {
@@ -62,6 +82,22 @@ const ApprovalList: React.FC = () => {
     }
   }, [isAuthenticated, userRole]);
 
+  // Append the next page of pending reports to the list.
+  const handleLoadMore = () => {
+    setIsLoadingMore(true);
+    fetchPendingPage(nextCursor)
+      .then((page) => {
+        setPendingExpenses(prevExpenses => [...prevExpenses, ...page.items.map(toExpenseReport)]);
+        setNextCursor(page.nextCursor);
+      })
+      .catch(() => {
+        setError('Failed to fetch pending expenses.');
+      })
+      .finally(() => {
+        setIsLoadingMore(false);
+      });
+  };
+
   // Handle approval of an expense report.
   const handleApprove = (reportId: number) => {
     axios.post(`/api/expenses/${reportId}/approve`)
@@ -170,6 +206,11 @@ const ApprovalList: React.FC = () => {
           </tbody>
         </table>
       )}
+      {nextCursor && (
+        <button onClick={handleLoadMore} disabled={isLoadingMore}>
+          {isLoadingMore ? 'Loading...' : 'Load more'}
+        </button>
+      )}
     </div>
   );
 };
@@ -7,9 +7,9 @@ import React, { useState, useEffect } from 'react'; // React version 17.0.2
 // useEffect is used to perform side effects such as fetching data on component mount.
 
 // Internal imports
-import useExpenseData from '../hooks/useExpenseData';
-// useExpenseData hook (src/web/src/hooks/useExpenseData.ts)
-// Purpose: To manage and retrieve expense data for the component.
+import { fetchExpensePage } from '../services/api';
+// fetchExpensePage (src/web/src/services/api.ts)
+// Purpose: To fetch the user's expenses one keyset page at a time.
 
 import ExpenseItem from './ExpenseItem';
 // ExpenseItem component (src/web/src/components/ExpenseItem.tsx)
@@ -24,7 +24,8 @@ import { formatDate, formatCurrency } from '../utils/formatters';
  * ---------------------
  * Description:
  * Renders a list of expense items, allowing users to view their submitted expenses.
- * Integrates with hooks to fetch and manage expense data.
+ * Loads the first page of expenses on mount and further pages on request, following the cursor
+ * returned with each page, rather than fetching every expense at once.
  *
  * Requirements Addressed:
  * - Expense Submission
@@ -34,38 +35,52 @@ import { formatDate, formatCurrency } from '../utils/formatters';
  * This component displays submitted expenses, supporting multi-currency display and efficient interaction as per the requirements, addressing TR-F002.3 (Multi-currency support) and TR-F002.5 (Categorization of expenses).
  */
 
+// Expenses fetched per page.
+const PAGE_SIZE = 50;
+
 const ExpenseList: React.FC = () => {
-    // Step 1: Initialize state variables for storing expense data using useState.
-    const [expenses, setExpenses] = useState([]); // Local state for expense data
+    // Step 1: Initialize state variables for the loaded expenses and the cursor of the next page.
+    const [expenses, setExpenses] = useState<any[]>([]); // Local state for expense data
+    const [nextCursor, setNextCursor] = useState<string | null>(null); // null once the last page is loaded
+    const [loading, setLoading] = useState<boolean>(false);
+
+    // Fetches the page after the cursor and appends it to the loaded expenses.
+    const loadPage = async (cursor: string | null) => {
+        setLoading(true);
+        try {
+            const page = await fetchExpensePage({ cursor, limit: PAGE_SIZE });
+            setExpenses((loaded) => (cursor ? [...loaded, ...page.items] : page.items));
+            setNextCursor(page.nextCursor);
+        } finally {
+            setLoading(false);
+        }
+    };
 
-    // Step 2: Use useEffect to fetch expenses using the useExpenseData hook on component mount.
+    // Step 2: Use useEffect to fetch the first page of expenses on component mount.
     useEffect(() => {
-        // Function to fetch expenses
-        const fetchExpenseData = async () => {
-            // Fetch expenses using the useExpenseData hook
-            const data = await useExpenseData();
-            // Update the local state with the fetched expenses
-            setExpenses(data);
-        };
-        // Fetch expenses when the component mounts
-        fetchExpenseData();
+        loadPage(null);
     }, []);
 
-    // Step 3: Return the list of rendered ExpenseItem components.
+    // Step 3: Return the list of rendered ExpenseItem components, and a button for the next page.
     return (
         <div className="expense-list">
-            {/* Map over the fetched expense data to render an ExpenseItem component for each expense */}
+            {/* Map over the loaded expense data to render an ExpenseItem component for each expense */}
             {expenses.map((expense) => (
                 <ExpenseItem
-                    key={expense.id}
+                    key={expense.expense_id}
                     // Step 4: Format each expense's date and amount using formatDate and formatCurrency utilities.
                     // This addresses TR-F002.3 for multi-currency support and proper date formatting
-                    date={formatDate(expense.date)}
-                    amount={formatCurrency(expense.amount, expense.currency)}
+                    date={formatDate(expense.expense_date)}
+                    amount={formatCurrency(Number(expense.amount), expense.currency)}
                     category={expense.category}
                     description={expense.description}
                 />
             ))}
+            {nextCursor && (
+                <button onClick={() => loadPage(nextCursor)} disabled={loading}>
+                    {loading ? 'Loading...' : 'Load more'}
+                </button>
+            )}
         </div>
     );
 };
@@ -72,6 +72,71 @@ export const fetchExpenses = async (userId: string): Promise<any[]> => {
   }
 };
 
+/**
+ * One page of a listing, and the cursor of the next page (null on the last page).
+ */
+export interface Page<T> {
+  items: T[];
+  nextCursor: string | null;
+}
+
+/**
+ * Filters and paging options of the listing endpoints. Dates are ISO strings (YYYY-MM-DD).
+ */
+export interface ListingOptions {
+  cursor?: string | null;
+  limit?: number;
+  status?: string;
+  category?: string;
+  dateFrom?: string;
+  dateTo?: string;
+  scope?: 'own' | 'all';
+}
+
+// Converts listing options to the query parameters of the backend.
+const listingParams = (options: ListingOptions): Record<string, string | number> => {
+  const params: Record<string, string | number> = {};
+  if (options.cursor) params.cursor = options.cursor;
+  if (options.limit) params.limit = options.limit;
+  if (options.status) params.status = options.status;
+  if (options.category) params.category = options.category;
+  if (options.dateFrom) params.date_from = options.dateFrom;
+  if (options.dateTo) params.date_to = options.dateTo;
+  if (options.scope) params.scope = options.scope;
+  return params;
+};
+
+/**
+ * Fetches one page of the authenticated user's expenses, newest first.
+ *
+ * Requirements Addressed:
+ * - Scalability and Reliability (Technical Specification/5.19 Feature ID: F-019)
+ *   - Pages through expenses with keyset cursors instead of fetching every expense.
+ *
+ * @param options - Filters, page size and the cursor returned with the previous page.
+ * @returns A promise that resolves to the page.
+ */
+export const fetchExpensePage = async (options: ListingOptions = {}): Promise<Page<any>> => {
+  const response = await apiClient.get('/expenses', { params: listingParams(options) });
+  return { items: response.data.expenses, nextCursor: response.data.next_cursor };
+};
+
+/**
+ * Fetches one page of expense reports, newest first. Use { scope: 'all', status: 'Pending' }
+ * for the approval queue.
+ *
+ * Requirements Addressed:
+ * - Scalability and Reliability (Technical Specification/5.19 Feature ID: F-019)
+ *   - Pages through reports with keyset cursors instead of fetching every report.
+ *
+ * @param options - Filters, page size and the cursor returned with the previous page.
+ * @returns A promise that resolves to the page.
+ */
+export const fetchReportPage = async (options: ListingOptions = {}): Promise<Page<any>> => {
+  const response = await apiClient.get('/reports', { params: listingParams(options) });
+  return { items: response.data.expense_reports, nextCursor: response.data.next_cursor };
+};
+
 /**
  * Submits a new expense report to the backend API.
  * 